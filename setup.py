@@ -65,7 +65,6 @@ setup(
         "kubernetes>=33.1.0,!=36.0.0",
         "kr8s>=0.20.0",
         "pyyaml>=6.0.2",
-        "ratelimit==2.2.1",
         "tabulate==0.9.0",
         "itables>=2.2.2",
         "jinja2>=3.1.2",
@@ -98,7 +97,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "hyp=sagemaker.hyperpod.cli.hyp_cli:cli",
+            "hyp=sagemaker.hyperpod.cli.daemon_client:main",
         ],
     },
     classifiers=[
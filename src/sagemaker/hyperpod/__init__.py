@@ -1,2 +1,21 @@
-from .common.utils import *
-from .observability.MonitoringConfig import MonitoringConfig
\ No newline at end of file
+import importlib
+
+# Top-level helpers are resolved on first access so that importing a submodule
+# (for example the ``hyp`` entry point) does not pull in kubernetes and boto3.
+_LAZY_ATTRIBUTES = {
+    "MonitoringConfig": "sagemaker.hyperpod.observability.MonitoringConfig",
+    "HyperPodCache": "sagemaker.hyperpod.common.informer",
+}
+_UTILS_MODULE = "sagemaker.hyperpod.common.utils"
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRIBUTES.get(name, _UTILS_MODULE))
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
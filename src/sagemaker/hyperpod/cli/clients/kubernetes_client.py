@@ -10,8 +10,13 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import atexit
+import base64
 import os
-from typing import List, Optional
+import tempfile
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import yaml
 from kubernetes import client, config, stream
@@ -24,6 +29,9 @@ from kubernetes.config import (
 )
 from kubernetes.client.rest import ApiException
 from sagemaker.hyperpod.cli.constants.command_constants import (
+    EKS_CLUSTER_ID_HEADER,
+    EKS_TOKEN_PREFIX,
+    EKS_TOKEN_TTL_SECONDS,
     SAGEMAKER_MANAGED_QUEUE_LABEL,
     TEMP_KUBE_CONFIG_FILE,
 )
@@ -56,23 +64,253 @@ from sagemaker.hyperpod.cli.constants.space_access_constants import (
     SPACE_ACCESS_PLURAL,
 )
 from sagemaker.hyperpod.cli.utils import setup_logger
+from sagemaker.hyperpod.common.utils import (
+    create_boto3_client,
+    get_shared_api_client,
+)
+from sagemaker.hyperpod.common.k8s_bulk import list_custom_object_pages_all_namespaces
+from sagemaker.hyperpod.common.pod_logs import stream_pod_logs
 
 logger = setup_logger(__name__)
 
 KUBE_CONFIG_PATH = os.path.expanduser(KUBE_CONFIG_DEFAULT_LOCATION)
 
+# (kubeconfig path, context) -> (kubeconfig mtime, ApiClient)
+_api_client_pool: Dict[
+    Tuple[str, Optional[str]], Tuple[Optional[float], client.ApiClient]
+] = {}
+_api_client_pool_lock = threading.Lock()
+
+
+def _kubeconfig_mtime(config_file: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(config_file)
+    except OSError:
+        return None
+
+
+def get_api_client(
+    config_file: Optional[str] = None,
+    context: Optional[str] = None,
+) -> client.ApiClient:
+    """
+    Get a pooled ApiClient for a kubeconfig file and context.
+
+    Each ApiClient is built from its own Configuration, so loading it never
+    touches the process-wide default configuration and clients for different
+    clusters can be used from different threads at the same time. A client is
+    rebuilt when its kubeconfig file has been rewritten since it was created.
+
+    Args:
+        config_file (Optional[str]): Path to the kubeconfig file. Defaults to ~/.kube/config.
+        context (Optional[str]): Kubeconfig context to use. Defaults to the current context.
+
+    Returns:
+        client.ApiClient: The ApiClient for the given kubeconfig file and context.
+    """
+    config_file = os.path.abspath(os.path.expanduser(config_file or KUBE_CONFIG_PATH))
+    key = (config_file, context)
+    mtime = _kubeconfig_mtime(config_file)
+    with _api_client_pool_lock:
+        pooled = _api_client_pool.get(key)
+        if pooled is not None and pooled[0] == mtime:
+            return pooled[1]
+        api_client = config.new_client_from_config(
+            config_file=config_file,
+            context=context,
+            persist_config=False,
+        )
+        _api_client_pool[key] = (mtime, api_client)
+        if pooled is not None:
+            pooled[1].close()
+        return api_client
+
+
+# (EKS cluster name, region) -> (token, monotonic expiry time)
+_eks_tokens: Dict[Tuple[str, Optional[str]], Tuple[str, float]] = {}
+# (EKS cluster name, region) -> ApiClient
+_eks_api_clients: Dict[Tuple[str, Optional[str]], client.ApiClient] = {}
+# certificate authority data -> path of the file holding it
+_eks_ca_files: Dict[str, str] = {}
+
+
+def _inject_eks_cluster_id(params, context, **kwargs):
+    if EKS_CLUSTER_ID_HEADER in params:
+        context[EKS_CLUSTER_ID_HEADER] = params.pop(EKS_CLUSTER_ID_HEADER)
+
+
+def _add_eks_cluster_id_header(request, **kwargs):
+    if EKS_CLUSTER_ID_HEADER in request.context:
+        request.headers[EKS_CLUSTER_ID_HEADER] = request.context[EKS_CLUSTER_ID_HEADER]
+
+
+def get_eks_token(eks_name: str, region: Optional[str] = None) -> str:
+    """
+    Get a bearer token for an EKS cluster, equivalent to `aws eks get-token`.
+
+    The token is a presigned STS GetCallerIdentity URL bound to the cluster
+    name. It is generated in-process and cached until shortly before EKS
+    stops accepting it.
+
+    Args:
+        eks_name (str): The name of the EKS cluster.
+        region (Optional[str]): The AWS region where the EKS cluster resides.
+
+    Returns:
+        str: The bearer token.
+    """
+    key = (eks_name, region)
+    with _api_client_pool_lock:
+        cached = _eks_tokens.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    sts_client = create_boto3_client("sts", region_name=region)
+    # The cluster name travels in the request context rather than in client
+    # state, so the pooled STS client can sign tokens for several clusters
+    # from different threads.
+    sts_client.meta.events.register(
+        "provide-client-params.sts.GetCallerIdentity",
+        _inject_eks_cluster_id,
+        unique_id="hyperpod-eks-cluster-id-param",
+    )
+    sts_client.meta.events.register(
+        "before-sign.sts.GetCallerIdentity",
+        _add_eks_cluster_id_header,
+        unique_id="hyperpod-eks-cluster-id-header",
+    )
+    expires_at = time.monotonic() + EKS_TOKEN_TTL_SECONDS
+    url = sts_client.generate_presigned_url(
+        "get_caller_identity",
+        Params={EKS_CLUSTER_ID_HEADER: eks_name},
+        ExpiresIn=60,
+        HttpMethod="GET",
+    )
+    token = EKS_TOKEN_PREFIX + base64.urlsafe_b64encode(
+        url.encode("utf-8")
+    ).decode("utf-8").rstrip("=")
+
+    with _api_client_pool_lock:
+        _eks_tokens[key] = (token, expires_at)
+    return token
+
+
+def _get_eks_ca_file(ca_data: str) -> str:
+    # The REST client only accepts a CA bundle path, so write the cluster CA
+    # once per process and remove it on exit.
+    with _api_client_pool_lock:
+        path = _eks_ca_files.get(ca_data)
+        if path is None:
+            with tempfile.NamedTemporaryFile(
+                mode="wb", suffix=".crt", delete=False
+            ) as ca_file:
+                ca_file.write(base64.b64decode(ca_data))
+            path = ca_file.name
+            _eks_ca_files[ca_data] = path
+            atexit.register(_remove_file, path)
+        return path
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def get_eks_api_client(eks_name: str, region: Optional[str] = None) -> client.ApiClient:
+    """
+    Get a pooled ApiClient for an EKS cluster without writing a kubeconfig.
+
+    The endpoint and certificate authority come from EKS DescribeCluster and
+    the bearer token from get_eks_token, which the client refreshes on its
+    own once the cached token expires.
+
+    Args:
+        eks_name (str): The name of the EKS cluster.
+        region (Optional[str]): The AWS region where the EKS cluster resides.
+
+    Returns:
+        client.ApiClient: The ApiClient for the EKS cluster.
+    """
+    key = (eks_name, region)
+    with _api_client_pool_lock:
+        api_client = _eks_api_clients.get(key)
+    if api_client is not None:
+        return api_client
+
+    cluster = create_boto3_client("eks", region_name=region).describe_cluster(
+        name=eks_name
+    )["cluster"]
+
+    configuration = client.Configuration()
+    configuration.host = cluster["endpoint"]
+    configuration.ssl_ca_cert = _get_eks_ca_file(cluster["certificateAuthority"]["data"])
+    configuration.api_key_prefix["authorization"] = "Bearer"
+    configuration.api_key["authorization"] = get_eks_token(eks_name, region)
+    configuration.refresh_api_key_hook = lambda conf: conf.api_key.update(
+        authorization=get_eks_token(eks_name, region)
+    )
+    api_client = client.ApiClient(configuration)
+
+    with _api_client_pool_lock:
+        pooled = _eks_api_clients.setdefault(key, api_client)
+    if pooled is not api_client:
+        api_client.close()
+    return pooled
+
+
+def clear_api_client_pool() -> None:
+    """Close and drop all pooled ApiClients and cached EKS tokens."""
+    with _api_client_pool_lock:
+        for _, api_client in _api_client_pool.values():
+            api_client.close()
+        _api_client_pool.clear()
+        for api_client in _eks_api_clients.values():
+            api_client.close()
+        _eks_api_clients.clear()
+        _eks_tokens.clear()
+
 
 class KubernetesClient:
     _instance = None
     _kube_client = None
-
-    def __new__(cls, config_file: Optional[str] = None) -> "KubernetesClient":
+    # ApiClient an isolated instance is bound to. None means the SDK's shared
+    # ApiClient for the kube config loaded into the singleton.
+    _bound_api_client = None
+
+    def __new__(
+        cls,
+        config_file: Optional[str] = None,
+        context: Optional[str] = None,
+        eks_name: Optional[str] = None,
+        region: Optional[str] = None,
+    ) -> "KubernetesClient":
+        if eks_name is not None:
+            # EKS cluster: authenticate in-process without a kubeconfig file
+            instance = super(KubernetesClient, cls).__new__(cls)
+            instance._kube_client = get_eks_api_client(eks_name, region)
+            instance._bound_api_client = instance._kube_client
+            return instance
+        if config_file is not None or context is not None:
+            # Explicit kubeconfig: bind an isolated instance to a pooled
+            # ApiClient instead of loading it into the shared singleton.
+            instance = super(KubernetesClient, cls).__new__(cls)
+            instance._kube_client = get_api_client(config_file, context)
+            instance._bound_api_client = instance._kube_client
+            return instance
         if cls._instance is None:
             cls._instance = super(KubernetesClient, cls).__new__(cls)
             config.load_kube_config(config_file=config_file or KUBE_CONFIG_PATH)
-            cls._instance._kube_client = client.ApiClient()
+            cls._instance._kube_client = get_shared_api_client()
         return cls._instance
 
+    @property
+    def _api_client(self) -> client.ApiClient:
+        """ApiClient passed to the typed API classes."""
+        # Resolved on each call so the singleton follows set_context
+        return self._bound_api_client or get_shared_api_client()
+
     def set_context(
         self,
         context_name: str,
@@ -125,7 +363,7 @@ class KubernetesClient:
             raise RuntimeError(
                 "Kubernetes client is not initialized. Call set_context() first."
             )
-        return client.CoreV1Api(self._kube_client)
+        return client.CoreV1Api(self._api_client)
 
     def get_apps_v1_api(self) -> client.AppsV1Api:
         """
@@ -138,7 +376,7 @@ class KubernetesClient:
             raise RuntimeError(
                 "Kubernetes client is not initialized. Call set_context() first."
             )
-        return client.AppsV1Api(self._kube_client)
+        return client.AppsV1Api(self._api_client)
 
     def get_auth_v1_api(self) -> client.AuthorizationV1Api:
         """
@@ -152,7 +390,7 @@ class KubernetesClient:
             raise RuntimeError(
                 "Kubernetes client is not initialized. Call set_context() first."
             )
-        return client.AuthorizationV1Api(self._kube_client)
+        return client.AuthorizationV1Api(self._api_client)
 
     def context_exists(self, context: str) -> bool:
         """
@@ -170,20 +408,31 @@ class KubernetesClient:
         except Exception as e:
             raise RuntimeError(f"Failed to check Kubernetes context: {e}")
 
+    def list_nodes(self, selector_str: str) -> List:
+        """
+        List all nodes matching a label selector, following pagination
+
+        Args:
+            selector_str (str): Selector to filter
+        """
+        return self._list_nodes(client.CoreV1Api(self._api_client), selector_str)
+
     def list_node_with_temp_config(
         self,
         file: str,
         selector_str: str,
     ) -> List:
         """
-        Load kubeconfig from a local file
+        List nodes of the cluster described by a local kubeconfig file
+        without changing the default kubeconfig loaded in the process
 
         Args:
             file (str): The path to the kubeconfig file
             selector_str (str): Selector to filter
         """
-        config.load_kube_config(config_file=file)
-        v1Client = client.CoreV1Api()
+        return self._list_nodes(client.CoreV1Api(get_api_client(file)), selector_str)
+
+    def _list_nodes(self, v1Client: client.CoreV1Api, selector_str: str) -> List:
         _continue = None
 
         nodes = []
@@ -215,7 +464,7 @@ class KubernetesClient:
         returns all namespaces
         """
         result: List[str] = []
-        namespaces: V1NamespaceList = client.CoreV1Api().list_namespace()
+        namespaces: V1NamespaceList = client.CoreV1Api(self._api_client).list_namespace()
         namespace: V1Namespace
         for namespace in namespaces.items:
             if namespace.metadata and namespace.metadata.name:
@@ -236,7 +485,7 @@ class KubernetesClient:
         if namespace is None:
             return None
         try:
-            response = client.CoreV1Api().read_namespace(name=namespace)
+            response = client.CoreV1Api(self._api_client).read_namespace(name=namespace)
             labels = response.metadata.labels
             if labels and SAGEMAKER_MANAGED_QUEUE_LABEL in labels and labels[SAGEMAKER_MANAGED_QUEUE_LABEL] == "true":
                 return response
@@ -248,13 +497,13 @@ class KubernetesClient:
         return None
 
     def list_pods_with_labels(self, namespace: str, label_selector: str):
-        return client.CoreV1Api().list_namespaced_pod(
+        return client.CoreV1Api(self._api_client).list_namespaced_pod(
             namespace=namespace,
             label_selector=label_selector,
         )
 
     def list_pods_in_all_namespaces_with_labels(self, label_selector: str):
-        v1Client = client.CoreV1Api()
+        v1Client = client.CoreV1Api(self._api_client)
         pods = []
         _continue = None
 
@@ -274,12 +523,31 @@ class KubernetesClient:
         return pods
 
     def get_logs_for_pod(self, pod_name: str, namespace: str):
-        return client.CoreV1Api().read_namespaced_pod_log(
+        return client.CoreV1Api(self._api_client).read_namespaced_pod_log(
             name=pod_name, namespace=namespace
         )
 
+    def stream_logs_for_pod(
+        self,
+        pod_name: str,
+        namespace: str,
+        follow: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+    ) -> Iterator[str]:
+        return stream_pod_logs(
+            client.CoreV1Api(self._api_client),
+            name=pod_name,
+            namespace=namespace,
+            follow=follow,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            limit_bytes=limit_bytes,
+        )
+
     def get_job(self, job_name: str, namespace: str):
-        return client.CustomObjectsApi().get_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).get_namespaced_custom_object(
             group=PYTORCH_CUSTOM_OBJECT_GROUP,
             version=PYTORCH_CUSTOM_OBJECT_VERSION,
             namespace=namespace,
@@ -288,12 +556,12 @@ class KubernetesClient:
         )
     
     def get_pod_details(self, pod_name: str, namespace: str):
-        return client.CoreV1Api().read_namespaced_pod(
+        return client.CoreV1Api(self._api_client).read_namespaced_pod(
             name=pod_name, namespace=namespace
         )
 
     def delete_training_job(self, job_name: str, namespace: str):
-        return client.CustomObjectsApi().delete_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).delete_namespaced_custom_object(
             group=PYTORCH_CUSTOM_OBJECT_GROUP,
             version=PYTORCH_CUSTOM_OBJECT_VERSION,
             namespace=namespace,
@@ -306,17 +574,67 @@ class KubernetesClient:
         namespace: str,
         label_selector: Optional[str],
     ):
-        return client.CustomObjectsApi().list_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).list_namespaced_custom_object(
             group=PYTORCH_CUSTOM_OBJECT_GROUP,
             version=PYTORCH_CUSTOM_OBJECT_VERSION,
             namespace=namespace,
             plural=PYTORCH_CUSTOM_OBJECT_PLURAL,
             label_selector=label_selector,
         )
+
+    def list_training_job_pages_for_all_namespaces(
+        self,
+        label_selector: Optional[str],
+    ) -> Iterator[List[dict]]:
+        """
+        Yield pages of training jobs across all namespaces the user can read,
+        using one paginated cluster-scoped LIST when RBAC allows it
+        """
+        return list_custom_object_pages_all_namespaces(
+            client.CustomObjectsApi(self._api_client),
+            group=PYTORCH_CUSTOM_OBJECT_GROUP,
+            version=PYTORCH_CUSTOM_OBJECT_VERSION,
+            plural=PYTORCH_CUSTOM_OBJECT_PLURAL,
+            list_namespaces=self.list_namespaces,
+            label_selector=label_selector,
+        )
     
+    def has_custom_objects(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        request_timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Whether at least one custom object of the given kind exists in the
+        namespace, or cluster-wide when namespace is None, using a LIST
+        that returns at most one item
+        """
+        custom_api = client.CustomObjectsApi(self._api_client)
+        if namespace is None:
+            response = custom_api.list_cluster_custom_object(
+                group=group,
+                version=version,
+                plural=plural,
+                limit=1,
+                _request_timeout=request_timeout,
+            )
+        else:
+            response = custom_api.list_namespaced_custom_object(
+                group=group,
+                version=version,
+                namespace=namespace,
+                plural=plural,
+                limit=1,
+                _request_timeout=request_timeout,
+            )
+        return bool(response.get("items"))
+
     def check_if_namespace_exists(self, namespace: str):
         try:
-            client.CoreV1Api().read_namespace(name=namespace)
+            client.CoreV1Api(self._api_client).read_namespace(name=namespace)
             return True
         except client.rest.ApiException as e:
             if e.status == 404:
@@ -332,7 +650,7 @@ class KubernetesClient:
         bash_command: str,
     ):
         return stream.stream(
-            client.CoreV1Api().connect_get_namespaced_pod_exec,
+            client.CoreV1Api(self._api_client).connect_get_namespaced_pod_exec,
             stderr=True,
             stdout=True,
             name=pod,
@@ -341,7 +659,7 @@ class KubernetesClient:
         )
 
     def patch_workload(self, workload_name: str, namespace: str, patch_body: str):
-        return client.CustomObjectsApi().patch_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).patch_namespaced_custom_object(
             group=KUEUE_CUSTOM_OBJECT_GROUP,
             version=KUEUE_CUSTOM_OBJECT_VERSION,
             namespace=namespace,
@@ -351,7 +669,7 @@ class KubernetesClient:
         )
 
     def get_workload_by_label(self, label_selector: str, namespace: str):
-        return client.CustomObjectsApi().list_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).list_namespaced_custom_object(
             group=KUEUE_CUSTOM_OBJECT_GROUP,
             version=KUEUE_CUSTOM_OBJECT_VERSION,
             namespace=namespace,
@@ -360,14 +678,14 @@ class KubernetesClient:
         )
     
     def list_workload_priority_classes(self):
-        return client.CustomObjectsApi().list_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).list_cluster_custom_object(
             group=KUEUE_CUSTOM_OBJECT_GROUP,
             version=KUEUE_CUSTOM_OBJECT_VERSION,
             plural=WORKLOAD_PRIORITY_CLASS_CUSTOM_OBJECT_PLURAL,
         )
     
     def get_cluster_queue(self, cluster_queue_name: str):
-        return client.CustomObjectsApi().get_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).get_cluster_custom_object(
             group=KUEUE_CUSTOM_OBJECT_GROUP,
             version=KUEUE_CUSTOM_OBJECT_VERSION,
             plural=CLUSTER_QUEUE_PRIORITY_CLASS_CUSTOM_OBJECT_PLURAL,
@@ -375,7 +693,7 @@ class KubernetesClient:
         )
 
     def create_space(self, namespace: str, space_spec: dict):
-        return client.CustomObjectsApi().create_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).create_namespaced_custom_object(
             group=SPACE_GROUP,
             version=SPACE_VERSION,
             namespace=namespace,
@@ -385,21 +703,21 @@ class KubernetesClient:
 
     def list_spaces(self, namespace: str):
         if namespace:
-            return client.CustomObjectsApi().list_namespaced_custom_object(
+            return client.CustomObjectsApi(self._api_client).list_namespaced_custom_object(
                 group=SPACE_GROUP,
                 version=SPACE_VERSION,
                 namespace=namespace,
                 plural=SPACE_PLURAL
             )
         else:
-            return client.CustomObjectsApi().list_cluster_custom_object(
+            return client.CustomObjectsApi(self._api_client).list_cluster_custom_object(
                 group=SPACE_GROUP,
                 version=SPACE_VERSION,
                 plural=SPACE_PLURAL
             )
 
     def get_space(self, namespace: str, name: str):
-        return client.CustomObjectsApi().get_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).get_namespaced_custom_object(
             group=SPACE_GROUP,
             version=SPACE_VERSION,
             namespace=namespace,
@@ -408,7 +726,7 @@ class KubernetesClient:
         )
 
     def delete_space(self, namespace: str, name: str):
-        return client.CustomObjectsApi().delete_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).delete_namespaced_custom_object(
             group=SPACE_GROUP,
             version=SPACE_VERSION,
             namespace=namespace,
@@ -417,7 +735,7 @@ class KubernetesClient:
         )
 
     def patch_space(self, namespace: str, name: str, body: dict):
-        return client.CustomObjectsApi().patch_namespaced_custom_object(
+        return client.CustomObjectsApi(self._api_client).patch_namespaced_custom_object(
             group=SPACE_GROUP,
             version=SPACE_VERSION,
             namespace=namespace,
@@ -428,7 +746,7 @@ class KubernetesClient:
 
     # Space Template Configuration methods
     def create_space_template(self, config_spec: dict):
-        return client.CustomObjectsApi().create_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).create_cluster_custom_object(
             group=SPACE_TEMPLATE_GROUP,
             version=SPACE_TEMPLATE_VERSION,
             plural=SPACE_TEMPLATE_PLURAL,
@@ -436,14 +754,14 @@ class KubernetesClient:
         )
 
     def list_space_templates(self):
-        return client.CustomObjectsApi().list_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).list_cluster_custom_object(
             group=SPACE_TEMPLATE_GROUP,
             version=SPACE_TEMPLATE_VERSION,
             plural=SPACE_TEMPLATE_PLURAL
         )
 
     def get_space_template(self, name: str):
-        return client.CustomObjectsApi().get_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).get_cluster_custom_object(
             group=SPACE_TEMPLATE_GROUP,
             version=SPACE_TEMPLATE_VERSION,
             plural=SPACE_TEMPLATE_PLURAL,
@@ -451,7 +769,7 @@ class KubernetesClient:
         )
 
     def delete_space_template(self, name: str):
-        return client.CustomObjectsApi().delete_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).delete_cluster_custom_object(
             group=SPACE_TEMPLATE_GROUP,
             version=SPACE_TEMPLATE_VERSION,
             plural=SPACE_TEMPLATE_PLURAL,
@@ -459,7 +777,7 @@ class KubernetesClient:
         )
 
     def patch_space_template(self, name: str, body: dict):
-        return client.CustomObjectsApi().patch_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).patch_cluster_custom_object(
             group=SPACE_TEMPLATE_GROUP,
             version=SPACE_TEMPLATE_VERSION,
             plural=SPACE_TEMPLATE_PLURAL,
@@ -468,7 +786,7 @@ class KubernetesClient:
         )
 
     def create_space_access(self, config_spec: dict):
-        return client.CustomObjectsApi().create_cluster_custom_object(
+        return client.CustomObjectsApi(self._api_client).create_cluster_custom_object(
             group=SPACE_ACCESS_GROUP,
             version=SPACE_ACCESS_VERSION,
             plural=SPACE_ACCESS_PLURAL,
@@ -0,0 +1,353 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""
+Static manifest of the ``hyp`` command tree.
+
+The entry point resolves subcommands from this manifest so that a command
+module (and the kubernetes, boto3 and template packages it pulls in) is only
+imported when that command is actually invoked. ``hyp --help`` and the group
+help pages are rendered from the ``short_help`` recorded here.
+
+When adding or renaming a command, update the matching entry below;
+``test_command_manifest_matches_commands`` fails if the manifest drifts from
+the real click commands.
+"""
+from typing import Dict, NamedTuple, Optional
+
+
+class LazyCommand(NamedTuple):
+    """
+    Location and help summary of a lazily loaded click command.
+
+    Attributes:
+        import_path: ``"<module>:<attribute>"`` of the click command object.
+        short_help: Summary shown in the parent group's help listing.
+        help: Optional help text override. When set, the resolved command is
+            copied and registered with this help text (used for aliases such as
+            ``hyp-recipe-job`` that reuse the ``hyp-pytorch-job`` commands).
+        hidden: Whether the command is hidden from help listings.
+    """
+
+    import_path: str
+    short_help: str
+    help: Optional[str] = None
+    hidden: bool = False
+
+
+_TRAINING = "sagemaker.hyperpod.cli.commands.training"
+_INFERENCE = "sagemaker.hyperpod.cli.commands.inference"
+_CLUSTER = "sagemaker.hyperpod.cli.commands.cluster"
+_CLUSTER_STACK = "sagemaker.hyperpod.cli.commands.cluster_stack"
+_SPACE = "sagemaker.hyperpod.cli.commands.space"
+_SPACE_TEMPLATE = "sagemaker.hyperpod.cli.commands.space_template"
+_SPACE_ACCESS = "sagemaker.hyperpod.cli.commands.space_access"
+_INIT = "sagemaker.hyperpod.cli.commands.init"
+_DAEMON = "sagemaker.hyperpod.cli.daemon"
+
+
+COMMAND_MANIFEST: Dict[str, Dict[str, LazyCommand]] = {
+    "hyp": {
+        "init": LazyCommand(
+            f"{_INIT}:init",
+            "Initialize a TEMPLATE scaffold in DIRECTORY.",
+        ),
+        "reset": LazyCommand(
+            f"{_INIT}:reset",
+            "Reset the current directory's config.yaml to an \"empty\" scaffold: "
+            "all schema keys set to default values (but keeping the template and version).",
+        ),
+        "configure": LazyCommand(
+            f"{_INIT}:configure",
+            "Update any subset of fields in ./config.yaml by passing --<field> flags.",
+        ),
+        "validate": LazyCommand(
+            f"{_INIT}:validate",
+            "Validate this directory's config.yaml against the appropriate schema.",
+        ),
+        "list-cluster": LazyCommand(
+            f"{_CLUSTER}:list_cluster",
+            "List SageMaker Hyperpod Clusters with metadata.",
+        ),
+        "set-cluster-context": LazyCommand(
+            f"{_CLUSTER}:set_cluster_context",
+            "Connect to a HyperPod EKS cluster.",
+        ),
+        "get-cluster-context": LazyCommand(
+            f"{_CLUSTER}:get_cluster_context",
+            "Get context related to the current set cluster.",
+        ),
+        "get-monitoring": LazyCommand(
+            f"{_CLUSTER}:get_monitoring",
+            "Get monitoring configurations for Hyperpod cluster.",
+        ),
+        "list-accelerator-partition-type": LazyCommand(
+            f"{_TRAINING}:list_accelerator_partition_type",
+            "List available accelerator partition types for an instance type.",
+        ),
+    },
+    "create": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_create",
+            "Create a PyTorch job",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_create",
+            "Create a jumpstart model endpoint",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_create",
+            "Create a custom model endpoint",
+        ),
+        "_default_create": LazyCommand(
+            f"{_INIT}:_default_create",
+            "Validate configuration and render template files for deployment.",
+            hidden=True,
+        ),
+        "hyp-space": LazyCommand(f"{_SPACE}:space_create", ""),
+        "hyp-space-template": LazyCommand(
+            f"{_SPACE_TEMPLATE}:space_template_create",
+            "Create a space-template resource.",
+        ),
+        "hyp-space-access": LazyCommand(
+            f"{_SPACE_ACCESS}:space_access_create",
+            "Create a space access resource.",
+        ),
+    },
+    "list": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:list_jobs",
+            "List all HyperPod PyTorch jobs.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:list_jobs",
+            "List all HyperPod recipe jobs",
+            help="List all HyperPod recipe jobs",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_list",
+            "List all HyperPod Jumpstart model endpoints.",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_list",
+            "List all HyperPod custom model endpoints.",
+        ),
+        "jumpstart-models": LazyCommand(
+            f"{_INFERENCE}:js_model_list",
+            "List JumpStart models in the SageMaker Public Hub.",
+        ),
+        "cluster-stack": LazyCommand(
+            f"{_CLUSTER_STACK}:list_cluster_stacks",
+            "List all HyperPod cluster stacks.",
+        ),
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_list",
+            "List space resources.",
+        ),
+        "hyp-space-template": LazyCommand(
+            f"{_SPACE_TEMPLATE}:space_template_list",
+            "List space-template resources.",
+        ),
+    },
+    "describe": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_describe",
+            "Describe a HyperPod PyTorch job.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:pytorch_describe",
+            "Describe a HyperPod recipe job.",
+            help="Describe a HyperPod recipe job.",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_describe",
+            "Describe a HyperPod Jumpstart model endpoint.",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_describe",
+            "Describe a HyperPod custom model endpoint.",
+        ),
+        "cluster-stack": LazyCommand(
+            f"{_CLUSTER_STACK}:describe_cluster_stack",
+            "Describe the status of a HyperPod cluster stack.",
+        ),
+        "cluster": LazyCommand(
+            f"{_CLUSTER}:describe_cluster",
+            "Describe the status of a HyperPod cluster.",
+        ),
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_describe",
+            "Describe a space resource.",
+        ),
+        "hyp-space-template": LazyCommand(
+            f"{_SPACE_TEMPLATE}:space_template_describe",
+            "Describe a space-template resource.",
+        ),
+    },
+    "update": {
+        "cluster": LazyCommand(
+            f"{_CLUSTER_STACK}:update_cluster",
+            "Update an existing HyperPod cluster configuration.",
+        ),
+        "hyp-space": LazyCommand(f"{_SPACE}:space_update", ""),
+        "hyp-space-template": LazyCommand(
+            f"{_SPACE_TEMPLATE}:space_template_update",
+            "Update a space-template resource.",
+        ),
+    },
+    "delete": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_delete",
+            "Delete a HyperPod PyTorch job.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:pytorch_delete",
+            "Delete a HyperPod recipe job.",
+            help="Delete a HyperPod recipe job.",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_delete",
+            "Delete a Hyperpod Jumpstart model endpoint.",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_delete",
+            "Delete a Hyperpod custom model endpoint.",
+        ),
+        "cluster-stack": LazyCommand(
+            f"{_CLUSTER_STACK}:delete_cluster_stack",
+            "Delete a HyperPod cluster stack.",
+        ),
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_delete",
+            "Delete a space resource.",
+        ),
+        "hyp-space-template": LazyCommand(
+            f"{_SPACE_TEMPLATE}:space_template_delete",
+            "Delete a space-template resource.",
+        ),
+    },
+    "start": {
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_start",
+            "Start a space resource.",
+        ),
+    },
+    "stop": {
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_stop",
+            "Stop a space resource.",
+        ),
+    },
+    "portforward": {
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_portforward",
+            "Port forward to localhost for a space resource.",
+        ),
+    },
+    "list-pods": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_list_pods",
+            "List all HyperPod PyTorch pods related to the job.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:pytorch_list_pods",
+            "List all HyperPod PyTorch pods related to the recipe job.",
+            help="List all HyperPod PyTorch pods related to the recipe job.",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_list_pods",
+            "List all pods related to jumpstart model endpoint.",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_list_pods",
+            "List all pods related to custom model endpoint.",
+        ),
+    },
+    "get-logs": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_get_logs",
+            "Get specific pod log for Hyperpod Pytorch job.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:pytorch_get_logs",
+            "Get specific pod log for HyperPod recipe job.",
+            help="Get specific pod log for HyperPod recipe job.",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_get_logs",
+            "Get specific pod log for jumpstart model endpoint.",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_get_logs",
+            "Get specific pod log for custom model endpoint.",
+        ),
+        "hyp-space": LazyCommand(
+            f"{_SPACE}:space_get_logs",
+            "Get logs for a space resource.",
+        ),
+    },
+    "invoke": {
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_invoke",
+            "Invoke a custom model endpoint.",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_invoke",
+            "Invoke a jumpstart model endpoint.",
+            help="Invoke a jumpstart model endpoint.",
+        ),
+    },
+    "get-operator-logs": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_get_operator_logs",
+            "Get operator logs for pytorch training jobs.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:pytorch_get_operator_logs",
+            "Get operator logs for HyperPod recipe jobs.",
+            help="Get operator logs for HyperPod recipe jobs.",
+        ),
+        "hyp-jumpstart-endpoint": LazyCommand(
+            f"{_INFERENCE}:js_get_operator_logs",
+            "Get operator logs for jumpstart model endpoint.",
+        ),
+        "hyp-custom-endpoint": LazyCommand(
+            f"{_INFERENCE}:custom_get_operator_logs",
+            "Get operator logs for custom model endpoint.",
+        ),
+    },
+    "exec": {
+        "hyp-pytorch-job": LazyCommand(
+            f"{_TRAINING}:pytorch_exec",
+            "Execute commands in pods associated with a HyperPod PyTorch job.",
+        ),
+        "hyp-recipe-job": LazyCommand(
+            f"{_TRAINING}:pytorch_exec",
+            "Execute commands in pods associated with a HyperPod recipe job.",
+            help="Execute commands in pods associated with a HyperPod recipe job.",
+        ),
+    },
+    "daemon": {
+        "start": LazyCommand(
+            f"{_DAEMON}:daemon_start",
+            "Start a background process that serves read-only hyp commands from warm clients.",
+        ),
+        "stop": LazyCommand(
+            f"{_DAEMON}:daemon_stop",
+            "Stop the running hyp daemon.",
+        ),
+        "status": LazyCommand(
+            f"{_DAEMON}:daemon_status",
+            "Show whether the hyp daemon is running and how many commands it served.",
+        ),
+    },
+}
@@ -24,7 +24,6 @@ import boto3
 import click
 from botocore.client import BaseClient
 from kubernetes import client
-from ratelimit import limits, sleep_and_retry
 from tabulate import tabulate
 
 from sagemaker.hyperpod.cli.clients.kubernetes_client import (
@@ -41,7 +40,6 @@ from sagemaker.hyperpod.cli.constants.command_constants import (
     SAGEMAKER_MANAGED_CLUSTER_QUEUE_SUFFIX,
     SAGEMAKER_QUOTA_ALLOCATION_LABEL,
     TOTAL_ACCELERATOR_DEVICES_KEY,
-    TEMP_KUBE_CONFIG_FILE,
     OutputFormat,
 )
 from sagemaker.hyperpod.common.telemetry.user_agent import (
@@ -70,6 +68,10 @@ from sagemaker.hyperpod.common.utils import (
     get_cluster_context as get_cluster_context_util,
     _resolve_region,
 )
+from sagemaker.hyperpod.common.rate_limit import (
+    AdaptiveRateLimiter,
+    is_throttling_error,
+)
 from sagemaker.hyperpod.observability.utils import (
     get_monitoring_config,
     is_observability_addon_enabled,
@@ -81,8 +83,13 @@ from sagemaker.hyperpod.common.telemetry.constants import Feature
 from sagemaker.hyperpod.cli.utils import convert_datetimes
 from sagemaker_core.main.resources import Cluster
 
-RATE_LIMIT = 4
-RATE_LIMIT_PERIOD = 1  # 1 second
+# Initial and maximum cluster scans started per second; throttling lowers the rate
+RATE_LIMIT = 10
+MAX_RATE_LIMIT = 40
+# Fixed number of clusters scanned concurrently, regardless of account size
+LIST_CLUSTER_MAX_WORKERS = 16
+# Attempts per cluster when SageMaker, EKS or the Kubernetes API throttles the scan
+THROTTLE_RETRY_ATTEMPTS = 5
 
 logger = setup_logger(__name__)
 
@@ -198,177 +205,219 @@ def list_cluster(
             logger.error(f"Failed to list HyperPod clusters due to an error: {e}")
             sys.exit(1)
 
-    cluster_capacities: List[List[str]] = []
+    headers = [
+        "Cluster",
+        "InstanceType",
+        "TotalNodes",
+        "AcceleratorDevicesAvailable",
+        "NodeHealthStatus=Schedulable",
+        "DeepHealthCheckStatus=Passed",
+    ]
 
-    # Process clusters in parallel with limited concurrency
-    if cluster_names:
-        with ThreadPoolExecutor(max_workers=len(cluster_names)) as executor:
-            futures = {}
-            counter = 0
+    if namespace is not None:
+        for ns in namespace:
+            headers.append(ns + TOTAL_ACCELERATOR_DEVICES_KEY)
+            headers.append(ns + AVAILABLE_ACCELERATOR_DEVICES_KEY)
 
-            for cluster_name in cluster_names[:50]:  # Limit to 50 clusters
-                future = executor.submit(
+    writer = _ClusterCapacityWriter(output, headers, namespace)
+
+    # Scan clusters on a fixed-size pool, writing each cluster as soon as it finishes
+    if cluster_names:
+        limiter = AdaptiveRateLimiter(rate=RATE_LIMIT, max_rate=MAX_RATE_LIMIT)
+        with ThreadPoolExecutor(max_workers=LIST_CLUSTER_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
                     rate_limited_operation,
                     cluster_name=cluster_name,
                     validator=validator,
                     sm_client=sm_client,
                     region=region,
-                    temp_config_file=f"{TEMP_KUBE_CONFIG_FILE}_{cluster_name}",
                     namespace=namespace,
-                )
-                futures[future] = cluster_name
+                    limiter=limiter,
+                ): cluster_name
+                for cluster_name in cluster_names
+            }
 
             for future in as_completed(futures):
                 cluster_name = futures[future]
                 try:
                     result = future.result()
                     if result:  # Only add if cluster processing was successful
-                        cluster_capacities.extend(result)
-                        counter += 1
+                        writer.write(result)
                 except Exception as e:
                     logger.error(f"Error processing cluster {cluster_name}: {e}")
 
-    headers = [
-        "Cluster",
-        "InstanceType",
-        "TotalNodes",
-        "AcceleratorDevicesAvailable",
-        "NodeHealthStatus=Schedulable",
-        "DeepHealthCheckStatus=Passed",
-    ]
+    writer.finish()
 
-    if namespace is not None:
-        for ns in namespace:
-            headers.append(ns + TOTAL_ACCELERATOR_DEVICES_KEY)
-            headers.append(ns + AVAILABLE_ACCELERATOR_DEVICES_KEY)
-    if output == OutputFormat.TABLE.value:
-        print(tabulate(cluster_capacities, headers=headers, tablefmt="presto"))
-    elif output == OutputFormat.JSON.value:
-        json_list = [dict(zip(headers, value)) for value in cluster_capacities]
-        json_list = _restructure_output(json_list, namespace)
-        print(json.dumps(json_list, indent=4))
+
+class _ClusterCapacityWriter:
+    """Write list-cluster rows in table or JSON format as each cluster finishes.
+
+    JSON elements are printed as soon as their cluster finishes. Table column
+    widths depend on every row, so table rows are collected and printed with
+    tabulate once all clusters finish.
+    """
+
+    def __init__(self, output, headers, namespace):
+        self.output = output
+        self.headers = headers
+        self.namespace = namespace
+        self.rows = []
+        self.written = 0
+
+    def write(self, rows):
+        if self.output == OutputFormat.TABLE.value:
+            self.rows.extend(rows)
+        elif self.output == OutputFormat.JSON.value:
+            json_list = [dict(zip(self.headers, value)) for value in rows]
+            for cluster in _restructure_output(json_list, self.namespace):
+                # Indent each element the way json.dumps(list, indent=4) would
+                element = json.dumps(cluster, indent=4).replace("\n", "\n    ")
+                print(("[\n    " if self.written == 0 else ",\n    ") + element, end="", flush=True)
+                self.written += 1
+
+    def finish(self):
+        if self.output == OutputFormat.TABLE.value:
+            print(tabulate(self.rows, headers=self.headers, tablefmt="presto"))
+        elif self.output == OutputFormat.JSON.value:
+            print("\n]" if self.written else "[]", flush=True)
 
 
-@sleep_and_retry
-@limits(calls=RATE_LIMIT, period=RATE_LIMIT_PERIOD)
 def rate_limited_operation(
     cluster_name: str,
     validator: ClusterValidator,
     sm_client: BaseClient,
     region: Optional[str],
-    temp_config_file: str,
     namespace: Optional[List[str]],
+    limiter: Optional[AdaptiveRateLimiter] = None,
 ) -> Optional[List[List[str]]]:
-    try:
-        cluster_capacities = []  # Initialize at the beginning
-        
-        # Get cluster details to check instance count
-        cluster_response = sm_client.describe_cluster(ClusterName=cluster_name)
-        cluster_status = cluster_response.get('ClusterStatus', 'Unknown')
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(rate=RATE_LIMIT, max_rate=MAX_RATE_LIMIT)
+
+    for attempt in range(1, THROTTLE_RETRY_ATTEMPTS + 1):
+        limiter.acquire()
+        try:
+            result = _get_cluster_capacities(
+                cluster_name, validator, sm_client, region, namespace
+            )
+            limiter.on_success()
+            return result
+        except Exception as e:
+            if is_throttling_error(e) and attempt < THROTTLE_RETRY_ATTEMPTS:
+                logger.debug(f"Throttled while processing cluster {cluster_name}, retrying...")
+                limiter.on_throttle()
+                continue
+            if isinstance(e, RuntimeError) and "not found" in str(e):
+                logger.debug(f"Skipping cluster {cluster_name}: {e}")
+            else:
+                logger.error(f"Error processing cluster {cluster_name}: {e}, continue...")
+            return None
+
+
+def _get_cluster_capacities(
+    cluster_name: str,
+    validator: ClusterValidator,
+    sm_client: BaseClient,
+    region: Optional[str],
+    namespace: Optional[List[str]],
+) -> Optional[List[List[str]]]:
+    cluster_capacities = []  # Initialize at the beginning
+    
+    # Get cluster details to check instance count
+    cluster_response = sm_client.describe_cluster(ClusterName=cluster_name)
+    cluster_status = cluster_response.get('ClusterStatus', 'Unknown')
+    
+    # Check if cluster has zero instances
+    instance_groups = cluster_response.get('InstanceGroups', [])
+    total_instances = sum(
+        group.get('CurrentCount', 0) for group in instance_groups
+    )
+    
+    # If cluster has 0 instances, add it with 0 nodes
+    if total_instances == 0:
+        logger.info(f"Adding cluster {cluster_name} with 0 instances (status: {cluster_status})")
+        zero_instance_row = [
+            cluster_name,
+            "N/A",  # InstanceType
+            0,      # TotalNodes
+            0,      # AcceleratorDevicesAvailable
+            0,      # NodeHealthStatus=Schedulable
+            "N/A",  # DeepHealthCheckStatus=Passed
+        ]
         
-        # Check if cluster has zero instances
-        instance_groups = cluster_response.get('InstanceGroups', [])
-        total_instances = sum(
-            group.get('CurrentCount', 0) for group in instance_groups
-        )
+        # Add namespace columns with 0 values
+        if namespace:
+            for ns in namespace:
+                zero_instance_row.extend([0, 0])  # Total and Available accelerator devices
         
-        # If cluster has 0 instances, add it with 0 nodes
-        if total_instances == 0:
-            logger.info(f"Adding cluster {cluster_name} with 0 instances (status: {cluster_status})")
-            zero_instance_row = [
-                cluster_name,
-                "N/A",  # InstanceType
-                0,      # TotalNodes
-                0,      # AcceleratorDevicesAvailable
-                0,      # NodeHealthStatus=Schedulable
-                "N/A",  # DeepHealthCheckStatus=Passed
-            ]
-            
-            # Add namespace columns with 0 values
-            if namespace:
-                for ns in namespace:
-                    zero_instance_row.extend([0, 0])  # Total and Available accelerator devices
-            
-            cluster_capacities.append(zero_instance_row)
-            return cluster_capacities
+        cluster_capacities.append(zero_instance_row)
+        return cluster_capacities
         
-        # Proceed with EKS validation for clusters with instances
-        eks_cluster_arn = validator.validate_cluster_and_get_eks_arn(
-            cluster_name, sm_client
-        )
-        if eks_cluster_arn is None:
-            logger.warning(
-                f"Cannot find EKS cluster behind {cluster_name}, continue..."
-            )
-            return None
-        eks_cluster_name = get_name_from_arn(eks_cluster_arn)
-        _update_kube_config(eks_cluster_name, region, temp_config_file)
-        k8s_client = KubernetesClient(config_file=temp_config_file)
-        nodes = k8s_client.list_node_with_temp_config(
-            temp_config_file, SAGEMAKER_HYPERPOD_NAME_LABEL
+    # Proceed with EKS validation for clusters with instances
+    eks_cluster_arn = validator.validate_cluster_and_get_eks_arn(
+        cluster_name, sm_client
+    )
+    if eks_cluster_arn is None:
+        logger.warning(
+            f"Cannot find EKS cluster behind {cluster_name}, continue..."
         )
-        nodes_info = _aggregate_nodes_info(nodes)
+        return None
+    eks_cluster_name = get_name_from_arn(eks_cluster_arn)
+    k8s_client = KubernetesClient(eks_name=eks_cluster_name, region=region)
+    nodes = k8s_client.list_nodes(SAGEMAKER_HYPERPOD_NAME_LABEL)
+    nodes_info = _aggregate_nodes_info(nodes, k8s_client)
+
+    ns_nominal_quota = {}
+    ns_quota_usage = {}
 
-        ns_nominal_quota = {}
-        ns_quota_usage = {}
+    if namespace:
+        for ns in namespace:
+            sm_managed_namespace = k8s_client.get_sagemaker_managed_namespace(ns)
+            if sm_managed_namespace:
+                quota_allocation_id = sm_managed_namespace.metadata.labels[
+                    SAGEMAKER_QUOTA_ALLOCATION_LABEL
+                ]
+                cluster_queue_name = (
+                    HYPERPOD_NAMESPACE_PREFIX
+                    + quota_allocation_id
+                    + SAGEMAKER_MANAGED_CLUSTER_QUEUE_SUFFIX
+                )
 
+                cluster_queue = k8s_client.get_cluster_queue(cluster_queue_name)
+                nominal_quota = _get_cluster_queue_nominal_quota(cluster_queue)
+                quota_usage = _get_cluster_queue_quota_usage(cluster_queue)
+                ns_nominal_quota[ns] = nominal_quota
+                ns_quota_usage[ns] = quota_usage
+            else:
+                ns_nominal_quota[ns] = {}
+                ns_quota_usage[ns] = {}
+
+    for instance_type, nodes_summary in nodes_info.items():
+        capacities = [
+            cluster_name,
+            instance_type,
+            nodes_summary["total_nodes"],
+            nodes_summary["accelerator_devices_available"],
+            nodes_summary["schedulable"],
+            nodes_summary["deep_health_check_passed"],
+        ]
         if namespace:
             for ns in namespace:
-                sm_managed_namespace = k8s_client.get_sagemaker_managed_namespace(ns)
-                if sm_managed_namespace:
-                    quota_allocation_id = sm_managed_namespace.metadata.labels[
-                        SAGEMAKER_QUOTA_ALLOCATION_LABEL
-                    ]
-                    cluster_queue_name = (
-                        HYPERPOD_NAMESPACE_PREFIX
-                        + quota_allocation_id
-                        + SAGEMAKER_MANAGED_CLUSTER_QUEUE_SUFFIX
-                    )
-
-                    cluster_queue = k8s_client.get_cluster_queue(cluster_queue_name)
-                    nominal_quota = _get_cluster_queue_nominal_quota(cluster_queue)
-                    quota_usage = _get_cluster_queue_quota_usage(cluster_queue)
-                    ns_nominal_quota[ns] = nominal_quota
-                    ns_quota_usage[ns] = quota_usage
-                else:
-                    ns_nominal_quota[ns] = {}
-                    ns_quota_usage[ns] = {}
-
-        for instance_type, nodes_summary in nodes_info.items():
-            capacities = [
-                cluster_name,
-                instance_type,
-                nodes_summary["total_nodes"],
-                nodes_summary["accelerator_devices_available"],
-                nodes_summary["schedulable"],
-                nodes_summary["deep_health_check_passed"],
-            ]
-            if namespace:
-                for ns in namespace:
-                    capacities.append(
-                        ns_nominal_quota.get(ns)
-                        .get(instance_type, {})
-                        .get(NVIDIA_GPU_RESOURCE_LIMIT_KEY, "N/A")
-                    )
-                    capacities.append(
-                        _get_available_quota(
-                            ns_nominal_quota.get(ns),
-                            ns_quota_usage.get(ns),
-                            instance_type,
-                            NVIDIA_GPU_RESOURCE_LIMIT_KEY,
-                        )
+                capacities.append(
+                    ns_nominal_quota.get(ns)
+                    .get(instance_type, {})
+                    .get(NVIDIA_GPU_RESOURCE_LIMIT_KEY, "N/A")
+                )
+                capacities.append(
+                    _get_available_quota(
+                        ns_nominal_quota.get(ns),
+                        ns_quota_usage.get(ns),
+                        instance_type,
+                        NVIDIA_GPU_RESOURCE_LIMIT_KEY,
                     )
-            cluster_capacities.append(capacities)
-        return cluster_capacities
-    except RuntimeError as e:
-        if "not found" in str(e):
-            logger.debug(f"Skipping cluster {cluster_name}: {e}")
-        else:
-            logger.error(f"Error processing cluster {cluster_name}: {e}, continue...")
-        return None
-    except Exception as e:
-        logger.error(f"Error processing cluster {cluster_name}: {e}, continue...")
-        return None
+                )
+        cluster_capacities.append(capacities)
+    return cluster_capacities
 
 
 def _get_cluster_queue_nominal_quota(cluster_queue):
@@ -424,11 +473,16 @@ def _get_available_quota(nominal, usage, flavor, resource_name):
 
 def _get_hyperpod_clusters(sm_client: boto3.client) -> List[str]:
     cluster_names: List[str] = []
-    response = sm_client.list_clusters()
-    if "ClusterSummaries" in response:
-        cluster_names = [
-            cluster["ClusterName"] for cluster in response["ClusterSummaries"]
-        ]
+    kwargs = {}
+    while True:
+        response = sm_client.list_clusters(**kwargs)
+        cluster_names.extend(
+            cluster["ClusterName"] for cluster in response.get("ClusterSummaries", [])
+        )
+        next_token = response.get("NextToken")
+        if not next_token:
+            break
+        kwargs["NextToken"] = next_token
 
     return cluster_names
 
@@ -466,10 +520,13 @@ def _restructure_output(summary_list, namespaces):
 
 def _aggregate_nodes_info(
     nodes: List[client.V1Node],
+    k8s_client: Optional[KubernetesClient] = None,
 ) -> Dict[str, Dict[str, Any]]:
     list_pods_service = ListPods()
     nodes_resource_allocated_dict = (
-        list_pods_service.list_pods_and_get_requested_resources_group_by_node_name()
+        list_pods_service.list_pods_and_get_requested_resources_group_by_node_name(
+            k8s_client
+        )
     )
     nodes_summary: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
 
@@ -1,5 +1,6 @@
 import click
 import json
+from botocore.config import Config
 from sagemaker.hyperpod.common.utils import create_boto3_client
 from typing import Optional
 from tabulate import tabulate
@@ -15,13 +16,34 @@ from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
 )
 from sagemaker.hyperpod.common.telemetry.constants import Feature
 from sagemaker.hyperpod.common.cli_decorators import handle_cli_exceptions
-from sagemaker.hyperpod.common.utils import display_formatted_logs
+from sagemaker.hyperpod.common.utils import display_formatted_log_stream
+from sagemaker.hyperpod.cli.common_utils import log_stream_options, wait_options, get_wait_options
+from sagemaker.hyperpod.cli.constants.command_constants import OutputFormat
+from sagemaker.hyperpod.inference.jumpstart_model_catalog import ensure_model_catalog, search_model_catalog
+
+
+# Deployment states that end `hyp create ... --wait`
+ENDPOINT_WAIT_STATES = ("DeploymentComplete", "DeploymentFailed")
+
+
+def _wait_for_endpoint(endpoint, timeout):
+    """Watch a newly created endpoint until its deployment completes or fails."""
+    name = endpoint.metadata.name
+    click.echo(f"Waiting for endpoint '{name}' to deploy...")
+    endpoint.wait_until(
+        lambda e: e.status is not None and e.status.state in ENDPOINT_WAIT_STATES,
+        timeout=timeout,
+    )
+    if endpoint.status.state == "DeploymentFailed":
+        raise Exception(f"Endpoint '{name}' deployment failed.")
+    click.echo(f"Endpoint '{name}' is deployed.")
 
 
 # CREATE
 @click.command("hyp-jumpstart-endpoint")
 @click.option("--version", default="1.2", help="Schema version to use")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
+@wait_options
 @generate_click_command(
     schema_pkg="hyperpod_jumpstart_inference_template",
     registry=JS_REG,
@@ -33,10 +55,15 @@ def js_create(version, debug, js_endpoint):
     click.echo(f"Using version: {version}")
     js_endpoint.create(debug=debug)
 
+    wait, wait_timeout = get_wait_options()
+    if wait:
+        _wait_for_endpoint(js_endpoint, wait_timeout)
+
 
 @click.command("hyp-custom-endpoint")
 @click.option("--version", default="1.2", help="Schema version to use")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
+@wait_options
 @generate_click_command(
     schema_pkg="hyperpod_custom_inference_template",
     registry=C_REG,
@@ -47,6 +74,10 @@ def custom_create(version, debug, custom_endpoint):
     """Create a custom model endpoint"""
     click.echo(f"Using version: {version}")
     custom_endpoint.create(debug=debug)
+
+    wait, wait_timeout = get_wait_options()
+    if wait:
+        _wait_for_endpoint(custom_endpoint, wait_timeout)
     
 
 # INVOKE
@@ -159,6 +190,89 @@ def js_list(
     click.echo(tabulate(rows, headers=headers, tablefmt="github"))
 
 
+@click.command("jumpstart-models")
+@click.option(
+    "--search",
+    type=click.STRING,
+    required=False,
+    help="Optional. Words to find in the model ID, name, description or search keywords.",
+)
+@click.option(
+    "--instance-type",
+    type=click.STRING,
+    required=False,
+    help="Optional. Only list models that can be deployed on this instance type, e.g. ml.g5.2xlarge.",
+)
+@click.option(
+    "--region",
+    type=click.STRING,
+    required=False,
+    help="Optional. The region of the SageMaker Public Hub. If not specified, it will be set to the region from the current AWS account credentials.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Optional. Sync the local model catalog with the hub before listing.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    required=False,
+    help="Optional. The maximum number of models to list.",
+)
+@click.option(
+    "--output",
+    type=click.Choice([c.value for c in OutputFormat]),
+    required=False,
+    default=OutputFormat.TABLE.value,
+    help="Optional. The output format. Available values are `TABLE` and `JSON`. The default value is `TABLE`.",
+)
+@_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "list_jumpstart_models_cli")
+@handle_cli_exceptions()
+def js_model_list(
+    search: Optional[str],
+    instance_type: Optional[str],
+    region: Optional[str],
+    refresh: bool,
+    limit: Optional[int],
+    output: str,
+):
+    """
+    List JumpStart models in the SageMaker Public Hub.
+    """
+    sagemaker_client = create_boto3_client(
+        "sagemaker",
+        region_name=region,
+        config=Config(retries={"max_attempts": 10, "mode": "adaptive"}),
+    )
+    ensure_model_catalog(sagemaker_client, refresh=refresh)
+    models = search_model_catalog(
+        sagemaker_client.meta.region_name,
+        search=search,
+        instance_type=instance_type,
+        limit=limit,
+    )
+
+    if output == OutputFormat.JSON.value:
+        click.echo(json.dumps(models, indent=4))
+        return
+    if not models:
+        click.echo("No models found")
+        return
+
+    headers = ["model_id", "name", "type", "default_instance_type"]
+    rows = [
+        [
+            model["model_id"],
+            model["display_name"] or "",
+            model["model_type"] or "",
+            model["default_instance_type"] or "",
+        ]
+        for model in models
+    ]
+    click.echo(tabulate(rows, headers=headers, tablefmt="github"))
+
+
 @click.command("hyp-custom-endpoint")
 @click.option(
     "--namespace",
@@ -666,22 +780,35 @@ def custom_list_pods(
     default="default",
     help="Optional. The namespace of the jumpstart model to get logs for. Default set to 'default'.",
 )
+@log_stream_options
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "get_logs_js_endpoint")
 @handle_cli_exceptions()
 def js_get_logs(
     pod_name: str,
     container: Optional[str],
     namespace: Optional[str],
+    follow: bool,
+    since_seconds: Optional[int],
+    tail_lines: Optional[int],
+    limit_bytes: Optional[int],
 ):
     """
     Get specific pod log for jumpstart model endpoint.
     """
     my_endpoint = HPJumpStartEndpoint.model_construct()
-    logs = my_endpoint.get_logs(pod=pod_name, container=container, namespace=namespace)
-    
+    log_lines = my_endpoint.stream_logs(
+        pod=pod_name,
+        container=container,
+        namespace=namespace,
+        follow=follow,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        limit_bytes=limit_bytes,
+    )
+
     # Use common log display utility for consistent formatting across all job types
     container_info = f" (container: {container})" if container else ""
-    display_formatted_logs(logs, title=f"JumpStart Endpoint Logs for {pod_name}{container_info}")
+    display_formatted_log_stream(log_lines, title=f"JumpStart Endpoint Logs for {pod_name}{container_info}")
 
 
 @click.command("hyp-custom-endpoint")
@@ -704,22 +831,35 @@ def js_get_logs(
     default="default",
     help="Optional. The namespace of the custom model to get logs for. Default set to 'default'.",
 )
+@log_stream_options
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "get_logs_custom_endpoint")
 @handle_cli_exceptions()
 def custom_get_logs(
     pod_name: str,
     container: Optional[str],
     namespace: Optional[str],
+    follow: bool,
+    since_seconds: Optional[int],
+    tail_lines: Optional[int],
+    limit_bytes: Optional[int],
 ):
     """
     Get specific pod log for custom model endpoint.
     """
     my_endpoint = HPEndpoint.model_construct()
-    logs = my_endpoint.get_logs(pod=pod_name, container=container, namespace=namespace)
-    
+    log_lines = my_endpoint.stream_logs(
+        pod=pod_name,
+        container=container,
+        namespace=namespace,
+        follow=follow,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        limit_bytes=limit_bytes,
+    )
+
     # Use common log display utility for consistent formatting across all job types
     container_info = f" (container: {container})" if container else ""
-    display_formatted_logs(logs, title=f"Custom Endpoint Logs for {pod_name}{container_info}")
+    display_formatted_log_stream(log_lines, title=f"Custom Endpoint Logs for {pod_name}{container_info}")
 
 
 @click.command("hyp-jumpstart-endpoint")
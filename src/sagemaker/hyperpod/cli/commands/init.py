@@ -4,7 +4,6 @@ import sys
 import shutil
 from pathlib import Path
 from datetime import datetime
-from jinja2 import Template
 from sagemaker.hyperpod.cli.constants.init_constants import (
     USAGE_GUIDE_TEXT_CFN,
     USAGE_GUIDE_TEXT_CRD,
@@ -28,6 +27,7 @@ from sagemaker.hyperpod.cli.init_utils import (
     is_dynamic_template
 )
 from sagemaker.hyperpod.common.utils import get_aws_default_region
+from sagemaker.hyperpod.common.templating import render_template
 from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
     _hyperpod_telemetry_emitter,
 )
@@ -435,8 +435,7 @@ def _create_standard_template(dir_path: Path, data: dict, template: str, version
 
     try:
         template_source = jinja_file.read_text()
-        tpl = Template(template_source)
-        rendered = tpl.render(**data)
+        rendered = render_template(template_source, data)
     except Exception as e:
         click.secho(f"❌  Failed to render template: {e}", fg="red")
         sys.exit(1)
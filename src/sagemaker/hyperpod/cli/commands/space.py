@@ -12,10 +12,33 @@ from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
 from sagemaker.hyperpod.common.telemetry.constants import Feature
 from sagemaker.hyperpod.cli.constants.space_constants import DEFAULT_SPACE_PORT
 from sagemaker.hyperpod.common.cli_decorators import handle_cli_exceptions
+from sagemaker.hyperpod.cli.common_utils import log_stream_options, wait_options, get_wait_options
+
+
+def _space_condition(space, condition_type):
+    """Status of the space condition of the given type, e.g. 'True', or '' if absent."""
+    for condition in (space.status or {}).get("conditions", []):
+        if condition.get("type") == condition_type:
+            return condition.get("status", "")
+    return ""
+
+
+def _wait_for_space(space, timeout):
+    """Watch a space until it becomes available or degraded."""
+    name = space.config.name
+    click.echo(f"Waiting for space '{name}' to become available...")
+    space.wait_until(
+        lambda s: "True" in (_space_condition(s, "Available"), _space_condition(s, "Degraded")),
+        timeout=timeout,
+    )
+    if _space_condition(space, "Available") != "True":
+        raise Exception(f"Space '{name}' is degraded.")
+    click.echo(f"Space '{name}' is available")
 
 
 @click.command("hyp-space")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
+@wait_options
 @generate_click_command(
     schema_pkg="hyperpod_space_template",
     registry=SCHEMA_REGISTRY,
@@ -30,6 +53,10 @@ def space_create(version, debug, config):
     space.create(debug=debug)
     click.echo(f"Space '{space_config.name}' created successfully in namespace '{space_config.namespace}'")
 
+    wait, wait_timeout = get_wait_options()
+    if wait:
+        _wait_for_space(space, wait_timeout)
+
 
 @click.command("hyp-space")
 @click.option("--namespace", "-n", required=False, default="default", help="Kubernetes namespace")
@@ -142,6 +169,7 @@ def space_update(version, config):
 @click.command("hyp-space")
 @click.option("--name", required=True, help="Name of the space")
 @click.option("--namespace", "-n", required=False, default="default", help="Kubernetes namespace")
+@wait_options
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "start_space")
 @handle_cli_exceptions()
 def space_start(name, namespace):
@@ -150,6 +178,10 @@ def space_start(name, namespace):
     current_space.start()
     click.echo(f"Space '{name}' start requested")
 
+    wait, wait_timeout = get_wait_options()
+    if wait:
+        _wait_for_space(current_space, wait_timeout)
+
 
 @click.command("hyp-space")
 @click.option("--name", required=True, help="Name of the space")
@@ -168,13 +200,22 @@ def space_stop(name, namespace):
 @click.option("--namespace", "-n", required=False, default="default", help="Kubernetes namespace")
 @click.option("--pod-name", required=False, help="Name of the pod to get logs from")
 @click.option("--container", required=False, help="Name of the container to get logs from")
+@log_stream_options
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "get_logs_for_space")
 @handle_cli_exceptions()
-def space_get_logs(name, namespace, pod_name, container):
+def space_get_logs(name, namespace, pod_name, container, follow, since_seconds, tail_lines, limit_bytes):
     """Get logs for a space resource."""
     current_space = HPSpace.get(name=name, namespace=namespace)
-    logs = current_space.get_logs(pod_name=pod_name, container=container)
-    click.echo(logs)
+    log_lines = current_space.stream_logs(
+        pod_name=pod_name,
+        container=container,
+        follow=follow,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        limit_bytes=limit_bytes,
+    )
+    for line in log_lines:
+        click.echo(line)
 
 
 @click.command("hyp-space")
@@ -1,4 +1,6 @@
 import click
+import json
+from typing import Optional
 from sagemaker.hyperpod.training.hyperpod_pytorch_job import HyperPodPytorchJob, list_accelerator_partition_types
 from sagemaker.hyperpod.common.config import Metadata
 from sagemaker.hyperpod.cli.training_utils import generate_click_command
@@ -8,12 +10,42 @@ from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
 )
 from sagemaker.hyperpod.common.telemetry.constants import Feature
 from sagemaker.hyperpod.common.cli_decorators import handle_cli_exceptions
-from sagemaker.hyperpod.common.utils import display_formatted_logs
+from sagemaker.hyperpod.common.utils import (
+    display_formatted_logs,
+    display_formatted_log_stream,
+)
+from sagemaker.hyperpod.common.pod_logs import LOG_AGGREGATION_MAX_WORKERS
+from sagemaker.hyperpod.common.pod_exec import (
+    EXEC_MAX_WORKERS,
+    EXEC_POD_TIMEOUT_SECONDS,
+)
+from sagemaker.hyperpod.cli.common_utils import (
+    log_stream_options,
+    wait_options,
+    get_wait_options,
+    sweep_options,
+    get_sweep_options,
+)
+
+
+# Job states that end `hyp create hyp-pytorch-job --wait`
+JOB_WAIT_STATES = ("Running", "Completed", "Failed")
+
+
+def _job_state(job) -> Optional[str]:
+    """Type of the most recent condition of the job whose status is True."""
+    if job.status and job.status.conditions:
+        for condition in reversed(job.status.conditions):
+            if condition.status == "True":
+                return condition.type
+    return None
 
 
 @click.command("hyp-pytorch-job")
 @click.option("--version", default="1.0", help="Schema version to use")
 @click.option("--debug", is_flag=True, help="Enable debug mode")
+@wait_options
+@sweep_options
 @generate_click_command(
     schema_pkg="hyperpod_pytorch_job_template",
     registry=SCHEMA_REGISTRY,
@@ -23,9 +55,40 @@ from sagemaker.hyperpod.common.utils import display_formatted_logs
 def pytorch_create(version, debug, job):
     """Create a PyTorch job"""
     click.echo(f"Using version: {version}")
+    wait, wait_timeout = get_wait_options()
+
+    sweep, manifest = get_sweep_options()
+    if sweep:
+        if wait:
+            raise click.UsageError("--wait cannot be used with --sweep")
+        _create_sweep(job, manifest, debug)
+        return
+
     # Create job
     job.create(debug=debug)
 
+    if wait:
+        click.echo(f"Waiting for job '{job.metadata.name}' to start...")
+        job.wait_until(lambda j: _job_state(j) in JOB_WAIT_STATES, timeout=wait_timeout)
+        state = _job_state(job)
+        if state == "Failed":
+            raise Exception(f"Job '{job.metadata.name}' failed.")
+        click.echo(f"Job '{job.metadata.name}' is {state}.")
+
+
+def _create_sweep(jobs, manifest: str, debug: bool):
+    """Create the jobs of a sweep and write the manifest of what was created."""
+    click.echo(f"Creating {len(jobs)} jobs from sweep...")
+    result = HyperPodPytorchJob.create_many(jobs, debug=debug)
+    with open(manifest, "w") as f:
+        json.dump(result.to_manifest(), f, indent=4)
+
+    click.echo(f"Created {len(result.created)} of {len(jobs)} jobs. Manifest written to {manifest}")
+    if result.failed:
+        for failure in result.failed:
+            click.echo(f"  {failure.namespace}/{failure.name}: {failure.error}", err=True)
+        raise Exception(f"{len(result.failed)} of {len(jobs)} jobs could not be created.")
+
 
 @click.command("hyp-pytorch-job")
 @click.option(
@@ -34,11 +97,20 @@ def pytorch_create(version, debug, job):
     default="default",
     help="Optional. The namespace to list jobs from. Defaults to 'default' namespace.",
 )
+@click.option(
+    "--all-namespaces",
+    "-A",
+    is_flag=True,
+    help="Optional. List jobs across all namespaces you can access.",
+)
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "list_pytorchjobs_cli")
 @handle_cli_exceptions()
-def list_jobs(namespace: str):
+def list_jobs(namespace: str, all_namespaces: bool):
     """List all HyperPod PyTorch jobs."""
-    jobs = HyperPodPytorchJob.list(namespace=namespace)
+    if all_namespaces:
+        jobs = HyperPodPytorchJob.list(all_namespaces=True)
+    else:
+        jobs = HyperPodPytorchJob.list(namespace=namespace)
 
     if not jobs:
         click.echo("No jobs found.")
@@ -269,7 +341,22 @@ def pytorch_list_pods(job_name: str, namespace: str):
     help="Required. Specify the job name for pod log retrieval.",
 )
 @click.option(
-    "--pod-name", required=True, help="Required. The name of the pod to get logs from."
+    "--pod-name",
+    required=False,
+    help="The name of the pod to get logs from. (Required: specify either --pod-name or --all-pods)",
+)
+@click.option(
+    "--all-pods",
+    is_flag=True,
+    default=False,
+    help="Get logs from all pods of the job, merged and prefixed with the pod name. (Required: specify either --pod-name or --all-pods)",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=LOG_AGGREGATION_MAX_WORKERS,
+    show_default=True,
+    help="Optional. Maximum number of pod logs read at the same time with --all-pods. With --follow every pod's log stays open, so at most this many pods can be followed.",
 )
 @click.option(
     "--namespace",
@@ -277,16 +364,49 @@ def pytorch_list_pods(job_name: str, namespace: str):
     default="default",
     help="Optional. The namespace of the job. Defaults to 'default' namespace.",
 )
+@log_stream_options
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "get_pytorchjob_logs_from_pod_cli")
 @handle_cli_exceptions()
-def pytorch_get_logs(job_name: str, pod_name: str, namespace: str):
+def pytorch_get_logs(
+    job_name: str,
+    pod_name: Optional[str],
+    all_pods: bool,
+    max_workers: int,
+    namespace: str,
+    follow: bool,
+    since_seconds: Optional[int],
+    tail_lines: Optional[int],
+    limit_bytes: Optional[int],
+):
     """Get specific pod log for Hyperpod Pytorch job."""
-    click.echo("Listing logs for pod: " + pod_name)
+    if (all_pods and pod_name) or not (all_pods or pod_name):
+        raise click.UsageError("Must specify exactly one of the following: --all-pods, --pod-name")
+
     job = HyperPodPytorchJob.get(name=job_name, namespace=namespace)
-    logs = job.get_logs_from_pod(pod_name=pod_name)
+
+    if all_pods:
+        click.echo("Listing logs for all pods of job: " + job_name)
+        log_lines = job.get_logs_all_pods(
+            follow=follow,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            limit_bytes_per_pod=limit_bytes,
+            max_workers=max_workers,
+        )
+        display_formatted_log_stream(log_lines, title=f"Pod Logs for {job_name}")
+        return
+
+    click.echo("Listing logs for pod: " + pod_name)
+    log_lines = job.stream_logs_from_pod(
+        pod_name=pod_name,
+        follow=follow,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+        limit_bytes=limit_bytes,
+    )
 
     # Use common log display utility for consistent formatting across all job types
-    display_formatted_logs(logs, title=f"Pod Logs for {pod_name}")
+    display_formatted_log_stream(log_lines, title=f"Pod Logs for {pod_name}")
 
 
 @click.command("hyp-pytorch-job")
@@ -316,13 +436,41 @@ Usage Format:
 @click.option("--all-pods", is_flag=True, help="Execute command in all pods associated with the job. (Required: specify either --pod or --all-pods)")
 @click.option("--namespace", "-n", default="default", help="Optional. The namespace of the job.")
 @click.option("--container", help="Optional. The container name to execute the command in.")
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=EXEC_MAX_WORKERS,
+    show_default=True,
+    help="Optional. Maximum number of pods running the command at the same time with --all-pods.",
+)
+@click.option(
+    "--timeout",
+    "timeout_seconds",
+    type=click.FloatRange(min=0, min_open=True),
+    default=EXEC_POD_TIMEOUT_SECONDS,
+    show_default=True,
+    help="Optional. Per-pod time limit in seconds with --all-pods.",
+)
 @click.argument("command", nargs=-1, required=True)
 @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "exec_pytorchjob_cli")
-def pytorch_exec(job_name: str, pod: str, all_pods: bool, namespace: str, container: str, command: tuple):
+def pytorch_exec(
+    job_name: str,
+    pod: str,
+    all_pods: bool,
+    namespace: str,
+    container: str,
+    max_workers: int,
+    timeout_seconds: float,
+    command: tuple,
+):
     """Execute commands in pods associated with a HyperPod PyTorch job."""
     if (all_pods and pod) or not (all_pods or pod):
         raise click.UsageError("Must specify exactly one of the following: --all-pods, --pod")
 
+    if all_pods:
+        _pytorch_exec_all_pods(job_name, namespace, container, max_workers, timeout_seconds, command)
+        return
+
     try:
         job = HyperPodPytorchJob.get(name=job_name, namespace=namespace)
         output = job.exec_command(list(command), pod, all_pods, container)
@@ -337,6 +485,43 @@ def pytorch_exec(job_name: str, pod: str, all_pods: bool, namespace: str, contai
         # Other errors (API, network, etc.)
         raise click.UsageError(f"Failed to execute command: {str(e)}")
 
+
+def _pytorch_exec_all_pods(
+    job_name: str,
+    namespace: str,
+    container: Optional[str],
+    max_workers: int,
+    timeout_seconds: float,
+    command: tuple,
+):
+    """Run a command in every pod of a job, streaming prefixed output and summarizing per pod."""
+    try:
+        job = HyperPodPytorchJob.get(name=job_name, namespace=namespace)
+        result = job.exec_command_all_pods(
+            list(command),
+            container=container,
+            on_output=lambda pod_name, line: click.echo(f"[{pod_name}] {line}"),
+            max_workers=max_workers,
+            timeout_seconds=timeout_seconds,
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    except Exception as e:
+        raise click.UsageError(f"Failed to execute command: {str(e)}")
+
+    click.echo()
+    click.echo(f"{'POD':<50}{'EXIT CODE':<12}{'DURATION':<12}ERROR")
+    for pod_result in result.pods:
+        exit_code = "-" if pod_result.exit_code is None else str(pod_result.exit_code)
+        duration = f"{pod_result.duration_seconds:.1f}s"
+        click.echo(f"{pod_result.pod:<50}{exit_code:<12}{duration:<12}{pod_result.error or ''}")
+
+    if not result.succeeded:
+        raise click.ClickException(
+            f"Command failed on {len(result.failed)} of {len(result.pods)} pods"
+        )
+
+
 @click.command("list-accelerator-partition-type")
 @click.option(
     "--instance-type",
@@ -1,8 +1,10 @@
+import os
 import sys
 from typing import Mapping, Type, List, Dict, Any
 import click
 import pkgutil
 import json
+import re
 
 JUMPSTART_SCHEMA = "hyperpod_jumpstart_inference_template"
 CUSTOM_SCHEMA = "hyperpod_custom_inference_template"
@@ -119,3 +121,198 @@ def categorize_resources_by_type(resources: List[Dict[str, Any]],
 
     # Remove empty categories
     return {k: v for k, v in categorized.items() if v}
+
+
+_DURATION_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration_seconds(value: str) -> int:
+    """
+    Parse a relative duration such as "30s", "5m", "2h" or "1h30m" into seconds.
+
+    Args:
+        value: Duration made of one or more <number><unit> parts, unit one of s, m, h, d
+
+    Returns:
+        Total number of seconds
+
+    Raises:
+        ValueError: If the duration is malformed or not positive
+    """
+    parts = re.findall(r"(\d+)([smhd])", value or "")
+    if not parts or "".join(n + u for n, u in parts) != value:
+        raise ValueError(
+            f"Invalid duration '{value}'. Use a number followed by s, m, h or d, e.g. 30s, 5m, 1h30m."
+        )
+    seconds = sum(int(number) * _DURATION_UNIT_SECONDS[unit] for number, unit in parts)
+    if seconds <= 0:
+        raise ValueError(f"Invalid duration '{value}'. Duration must be greater than zero.")
+    return seconds
+
+
+def _since_callback(ctx, param, value):
+    if value is None:
+        return None
+    try:
+        return parse_duration_seconds(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def log_stream_options(func):
+    """
+    Add the --follow, --since, --tail and --limit-bytes options shared by `hyp get-logs` commands.
+
+    The decorated command receives them as follow, since_seconds, tail_lines and limit_bytes.
+    """
+    options = [
+        click.option(
+            "--follow",
+            "-f",
+            is_flag=True,
+            default=False,
+            help="Optional. Keep streaming new log lines until the container exits.",
+        ),
+        click.option(
+            "--since",
+            "since_seconds",
+            type=click.STRING,
+            required=False,
+            callback=_since_callback,
+            help="Optional. Only return logs newer than a relative duration like 30s, 5m or 2h.",
+        ),
+        click.option(
+            "--tail",
+            "tail_lines",
+            type=click.IntRange(min=0),
+            required=False,
+            help="Optional. Only return this many lines from the end of the log.",
+        ),
+        click.option(
+            "--limit-bytes",
+            type=click.IntRange(min=1),
+            required=False,
+            help="Optional. Stop after this many bytes of log output.",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+# Default limit for `--wait` when --wait-timeout is not given
+DEFAULT_WAIT_TIMEOUT = "1h"
+
+
+def _store_wait_option(ctx, param, value):
+    if param.name == "wait_timeout" and value is not None:
+        try:
+            value = parse_duration_seconds(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+    ctx.meta[f"hyperpod.{param.name}"] = value
+    return value
+
+
+def wait_options(func):
+    """
+    Add the --wait and --wait-timeout options shared by create and start commands.
+
+    The options are not passed to the decorated command, because schema-generated
+    commands build their model from every argument they receive. Read them with
+    get_wait_options() instead.
+    """
+    options = [
+        click.option(
+            "--wait",
+            is_flag=True,
+            default=False,
+            expose_value=False,
+            callback=_store_wait_option,
+            help="Optional. Wait until the resource is ready or has failed, watching its status instead of polling.",
+        ),
+        click.option(
+            "--wait-timeout",
+            type=click.STRING,
+            default=DEFAULT_WAIT_TIMEOUT,
+            show_default=True,
+            expose_value=False,
+            callback=_store_wait_option,
+            help="Optional. How long --wait waits, as a duration like 30m or 2h.",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def get_wait_options():
+    """
+    Return (wait, timeout_seconds) from the --wait options of the running command.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return False, None
+    return ctx.meta.get("hyperpod.wait", False), ctx.meta.get("hyperpod.wait_timeout")
+
+
+def _store_sweep_option(ctx, param, value):
+    ctx.meta[f"hyperpod.{param.name}"] = value
+    return value
+
+
+def sweep_options(func):
+    """
+    Add the --sweep and --sweep-manifest options of create commands.
+
+    Like the --wait options they are not passed to the decorated command; read
+    them with get_sweep_options(). --sweep is processed before the other
+    options so that options declared with RequiredUnlessSweepOption may come
+    from the sweep file instead.
+    """
+    options = [
+        click.option(
+            "--sweep",
+            type=click.Path(exists=True, dir_okay=False),
+            is_eager=True,
+            expose_value=False,
+            callback=_store_sweep_option,
+            help="Optional. YAML file with a job configuration and a matrix of parameter values. "
+                 "Creates one job per combination; other options set defaults for every job.",
+        ),
+        click.option(
+            "--sweep-manifest",
+            type=click.Path(dir_okay=False, writable=True),
+            expose_value=False,
+            callback=_store_sweep_option,
+            help="Optional. Where to write the created job names and failures of a --sweep, "
+                 "as JSON. Defaults to <sweep file>.manifest.json.",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def get_sweep_options():
+    """
+    Return (sweep_file, manifest_file) from the --sweep options of the running command.
+
+    Both are None when --sweep is not given.
+    """
+    ctx = click.get_current_context(silent=True)
+    sweep = ctx.meta.get("hyperpod.sweep") if ctx is not None else None
+    if sweep is None:
+        return None, None
+    manifest = ctx.meta.get("hyperpod.sweep_manifest") or f"{os.path.splitext(sweep)[0]}.manifest.json"
+    return sweep, manifest
+
+
+class RequiredUnlessSweepOption(click.Option):
+    """Option that is only required when no --sweep file is given to provide it."""
+
+    def value_is_missing(self, value) -> bool:
+        ctx = click.get_current_context(silent=True)
+        if ctx is not None and ctx.meta.get("hyperpod.sweep") is not None:
+            return False
+        return super().value_is_missing(value)
@@ -39,6 +39,10 @@ DEEP_HEALTH_CHECK_STATUS_LABEL = "sagemaker.amazonaws.com/deep-health-check-stat
 SAGEMAKER_MANAGED_QUEUE_LABEL= "sagemaker.amazonaws.com/sagemaker-managed-queue"
 SAGEMAKER_QUOTA_ALLOCATION_LABEL = "sagemaker.amazonaws.com/quota-allocation-id"
 TEMP_KUBE_CONFIG_FILE = "/tmp/kubeconfig"
+EKS_TOKEN_PREFIX = "k8s-aws-v1."
+EKS_CLUSTER_ID_HEADER = "x-k8s-aws-id"
+# EKS accepts a presigned token for 15 minutes; refresh one minute early
+EKS_TOKEN_TTL_SECONDS = 14 * 60
 HYPERPOD_NAMESPACE_PREFIX = "hyperpod-ns-"
 SAGEMAKER_MANAGED_LOCAL_QUEUE_SUFFIX = "-localqueue"
 SAGEMAKER_MANAGED_CLUSTER_QUEUE_SUFFIX = "-clusterqueue"
@@ -14,3 +14,6 @@ PYTORCH_CUSTOM_OBJECT_GROUP = "kubeflow.org"
 PYTORCH_CUSTOM_OBJECT_PLURAL = "pytorchjobs"
 PYTORCH_CUSTOM_OBJECT_VERSION = "v1"
 HYPERPOD_PYTORCH_CRD_NAME = "hyperpodpytorchjobs.sagemaker.amazonaws.com"
+HYPERPOD_PYTORCH_CUSTOM_OBJECT_GROUP = "sagemaker.amazonaws.com"
+HYPERPOD_PYTORCH_CUSTOM_OBJECT_VERSION = "v1"
+HYPERPOD_PYTORCH_CUSTOM_OBJECT_PLURAL = "hyperpodpytorchjobs"
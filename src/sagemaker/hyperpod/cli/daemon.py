@@ -0,0 +1,505 @@
+"""
+``hyp daemon`` commands and the long-lived process behind them.
+
+The daemon imports the command tree once and then runs the commands forwarded
+by the ``hyp`` entry point (see sagemaker.hyperpod.cli.daemon_client) one at a
+time, with the caller's argv, environment and working directory, while the
+command's stdout and stderr are streamed back to the caller. Kubernetes and
+boto3 clients, connection pools, loaded kubeconfig and in-memory caches
+survive between commands.
+
+Process-wide state a command may change is put back after every command. The
+kubeconfig is reloaded when the kubeconfig files change, and the boto3 clients
+are rebuilt when the AWS environment or credential files change.
+"""
+
+import io
+import json
+import logging
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, Optional, Tuple
+
+import click
+
+from sagemaker.hyperpod.cli.daemon_client import (
+    DAEMON_COMMANDS,
+    connect_to_daemon,
+    get_build_id,
+    get_daemon_socket_path,
+    is_daemon_disabled,
+    is_private_directory,
+    request_daemon,
+    send_message,
+)
+from sagemaker.hyperpod.common.metadata_cache import set_metadata_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+# Seconds without forwarded commands after which the daemon exits
+DAEMON_IDLE_TIMEOUT_SECONDS = 30 * 60
+# Seconds `hyp daemon start` waits for the daemon to import the command tree
+DAEMON_START_TIMEOUT_SECONDS = 60
+# Seconds `hyp daemon stop` waits for the daemon to exit
+DAEMON_STOP_TIMEOUT_SECONDS = 10
+DAEMON_LOG_FILE_NAME = "daemon.log"
+
+# SDK classes that load the kubeconfig only once per process
+_KUBECONFIG_CLASSES = (
+    ("sagemaker.hyperpod.training.hyperpod_pytorch_job", "HyperPodPytorchJob"),
+    ("sagemaker.hyperpod.inference.hp_endpoint_base", "HPEndpointBase"),
+    ("sagemaker.hyperpod.space.hyperpod_space", "HPSpace"),
+    ("sagemaker.hyperpod.space.hyperpod_space_template", "HPSpaceTemplate"),
+)
+
+# Connection of the command that is running, see _ForwardedStream
+_current_session: Optional["_Session"] = None
+
+
+class _Session:
+    """Connection to the client whose command is running."""
+
+    def __init__(self, wfile, tty: Dict[str, bool]):
+        self._wfile = wfile
+        self._lock = threading.Lock()
+        self.tty = tty
+
+    def send(self, message: Dict[str, Any]) -> None:
+        # Commands may write from worker threads
+        with self._lock:
+            send_message(self._wfile, message)
+
+
+class _ForwardedStream(io.TextIOBase):
+    """
+    Replacement for sys.stdout and sys.stderr in the daemon.
+
+    Writes go to the client of the running command, or to the daemon's own
+    stream between commands. Installed once rather than per command so that
+    logging handlers created during a command keep writing to the right place.
+    """
+
+    def __init__(self, name: str, fallback):
+        self._name = name
+        self._fallback = fallback
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        session = _current_session
+        if session is None:
+            return self._fallback.write(text)
+        session.send({self._name: text})
+        return len(text)
+
+    def flush(self):
+        if _current_session is None:
+            self._fallback.flush()
+
+    def isatty(self):
+        session = _current_session
+        return session.tty.get(self._name, False) if session else False
+
+
+def _file_fingerprint(paths) -> Tuple:
+    fingerprint = []
+    for path in paths:
+        try:
+            fingerprint.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            fingerprint.append((path, None))
+    return tuple(fingerprint)
+
+
+def _kubeconfig_fingerprint() -> Tuple:
+    kubeconfig = os.environ.get("KUBECONFIG") or os.path.expanduser("~/.kube/config")
+    return _file_fingerprint(kubeconfig.split(os.pathsep))
+
+
+def _aws_fingerprint() -> Tuple:
+    environment = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("AWS_")))
+    files = _file_fingerprint((
+        os.environ.get("AWS_SHARED_CREDENTIALS_FILE") or os.path.expanduser("~/.aws/credentials"),
+        os.environ.get("AWS_CONFIG_FILE") or os.path.expanduser("~/.aws/config"),
+    ))
+    return environment, files
+
+
+def _reset_kubeconfig_flags() -> None:
+    """Make the SDK classes and the CLI client load the kubeconfig again on their next call."""
+    for module_name, class_name in _KUBECONFIG_CLASSES:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        pending = [getattr(module, class_name)]
+        while pending:
+            cls = pending.pop()
+            if "is_kubeconfig_loaded" in vars(cls):
+                cls.is_kubeconfig_loaded = False
+            pending.extend(cls.__subclasses__())
+    # The CLI's client singleton holds the ApiClient of the old kubeconfig
+    module = sys.modules.get("sagemaker.hyperpod.cli.clients.kubernetes_client")
+    if module is not None:
+        module.KubernetesClient._instance = None
+
+
+def _clear_telemetry_account() -> None:
+    """Resolve the telemetry region and account again on the next call."""
+    module = sys.modules.get("sagemaker.hyperpod.common.telemetry.telemetry_logging")
+    if module is not None:
+        module._get_cached_region_and_account.cache_clear()
+
+
+def _all_loggers():
+    return [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+
+
+def _logging_state() -> Dict[str, Tuple]:
+    return {
+        logger.name: (logger.level, list(logger.handlers), logger.propagate, logger.disabled)
+        for logger in _all_loggers()
+    }
+
+
+def _restore_logging(state: Dict[str, Tuple]) -> None:
+    # Commands add handlers and raise levels on every call; loggers created
+    # since the snapshot go back to the defaults of a fresh logger
+    for logger in _all_loggers():
+        level, handlers, propagate, disabled = state.get(logger.name, (logging.NOTSET, [], True, False))
+        logger.setLevel(level)
+        logger.handlers = list(handlers)
+        logger.propagate = propagate
+        logger.disabled = disabled
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # Like the interpreter, print a non-integer exit status and fail
+    sys.stderr.write(f"{code}\n")
+    return 1
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return
+        try:
+            self.server.hyp_daemon.handle(request, self.wfile)
+        except OSError:
+            # The client went away
+            pass
+
+
+class HypDaemon:
+    """
+    Serves forwarded ``hyp`` commands from one long-lived process.
+
+    Args:
+        socket_path: Socket to listen on, defaults to get_daemon_socket_path().
+        idle_timeout: Seconds without commands after which serve_forever
+            returns, 0 to serve until stopped.
+        command: Click command that runs forwarded argv, defaults to the
+            ``hyp`` command tree.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        idle_timeout: int = DAEMON_IDLE_TIMEOUT_SECONDS,
+        command: Optional[click.Command] = None,
+    ):
+        self.socket_path = socket_path or get_daemon_socket_path()
+        self.idle_timeout = idle_timeout
+        self.command = command
+        self.requests = 0
+        self._run_lock = threading.Lock()
+        self._server: Optional[_UnixServer] = None
+        self._started = time.monotonic()
+        self._last_request = self._started
+        self._ready = threading.Event()
+        self._logging_baseline: Dict[str, Tuple] = {}
+        self._forwarded_streams: Tuple = (sys.stdout, sys.stderr)
+        self._kubeconfig = _kubeconfig_fingerprint()
+        self._aws = _aws_fingerprint()
+
+    def _warm_up(self) -> None:
+        """Import every forwarded command so the first call does not pay for it."""
+        if self.command is None:
+            from sagemaker.hyperpod.cli.hyp_cli import cli
+
+            self.command = cli
+        for name in sorted(DAEMON_COMMANDS):
+            command = self.command.get_command(None, name) if isinstance(self.command, click.Group) else None
+            if not isinstance(command, click.Group):
+                continue
+            for subcommand in command.list_commands(None):
+                try:
+                    command.get_command(None, subcommand)
+                except Exception as e:
+                    logger.debug(f"Could not import 'hyp {name} {subcommand}': {e}")
+
+    def _bind(self) -> _UnixServer:
+        directory = os.path.dirname(self.socket_path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private_directory(directory):
+            raise click.ClickException(
+                f"{directory} must be owned by the current user and not accessible to others."
+            )
+        if os.path.exists(self.socket_path):
+            try:
+                connect_to_daemon(self.socket_path).close()
+            except OSError:
+                # Left behind by a daemon that did not shut down cleanly
+                os.unlink(self.socket_path)
+            else:
+                raise click.ClickException(f"A hyp daemon is already listening on {self.socket_path}")
+        server = _UnixServer(self.socket_path, _RequestHandler)
+        server.hyp_daemon = self
+        return server
+
+    def serve_forever(self) -> None:
+        """Import the command tree, then serve commands until stopped or idle."""
+        self._warm_up()
+        self._server = self._bind()
+        streams = sys.stdin, sys.stdout, sys.stderr
+        self._forwarded_streams = _ForwardedStream("stdout", streams[1]), _ForwardedStream("stderr", streams[2])
+        sys.stdout, sys.stderr = self._forwarded_streams
+        # Forwarded commands never prompt
+        sys.stdin = open(os.devnull)
+        self._logging_baseline = _logging_state()
+        if self.idle_timeout:
+            threading.Thread(target=self._stop_when_idle, name="hyp-daemon-idle", daemon=True).start()
+        self._ready.set()
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            sys.stdin.close()
+            sys.stdin, sys.stdout, sys.stderr = streams
+            self._server.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until serve_forever accepts connections."""
+        return self._ready.wait(timeout)
+
+    def shutdown(self) -> None:
+        """Stop serve_forever after the running command, if any, finishes."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _stop_when_idle(self) -> None:
+        while True:
+            time.sleep(1)
+            idle = time.monotonic() - self._last_request
+            if idle >= self.idle_timeout and not self._run_lock.locked():
+                logger.info(f"No commands for {self.idle_timeout} seconds, stopping")
+                self.shutdown()
+                return
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "socket": self.socket_path,
+            "uptime_seconds": int(time.monotonic() - self._started),
+            "requests": self.requests,
+            "idle_timeout_seconds": self.idle_timeout,
+        }
+
+    def handle(self, request: Dict[str, Any], wfile) -> None:
+        """Answer one request read from a client connection."""
+        op = request.get("op")
+        if op == "status":
+            send_message(wfile, {"status": self.status()})
+        elif op == "stop":
+            send_message(wfile, {"stopped": True})
+            # shutdown() waits for serve_forever, so it cannot run on a handler thread that it waits for
+            threading.Thread(target=self.shutdown, daemon=True).start()
+        elif op == "run":
+            if request.get("build") != get_build_id():
+                send_message(wfile, {"fallback": "the daemon runs another hyp installation"})
+                return
+            session = _Session(wfile, request.get("tty") or {})
+            with self._run_lock:
+                exit_code = self._run(request, session)
+                self._last_request = time.monotonic()
+            if exit_code is None:
+                send_message(wfile, {"fallback": f"cannot change to {request.get('cwd')}"})
+            else:
+                session.send({"exit": exit_code})
+        else:
+            send_message(wfile, {"error": f"Unknown request {op!r}"})
+
+    def _refresh_clients(self) -> None:
+        kubeconfig = _kubeconfig_fingerprint()
+        if kubeconfig != self._kubeconfig:
+            self._kubeconfig = kubeconfig
+            _reset_kubeconfig_flags()
+            _clear_telemetry_account()
+        aws = _aws_fingerprint()
+        if aws != self._aws:
+            self._aws = aws
+            _clear_telemetry_account()
+            if "sagemaker.hyperpod.common.utils" in sys.modules:
+                from sagemaker.hyperpod.common.utils import clear_boto3_client_cache
+
+                clear_boto3_client_cache()
+
+    def _run(self, request: Dict[str, Any], session: _Session) -> Optional[int]:
+        """Run a forwarded command, returning its exit code or None if it cannot run here."""
+        global _current_session
+        saved_env, saved_cwd, saved_argv = dict(os.environ), os.getcwd(), sys.argv
+        try:
+            os.chdir(request["cwd"])
+        except OSError:
+            return None
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = ["hyp"] + request["argv"]
+        _current_session = session
+        try:
+            self._refresh_clients()
+            self.command.main(args=request["argv"], prog_name="hyp")
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = _exit_code(e.code)
+        except BrokenPipeError:
+            exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            _current_session = None
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            # click wraps the streams after a broken pipe
+            sys.stdout, sys.stderr = self._forwarded_streams
+            set_metadata_cache_enabled(True)
+            _restore_logging(self._logging_baseline)
+            self.requests += 1
+        return exit_code
+
+
+def _check_supported() -> None:
+    if is_daemon_disabled():
+        raise click.ClickException(
+            "The hyp daemon is disabled by HYPERPOD_NO_DAEMON or not supported on this platform."
+        )
+
+
+def _wait_for(predicate, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@click.command("start")
+@click.option(
+    "--foreground",
+    is_flag=True,
+    help="Optional. Run the daemon in this process instead of in the background.",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.IntRange(min=0),
+    default=DAEMON_IDLE_TIMEOUT_SECONDS,
+    show_default=True,
+    help="Optional. Exit after this many seconds without commands, 0 to never exit.",
+)
+def daemon_start(foreground: bool, idle_timeout: int):
+    """Start a background process that serves read-only hyp commands from warm clients."""
+    _check_supported()
+    status = request_daemon("status")
+    if status is not None:
+        click.echo(f"hyp daemon is already running (pid {status['status']['pid']}).")
+        return
+
+    socket_path = get_daemon_socket_path()
+    if foreground:
+        daemon = HypDaemon(socket_path, idle_timeout=idle_timeout)
+        click.echo(f"Starting hyp daemon on {socket_path}")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    os.makedirs(os.path.dirname(socket_path), mode=0o700, exist_ok=True)
+    log_path = os.path.join(os.path.dirname(socket_path), DAEMON_LOG_FILE_NAME)
+    with open(log_path, "ab") as log_file:
+        process = subprocess.Popen(
+            [sys.executable, "-c", "from sagemaker.hyperpod.cli.hyp_cli import cli; cli()",
+             "daemon", "start", "--foreground", "--idle-timeout", str(idle_timeout)],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    started = _wait_for(
+        lambda: process.poll() is not None or request_daemon("status") is not None,
+        DAEMON_START_TIMEOUT_SECONDS,
+    )
+    if not started or process.poll() is not None:
+        raise click.ClickException(f"The hyp daemon did not start, see {log_path}")
+    # The daemon outlives this process, so it is never waited on
+    process.returncode = 0
+    click.echo(f"hyp daemon started (pid {process.pid}).")
+
+
+@click.command("stop")
+def daemon_stop():
+    """Stop the running hyp daemon."""
+    _check_supported()
+    if request_daemon("stop") is None:
+        click.echo("hyp daemon is not running.")
+        return
+    if not _wait_for(lambda: not os.path.exists(get_daemon_socket_path()), DAEMON_STOP_TIMEOUT_SECONDS):
+        raise click.ClickException("The hyp daemon did not stop in time.")
+    click.echo("hyp daemon stopped.")
+
+
+@click.command("status")
+def daemon_status():
+    """Show whether the hyp daemon is running and how many commands it served."""
+    _check_supported()
+    reply = request_daemon("status")
+    if reply is None:
+        click.echo("hyp daemon is not running.")
+        return
+    status = reply["status"]
+    click.echo(f"hyp daemon is running (pid {status['pid']}).")
+    click.echo(f"Socket: {status['socket']}")
+    click.echo(f"Uptime: {status['uptime_seconds']}s")
+    click.echo(f"Commands served: {status['requests']}")
@@ -0,0 +1,224 @@
+"""
+Entry point of the ``hyp`` command.
+
+When a daemon started with ``hyp daemon start`` is running, read-only commands
+are forwarded to it over a Unix domain socket together with the caller's
+environment and working directory, and its stdout and stderr are streamed
+back. The daemon keeps the command modules imported and the Kubernetes and
+boto3 clients and caches warm, so a forwarded command skips interpreter
+startup, imports, kubeconfig loading and the Kubernetes version check.
+
+Every other command, and every command when no daemon is running, runs in this
+process exactly as before. This module only imports the standard library so
+that forwarding stays cheap.
+
+Set ``HYPERPOD_NO_DAEMON=1`` to never forward, and ``HYPERPOD_DAEMON_SOCKET``
+to use another socket path.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, TextIO
+
+DAEMON_SOCKET_FILE_NAME = "daemon.sock"
+# Top-level commands forwarded to the daemon. They only read cluster state,
+# never prompt and finish on their own, so the daemon can run them one at a
+# time; ``--follow`` log streams stay in-process.
+DAEMON_COMMANDS = frozenset({
+    "list",
+    "describe",
+    "list-pods",
+    "get-logs",
+    "get-operator-logs",
+    "list-cluster",
+    "get-cluster-context",
+    "get-monitoring",
+    "list-accelerator-partition-type",
+})
+# Seconds to wait for a running daemon to accept a connection
+DAEMON_CONNECT_TIMEOUT_SECONDS = 1
+
+
+def is_daemon_disabled() -> bool:
+    """Whether forwarding is turned off with ``HYPERPOD_NO_DAEMON`` or unsupported on this platform."""
+    no_daemon = os.environ.get("HYPERPOD_NO_DAEMON", "").strip().lower()
+    return no_daemon in ("1", "true", "yes") or not hasattr(socket, "AF_UNIX")
+
+
+def get_daemon_socket_path() -> str:
+    """Location of the daemon socket, in a directory only the current user can access."""
+    path = os.environ.get("HYPERPOD_DAEMON_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"hyperpod-{os.getuid()}", DAEMON_SOCKET_FILE_NAME)
+
+
+def is_private_directory(path: str) -> bool:
+    """Whether the directory is owned by the current user and closed to everyone else."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def get_build_id() -> str:
+    """
+    Identify the installed CLI.
+
+    The daemon only serves clients with the same interpreter and installation,
+    so a daemon left running across an upgrade is not used.
+    """
+    return f"{sys.executable}:{os.path.realpath(__file__)}:{os.stat(__file__).st_mtime_ns}"
+
+
+def send_message(wfile, message: Dict[str, Any]) -> None:
+    """Write one newline-delimited JSON message and flush it."""
+    wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+    wfile.flush()
+
+
+def connect_to_daemon(
+    socket_path: Optional[str] = None, timeout: float = DAEMON_CONNECT_TIMEOUT_SECONDS
+) -> socket.socket:
+    """
+    Connect to a running daemon.
+
+    Raises:
+        OSError: If no daemon is listening on the socket or its directory is
+            not private to the current user.
+    """
+    socket_path = socket_path or get_daemon_socket_path()
+    if not is_private_directory(os.path.dirname(socket_path)):
+        raise FileNotFoundError(f"No private hyp daemon socket at {socket_path}")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+def request_daemon(op: str, socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Send a control request such as ``status`` or ``stop`` to the daemon.
+
+    Returns:
+        The daemon's reply, or None if no daemon is running.
+    """
+    try:
+        sock = connect_to_daemon(socket_path)
+    except OSError:
+        return None
+    with sock:
+        try:
+            send_message(sock.makefile("wb"), {"op": op})
+            line = sock.makefile("rb").readline()
+        except OSError:
+            return None
+    return json.loads(line) if line else None
+
+
+def _is_forwardable(argv: List[str]) -> bool:
+    if is_daemon_disabled():
+        return False
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command not in DAEMON_COMMANDS:
+        return False
+    return not any(arg in ("-f", "--follow") for arg in argv)
+
+
+def _isatty(stream: TextIO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def forward_command(
+    argv: List[str],
+    socket_path: Optional[str] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """
+    Run a ``hyp`` command in the daemon, streaming its output to stdout and stderr.
+
+    Args:
+        argv: Arguments after ``hyp``.
+        socket_path: Daemon socket, defaults to get_daemon_socket_path().
+        stdout: Stream for the command's stdout, defaults to sys.stdout.
+        stderr: Stream for the command's stderr, defaults to sys.stderr.
+
+    Returns:
+        The command's exit code, or None if the command must run in-process
+        because it is not forwarded, no daemon is running or the daemon
+        declined it.
+    """
+    if not _is_forwardable(argv):
+        return None
+    try:
+        sock = connect_to_daemon(socket_path)
+    except OSError:
+        return None
+
+    streams = {"stdout": stdout or sys.stdout, "stderr": stderr or sys.stderr}
+    env = dict(os.environ)
+    if _isatty(streams["stdout"]):
+        # Tables are laid out for the caller's terminal, not the daemon's
+        columns, lines = os.get_terminal_size(streams["stdout"].fileno())
+        env.setdefault("COLUMNS", str(columns))
+        env.setdefault("LINES", str(lines))
+    request = {
+        "op": "run",
+        "build": get_build_id(),
+        "argv": argv,
+        "env": env,
+        "cwd": os.getcwd(),
+        "tty": {name: _isatty(stream) for name, stream in streams.items()},
+    }
+
+    received_output = False
+    with sock:
+        try:
+            send_message(sock.makefile("wb"), request)
+            for line in sock.makefile("rb"):
+                message = json.loads(line)
+                if "exit" in message:
+                    return message["exit"]
+                if "fallback" in message:
+                    return None
+                for name, stream in streams.items():
+                    if name in message:
+                        stream.write(message[name])
+                        stream.flush()
+                        received_output = True
+        except KeyboardInterrupt:
+            streams["stderr"].write("Aborted!\n")
+            return 1
+        except OSError:
+            pass
+
+    if not received_output:
+        # The daemon went away before the command started, run it here instead
+        return None
+    streams["stderr"].write("Error: lost connection to the hyp daemon\n")
+    return 1
+
+
+def main() -> None:
+    """Console script entry point for ``hyp``."""
+    exit_code = forward_command(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from sagemaker.hyperpod.cli.hyp_cli import cli
+
+    cli(prog_name="hyp")
@@ -1,67 +1,12 @@
 import click
-from typing import Union
+import importlib
+from typing import Dict, Optional, Union
+from click.utils import make_default_short_help
 from importlib.metadata import version, PackageNotFoundError
 import copy
 
-from sagemaker.hyperpod.cli.commands.cluster import list_cluster, set_cluster_context, get_cluster_context, \
-    get_monitoring, describe_cluster
-from sagemaker.hyperpod.cli.commands.cluster_stack import create_cluster_stack, describe_cluster_stack, \
-    list_cluster_stacks, update_cluster, delete_cluster_stack
-from sagemaker.hyperpod.cli.commands.training import (
-    pytorch_create,
-    list_jobs,
-    pytorch_describe,
-    pytorch_delete,
-    pytorch_list_pods,
-    pytorch_get_logs,
-    pytorch_get_operator_logs,
-    pytorch_exec,
-    list_accelerator_partition_type,
-)
-from sagemaker.hyperpod.cli.commands.inference import (
-    js_create,
-    custom_create,
-    custom_invoke,
-    js_list,
-    custom_list,
-    js_describe,
-    custom_describe,
-    js_delete,
-    custom_delete,
-    js_list_pods,
-    custom_list_pods,
-    js_get_logs,
-    custom_get_logs,
-    js_get_operator_logs,
-    custom_get_operator_logs,
-)
-from sagemaker.hyperpod.cli.commands.space import (
-    space_create,
-    space_list,
-    space_describe,
-    space_delete,
-    space_update,
-    space_start,
-    space_stop,
-    space_get_logs,
-    space_portforward,
-)
-from sagemaker.hyperpod.cli.commands.space_template import (
-    space_template_create,
-    space_template_list,
-    space_template_describe,
-    space_template_delete,
-    space_template_update,
-)
-from sagemaker.hyperpod.cli.commands.space_access import space_access_create
-
-from sagemaker.hyperpod.cli.commands.init import (
-    init,
-    reset,
-    validate,
-    configure,
-    _default_create
-)
+from sagemaker.hyperpod.cli.command_manifest import COMMAND_MANIFEST, LazyCommand
+from sagemaker.hyperpod.common.metadata_cache import set_metadata_cache_enabled
 
 
 def get_package_version(package_name):
@@ -87,11 +32,9 @@ def print_version(ctx, param, value):
     ctx.exit()
 
 
-@click.group(context_settings={'max_content_width': 200})
-@click.option('--version', is_flag=True, callback=print_version, expose_value=False, is_eager=True,
-              help='Show version information')
-def cli():
-    pass
+def disable_metadata_cache(ctx, param, value):
+    if value:
+        set_metadata_cache_enabled(False)
 
 
 class CLICommand(click.Group):
@@ -105,14 +48,86 @@ class CLICommand(click.Group):
         #  - user didn't ask for help
         if self.default_cmd:
             # any non-flag token that is a known subcommand?
-            has_subcmd = any((not a.startswith("-")) and (a in self.commands) for a in args)
+            has_subcmd = any((not a.startswith("-")) and (a in self.list_commands(ctx)) for a in args)
             asked_for_help = any(a in ("-h", "--help") for a in args)
             if (not has_subcmd) and (not asked_for_help):
                 args = [self.default_cmd] + args
         return super().parse_args(ctx, args)
 
 
-@cli.group(cls=CLICommand, default_cmd='_default_create')
+class LazyCLICommand(CLICommand):
+    """
+    CLICommand whose subcommands are imported on first use.
+
+    Subcommands are described by a mapping of command name to LazyCommand (see
+    sagemaker.hyperpod.cli.command_manifest). The command module is imported
+    only when click resolves that command, and help listings are rendered from
+    the manifest without importing anything.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, LazyCommand]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._load_command(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        spec = self.lazy_commands[cmd_name]
+        module_name, attr_name = spec.import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if spec.help is not None:
+            # Aliases share the underlying command but carry their own help text
+            command = copy.copy(command)
+            command.help = spec.help
+        if spec.hidden:
+            command.hidden = True
+        return command
+
+    def format_commands(self, ctx, formatter):
+        # Same layout as click.Group.format_commands, but unresolved commands
+        # take their summary from the manifest instead of being imported.
+        commands = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                cmd = self.commands[name]
+                if cmd.hidden:
+                    continue
+                commands.append((name, cmd, None))
+            else:
+                spec = self.lazy_commands[name]
+                if spec.hidden:
+                    continue
+                commands.append((name, None, spec.short_help))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _, _ in commands)
+            rows = []
+            for name, cmd, short_help in commands:
+                if cmd is not None:
+                    rows.append((name, cmd.get_short_help_str(limit)))
+                else:
+                    rows.append((name, make_default_short_help(short_help, limit) if short_help else ""))
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["hyp"],
+             context_settings={'max_content_width': 200})
+@click.option('--version', is_flag=True, callback=print_version, expose_value=False, is_eager=True,
+              help='Show version information')
+@click.option('--no-cache', is_flag=True, callback=disable_metadata_cache, expose_value=False, is_eager=True,
+              help='Call AWS for cluster and add-on metadata instead of using cached responses')
+def cli():
+    pass
+
+
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["create"], default_cmd='_default_create')
 def create():
     """
     Create endpoints, pytorch jobs, cluster stacks, space, space access or space admin config.
@@ -129,174 +144,83 @@ def create():
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["list"])
 def list():
     """List endpoints, pytorch jobs, cluster stacks, spaces, and space templates."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["describe"])
 def describe():
     """Describe endpoints, pytorch jobs or cluster stacks, spaces or space template."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["update"])
 def update():
     """Update an existing HyperPod cluster configuration, space, or space template."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["delete"])
 def delete():
     """Delete endpoints, pytorch jobs, space, space access or space template."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["start"])
 def start():
     """Start space resources."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["stop"])
 def stop():
     """Stop space resources."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["portforward"])
 def portforward():
     """Port forward for space resources."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["list-pods"])
 def list_pods():
     """List pods for endpoints, pytorch jobs, or recipe jobs."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["get-logs"])
 def get_logs():
     """Get pod logs for endpoints, pytorch jobs or spaces."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["invoke"])
 def invoke():
     """Invoke model endpoints."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["get-operator-logs"])
 def get_operator_logs():
     """Get operator logs for endpoints."""
     pass
 
 
-@cli.group(cls=CLICommand)
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["exec"])
 def exec():
     """Execute commands in pods for endpoints, pytorch jobs, or recipe jobs."""
     pass
 
 
-cli.add_command(init)
-cli.add_command(reset)
-cli.add_command(configure)
-cli.add_command(validate)
-
-create.add_command(pytorch_create)
-# create.add_command(create_recipe_job_interactive)
-create.add_command(js_create)
-create.add_command(custom_create)
-
-_default_create.hidden = True
-create.add_command(_default_create)
-create.add_command(space_create)
-create.add_command(space_template_create)
-create.add_command(space_access_create)
-
-list.add_command(list_jobs)
-recipe_list_cmd = copy.copy(list_jobs)
-recipe_list_cmd.help = "List all HyperPod recipe jobs"
-list.add_command(recipe_list_cmd, name="hyp-recipe-job")
-list.add_command(js_list)
-list.add_command(custom_list)
-list.add_command(list_cluster_stacks)
-list.add_command(space_list)
-list.add_command(space_template_list)
-
-describe.add_command(pytorch_describe)
-recipe_describe_cmd = copy.copy(pytorch_describe)
-recipe_describe_cmd.help = "Describe a HyperPod recipe job."
-describe.add_command(recipe_describe_cmd, name="hyp-recipe-job")
-describe.add_command(js_describe)
-describe.add_command(custom_describe)
-describe.add_command(describe_cluster_stack)
-
-describe.add_command(describe_cluster)
-describe.add_command(space_describe)
-describe.add_command(space_template_describe)
-
-update.add_command(update_cluster)
-update.add_command(space_update)
-update.add_command(space_template_update)
-
-delete.add_command(pytorch_delete)
-recipe_delete_cmd = copy.copy(pytorch_delete)
-recipe_delete_cmd.help = "Delete a HyperPod recipe job."
-delete.add_command(recipe_delete_cmd, name="hyp-recipe-job")
-delete.add_command(js_delete)
-delete.add_command(custom_delete)
-delete.add_command(delete_cluster_stack)
-delete.add_command(space_delete)
-delete.add_command(space_template_delete)
-
-start.add_command(space_start)
-
-stop.add_command(space_stop)
-
-list_pods.add_command(pytorch_list_pods)
-recipe_list_pods_cmd = copy.copy(pytorch_list_pods)
-recipe_list_pods_cmd.help = "List all HyperPod PyTorch pods related to the recipe job."
-list_pods.add_command(recipe_list_pods_cmd, name="hyp-recipe-job")
-list_pods.add_command(js_list_pods)
-list_pods.add_command(custom_list_pods)
-
-get_logs.add_command(pytorch_get_logs)
-recipe_get_logs_cmd = copy.copy(pytorch_get_logs)
-recipe_get_logs_cmd.help = "Get specific pod log for HyperPod recipe job."
-get_logs.add_command(recipe_get_logs_cmd, name="hyp-recipe-job")
-get_logs.add_command(js_get_logs)
-get_logs.add_command(custom_get_logs)
-get_logs.add_command(space_get_logs)
-
-portforward.add_command(space_portforward)
-
-get_operator_logs.add_command(pytorch_get_operator_logs)
-recipe_get_operator_logs_cmd = copy.copy(pytorch_get_operator_logs)
-recipe_get_operator_logs_cmd.help = "Get operator logs for HyperPod recipe jobs."
-get_operator_logs.add_command(recipe_get_operator_logs_cmd, name="hyp-recipe-job")
-get_operator_logs.add_command(js_get_operator_logs)
-get_operator_logs.add_command(custom_get_operator_logs)
-
-invoke.add_command(custom_invoke)
-jumpstart_invoke_cmd = copy.copy(custom_invoke)
-jumpstart_invoke_cmd.help = "Invoke a jumpstart model endpoint."
-invoke.add_command(jumpstart_invoke_cmd, name="hyp-jumpstart-endpoint")
-
-cli.add_command(list_cluster)
-cli.add_command(set_cluster_context)
-cli.add_command(get_cluster_context)
-cli.add_command(get_monitoring)
-# cli.add_command(create_cluster_stack) # Not supported yet
-cli.add_command(list_accelerator_partition_type)
-
-exec.add_command(pytorch_exec)
-recipe_exec_cmd = copy.copy(pytorch_exec)
-recipe_exec_cmd.help = "Execute commands in pods associated with a HyperPod recipe job."
-exec.add_command(recipe_exec_cmd, name="hyp-recipe-job")
+@cli.group(cls=LazyCLICommand, lazy_commands=COMMAND_MANIFEST["daemon"])
+def daemon():
+    """Run a background process that keeps hyp clients and caches warm between commands."""
+    pass
+
 
 if __name__ == "__main__":
     cli()
@@ -6,12 +6,14 @@ import yaml
 import click
 import boto3
 import sys
-from jinja2 import Template
 from kubernetes import client, config
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 from sagemaker.hyperpod.cli.init_utils import load_dynamic_schema
 from sagemaker.hyperpod.cli.type_handler_utils import is_undefined_value
+from sagemaker.hyperpod.common.hub_cache import PUBLIC_HUB_NAME, get_hub_content_document, get_recipe_index
+from sagemaker.hyperpod.common.metadata_cache import cached_api_call
+from sagemaker.hyperpod.common.templating import render_template
 
 _KIND_PLURALS = {
     "ingress": "ingresses",
@@ -69,16 +71,25 @@ def _parse_hub_content_arn(arn: str) -> dict:
     return params
 
 
-def _fetch_recipe_from_private_hub(sagemaker_client, hub_content_arn: str) -> Dict[str, Any]:
-    """Fetch hub content document using a Hub Content ARN."""
+def _hub_content_arn_args(hub_content_arn: str) -> Tuple[str, str, str, Optional[str]]:
+    """Validate a Hub Content ARN and return its hub, type, name and version."""
     if not _is_hub_content_arn(hub_content_arn):
         raise ValueError(
             f"Invalid Hub Content ARN format: '{hub_content_arn}'. "
             f"Expected format: arn:aws:sagemaker:<region>:<account>:hub-content/<hub>/<type>/<name>"
         )
     params = _parse_hub_content_arn(hub_content_arn)
-    response = sagemaker_client.describe_hub_content(**params)
-    return json.loads(response.get('HubContentDocument', '{}'))
+    return (
+        params["HubName"],
+        params["HubContentType"],
+        params["HubContentName"],
+        params.get("HubContentVersion"),
+    )
+
+
+def _fetch_recipe_from_private_hub(sagemaker_client, hub_content_arn: str) -> Dict[str, Any]:
+    """Fetch hub content document using a Hub Content ARN."""
+    return get_hub_content_document(sagemaker_client, *_hub_content_arn_args(hub_content_arn))
 
 
 def _resolve_huggingface_model_id(sagemaker_client, hf_model_id: str) -> str:
@@ -91,8 +102,10 @@ def _resolve_huggingface_model_id(sagemaker_client, hf_model_id: str) -> str:
     raw = hf_model_id.split('/')[-1].lower()
     search_term = re.sub(r'[^a-z0-9\-]', '-', raw).strip('-')
 
-    response = sagemaker_client.list_hub_contents(
-        HubName='SageMakerPublicHub',
+    response = cached_api_call(
+        sagemaker_client,
+        "list_hub_contents",
+        HubName=PUBLIC_HUB_NAME,
         HubContentType='Model',
         NameContains=search_term,
         MaxResults=20,
@@ -124,19 +137,13 @@ def _fetch_recipe_from_hub(sagemaker_client, model_id: str, job_type: str, techn
     - Hub Content ARN via --model-id (e.g. arn:aws:sagemaker:...)
     """
     if _is_hub_content_arn(model_id):
-        hub_content_doc = _fetch_recipe_from_private_hub(sagemaker_client, model_id)
+        recipe_index = get_recipe_index(sagemaker_client, *_hub_content_arn_args(model_id))
     else:
         if is_huggingface:
             resolved_id = _resolve_huggingface_model_id(sagemaker_client, model_id)
         else:
             resolved_id = model_id
-        response = sagemaker_client.describe_hub_content(
-            HubName="SageMakerPublicHub",
-            HubContentType="Model",
-            HubContentName=resolved_id,
-        )
-        hub_content_doc = json.loads(response.get('HubContentDocument', '{}'))
-    recipe_collection = hub_content_doc.get('RecipeCollection', [])
+        recipe_index = get_recipe_index(sagemaker_client, PUBLIC_HUB_NAME, "Model", resolved_id)
 
     if not technique:
         raise ValueError("technique is required. Supported values: SFT, DPO, RLAIF, RLVR, CPT, PPO, deterministic, LLMAJ")
@@ -145,30 +152,18 @@ def _fetch_recipe_from_hub(sagemaker_client, model_id: str, job_type: str, techn
     technique_lower = technique.lower()
     technique = _TECHNIQUE_ALIASES.get(technique_lower, technique.upper() if technique_lower not in _TECHNIQUE_ALIASES else technique)
 
-    # Filter recipes by technique
-    matching_recipes = [
-        r for r in recipe_collection
-        if (r.get('CustomizationTechnique') or '').upper() == technique.upper()
-        or r.get('EvaluationType') == technique
-    ]
+    matching_recipes = recipe_index.recipes(technique)
     
     if not matching_recipes:
-        available = set()
-        for r in recipe_collection:
-            available.add(r.get('CustomizationTechnique') or r.get('EvaluationType') or '(none)')
-        raise ValueError(f"No recipe found for technique: {technique}. Available: {sorted(available)}")
+        raise ValueError(f"No recipe found for technique: {technique}. Available: {sorted(recipe_index.techniques())}")
     
     # If instance type is provided, find recipe that supports it
     if instance_type:
-        for recipe in matching_recipes:
-            if instance_type in recipe.get('SupportedInstanceTypes', []):
-                return recipe
-        
-        # If no recipe supports the instance type, collect all supported types
-        all_supported = set()
-        for recipe in matching_recipes:
-            all_supported.update(recipe.get('SupportedInstanceTypes', []))
+        recipe = recipe_index.recipe(technique, instance_type)
+        if recipe is not None:
+            return recipe
         
+        all_supported = recipe_index.instance_types(technique)
         raise ValueError(f"Instance type {instance_type} not supported. Supported: {sorted(all_supported)}")
     
     # Return first matching recipe if no instance type specified
@@ -320,8 +315,7 @@ def _submit_k8s_resources(custom_api, rendered_yaml: str) -> None:
 
 def _render_k8s_template(template_content: str, config_data: Dict[str, Any]) -> str:
     """Render Kubernetes template with configuration data."""
-    template = Template(template_content)
-    return template.render(**config_data)
+    return render_template(template_content, config_data)
 
 
 def _collect_all_parameters_interactively(spec: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,17 +11,24 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import concurrent
+import os
 import sys
 import copy
+from kubernetes import config
 from kubernetes.client.rest import ApiException
 from sagemaker.hyperpod.cli.clients.kubernetes_client import KubernetesClient
 from sagemaker.hyperpod.cli.service.get_namespaces import GetNamespaces
 from sagemaker.hyperpod.cli.service.self_subject_access_review import SelfSubjectAccessReview
+from sagemaker.hyperpod.cli.service.self_subject_rules_review import SelfSubjectRulesReview
 from sagemaker.hyperpod.cli.utils import setup_logger
+from sagemaker.hyperpod.common.metadata_cache import get_cached_value, put_cached_value
 
 
 logger = setup_logger(__name__)
 
+# Seconds discovered namespaces and per-namespace permission rules are reused across commands
+NAMESPACE_DISCOVERY_CACHE_TTL_SECONDS = 300
+
 class DiscoverNamespaces:
     def __init__(self):
         return
@@ -39,15 +46,32 @@ class DiscoverNamespaces:
             return context_namespace
         
         try:
-            if only_sm_managed:
-                namespaces = GetNamespaces().get_sagemaker_managed_namespaces()
-            else:
-                namespaces = GetNamespaces().get_namespaces()
+            identity = _kube_identity()
+            cache_key = None
+            if identity is not None:
+                cache_key = [
+                    "accessible-namespaces",
+                    identity,
+                    only_sm_managed,
+                    _resource_attributes_key(resource_attributes_template),
+                ]
+            discovered_namespaces = get_cached_value(cache_key) if cache_key else None
+
+            if discovered_namespaces is None:
+                if only_sm_managed:
+                    namespaces = GetNamespaces().get_sagemaker_managed_namespaces()
+                else:
+                    namespaces = GetNamespaces().get_namespaces()
 
-            discovered_namespaces = self.get_namespaces_by_checking_access_permission(
-                namespaces,
-                resource_attributes_template,
-            )
+                discovered_namespaces = self.get_namespaces_by_checking_access_permission(
+                    namespaces,
+                    resource_attributes_template,
+                )
+                # Empty results are not cached so newly granted access is picked up right away
+                if cache_key and discovered_namespaces:
+                    put_cached_value(
+                        cache_key, discovered_namespaces, NAMESPACE_DISCOVERY_CACHE_TTL_SECONDS
+                    )
 
             if len(discovered_namespaces) == 0:
                 logger.error("Found no accessible namespaces. Please ask for cluster admin for assistance or specify value of namespace explicitly in the command.")
@@ -72,17 +96,33 @@ class DiscoverNamespaces:
             max_workers=10
         ):
         """
-        Get the accessible namespaces by performing the SelfSubjectAccessReview. For each of the namespace,
-        check if user has specified permission to it, if the answer is NO, the namespace will be skipped.
+        Get the accessible namespaces by checking the user's permissions in each namespace. Namespaces
+        where the user lacks the requested permission are skipped.
 
-        Performing access check can take quite long if the number of namespaces is large. Thus the implementation
-        leverages the multi-threading to ensure that multiple access check can be performed in parallel.
+        Each namespace costs one SelfSubjectRulesReview, which returns every action the user may perform
+        there and is cached per kube context, so later checks for other verbs or resources are answered
+        locally. A SelfSubjectAccessReview is only sent for namespaces whose rules are unavailable or
+        incomplete, such as when a webhook authorizer grants access that RBAC rules do not show.
+        Reviews run on multiple threads since clusters can have many namespaces.
         """
-        subject_access_review = SelfSubjectAccessReview()
+        namespace_rules = self.get_namespace_rules(namespaces, max_workers=max_workers)
+
         accessible_namespaces = list()
+        namespaces_to_review = list()
+        for namespace in namespaces:
+            rules = namespace_rules.get(namespace)
+            if rules is not None and _rules_allow(rules, resource_attributes_template):
+                accessible_namespaces.append(namespace)
+            elif rules is None or rules["incomplete"]:
+                namespaces_to_review.append(namespace)
+
+        if not namespaces_to_review:
+            return accessible_namespaces
+
+        subject_access_review = SelfSubjectAccessReview()
         resource_attributes = list()
 
-        for namespace in namespaces:
+        for namespace in namespaces_to_review:
             resource_attribute = copy.deepcopy(resource_attributes_template)
             resource_attribute.namespace = namespace
             resource_attributes.append(resource_attribute)
@@ -105,4 +145,111 @@ class DiscoverNamespaces:
                 except Exception as e:
                     raise(e)
 
-        return accessible_namespaces
\ No newline at end of file
+        return accessible_namespaces
+
+    def get_namespace_rules(self, namespaces, max_workers=10):
+        """
+        Get the user's permission rules in each namespace, reusing cached rules for the current kube
+        context. Namespaces whose rules cannot be reviewed are left out of the returned dict.
+        """
+        identity = _kube_identity()
+        namespace_rules = dict()
+        namespaces_to_review = list()
+
+        for namespace in namespaces:
+            rules = get_cached_value(["namespace-rules", identity, namespace]) if identity else None
+            if rules is not None:
+                namespace_rules[namespace] = rules
+            else:
+                namespaces_to_review.append(namespace)
+
+        if not namespaces_to_review:
+            return namespace_rules
+
+        subject_rules_review = SelfSubjectRulesReview()
+
+        def review(namespace):
+            try:
+                return _rules_from_review(subject_rules_review.self_subject_rules_review(namespace))
+            except ApiException as e:
+                logger.debug(f"SelfSubjectRulesReview failed for namespace {namespace}: {e.reason}")
+                return None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for namespace, rules in zip(namespaces_to_review, executor.map(review, namespaces_to_review)):
+                if rules is None:
+                    continue
+                namespace_rules[namespace] = rules
+                if identity:
+                    put_cached_value(
+                        ["namespace-rules", identity, namespace],
+                        rules,
+                        NAMESPACE_DISCOVERY_CACHE_TTL_SECONDS,
+                    )
+
+        return namespace_rules
+
+
+def _kube_identity():
+    """The current kube context, cluster, user and AWS profile, or None if kubeconfig cannot be read."""
+    try:
+        _, active_context = config.list_kube_config_contexts()
+    except Exception:
+        return None
+    context = active_context.get("context") or {}
+    return [
+        active_context.get("name"),
+        context.get("cluster"),
+        context.get("user"),
+        os.environ.get("AWS_PROFILE"),
+    ]
+
+
+def _resource_attributes_key(resource_attributes):
+    return [
+        getattr(resource_attributes, field, None)
+        for field in ("verb", "group", "resource", "subresource", "name", "version")
+    ]
+
+
+def _rules_from_review(response):
+    status = response.status
+    return {
+        "incomplete": bool(status.incomplete),
+        "resource_rules": [
+            {
+                "verbs": rule.verbs or [],
+                "api_groups": rule.api_groups or [],
+                "resources": rule.resources or [],
+                "resource_names": rule.resource_names or [],
+            }
+            for rule in status.resource_rules or []
+        ],
+    }
+
+
+def _rules_allow(rules, resource_attributes):
+    """Evaluate the review's resource rules the way Kubernetes RBAC matches a request."""
+    verb = resource_attributes.verb
+    group = resource_attributes.group or ""
+    resource = resource_attributes.resource
+    subresource = resource_attributes.subresource
+    name = resource_attributes.name
+    requested = f"{resource}/{subresource}" if subresource else resource
+
+    for rule in rules["resource_rules"]:
+        if "*" not in rule["verbs"] and verb not in rule["verbs"]:
+            continue
+        if "*" not in rule["api_groups"] and group not in rule["api_groups"]:
+            continue
+        resources = rule["resources"]
+        if not (
+            "*" in resources
+            or requested in resources
+            or (subresource and f"*/{subresource}" in resources)
+        ):
+            continue
+        if rule["resource_names"] and name not in rule["resource_names"]:
+            continue
+        return True
+    return False
@@ -10,7 +10,8 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from typing import Optional
+from typing import Iterator, Optional
+from sagemaker.hyperpod.common.metadata_cache import cached_api_call
 from sagemaker.hyperpod.common.utils import create_boto3_client
 
 from sagemaker.hyperpod.cli.clients.kubernetes_client import (
@@ -46,6 +47,48 @@ class GetLogs:
         Get logs for pod asscoited with the training job
         """
         k8s_client = KubernetesClient()
+        namespace = self._resolve_training_job_pod(job_name, pod_name, namespace)
+        try:
+            return k8s_client.get_logs_for_pod(pod_name, namespace)
+        except ApiException as e:
+            raise RuntimeError(f"Unexpected API error: {e.reason} ({e.status})")
+
+    def stream_training_job_logs(
+        self,
+        job_name: str,
+        pod_name: str,
+        namespace: Optional[str],
+        follow: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Stream logs line by line for pod associated with the training job
+        """
+        k8s_client = KubernetesClient()
+        namespace = self._resolve_training_job_pod(job_name, pod_name, namespace)
+        try:
+            return k8s_client.stream_logs_for_pod(
+                pod_name,
+                namespace,
+                follow=follow,
+                since_seconds=since_seconds,
+                tail_lines=tail_lines,
+                limit_bytes=limit_bytes,
+            )
+        except ApiException as e:
+            raise RuntimeError(f"Unexpected API error: {e.reason} ({e.status})")
+
+    def _resolve_training_job_pod(
+        self,
+        job_name: str,
+        pod_name: str,
+        namespace: Optional[str],
+    ) -> str:
+        """
+        Resolve the namespace and check the pod belongs to the training job
+        """
         list_pods_service = ListPods()
 
         if not namespace:
@@ -63,13 +106,13 @@ class GetLogs:
             pods_for_training_job = list_pods_service.list_pods_for_training_job(
                 job_name, namespace, False
             )
-            if pod_name not in pods_for_training_job:
-                raise RuntimeError(
-                    f"Given pod name {pod_name} is not associated with training job {job_name} in namespace {namespace}"
-                )
-            return k8s_client.get_logs_for_pod(pod_name, namespace)
         except ApiException as e:
             raise RuntimeError(f"Unexpected API error: {e.reason} ({e.status})")
+        if pod_name not in pods_for_training_job:
+            raise RuntimeError(
+                f"Given pod name {pod_name} is not associated with training job {job_name} in namespace {namespace}"
+            )
+        return namespace
     
     def generate_cloudwatch_link(
         self,
@@ -129,7 +172,7 @@ class GetLogs:
         return console_prefix + log_group_prefix + log_stream
 
     def is_container_insights_addon_enabled(self, eks_cluster_name):
-        response = create_boto3_client("eks").list_addons(clusterName=eks_cluster_name, maxResults=50)
+        response = cached_api_call(create_boto3_client("eks"), "list_addons", clusterName=eks_cluster_name, maxResults=50)
         if AMAZON_ClOUDWATCH_OBSERVABILITY in response.get('addons', []):
             return True
         else:
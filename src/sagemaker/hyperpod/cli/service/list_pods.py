@@ -66,13 +66,19 @@ class ListPods:
 
     def list_pods_and_get_requested_resources_group_by_node_name(
         self,
+        k8s_client: Optional[KubernetesClient] = None,
     ):
         """
         List pods for all namespaces and initialized by kubeflow.
         Group by the node_name of the pod and the value is the
         accelerator devices resources requested
+
+        Args:
+            k8s_client (Optional[KubernetesClient]): Client of the cluster to read
+                pods from. Defaults to the client for the current kubeconfig context.
         """
-        k8s_client = KubernetesClient()
+        if k8s_client is None:
+            k8s_client = KubernetesClient()
 
         label_filter = f"training.kubeflow.org/job-name"
         pods = k8s_client.list_pods_in_all_namespaces_with_labels(label_filter)
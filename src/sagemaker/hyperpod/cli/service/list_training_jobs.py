@@ -10,8 +10,9 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
+import itertools
 import json
 from datetime import datetime
 
@@ -54,15 +55,13 @@ class ListTrainingJobs:
         logger.debug(namespace)
         try:
             if all_namespaces:
-                namespaces: List[str] = k8s_client.list_namespaces()
-                for _namespace in namespaces:
-                    _jobs = k8s_client.list_training_jobs(
-                        namespace=_namespace,
-                        label_selector=selector,
-                    )
-                    if _jobs.get("items") and len(_jobs.get("items")) > 0:
-                        for _job in _jobs.get("items"):
-                            jobs.append(_job)
+                # Pages are summarized as they arrive instead of being held until the last one
+                pages = k8s_client.list_training_job_pages_for_all_namespaces(
+                    label_selector=selector,
+                )
+                return self._generate_list_training_job_output(
+                    itertools.chain.from_iterable(pages), output
+                )
             else:
                 if not namespace:
                     resource_attributes_template = V1ResourceAttributes(
@@ -89,7 +88,7 @@ class ListTrainingJobs:
 
         return self._generate_list_training_job_output(jobs, output)
 
-    def _generate_list_training_job_output(self, jobs: List, output: Optional[str]):
+    def _generate_list_training_job_output(self, jobs: Iterable, output: Optional[str]):
         output_jobs = {"jobs": []}
         priority_header_required = False
 
@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from sagemaker.hyperpod.cli.clients.kubernetes_client import (
+    KubernetesClient,
+)
+from kubernetes.client import (
+    V1SelfSubjectRulesReview,
+    V1SelfSubjectRulesReviewSpec,
+)
+
+
+class SelfSubjectRulesReview:
+    def __init__(self):
+        return
+
+    def self_subject_rules_review(self, namespace):
+        """
+        Submit self subject rules review, returning every action the user may perform in the namespace
+        """
+        auth_v1_api = KubernetesClient().get_auth_v1_api()
+
+        rules_review = V1SelfSubjectRulesReview(
+            spec=V1SelfSubjectRulesReviewSpec(namespace=namespace)
+        )
+
+        response = auth_v1_api.create_self_subject_rules_review(body=rules_review)
+
+        return response
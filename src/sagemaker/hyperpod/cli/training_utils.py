@@ -4,7 +4,15 @@ import click
 from typing import Callable, Optional, Mapping, Type, Dict, Any
 from pydantic import ValidationError
 import sys
-from sagemaker.hyperpod.cli.common_utils import extract_version_from_args, get_latest_version, load_schema_for_version
+from click.core import ParameterSource
+from sagemaker.hyperpod.cli.common_utils import (
+    RequiredUnlessSweepOption,
+    extract_version_from_args,
+    get_latest_version,
+    get_sweep_options,
+    load_schema_for_version,
+)
+from sagemaker.hyperpod.training.sweep_util import expand_sweep, load_sweep_file
 
 
 def generate_click_command(
@@ -90,18 +98,17 @@ def generate_click_command(
             # Filter out None values to avoid passing them to the model
             filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
 
+            sweep_file, _ = get_sweep_options()
+            if sweep_file is not None:
+                # One domain object per sweep variant, all validated before any is created
+                return func(version, debug, _build_sweep_domains(Model, sweep_file, filtered_kwargs))
+
             try:
                 flat = Model(**filtered_kwargs)
                 domain = flat.to_domain()
             except ValidationError as e:
-                error_messages = []
-                for err in e.errors():
-                    loc = ".".join(str(x) for x in err["loc"])
-                    msg = err["msg"]
-                    error_messages.append(f"  – {loc}: {msg}")
-                
                 raise click.UsageError(
-                    f"❌ Configuration validation errors:\n" + "\n".join(error_messages)
+                    "❌ Configuration validation errors:\n" + "\n".join(f"  – {line}" for line in _validation_error_lines(e))
                 )
 
             # call your handler
@@ -194,6 +201,7 @@ def generate_click_command(
 
             wrapped_func = click.option(
                 f"--{name.replace('_','-')}",
+                cls=RequiredUnlessSweepOption,
                 required=(name in reqs),
                 default=spec.get("default", None),
                 show_default=("default" in spec),
@@ -204,3 +212,46 @@ def generate_click_command(
         return wrapped_func
 
     return decorator
+
+
+def _validation_error_lines(e: ValidationError):
+    for err in e.errors():
+        loc = ".".join(str(x) for x in err["loc"])
+        yield f"{loc}: {err['msg']}"
+
+
+def _build_sweep_domains(Model: Type, sweep_file: str, cli_kwargs: Dict[str, Any]) -> list:
+    """Expand a sweep file and convert every variant to its domain object.
+
+    Options given on the command line override the sweep file's job
+    configuration, and other option defaults only fill keys it leaves out.
+    """
+    try:
+        job, matrix = load_sweep_file(sweep_file)
+    except (OSError, ValueError) as e:
+        raise click.UsageError(f"❌ Invalid sweep file: {e}")
+
+    ctx = click.get_current_context()
+    explicit = {
+        k: v for k, v in cli_kwargs.items()
+        if ctx.get_parameter_source(k) == ParameterSource.COMMANDLINE
+    }
+    defaults = {k: v for k, v in cli_kwargs.items() if k not in explicit}
+    try:
+        variants = expand_sweep({**defaults, **job, **explicit}, matrix)
+    except Exception as e:
+        raise click.UsageError(f"❌ Invalid sweep file: {e}")
+
+    domains = []
+    error_messages = []
+    for index, variant in enumerate(variants):
+        try:
+            domains.append(Model(**variant).to_domain())
+        except ValidationError as e:
+            name = variant.get("job_name", f"#{index}")
+            error_messages.extend(f"  – [{name}] {line}" for line in _validation_error_lines(e))
+    if error_messages:
+        raise click.UsageError(
+            "❌ Configuration validation errors:\n" + "\n".join(error_messages)
+        )
+    return domains
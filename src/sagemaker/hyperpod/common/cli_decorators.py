@@ -11,19 +11,34 @@ from kubernetes.client.exceptions import ApiException
 
 logger = logging.getLogger(__name__)
 
+# Timeout for the LIST that checks whether any resources exist after a 404
+RESOURCE_EXISTENCE_PROBE_TIMEOUT_SECONDS = 5
+
+# (API server, namespace) pairs confirmed to exist, so the error path does not check them again
+_existing_namespaces = set()
+
 def _namespace_exists(namespace: str) -> bool:
     """
     Check if a namespace exists using KubernetesClient.
     Uses lazy initialization to avoid import-time failures.
+    Namespaces found to exist are remembered for the rest of the process,
+    per API server so a process that switches cluster context checks again.
     """
     try:
         from sagemaker.hyperpod.cli.clients.kubernetes_client import KubernetesClient
+        from sagemaker.hyperpod.common.utils import get_shared_api_client
         k8s_client = KubernetesClient()
-        return k8s_client.check_if_namespace_exists(namespace)
+        key = (get_shared_api_client().configuration.host, namespace)
+        if key in _existing_namespaces:
+            return True
+        exists = k8s_client.check_if_namespace_exists(namespace)
     except Exception as e:
         logger.debug(f"Failed to check namespace existence: {e}")
         # If we can't check, assume it exists to avoid false negatives
         return True
+    if exists:
+        _existing_namespaces.add(key)
+    return exists
 
 def _check_training_operator_exists() -> bool:
     """
@@ -722,45 +737,71 @@ def _get_list_command_from_resource_type(raw_resource_type: str) -> str:
     # raw_resource_type is already in the correct format (e.g., "resource-type")
     return f"hyp list hyp-{raw_resource_type}"
 
+def _get_custom_object_for_resource_type(raw_resource_type: str):
+    """
+    Map a resource type from a command name (e.g., "pytorch-job") to the
+    (group, version, plural, namespaced) of the custom resource it manages.
+    Returns None for resource types that are not backed by a custom resource.
+    """
+    from sagemaker.hyperpod.cli.constants.pytorch_constants import (
+        HYPERPOD_PYTORCH_CUSTOM_OBJECT_GROUP,
+        HYPERPOD_PYTORCH_CUSTOM_OBJECT_VERSION,
+        HYPERPOD_PYTORCH_CUSTOM_OBJECT_PLURAL,
+    )
+    from sagemaker.hyperpod.cli.constants.space_constants import SPACE_GROUP, SPACE_VERSION, SPACE_PLURAL
+    from sagemaker.hyperpod.cli.constants.space_template_constants import (
+        SPACE_TEMPLATE_GROUP,
+        SPACE_TEMPLATE_VERSION,
+        SPACE_TEMPLATE_PLURAL,
+    )
+    from sagemaker.hyperpod.inference.config.constants import (
+        INFERENCE_GROUP,
+        INFERENCE_API_VERSION,
+        JUMPSTART_MODEL_PLURAL,
+        INFERENCE_ENDPOINT_CONFIG_PLURAL,
+    )
+
+    pytorch_job = (
+        HYPERPOD_PYTORCH_CUSTOM_OBJECT_GROUP,
+        HYPERPOD_PYTORCH_CUSTOM_OBJECT_VERSION,
+        HYPERPOD_PYTORCH_CUSTOM_OBJECT_PLURAL,
+        True,
+    )
+    return {
+        "pytorch-job": pytorch_job,
+        "recipe-job": pytorch_job,
+        "jumpstart-endpoint": (INFERENCE_GROUP, INFERENCE_API_VERSION, JUMPSTART_MODEL_PLURAL, True),
+        "custom-endpoint": (INFERENCE_GROUP, INFERENCE_API_VERSION, INFERENCE_ENDPOINT_CONFIG_PLURAL, True),
+        "space": (SPACE_GROUP, SPACE_VERSION, SPACE_PLURAL, True),
+        "space-template": (SPACE_TEMPLATE_GROUP, SPACE_TEMPLATE_VERSION, SPACE_TEMPLATE_PLURAL, False),
+    }.get(raw_resource_type)
+
 def _check_resources_exist(raw_resource_type: str, namespace: str) -> bool:
     """
-    Check if any resources exist in namespace - template-agnostic CLI approach.
-    Uses the existing CLI commands to check for resource existence without importing template classes.
+    Check if any resources exist in namespace with a single LIST limited to one item,
+    issued in-process through the shared KubernetesClient.
     Returns True if resources exist, False if no resources, None if unable to determine.
     """
+    custom_object = _get_custom_object_for_resource_type(raw_resource_type)
+    if custom_object is None:
+        logger.debug(f"No custom resource known for {raw_resource_type}")
+        return None
+    group, version, plural, namespaced = custom_object
+
+    # A missing namespace cannot hold resources; the proactive check usually already confirmed it exists
+    if namespaced and namespace != "default" and not _namespace_exists(namespace):
+        return False
+
     try:
-        import subprocess
-        
-        # Construct the list command that already exists (use hyp directly)
-        cmd = ["hyp", "list", f"hyp-{raw_resource_type}"]
-        if namespace != "default":
-            cmd.extend(["--namespace", namespace])
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,  
-            timeout=15,  # 15 second timeout
-            check=False  # Don't raise on non-zero exit
+        from sagemaker.hyperpod.cli.clients.kubernetes_client import KubernetesClient
+
+        return KubernetesClient().has_custom_objects(
+            group=group,
+            version=version,
+            plural=plural,
+            namespace=namespace if namespaced else None,
+            request_timeout=RESOURCE_EXISTENCE_PROBE_TIMEOUT_SECONDS,
         )
-        
-        if result.returncode == 0 and result.stdout.strip():
-            # Check if output contains any data rows (simple heuristic: more than 2 lines means header + separator + data)
-            lines = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-            
-            # If we have more than 2 lines, likely we have: header + separator + at least one data row
-            # This is much simpler and more reliable than parsing the table format
-            has_data = len(lines) > 2
-            
-            return has_data
-        
-        # If command failed or no output, assume no resources
-        logger.debug(f"List command failed or returned no data. Return code: {result.returncode}")
-        return False
-        
-    except subprocess.TimeoutExpired:
-        logger.debug(f"List command timed out for {raw_resource_type}")
-        return None
     except Exception as e:
         logger.debug(f"Failed to check resource existence for {raw_resource_type}: {e}")
         return None
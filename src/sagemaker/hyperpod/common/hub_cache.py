@@ -0,0 +1,288 @@
+"""Disk cache for SageMaker Hub content documents.
+
+Recipe jobs and JumpStart endpoints read the ``HubContentDocument`` of a model
+with ``describe_hub_content``, a large JSON document that one ``hyp init``,
+``configure`` and ``create`` session fetches and parses several times. A
+published hub content version never changes, so parsed documents are stored
+under ``~/.cache/hyperpod/hub`` keyed by region, hub, content type, name and
+``HubContentVersion``, in ``marshal`` form, which loads several times faster
+than the JSON and takes less space.
+
+Lookups without a version resolve the latest version first. The answer is
+remembered in the metadata cache for ``HUB_CONTENT_VERSION_TTL_SECONDS`` and
+then revalidated with ``list_hub_content_versions``, whose response is a few
+hundred bytes, so the document is only fetched again when a new version is
+published.
+
+Documents of private hubs are also keyed by the caller's access key. Clients
+whose region or credentials cannot be determined, ``hyp --no-cache`` and
+``HYPERPOD_NO_CACHE=1`` bypass the cache, and any cache failure falls back to
+calling the service.
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from sagemaker.hyperpod.common.metadata_cache import (
+    get_cache_dir,
+    get_cached_value,
+    is_metadata_cache_enabled,
+    put_cached_value,
+)
+
+logger = logging.getLogger(__name__)
+
+PUBLIC_HUB_NAME = "SageMakerPublicHub"
+# Seconds a resolved latest version is used before it is checked again
+HUB_CONTENT_VERSION_TTL_SECONDS = 60 * 60
+HUB_CACHE_DIR_NAME = "hub"
+
+# Recipe indexes of documents loaded in this process, by document key
+_recipe_indexes: Dict[str, "RecipeIndex"] = {}
+_recipe_indexes_lock = threading.Lock()
+
+
+class RecipeIndex:
+    """Recipes of a hub content document by technique and instance type.
+
+    A recipe matches a technique when its ``CustomizationTechnique`` equals
+    it ignoring case, or its ``EvaluationType`` equals it exactly. Matches
+    keep their order in the document's ``RecipeCollection``.
+
+    Args:
+        recipes (List[Dict[str, Any]]): The document's ``RecipeCollection``
+    """
+
+    def __init__(self, recipes: List[Dict[str, Any]]):
+        self._recipes = recipes
+        self._by_customization: Dict[str, List[int]] = {}
+        self._by_evaluation: Dict[str, List[int]] = {}
+        for position, recipe in enumerate(recipes):
+            customization = (recipe.get("CustomizationTechnique") or "").upper()
+            self._by_customization.setdefault(customization, []).append(position)
+            evaluation = recipe.get("EvaluationType")
+            if evaluation is not None:
+                self._by_evaluation.setdefault(evaluation, []).append(position)
+        self._matches: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_instance_type: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def recipes(self, technique: str) -> List[Dict[str, Any]]:
+        """Recipes for a technique, in document order."""
+        matches = self._matches.get(technique)
+        if matches is None:
+            positions = set(self._by_customization.get(technique.upper(), ()))
+            positions.update(self._by_evaluation.get(technique, ()))
+            matches = [self._recipes[position] for position in sorted(positions)]
+            self._matches[technique] = matches
+        return matches
+
+    def recipe(self, technique: str, instance_type: str) -> Optional[Dict[str, Any]]:
+        """The first recipe for a technique that supports the instance type, or None."""
+        by_instance_type = self._by_instance_type.get(technique)
+        if by_instance_type is None:
+            by_instance_type = {}
+            for recipe in self.recipes(technique):
+                for supported in recipe.get("SupportedInstanceTypes", []):
+                    by_instance_type.setdefault(supported, recipe)
+            self._by_instance_type[technique] = by_instance_type
+        return by_instance_type.get(instance_type)
+
+    def instance_types(self, technique: str) -> Set[str]:
+        """Instance types supported by any recipe for a technique."""
+        self.recipe(technique, "")
+        return set(self._by_instance_type[technique])
+
+    def techniques(self) -> Set[str]:
+        """Technique or evaluation type of every recipe, '(none)' for recipes with neither."""
+        return {
+            recipe.get("CustomizationTechnique") or recipe.get("EvaluationType") or "(none)"
+            for recipe in self._recipes
+        }
+
+
+def get_hub_cache_dir() -> str:
+    """Directory holding cached hub content documents."""
+    return os.path.join(get_cache_dir(), HUB_CACHE_DIR_NAME)
+
+
+def clear_hub_cache() -> None:
+    """Delete every cached hub content document."""
+    shutil.rmtree(get_hub_cache_dir(), ignore_errors=True)
+    with _recipe_indexes_lock:
+        _recipe_indexes.clear()
+
+
+def get_hub_content_document(
+    client,
+    hub_name: str,
+    hub_content_type: str,
+    hub_content_name: str,
+    hub_content_version: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Get the parsed HubContentDocument of hub content, using the disk cache.
+
+    Args:
+        client: SageMaker boto3 client
+        hub_name (str): Hub name, e.g. 'SageMakerPublicHub'
+        hub_content_type (str): Hub content type, e.g. 'Model'
+        hub_content_name (str): Hub content name, e.g. a JumpStart model ID
+        hub_content_version (Optional[str]): Version to get, the latest if None
+
+    Returns:
+        Dict[str, Any]: The parsed document, an empty dict if the content has none
+
+    Raises:
+        botocore.exceptions.ClientError: If describe_hub_content fails
+    """
+    return _load_document(client, hub_name, hub_content_type, hub_content_name, hub_content_version)[1]
+
+
+def get_recipe_index(
+    client,
+    hub_name: str,
+    hub_content_type: str,
+    hub_content_name: str,
+    hub_content_version: Optional[str] = None,
+) -> RecipeIndex:
+    """Get the recipe index of hub content, built once per document and process.
+
+    Takes the same arguments as get_hub_content_document.
+
+    Returns:
+        RecipeIndex: Index over the document's RecipeCollection
+    """
+    key, document = _load_document(
+        client, hub_name, hub_content_type, hub_content_name, hub_content_version, _recipe_indexes
+    )
+    if document is None:
+        return _recipe_indexes[key]
+    index = RecipeIndex(document.get("RecipeCollection", []))
+    if key is not None:
+        with _recipe_indexes_lock:
+            _recipe_indexes[key] = index
+    return index
+
+
+def _cache_scope(client, hub_name: str) -> Optional[List[str]]:
+    """Region and identity the client's hub content is cached under, or None if it must not be cached."""
+    if not is_metadata_cache_enabled():
+        return None
+    try:
+        region = client.meta.region_name
+        access_key = None
+        if hub_name != PUBLIC_HUB_NAME:
+            credentials = client._get_credentials()
+            access_key = credentials.access_key if credentials else None
+    except Exception:
+        return None
+    if not isinstance(region, str) or (hub_name != PUBLIC_HUB_NAME and not isinstance(access_key, str)):
+        return None
+    return [region, access_key, hub_name]
+
+
+def _document_key(scope: List[str], hub_content_type: str, hub_content_name: str, version: str) -> str:
+    # marshal data is only guaranteed to load on the Python version that wrote it
+    material = json.dumps(scope + [hub_content_type, hub_content_name, version, list(sys.version_info[:2])])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _version_pointer_key(scope: List[str], hub_content_type: str, hub_content_name: str) -> List[str]:
+    return ["hub-content-version"] + scope + [hub_content_type, hub_content_name]
+
+
+def _latest_version(client, scope, hub_name, hub_content_type, hub_content_name) -> Optional[str]:
+    pointer_key = _version_pointer_key(scope, hub_content_type, hub_content_name)
+    version = get_cached_value(pointer_key)
+    if version is not None:
+        return version
+    try:
+        response = client.list_hub_content_versions(
+            HubName=hub_name,
+            HubContentType=hub_content_type,
+            HubContentName=hub_content_name,
+            SortBy="CreationTime",
+            SortOrder="Descending",
+            MaxResults=1,
+        )
+        version = response["HubContentSummaries"][0]["HubContentVersion"]
+    except Exception as e:
+        # Callers may be allowed to describe but not list hub content
+        logger.debug(f"Could not list versions of {hub_content_name}: {e}")
+        return None
+    put_cached_value(pointer_key, version, HUB_CONTENT_VERSION_TTL_SECONDS)
+    return version
+
+
+def _read_document(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(get_hub_cache_dir(), key), "rb") as f:
+            # marshal.load reads a file object in small pieces, loads on the bytes is much faster
+            return marshal.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f"Hub content cache entry unreadable: {e}")
+        return None
+
+
+def _write_document(key: str, document: Dict[str, Any]) -> None:
+    directory = get_hub_cache_dir()
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=key, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(marshal.dumps(document))
+            os.replace(temp_path, os.path.join(directory, key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not cache hub content document: {e}")
+
+
+def _load_document(client, hub_name, hub_content_type, hub_content_name, hub_content_version, loaded=None):
+    """Return (document key, document), or (key, None) if the key is already in loaded."""
+    scope = _cache_scope(client, hub_name)
+    version = hub_content_version
+    key = None
+    if scope is not None:
+        if version is None:
+            version = _latest_version(client, scope, hub_name, hub_content_type, hub_content_name)
+        if version is not None:
+            key = _document_key(scope, hub_content_type, hub_content_name, version)
+            if loaded is not None and key in loaded:
+                return key, None
+            document = _read_document(key)
+            if document is not None:
+                return key, document
+
+    params = {"HubName": hub_name, "HubContentType": hub_content_type, "HubContentName": hub_content_name}
+    if version is not None:
+        params["HubContentVersion"] = version
+    response = client.describe_hub_content(**params)
+    document = json.loads(response.get("HubContentDocument") or "{}")
+    if scope is not None:
+        described_version = response.get("HubContentVersion")
+        if isinstance(described_version, str):
+            if version is None:
+                # The latest version could not be listed; describe told us instead
+                put_cached_value(
+                    _version_pointer_key(scope, hub_content_type, hub_content_name),
+                    described_version,
+                    HUB_CONTENT_VERSION_TTL_SECONDS,
+                )
+            version = described_version
+        if version is not None:
+            key = _document_key(scope, hub_content_type, hub_content_name, version)
+            _write_document(key, document)
+    return key, document
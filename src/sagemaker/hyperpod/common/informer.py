@@ -0,0 +1,500 @@
+"""In-memory informer cache for repeated SDK reads.
+
+Programs that call ``HyperPodPytorchJob.get``, ``HPEndpoint.get`` or
+``HPSpace.get`` in a loop send a GET to the API server for every call.
+``HyperPodCache`` instead LISTs each resource type once per namespace and
+then keeps the result current with a WATCH, so ``get``, ``list`` and
+``list_pods`` are answered from memory while the cache is running::
+
+    with HyperPodCache(namespaces=["team-a"]) as cache:
+        job = HyperPodPytorchJob.get("my-job", namespace="team-a")
+        print(cache.metrics())
+
+Objects in the cache are as current as the watch's resourceVersion, which
+bookmarks keep advancing even when nothing changes. Reads fall back to the
+API server when the cache does not hold the requested namespace or
+resource, when a requested object is not in the cache yet (for example
+right after creating it), and when the cache has not heard from the API
+server for longer than ``max_staleness`` seconds.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
+
+from sagemaker.hyperpod.cli.constants.pytorch_constants import (
+    HYPERPOD_PYTORCH_CUSTOM_OBJECT_GROUP,
+    HYPERPOD_PYTORCH_CUSTOM_OBJECT_PLURAL,
+    HYPERPOD_PYTORCH_CUSTOM_OBJECT_VERSION,
+)
+from sagemaker.hyperpod.cli.constants.space_constants import SPACE_GROUP, SPACE_PLURAL, SPACE_VERSION
+from sagemaker.hyperpod.common.utils import (
+    get_default_namespace,
+    get_shared_api_client,
+)
+from sagemaker.hyperpod.common.k8s_bulk import (
+    CUSTOM_OBJECT_LIST_PAGE_SIZE,
+    WATCH_CONNECTION_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_POD_RESOURCE = "pods"
+# Resources the cache can hold, named like the CLI names them
+CACHE_RESOURCES = (
+    "hyp-pytorch-job",
+    "hyp-custom-endpoint",
+    "hyp-jumpstart-endpoint",
+    "hyp-space",
+    CACHE_POD_RESOURCE,
+)
+# Seconds to wait before re-establishing a watch that failed
+INFORMER_RETRY_SECONDS = 5
+
+_active_cache: Optional["HyperPodCache"] = None
+_active_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _custom_resources() -> Dict[str, Tuple[str, str, str]]:
+    """(group, version, plural) of each cached custom resource."""
+    # Imported here because the inference package imports this module
+    from sagemaker.hyperpod.inference.config.constants import (
+        INFERENCE_API_VERSION,
+        INFERENCE_ENDPOINT_CONFIG_KIND,
+        INFERENCE_GROUP,
+        JUMPSTART_MODEL_KIND,
+        KIND_PLURAL_MAP,
+    )
+
+    return {
+        "hyp-pytorch-job": (
+            HYPERPOD_PYTORCH_CUSTOM_OBJECT_GROUP,
+            HYPERPOD_PYTORCH_CUSTOM_OBJECT_VERSION,
+            HYPERPOD_PYTORCH_CUSTOM_OBJECT_PLURAL,
+        ),
+        "hyp-custom-endpoint": (
+            INFERENCE_GROUP,
+            INFERENCE_API_VERSION,
+            KIND_PLURAL_MAP[INFERENCE_ENDPOINT_CONFIG_KIND],
+        ),
+        "hyp-jumpstart-endpoint": (
+            INFERENCE_GROUP,
+            INFERENCE_API_VERSION,
+            KIND_PLURAL_MAP[JUMPSTART_MODEL_KIND],
+        ),
+        "hyp-space": (SPACE_GROUP, SPACE_VERSION, SPACE_PLURAL),
+    }
+
+
+class Informer:
+    """
+    Keeps every object of one resource type in one namespace in memory.
+
+    ``start`` LISTs the objects page by page, then a background thread
+    WATCHes from the LIST's resourceVersion and applies each change. The
+    store is indexed by name, by label and by owner UID. If the watch's
+    resourceVersion expires (410 Gone) the objects are LISTed again.
+
+    Stored objects are shared with every reader and must not be modified.
+    """
+
+    def __init__(
+        self,
+        list_func: Callable,
+        description: str,
+        transform: Optional[Callable[[dict], dict]] = None,
+        page_size: int = CUSTOM_OBJECT_LIST_PAGE_SIZE,
+        **list_kwargs,
+    ):
+        self.description = description
+        self.resource_version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.relists = 0
+        self.reconnects = 0
+        self._list_func = list_func
+        self._list_kwargs = list_kwargs
+        self._transform = transform
+        self._page_size = page_size
+        self._objects: Dict[str, dict] = {}
+        self._label_index: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self._owner_index: Dict[str, Set[str]] = defaultdict(set)
+        self._lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._last_sync: Optional[float] = None
+        self._watcher: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """LIST the objects, raising any API error, then keep them current in the background."""
+        self._relist()
+        self._thread = threading.Thread(
+            target=self._run, name=f"hyperpod-informer-{self.description}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching. The store keeps its last contents."""
+        self._stopped.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stopped.is_set()
+
+    @property
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the API server last confirmed the store was current, or None before the first LIST."""
+        if self._last_sync is None:
+            return None
+        return time.monotonic() - self._last_sync
+
+    def get(self, name: str) -> Optional[dict]:
+        """The object with the given name, or None if the store does not hold it."""
+        with self._lock:
+            return self._objects.get(name)
+
+    def list(self, labels: Optional[Dict[str, str]] = None) -> List[dict]:
+        """Objects sorted by name, optionally only those carrying every given label."""
+        with self._lock:
+            if labels:
+                names = set.intersection(*(self._label_index.get(item, set()) for item in labels.items()))
+            else:
+                names = self._objects.keys()
+            return [self._objects[name] for name in sorted(names)]
+
+    def list_owned_by(self, owner_uid: str) -> List[dict]:
+        """Objects sorted by name whose ownerReferences include owner_uid."""
+        with self._lock:
+            return [self._objects[name] for name in sorted(self._owner_index.get(owner_uid, ()))]
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "objects": len(self._objects),
+                "resource_version": self.resource_version,
+                "staleness_seconds": self.staleness_seconds,
+                "running": self.running,
+                "hits": self.hits,
+                "misses": self.misses,
+                "relists": self.relists,
+                "reconnects": self.reconnects,
+            }
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch()
+            except ApiException as e:
+                if self._stopped.is_set():
+                    break
+                if e.status == 410:
+                    logger.debug(f"Watch on {self.description} expired, listing again")
+                    self.resource_version = None
+                    continue
+                logger.warning(f"Watch on {self.description} failed, retrying: {e.reason}")
+                self._stopped.wait(INFORMER_RETRY_SECONDS)
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                logger.warning(f"Watch on {self.description} failed, retrying: {e}")
+                self._stopped.wait(INFORMER_RETRY_SECONDS)
+
+    def _relist(self) -> None:
+        objects = []
+        _continue = None
+        while True:
+            kwargs = dict(self._list_kwargs, limit=self._page_size)
+            if _continue:
+                kwargs["_continue"] = _continue
+            response = json.loads(self._list_func(_preload_content=False, **kwargs).data)
+            objects.extend(response.get("items") or [])
+            metadata = response.get("metadata") or {}
+            _continue = metadata.get("continue")
+            if not _continue:
+                break
+
+        with self._lock:
+            self._objects.clear()
+            self._label_index.clear()
+            self._owner_index.clear()
+            for obj in objects:
+                self._put(obj)
+            self.resource_version = metadata.get("resourceVersion")
+            self._last_sync = time.monotonic()
+            self.relists += 1
+
+    def _watch(self) -> None:
+        self._watcher = watch.Watch()
+        for event in self._watcher.stream(
+            self._list_func,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=WATCH_CONNECTION_TIMEOUT_SECONDS,
+            **self._list_kwargs,
+        ):
+            obj = event["raw_object"]
+            if event["type"] == "ERROR":
+                raise ApiException(status=obj.get("code"), reason=obj.get("message"))
+            with self._lock:
+                if event["type"] == "DELETED":
+                    self._remove(obj["metadata"]["name"])
+                elif event["type"] in ("ADDED", "MODIFIED"):
+                    self._put(obj)
+                self.resource_version = obj["metadata"]["resourceVersion"]
+                self._last_sync = time.monotonic()
+
+        # A watch the server closed on schedule delivered every change up to now
+        with self._lock:
+            self._last_sync = time.monotonic()
+            self.reconnects += 1
+
+    def _put(self, obj: dict) -> None:
+        if self._transform is not None:
+            obj = self._transform(obj)
+        metadata = obj["metadata"]
+        name = metadata["name"]
+        self._remove(name)
+        self._objects[name] = obj
+        for item in (metadata.get("labels") or {}).items():
+            self._label_index[item].add(name)
+        for owner in metadata.get("ownerReferences") or []:
+            self._owner_index[owner["uid"]].add(name)
+
+    def _remove(self, name: str) -> None:
+        obj = self._objects.pop(name, None)
+        if obj is None:
+            return
+        metadata = obj["metadata"]
+        for item in (metadata.get("labels") or {}).items():
+            self._discard(self._label_index, item, name)
+        for owner in metadata.get("ownerReferences") or []:
+            self._discard(self._owner_index, owner["uid"], name)
+
+    @staticmethod
+    def _discard(index: dict, key, name: str) -> None:
+        names = index.get(key)
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del index[key]
+
+
+def _pod_metadata(pod: dict) -> dict:
+    # SDK reads only need pod names, labels and owners, so keep pods small
+    return {"metadata": pod["metadata"]}
+
+
+class HyperPodCache:
+    """
+    Serves SDK reads of jobs, endpoints, spaces and pods from in-memory informers.
+
+    While started, ``HyperPodPytorchJob``, ``HPEndpoint``, ``HPJumpStartEndpoint``
+    and ``HPSpace`` answer ``get``, ``list`` and ``list_pods`` for the cached
+    namespaces from memory instead of the API server. Only one cache can be
+    running in a process at a time.
+
+    Args:
+        namespaces (Optional[List[str]]): Namespaces to cache. Defaults to the
+            current context's namespace
+        resources (Optional[Iterable[str]]): Resources to cache, from
+            CACHE_RESOURCES. Defaults to all of them
+        max_staleness (Optional[float]): Serve reads from the API server
+            instead when the cache has not been confirmed current for this
+            many seconds. None always uses the cache
+
+    Example:
+        >>> with HyperPodCache(namespaces=["team-a"], max_staleness=120) as cache:
+        ...     for _ in range(1000):
+        ...         job = HyperPodPytorchJob.get("my-job", namespace="team-a")
+        ...     print(cache.metrics()["hyp-pytorch-job/team-a"]["hits"])
+    """
+
+    def __init__(
+        self,
+        namespaces: Optional[List[str]] = None,
+        resources: Optional[Iterable[str]] = None,
+        max_staleness: Optional[float] = None,
+    ):
+        resources = tuple(resources) if resources is not None else CACHE_RESOURCES
+        unknown = [resource for resource in resources if resource not in CACHE_RESOURCES]
+        if unknown:
+            raise ValueError(
+                f"Unknown cache resources {unknown}. Supported resources are {list(CACHE_RESOURCES)}"
+            )
+        self.namespaces = list(namespaces) if namespaces else None
+        self.resources = resources
+        self.max_staleness = max_staleness
+        self._informers: Dict[Tuple[str, str], Informer] = {}
+
+    def start(self) -> "HyperPodCache":
+        """
+        LIST every cached resource and start watching it.
+
+        Raises:
+            RuntimeError: If another HyperPodCache is already running
+            ApiException: If a resource cannot be listed, for example because RBAC forbids it
+        """
+        global _active_cache
+        config.load_kube_config()
+        if not self.namespaces:
+            self.namespaces = [get_default_namespace()]
+
+        with _active_cache_lock:
+            if _active_cache is not None:
+                raise RuntimeError("Another HyperPodCache is already running in this process")
+            try:
+                for namespace in self.namespaces:
+                    for resource in self.resources:
+                        informer = self._create_informer(resource, namespace)
+                        informer.start()
+                        self._informers[(resource, namespace)] = informer
+            except Exception:
+                self._stop_informers()
+                raise
+            _active_cache = self
+        return self
+
+    def stop(self) -> None:
+        """Stop every watch and stop serving reads from the cache."""
+        global _active_cache
+        with _active_cache_lock:
+            if _active_cache is self:
+                _active_cache = None
+        self._stop_informers()
+
+    def __enter__(self) -> "HyperPodCache":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def staleness_seconds(self) -> Optional[float]:
+        """Staleness of the least recently confirmed informer, or None if none has synced."""
+        values = [i.staleness_seconds for i in self._informers.values() if i.staleness_seconds is not None]
+        return max(values) if values else None
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-informer metrics keyed by '<resource>/<namespace>'.
+
+        Each entry reports the number of cached objects, the watch's
+        resourceVersion, staleness_seconds since the API server last confirmed
+        the store, whether the watch is running, cache hits and misses, and how
+        often the informer re-listed and reconnected.
+        """
+        return {
+            f"{resource}/{namespace}": informer.metrics()
+            for (resource, namespace), informer in self._informers.items()
+        }
+
+    def _create_informer(self, resource: str, namespace: str) -> Informer:
+        description = f"{resource}/{namespace}"
+        if resource == CACHE_POD_RESOURCE:
+            return Informer(
+                client.CoreV1Api(get_shared_api_client()).list_namespaced_pod,
+                description,
+                transform=_pod_metadata,
+                namespace=namespace,
+            )
+        group, version, plural = _custom_resources()[resource]
+        return Informer(
+            client.CustomObjectsApi(get_shared_api_client()).list_namespaced_custom_object,
+            description,
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+        )
+
+    def _stop_informers(self) -> None:
+        for informer in self._informers.values():
+            informer.stop()
+
+    def _informer(self, resource: str, namespace: str) -> Optional[Informer]:
+        informer = self._informers.get((resource, namespace))
+        if informer is None or not informer.running:
+            return None
+        if self.max_staleness is not None and informer.staleness_seconds > self.max_staleness:
+            informer.misses += 1
+            return None
+        return informer
+
+
+def _active_informer(resource: str, namespace: str) -> Optional[Informer]:
+    cache = _active_cache
+    if cache is None or namespace is None:
+        return None
+    return cache._informer(resource, namespace)
+
+
+def _custom_resource(group: str, version: str, plural: str) -> Optional[str]:
+    for resource, key in _custom_resources().items():
+        if key == (group, version, plural):
+            return resource
+    return None
+
+
+def get_cached_object(group: str, version: str, plural: str, namespace: str, name: str) -> Optional[dict]:
+    """
+    Return a custom object from the running HyperPodCache.
+
+    Args:
+        group (str): API group of the custom resource
+        version (str): API version of the custom resource
+        plural (str): Plural resource name
+        namespace (str): Namespace of the object
+        name (str): Name of the object
+
+    Returns:
+        The raw object, or None if no running cache holds it and the API server must be asked
+    """
+    informer = _active_informer(_custom_resource(group, version, plural), namespace)
+    if informer is None:
+        return None
+    obj = informer.get(name)
+    if obj is None:
+        informer.misses += 1
+    else:
+        informer.hits += 1
+    return obj
+
+
+def list_cached_objects(group: str, version: str, plural: str, namespace: str) -> Optional[List[dict]]:
+    """
+    Return every custom object of a resource in a namespace from the running HyperPodCache.
+
+    Returns:
+        The raw objects sorted by name, or None if no running cache holds the namespace
+    """
+    informer = _active_informer(_custom_resource(group, version, plural), namespace)
+    if informer is None:
+        return None
+    informer.hits += 1
+    return informer.list()
+
+
+def list_cached_pod_names(namespace: str, labels: Optional[Dict[str, str]] = None) -> Optional[List[str]]:
+    """
+    Return names of the pods in a namespace carrying every given label from the running HyperPodCache.
+
+    Returns:
+        Sorted pod names, or None if no running cache holds the namespace's pods
+    """
+    informer = _active_informer(CACHE_POD_RESOURCE, namespace)
+    if informer is None:
+        return None
+    informer.hits += 1
+    return [pod["metadata"]["name"] for pod in informer.list(labels)]
@@ -0,0 +1,412 @@
+"""Bulk operations on custom objects.
+
+``create_custom_objects`` creates many objects on a bounded pool within an
+adaptive rate limit, ``list_custom_object_pages`` and
+``list_custom_object_pages_all_namespaces`` page through large LISTs, and
+``wait_for_custom_object`` watches one object until a condition holds.
+"""
+
+import json
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from kubernetes import client, watch
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.rate_limit import AdaptiveRateLimiter, is_throttling_error
+
+# Concurrent create requests when creating many custom objects
+CREATE_MANY_MAX_WORKERS = 16
+# Initial and maximum create requests per second when creating many custom objects,
+# and the requests per second each successful create adds back after throttling
+CREATE_MANY_RATE_LIMIT = 50
+CREATE_MANY_MAX_RATE_LIMIT = 200
+CREATE_MANY_RATE_INCREASE = 1.0
+# Attempts per object when the API server throttles or fails a create request
+CREATE_MANY_RETRY_ATTEMPTS = 5
+# Annotation that tells an object created by a retried request apart from one
+# that already existed under the same name
+CREATE_REQUEST_ANNOTATION = "sagemaker.amazonaws.com/create-request-id"
+
+
+class ObjectCreateResult(NamedTuple):
+    """
+    Outcome of creating one custom object.
+
+    Attributes:
+        name: Name of the object.
+        namespace: Namespace of the object.
+        attempts: Create requests sent for the object.
+        error: Why the object was not created, or None if it was.
+    """
+
+    name: str
+    namespace: str
+    attempts: int
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class CreateManyResult(NamedTuple):
+    """
+    Per-object outcomes of creating many custom objects.
+
+    Attributes:
+        objects: One ObjectCreateResult per object, in the order the objects were given.
+    """
+
+    objects: List[ObjectCreateResult]
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.succeeded for result in self.objects)
+
+    @property
+    def created(self) -> List[ObjectCreateResult]:
+        return [result for result in self.objects if result.succeeded]
+
+    @property
+    def failed(self) -> List[ObjectCreateResult]:
+        return [result for result in self.objects if not result.succeeded]
+
+    def to_manifest(self) -> Dict[str, List[Dict[str, str]]]:
+        """Names of the created objects and names and errors of the failed ones, as JSON-ready data."""
+        return {
+            "created": [{"name": r.name, "namespace": r.namespace} for r in self.created],
+            "failed": [{"name": r.name, "namespace": r.namespace, "error": r.error} for r in self.failed],
+        }
+
+
+def _is_retryable_create_error(e: Exception) -> bool:
+    if isinstance(e, ApiException):
+        return e.status == 429 or (e.status is not None and e.status >= 500)
+    return is_throttling_error(e)
+
+
+def _create_error_message(e: Exception) -> str:
+    if isinstance(e, ApiException):
+        try:
+            # The API server explains rejected objects in the Status body
+            return f"{e.status} {e.reason}: {json.loads(e.body)['message']}"
+        except (TypeError, ValueError, KeyError):
+            return f"{e.status} {e.reason}"
+    return str(e)
+
+
+def _created_by_request(custom_api, group, version, plural, name, namespace, request_id) -> bool:
+    """Whether the existing object was created by the create request with this ID."""
+    try:
+        existing = custom_api.get_namespaced_custom_object(
+            group=group, version=version, namespace=namespace, plural=plural, name=name
+        )
+    except Exception:
+        return False
+    annotations = (existing.get("metadata") or {}).get("annotations") or {}
+    return annotations.get(CREATE_REQUEST_ANNOTATION) == request_id
+
+
+def create_custom_objects(
+    custom_api: client.CustomObjectsApi,
+    group: str,
+    version: str,
+    plural: str,
+    bodies: List[dict],
+    max_workers: int = CREATE_MANY_MAX_WORKERS,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    retry_attempts: int = CREATE_MANY_RETRY_ATTEMPTS,
+) -> CreateManyResult:
+    """
+    Create many namespaced custom objects concurrently, within a shared rate limit.
+
+    Requests are sent through a pool of ``max_workers`` threads that take a token
+    from ``limiter`` before each request. A request that is throttled (429) or
+    fails on the server (5xx) slows the limiter down and is retried up to
+    ``retry_attempts`` times. Each object is annotated with a unique
+    CREATE_REQUEST_ANNOTATION, so a retry answered with 409 counts as created
+    only if the existing object carries this request's annotation, i.e. an
+    earlier attempt created it. Any other error is recorded for that object and
+    does not stop the others.
+
+    Args:
+        custom_api: CustomObjectsApi used for the requests
+        group (str): API group of the custom resource
+        version (str): API version of the custom resource
+        plural (str): Plural resource name
+        bodies (List[dict]): Objects to create, each with metadata.name and metadata.namespace
+        max_workers (int): Maximum number of create requests in flight
+        limiter (Optional[AdaptiveRateLimiter]): Rate limit shared by the requests,
+            CREATE_MANY_RATE_LIMIT requests per second adapting up to
+            CREATE_MANY_MAX_RATE_LIMIT by default
+        retry_attempts (int): Attempts per object before its error is recorded
+
+    Returns:
+        CreateManyResult with the outcome of every object
+    """
+    if limiter is None:
+        limiter = AdaptiveRateLimiter(
+            rate=CREATE_MANY_RATE_LIMIT,
+            max_rate=CREATE_MANY_MAX_RATE_LIMIT,
+            increase=CREATE_MANY_RATE_INCREASE,
+        )
+
+    def _create(body: dict) -> ObjectCreateResult:
+        name = body["metadata"]["name"]
+        namespace = body["metadata"]["namespace"]
+        request_id = str(uuid.uuid4())
+        annotations = {**(body["metadata"].get("annotations") or {}), CREATE_REQUEST_ANNOTATION: request_id}
+        body = {**body, "metadata": {**body["metadata"], "annotations": annotations}}
+        for attempt in range(1, retry_attempts + 1):
+            limiter.acquire()
+            try:
+                custom_api.create_namespaced_custom_object(
+                    group=group, version=version, namespace=namespace, plural=plural, body=body
+                )
+                limiter.on_success()
+                return ObjectCreateResult(name, namespace, attempt)
+            except Exception as e:
+                if attempt > 1 and isinstance(e, ApiException) and e.status == 409:
+                    # A previous attempt may have reached the API server before failing
+                    if _created_by_request(custom_api, group, version, plural, name, namespace, request_id):
+                        return ObjectCreateResult(name, namespace, attempt)
+                    return ObjectCreateResult(name, namespace, attempt, _create_error_message(e))
+                if _is_retryable_create_error(e) and attempt < retry_attempts:
+                    limiter.on_throttle()
+                    continue
+                return ObjectCreateResult(name, namespace, attempt, _create_error_message(e))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return CreateManyResult(objects=list(executor.map(_create, bodies)))
+
+
+# Items requested per LIST page when listing custom objects
+CUSTOM_OBJECT_LIST_PAGE_SIZE = 500
+# Concurrent per-namespace LISTs when a cluster-scoped LIST is forbidden
+NAMESPACE_FANOUT_MAX_WORKERS = 16
+
+
+def list_custom_object_pages(
+    custom_api: client.CustomObjectsApi,
+    group: str,
+    version: str,
+    plural: str,
+    namespace: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    page_size: int = CUSTOM_OBJECT_LIST_PAGE_SIZE,
+) -> Iterator[List[dict]]:
+    """
+    Yield pages of custom objects from a namespaced or cluster-scoped LIST.
+
+    Continue tokens are followed until the API server reports no more items,
+    so callers can process each page before the next one is requested.
+
+    Args:
+        custom_api: CustomObjectsApi used for the requests
+        group (str): API group of the custom resource
+        version (str): API version of the custom resource
+        plural (str): Plural resource name
+        namespace (Optional[str]): Namespace to list, or None for every namespace
+        label_selector (Optional[str]): Only list objects matching this selector
+        page_size (int): Maximum items per LIST request
+
+    Returns:
+        Iterator over lists of custom object dicts, one list per page
+    """
+    kwargs = {"limit": page_size}
+    if label_selector:
+        kwargs["label_selector"] = label_selector
+    while True:
+        if namespace is None:
+            response = custom_api.list_cluster_custom_object(
+                group=group, version=version, plural=plural, **kwargs
+            )
+        else:
+            response = custom_api.list_namespaced_custom_object(
+                group=group, version=version, namespace=namespace, plural=plural, **kwargs
+            )
+        yield response.get("items") or []
+        continue_token = (response.get("metadata") or {}).get("continue")
+        if not continue_token:
+            return
+        kwargs["_continue"] = continue_token
+
+
+def list_custom_object_pages_all_namespaces(
+    custom_api: client.CustomObjectsApi,
+    group: str,
+    version: str,
+    plural: str,
+    list_namespaces: Callable[[], List[str]],
+    label_selector: Optional[str] = None,
+    page_size: int = CUSTOM_OBJECT_LIST_PAGE_SIZE,
+    max_workers: int = NAMESPACE_FANOUT_MAX_WORKERS,
+) -> Iterator[List[dict]]:
+    """
+    Yield pages of custom objects across every namespace the caller can read.
+
+    A single paginated cluster-scoped LIST is used when RBAC allows it. If the
+    API server forbids it, each namespace from list_namespaces is listed on a
+    bounded thread pool instead, skipping namespaces the caller cannot read.
+    Fallback pages are yielded in namespace order.
+
+    Args:
+        custom_api: CustomObjectsApi used for the requests
+        group (str): API group of the custom resource
+        version (str): API version of the custom resource
+        plural (str): Plural resource name
+        list_namespaces (Callable[[], List[str]]): Returns the namespaces to
+            list when falling back to per-namespace requests
+        label_selector (Optional[str]): Only list objects matching this selector
+        page_size (int): Maximum items per LIST request
+        max_workers (int): Maximum concurrent per-namespace LISTs in the fallback
+
+    Returns:
+        Iterator over lists of custom object dicts, one list per page
+    """
+    pages = list_custom_object_pages(
+        custom_api, group, version, plural, label_selector=label_selector, page_size=page_size
+    )
+    try:
+        first_page = next(pages)
+    except StopIteration:
+        return
+    except ApiException as e:
+        if e.status != 403:
+            raise
+        logger = logging.getLogger(__name__)
+        logger.debug(f"Cluster-scoped list of {plural} is forbidden, listing each namespace")
+        yield from _list_custom_object_pages_per_namespace(
+            custom_api, group, version, plural, list_namespaces(), label_selector, page_size, max_workers
+        )
+        return
+    yield first_page
+    yield from pages
+
+
+def _list_custom_object_pages_per_namespace(
+    custom_api, group, version, plural, namespaces, label_selector, page_size, max_workers
+) -> Iterator[List[dict]]:
+    def list_namespace(namespace):
+        try:
+            return [
+                item
+                for page in list_custom_object_pages(
+                    custom_api, group, version, plural, namespace, label_selector, page_size
+                )
+                for item in page
+            ]
+        except ApiException as e:
+            if e.status == 403:
+                return []
+            raise
+
+    if not namespaces:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(namespaces))) as executor:
+        for items in executor.map(list_namespace, namespaces):
+            if items:
+                yield items
+
+
+# Server-side lifetime of one watch connection; the watch resumes from the last resourceVersion after it
+WATCH_CONNECTION_TIMEOUT_SECONDS = 300
+
+
+def wait_for_custom_object(
+    custom_api: client.CustomObjectsApi,
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    namespace: str,
+    condition: Callable[[dict], bool],
+    timeout: Optional[float] = None,
+) -> dict:
+    """
+    Block until a namespaced custom object satisfies condition, using the watch API.
+
+    The object is read once, and if the condition does not hold yet a watch
+    filtered to the object is opened from the returned resourceVersion. Each
+    change is checked as soon as the API server sends it. Bookmarks advance
+    the resourceVersion, so a watch that closes after
+    WATCH_CONNECTION_TIMEOUT_SECONDS resumes where it left off. If that
+    resourceVersion has expired (410 Gone) the object is read again and
+    watched from its current version.
+
+    Args:
+        custom_api: CustomObjectsApi used for the requests
+        group (str): API group of the custom resource
+        version (str): API version of the custom resource
+        plural (str): Plural resource name
+        name (str): Name of the object to wait for
+        namespace (str): Namespace of the object
+        condition (Callable[[dict], bool]): Called with each observed version of the object
+        timeout (Optional[float]): Seconds to wait before giving up, or None to wait indefinitely
+
+    Returns:
+        The first observed object for which condition returned True
+
+    Raises:
+        TimeoutError: If the condition does not hold within timeout
+        RuntimeError: If the object is deleted while waiting
+    """
+    logger = logging.getLogger(__name__)
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def read():
+        return custom_api.get_namespaced_custom_object(
+            group=group, version=version, namespace=namespace, plural=plural, name=name
+        )
+
+    obj = read()
+    while True:
+        if condition(obj):
+            return obj
+        resource_version = obj["metadata"]["resourceVersion"]
+
+        try:
+            while True:
+                connection_timeout = WATCH_CONNECTION_TIMEOUT_SECONDS
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out after {timeout:g}s waiting for {plural} '{name}' in namespace '{namespace}'"
+                        )
+                    connection_timeout = max(1, min(connection_timeout, int(remaining + 0.999)))
+
+                watcher = watch.Watch()
+                for event in watcher.stream(
+                    custom_api.list_namespaced_custom_object,
+                    group=group,
+                    version=version,
+                    namespace=namespace,
+                    plural=plural,
+                    field_selector=f"metadata.name={name}",
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=connection_timeout,
+                ):
+                    event_object = event["raw_object"]
+                    resource_version = event_object["metadata"]["resourceVersion"]
+                    if event["type"] == "BOOKMARK":
+                        continue
+                    if event["type"] == "DELETED":
+                        watcher.stop()
+                        raise RuntimeError(
+                            f"{plural} '{name}' in namespace '{namespace}' was deleted while waiting"
+                        )
+                    if condition(event_object):
+                        watcher.stop()
+                        return event_object
+                logger.debug(f"Watch on {plural} '{name}' closed, resuming from {resource_version}")
+        except ApiException as e:
+            if e.status != 410:
+                raise
+            logger.debug(f"Watch on {plural} '{name}' expired, reading the current state")
+            obj = read()
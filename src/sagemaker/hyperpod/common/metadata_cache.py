@@ -0,0 +1,240 @@
+"""Persistent cache for slow-changing AWS control-plane metadata.
+
+Commands such as ``hyp get-monitoring`` or the training and space commands
+repeat the same describe and list calls on every invocation even though the
+answers rarely change. Responses for the operations in
+``METADATA_CACHE_TTL_SECONDS`` are kept in a SQLite database under
+``~/.cache/hyperpod`` so repeated invocations, for example in a CI loop, skip
+those calls until the entry expires.
+
+Entries are keyed by the caller's credentials, region, service, operation and
+request parameters, so switching profile, account or region never returns
+another identity's answer. SQLite in WAL mode makes the cache safe to share
+between concurrently running ``hyp`` processes, and any cache failure falls
+back to calling the service directly.
+
+Other slow lookups, such as Kubernetes namespace discovery, store their own
+results with ``get_cached_value`` and ``put_cached_value``.
+
+Set ``HYPERPOD_NO_CACHE=1`` or pass ``hyp --no-cache`` to bypass the cache,
+and ``HYPERPOD_CACHE_DIR`` to move it.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays valid, per (service, operation)
+METADATA_CACHE_TTL_SECONDS = {
+    ("sagemaker", "list_clusters"): 60,
+    ("sagemaker", "describe_cluster"): 300,
+    ("sagemaker", "list_hub_contents"): 60 * 60,
+    ("eks", "list_addons"): 600,
+    ("eks", "describe_addon"): 600,
+    ("ec2", "describe_availability_zones"): 24 * 60 * 60,
+}
+METADATA_CACHE_FILE_NAME = "metadata-cache.sqlite3"
+# How long a process waits for another process holding the database lock
+METADATA_CACHE_LOCK_TIMEOUT_SECONDS = 5
+
+_DATETIME_TAG = "__datetime__"
+
+_cache_enabled = True
+
+
+def set_metadata_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the metadata cache for the rest of this process."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def is_metadata_cache_enabled() -> bool:
+    """Whether cached responses may be used, honoring ``HYPERPOD_NO_CACHE``."""
+    no_cache = os.environ.get("HYPERPOD_NO_CACHE", "").strip().lower()
+    return _cache_enabled and no_cache not in ("1", "true", "yes")
+
+
+def get_cache_dir() -> str:
+    """Directory holding the HyperPod CLI caches, honoring ``HYPERPOD_CACHE_DIR``."""
+    cache_dir = os.environ.get("HYPERPOD_CACHE_DIR")
+    if not cache_dir:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        cache_dir = os.path.join(xdg_cache_home, "hyperpod")
+    return cache_dir
+
+
+def get_metadata_cache_path() -> str:
+    """Location of the cache database."""
+    return os.path.join(get_cache_dir(), METADATA_CACHE_FILE_NAME)
+
+
+def clear_metadata_cache() -> None:
+    """Delete every cached response."""
+    path = get_metadata_cache_path()
+    if not os.path.exists(path):
+        return
+    conn = _connect(path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM entries")
+    finally:
+        conn.close()
+
+
+def cached_api_call(client, operation: str, refresh: bool = False, **params) -> Any:
+    """Call ``client.<operation>(**params)``, reusing a cached response while it is fresh.
+
+    Operations without an entry in ``METADATA_CACHE_TTL_SECONDS`` and clients
+    whose credentials or region cannot be determined are always called
+    directly. Errors raised by the service are never cached.
+
+    Args:
+        client: boto3 client, usually from create_boto3_client
+        operation (str): Client method name, e.g. 'describe_cluster'
+        refresh (bool): Skip any cached response and store the new one
+        **params: Request parameters passed to the client method
+
+    Returns:
+        The service response, with ResponseMetadata removed when cached
+    """
+    call = getattr(client, operation)
+    key, ttl = _cache_key(client, operation, params)
+    if key is None:
+        return call(**params)
+
+    path = get_metadata_cache_path()
+    try:
+        cached = None if refresh else _read(path, key)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Metadata cache unavailable, calling {operation} directly: {e}")
+        return call(**params)
+    if cached is not None:
+        logger.debug(f"Using cached {operation} response")
+        return cached
+
+    response = call(**params)
+    value = {k: v for k, v in response.items() if k != "ResponseMetadata"}
+    try:
+        _write(path, key, value, ttl)
+    except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not cache {operation} response: {e}")
+    return value
+
+
+def get_cached_value(key_parts: List[Any]) -> Optional[Any]:
+    """Return the unexpired value stored under key_parts, or None.
+
+    Args:
+        key_parts (List[Any]): JSON-serializable values that together identify the entry
+
+    Returns:
+        The stored value, or None if absent, expired, or the cache is disabled or unusable
+    """
+    if not is_metadata_cache_enabled():
+        return None
+    try:
+        return _read(get_metadata_cache_path(), _hash_key(key_parts))
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Metadata cache unavailable: {e}")
+        return None
+
+
+def put_cached_value(key_parts: List[Any], value: Any, ttl: int) -> None:
+    """Store a JSON-serializable value under key_parts for ttl seconds.
+
+    Args:
+        key_parts (List[Any]): JSON-serializable values that together identify the entry
+        value (Any): Value to store
+        ttl (int): Seconds the value stays valid
+    """
+    if not is_metadata_cache_enabled():
+        return
+    try:
+        _write(get_metadata_cache_path(), _hash_key(key_parts), value, ttl)
+    except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write metadata cache entry: {e}")
+
+
+def _hash_key(key_parts: List[Any]) -> str:
+    material = json.dumps(key_parts, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _cache_key(client, operation: str, params: dict):
+    """Build the entry key and TTL for a call, or (None, None) if it must not be cached."""
+    if not is_metadata_cache_enabled():
+        return None, None
+    try:
+        service = client.meta.service_model.service_name
+        region = client.meta.region_name
+        credentials = client._get_credentials()
+        access_key = credentials.access_key if credentials else None
+    except Exception:
+        return None, None
+
+    ttl = METADATA_CACHE_TTL_SECONDS.get((service, operation))
+    if ttl is None or not all(isinstance(v, str) for v in (service, region, access_key)):
+        return None, None
+
+    # The access key identifies the account and principal without an STS round trip
+    return _hash_key([access_key, region, service, operation, params]), ttl
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=METADATA_CACHE_LOCK_TIMEOUT_SECONDS)
+    # WAL lets readers in other processes proceed while one process writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries "
+        "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+    )
+    return conn
+
+
+def _read(path: str, key: str) -> Optional[Any]:
+    if not os.path.exists(path):
+        return None
+    conn = _connect(path)
+    try:
+        row = conn.execute(
+            "SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+    finally:
+        conn.close()
+    return json.loads(row[0], object_hook=_decode) if row else None
+
+
+def _write(path: str, key: str, value: Any, ttl: int) -> None:
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    data = json.dumps(value, default=_encode)
+    now = time.time()
+    conn = _connect(path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, now + ttl, data),
+            )
+    finally:
+        conn.close()
+
+
+def _encode(value):
+    # boto3 responses carry datetimes, which JSON cannot represent natively
+    if isinstance(value, datetime.datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode(obj: dict):
+    if len(obj) == 1 and _DATETIME_TAG in obj:
+        return datetime.datetime.fromisoformat(obj[_DATETIME_TAG])
+    return obj
@@ -0,0 +1,187 @@
+"""Running a command across pods.
+
+``exec_on_pods`` opens exec sessions on a bounded pool and streams each
+pod's output back to the caller line by line, recording the exit code,
+duration and any error of every pod.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from kubernetes import client, stream
+from kubernetes.client.exceptions import ApiException
+from kubernetes.stream.ws_client import STDERR_CHANNEL, STDOUT_CHANNEL
+
+from sagemaker.hyperpod.common.pod_logs import LOG_AGGREGATION_QUEUE_SIZE, _put_until_stopped
+
+# Concurrent exec sessions when running a command across pods
+EXEC_MAX_WORKERS = 32
+# Default per-pod time limit when running a command across pods
+EXEC_POD_TIMEOUT_SECONDS = 300
+
+
+class PodExecResult(NamedTuple):
+    """
+    Outcome of running a command in one pod.
+
+    Attributes:
+        pod: Name of the pod the command ran in.
+        exit_code: Exit code of the command, or None if it did not finish.
+        duration_seconds: Wall-clock time spent on the pod.
+        error: Why the command did not finish, e.g. a timeout or API error.
+    """
+
+    pod: str
+    exit_code: Optional[int]
+    duration_seconds: float
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.exit_code == 0
+
+
+class ExecResult(NamedTuple):
+    """
+    Per-pod outcomes of running a command across several pods.
+
+    Attributes:
+        pods: One PodExecResult per pod, in the order the pods were given.
+    """
+
+    pods: List[PodExecResult]
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.succeeded for result in self.pods)
+
+    @property
+    def failed(self) -> List[PodExecResult]:
+        return [result for result in self.pods if not result.succeeded]
+
+
+def exec_on_pods(
+    v1: client.CoreV1Api,
+    pods: List[str],
+    namespace: str,
+    command: List[str],
+    container: Optional[str] = None,
+    on_output: Optional[Callable[[str, str], None]] = None,
+    max_workers: int = EXEC_MAX_WORKERS,
+    timeout_seconds: Optional[float] = EXEC_POD_TIMEOUT_SECONDS,
+    queue_size: int = LOG_AGGREGATION_QUEUE_SIZE,
+) -> ExecResult:
+    """
+    Run a command in many pods concurrently, streaming their output as it arrives.
+
+    Exec sessions are opened through a pool of ``max_workers`` threads. Output is
+    split into lines and passed to ``on_output(pod, line)`` on the calling thread
+    as soon as each line is complete; workers block while ``queue_size`` lines are
+    waiting, so a slow consumer cannot grow memory. A pod that fails or runs
+    longer than ``timeout_seconds`` is recorded in the result and does not stop
+    the other pods.
+
+    Args:
+        v1: CoreV1Api used to open the exec sessions
+        pods: Names of the pods to run the command in
+        namespace: Namespace of the pods
+        command: Command and arguments to run
+        container: Container name, required for multi-container pods
+        on_output: Called with the pod name and each line of stdout or stderr
+        max_workers: Maximum number of pods running the command at the same time
+        timeout_seconds: Per-pod time limit, or None for no limit
+        queue_size: Output lines buffered between workers and the caller
+
+    Returns:
+        ExecResult with the exit code and duration of every pod
+    """
+    events: queue.Queue = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+
+    def _run(pod: str) -> None:
+        result = _exec_on_pod(
+            v1, pod, namespace, command, container, timeout_seconds,
+            lambda line: _put_until_stopped(events, (pod, line, None), stopped),
+            stopped,
+        )
+        _put_until_stopped(events, (pod, None, result), stopped)
+
+    results: Dict[str, PodExecResult] = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = []
+    try:
+        for pod in pods:
+            futures.append(executor.submit(_run, pod))
+        while len(results) < len(pods):
+            pod, line, result = events.get()
+            if result is not None:
+                results[pod] = result
+            elif on_output:
+                on_output(pod, line)
+    finally:
+        stopped.set()
+        # shutdown(cancel_futures=True) needs Python 3.9
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    return ExecResult(pods=[results[pod] for pod in pods])
+
+
+def _exec_on_pod(
+    v1: client.CoreV1Api,
+    pod: str,
+    namespace: str,
+    command: List[str],
+    container: Optional[str],
+    timeout_seconds: Optional[float],
+    emit: Callable[[str], bool],
+    stopped: threading.Event,
+) -> PodExecResult:
+    """Run a command in one pod over a non-preloaded exec websocket, emitting output per line."""
+    start = time.monotonic()
+    pending = {STDOUT_CHANNEL: "", STDERR_CHANNEL: ""}
+    ws = None
+    try:
+        kwargs = {"container": container} if container else {}
+        ws = stream.stream(
+            v1.connect_get_namespaced_pod_exec,
+            name=pod,
+            namespace=namespace,
+            command=command,
+            stderr=True,
+            stdin=False,
+            stdout=True,
+            tty=False,
+            _preload_content=False,
+            **kwargs,
+        )
+        while ws.is_open():
+            if stopped.is_set():
+                return PodExecResult(pod, None, time.monotonic() - start, "Cancelled")
+            elapsed = time.monotonic() - start
+            if timeout_seconds is not None and elapsed > timeout_seconds:
+                return PodExecResult(pod, None, elapsed, f"Timed out after {timeout_seconds}s")
+            ws.update(timeout=1)
+            for channel in pending:
+                if ws.peek_channel(channel):
+                    *lines, pending[channel] = (pending[channel] + ws.read_channel(channel)).split("\n")
+                    for line in lines:
+                        emit(line)
+
+        for rest in pending.values():
+            if rest:
+                emit(rest)
+        return PodExecResult(pod, ws.returncode, time.monotonic() - start)
+    except Exception as e:
+        if isinstance(e, ApiException) and e.status == 400 and "does not have a host assigned" in str(e.body):
+            error = "Pod is not running (no host assigned)"
+        else:
+            error = str(e)
+        return PodExecResult(pod, None, time.monotonic() - start, error)
+    finally:
+        if ws is not None:
+            ws.close()
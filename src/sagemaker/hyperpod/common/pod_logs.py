@@ -0,0 +1,304 @@
+"""Streaming and merging of pod logs.
+
+``stream_pod_logs`` reads one pod's log in chunks and yields lines as they
+arrive, so a large or followed log is never held in memory.
+``aggregate_pod_logs`` reads the logs of many pods at once and merges them
+into one stream prefixed with the pod names, in timestamp order for capped
+logs and in arrival order when following.
+"""
+
+import codecs
+import heapq
+import logging
+import queue
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from kubernetes import client
+
+# Bytes read from the API server per iteration when streaming pod logs
+LOG_STREAM_CHUNK_SIZE = 64 * 1024
+# Pod log requests opened at the same time when aggregating logs across pods
+LOG_AGGREGATION_MAX_WORKERS = 32
+# Default per-pod log cap when aggregating logs across pods without following
+LOG_AGGREGATION_POD_LIMIT_BYTES = 1024 * 1024
+# Lines buffered between followed pods and the consumer before readers block
+LOG_AGGREGATION_QUEUE_SIZE = 10000
+
+
+def stream_pod_logs(
+    v1: client.CoreV1Api,
+    name: str,
+    namespace: str,
+    container: Optional[str] = None,
+    timestamps: bool = False,
+    follow: bool = False,
+    since_seconds: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    limit_bytes: Optional[int] = None,
+    chunk_size: int = LOG_STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Stream a pod's logs line by line without loading the whole log into memory.
+
+    The log request is sent immediately, so API errors such as a missing pod are
+    raised by this call rather than on first iteration. The returned iterator
+    reads the response in chunks and decodes it incrementally, yielding lines as
+    soon as they arrive. With ``follow=True`` it keeps yielding new lines until
+    the container exits or the caller stops iterating.
+
+    Args:
+        v1: CoreV1Api used to read the log
+        name: Pod name
+        namespace: Pod namespace
+        container: Container name, required for multi-container pods
+        timestamps: Prefix each line with its RFC3339 timestamp
+        follow: Keep the stream open and yield new lines as they are written
+        since_seconds: Only return logs newer than this many seconds
+        tail_lines: Only return this many lines from the end of the log
+        limit_bytes: Stop after this many bytes of log output
+        chunk_size: Number of bytes to read from the response at a time
+
+    Returns:
+        Iterator over log lines without their trailing newline
+    """
+    response = _request_pod_log(
+        v1, name, namespace, container, timestamps, follow, since_seconds, tail_lines, limit_bytes
+    )
+    return _iter_log_lines(response, chunk_size)
+
+
+def _request_pod_log(
+    v1: client.CoreV1Api,
+    name: str,
+    namespace: str,
+    container: Optional[str] = None,
+    timestamps: bool = False,
+    follow: bool = False,
+    since_seconds: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    limit_bytes: Optional[int] = None,
+):
+    """Send a pod log request and return the unread streaming response."""
+    kwargs = {}
+    if container:
+        kwargs["container"] = container
+    if since_seconds is not None:
+        kwargs["since_seconds"] = since_seconds
+    if tail_lines is not None:
+        kwargs["tail_lines"] = tail_lines
+    if limit_bytes is not None:
+        kwargs["limit_bytes"] = limit_bytes
+
+    return v1.read_namespaced_pod_log(
+        name=name,
+        namespace=namespace,
+        timestamps=timestamps,
+        follow=follow,
+        _preload_content=False,
+        **kwargs,
+    )
+
+
+def _iter_log_lines(response, chunk_size: int) -> Iterator[str]:
+    """Split a streamed log response into lines, decoding UTF-8 across chunk boundaries."""
+    for lines in _iter_log_line_chunks(response, chunk_size):
+        yield from lines
+
+
+def _iter_log_line_chunks(response, chunk_size: int) -> Iterator[List[str]]:
+    """Yield the complete lines of each chunk read from a streamed log response."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    try:
+        for chunk in response.stream(chunk_size):
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            if lines:
+                yield lines
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield [pending]
+    finally:
+        response.release_conn()
+
+
+def _log_timestamp_key(line: str) -> Tuple[str, str]:
+    """Sort key for a log line prefixed with an RFC3339Nano timestamp.
+
+    The API server trims trailing zeros from fractional seconds, so the fraction
+    is padded before comparing to keep lexical order equal to time order.
+    """
+    timestamp = line.split(" ", 1)[0].rstrip("Z")
+    seconds, _, fraction = timestamp.partition(".")
+    return seconds, fraction.ljust(9, "0")
+
+
+def aggregate_pod_logs(
+    v1: client.CoreV1Api,
+    pods: List[str],
+    namespace: str,
+    container: Optional[str] = None,
+    follow: bool = False,
+    since_seconds: Optional[int] = None,
+    tail_lines: Optional[int] = None,
+    limit_bytes_per_pod: Optional[int] = None,
+    max_workers: int = LOG_AGGREGATION_MAX_WORKERS,
+    queue_size: int = LOG_AGGREGATION_QUEUE_SIZE,
+) -> Iterator[str]:
+    """
+    Read the logs of many pods concurrently and merge them into one stream.
+
+    Every line is prefixed with ``[<pod name>]``. At most ``max_workers`` pod
+    log streams are open at the same time.
+
+    Without ``follow``, each pod's log is capped at ``limit_bytes_per_pod``
+    (LOG_AGGREGATION_POD_LIMIT_BYTES by default). A pool of ``max_workers``
+    threads copies each log to a temporary file, and the files are then merged
+    in timestamp order, so memory use does not grow with the number of pods.
+
+    With ``follow``, every pod's log stays open until its container exits, so
+    following more than ``max_workers`` pods raises a ValueError. Readers feed
+    one queue of ``queue_size`` lines and lines are yielded in arrival order,
+    with no per-pod cap unless one is given. Readers block while the queue is
+    full, so a slow consumer cannot grow memory.
+
+    A pod whose log cannot be read is logged as a warning and skipped, so one
+    failed pod does not hide the logs of the others.
+
+    Args:
+        v1: CoreV1Api used to read the logs
+        pods: Names of the pods to read
+        namespace: Namespace of the pods
+        container: Container name, required for multi-container pods
+        follow: Keep streaming new log lines until every container exits
+        since_seconds: Only return logs newer than this many seconds
+        tail_lines: Only return this many lines from the end of each pod's log
+        limit_bytes_per_pod: Stop reading a pod after this many bytes of log output
+        max_workers: Maximum number of pod log streams open at the same time
+        queue_size: Lines buffered between followed pods and the consumer
+
+    Returns:
+        Iterator over prefixed log lines
+
+    Raises:
+        ValueError: If ``follow`` is set and there are more pods than ``max_workers``
+    """
+    read_kwargs = dict(
+        namespace=namespace,
+        container=container,
+        timestamps=True,
+        follow=follow,
+        since_seconds=since_seconds,
+        tail_lines=tail_lines,
+    )
+    if follow:
+        if len(pods) > max_workers:
+            raise ValueError(
+                f"Following the logs of {len(pods)} pods needs {len(pods)} open log streams, "
+                f"more than max_workers ({max_workers})"
+            )
+        read_kwargs["limit_bytes"] = limit_bytes_per_pod
+        return _follow_pod_logs(v1, pods, read_kwargs, queue_size)
+
+    read_kwargs["limit_bytes"] = limit_bytes_per_pod or LOG_AGGREGATION_POD_LIMIT_BYTES
+    return _merge_pod_logs(v1, pods, read_kwargs, max_workers)
+
+
+def _spool_pod_log(v1, pod: str, read_kwargs: Dict[str, Any]) -> Optional[IO[bytes]]:
+    """Copy a pod's log to a temporary file opened for reading, or return None if it cannot be read."""
+    spool = tempfile.TemporaryFile()
+    try:
+        response = _request_pod_log(v1, name=pod, **read_kwargs)
+        for lines in _iter_log_line_chunks(response, LOG_STREAM_CHUNK_SIZE):
+            spool.writelines(f"{line}\n".encode("utf-8") for line in lines)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Failed to get logs from pod {pod}: {e}")
+        spool.close()
+        return None
+    spool.seek(0)
+    return spool
+
+
+def _merge_pod_logs(
+    v1, pods: List[str], read_kwargs: Dict[str, Any], max_workers: int
+) -> Iterator[str]:
+    """Spool capped pod logs to temporary files through a bounded pool, then merge them by timestamp."""
+    spools: Dict[str, IO[bytes]] = {}
+
+    def _lines(pod: str) -> Iterator[Tuple[Tuple[str, str], str, str]]:
+        for raw in spools[pod]:
+            line = raw[:-1].decode("utf-8")
+            yield _log_timestamp_key(line), pod, line
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {pod: executor.submit(_spool_pod_log, v1, pod, read_kwargs) for pod in pods}
+    try:
+        for pod, future in futures.items():
+            spool = future.result()
+            if spool is not None:
+                spools[pod] = spool
+        for _, pod, line in heapq.merge(*(_lines(pod) for pod in spools)):
+            yield f"[{pod}] {line}"
+    finally:
+        # Pods still being read when the consumer stops close their file once done
+        for future in futures.values():
+            if not future.cancel():
+                future.add_done_callback(_close_spool)
+        executor.shutdown(wait=False)
+
+
+def _close_spool(future) -> None:
+    spool = future.result()
+    if spool is not None:
+        spool.close()
+
+
+def _put_until_stopped(items: queue.Queue, item, stopped: threading.Event) -> bool:
+    """Put an item on a bounded queue, blocking while it is full until the consumer stops."""
+    while not stopped.is_set():
+        try:
+            items.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _follow_pod_logs(
+    v1, pods: List[str], read_kwargs: Dict[str, Any], queue_size: int
+) -> Iterator[str]:
+    """Follow every pod on its own reader thread, yielding lines in arrival order."""
+    logger = logging.getLogger(__name__)
+    lines: queue.Queue = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+
+    def _read(pod: str) -> None:
+        try:
+            if stopped.is_set():
+                return
+            response = _request_pod_log(v1, name=pod, **read_kwargs)
+            for chunk in _iter_log_line_chunks(response, LOG_STREAM_CHUNK_SIZE):
+                if not all(_put_until_stopped(lines, (pod, line), stopped) for line in chunk):
+                    return
+        except Exception as e:
+            logger.warning(f"Failed to get logs from pod {pod}: {e}")
+        finally:
+            _put_until_stopped(lines, (pod, None), stopped)
+
+    # Daemon threads so an abandoned or interrupted stream does not block interpreter exit
+    for pod in pods:
+        threading.Thread(target=_read, args=(pod,), daemon=True).start()
+
+    remaining = len(pods)
+    try:
+        while remaining:
+            pod, line = lines.get()
+            if line is None:
+                remaining -= 1
+                continue
+            yield f"[{pod}] {line}"
+    finally:
+        stopped.set()
@@ -0,0 +1,88 @@
+"""Client-side rate limiting that adapts to throttling.
+
+``AdaptiveRateLimiter`` is a token bucket shared by the workers of a fan-out,
+such as scanning many clusters or creating many custom objects. Workers
+report each request that ``is_throttling_error`` recognizes, and the bucket
+slows down until the service stops throttling.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from botocore.exceptions import ClientError
+from kubernetes.client.exceptions import ApiException
+
+
+# Error codes AWS services use to signal request throttling
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "SlowDown",
+}
+
+
+def is_throttling_error(e: Exception) -> bool:
+    """Whether an AWS or Kubernetes API error means the caller is being throttled."""
+    if isinstance(e, ApiException):
+        return e.status == 429
+    if isinstance(e, ClientError):
+        return e.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+    return False
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe token bucket whose refill rate adapts to throttling.
+
+    Callers take a token with ``acquire`` before each request and report the
+    outcome. Each throttled request halves the rate, down to ``min_rate``, and
+    each success adds ``increase`` requests per second back, up to ``max_rate``,
+    so concurrent workers converge on the rate the service actually allows.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.5,
+        increase: float = 0.5,
+        burst: Optional[float] = None,
+    ):
+        self.rate = rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Record a request that was not throttled."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> None:
+        """Record a throttled request, halving the rate and draining saved tokens."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
@@ -1,20 +1,28 @@
 from __future__ import absolute_import
+import atexit
+import inspect
 import logging
 import platform
+import queue
 import sys
-from time import perf_counter
-from typing import List, Tuple
+import threading
+from time import monotonic, perf_counter
+from typing import List, Optional, Tuple
 import functools
 import requests
-import subprocess
 import re
 
 import boto3
+from kubernetes import config
 from sagemaker.hyperpod.common.telemetry.constants import Feature, Status, Region
 import importlib.metadata
 
 SDK_VERSION = importlib.metadata.version("sagemaker-hyperpod")
 DEFAULT_AWS_REGION = "us-east-2"
+# Events beyond this are dropped rather than slowing down the caller
+TELEMETRY_QUEUE_SIZE = 100
+# Longest time the interpreter waits at exit for queued events to be sent
+TELEMETRY_FLUSH_TIMEOUT_SECONDS = 1.0
 OS_NAME = platform.system() or "UnresolvedOS"
 OS_VERSION = platform.release() or "UnresolvedOSVersion"
 OS_NAME_VERSION = "{}/{}".format(OS_NAME, OS_VERSION)
@@ -41,40 +49,42 @@ def get_region_and_account_from_current_context() -> Tuple[str, str]:
     Returns: (region, account_id)
     """
     try:
-        # Get current context
-        result = subprocess.run(
-            ["kubectl", "config", "current-context"], capture_output=True, text=True
-        )
-
-        if result.returncode == 0:
-            context = result.stdout.strip()
+        # Read the current context from the kubeconfig instead of spawning kubectl
+        _, active_context = config.list_kube_config_contexts()
+        context = active_context["name"]
 
-            # Extract region
-            region_pattern = r"([a-z]{2}-[a-z]+-\d{1})"
-            region = DEFAULT_AWS_REGION
-            if match := re.search(region_pattern, context):
-                region = match.group(1)
+        # Extract region
+        region_pattern = r"([a-z]{2}-[a-z]+-\d{1})"
+        region = DEFAULT_AWS_REGION
+        if match := re.search(region_pattern, context):
+            region = match.group(1)
 
-            # Extract account ID (12 digits)
-            account_pattern = r"(\d{12})"
-            account = "unknown"
-            if match := re.search(account_pattern, context):
-                account = match.group(1)
+        # Extract account ID (12 digits)
+        account_pattern = r"(\d{12})"
+        account = "unknown"
+        if match := re.search(account_pattern, context):
+            account = match.group(1)
 
-            return region, account
+        return region, account
 
     except Exception as e:
-        logger.debug(f"Failed to get context info from kubectl: {e}")
+        logger.debug(f"Failed to get context info from kubeconfig: {e}")
 
     return DEFAULT_AWS_REGION, "unknown"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_cached_region_and_account() -> Tuple[str, str]:
+    """Resolve region and account ID once per process"""
+    return get_region_and_account_from_current_context()
+
+
 def _requests_helper(url, timeout):
     """Make a GET request to the given URL"""
 
     response = None
     try:
-        response = requests.get(url, timeout)
+        response = requests.get(url, timeout=timeout)
     except requests.exceptions.RequestException as e:
         logger.exception("Request exception: %s", str(e))
     return response
@@ -106,7 +116,7 @@ def _construct_url(
     return base_url
 
 
-def _send_telemetry_request(
+def _deliver_telemetry_request(
     status: int,
     feature_list: List[int],
     session,
@@ -116,7 +126,7 @@ def _send_telemetry_request(
 ) -> None:
     """Make GET request to an empty object in S3 bucket"""
     try:
-        region, accountId = get_region_and_account_from_current_context()
+        region, accountId = _get_cached_region_and_account()
 
         try:
             Region(region)  # Validate the region
@@ -145,12 +155,82 @@ def _send_telemetry_request(
         logger.warning("SageMaker Python SDK telemetry not emitted!")
 
 
+_telemetry_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+_telemetry_worker: Optional[threading.Thread] = None
+_telemetry_worker_lock = threading.Lock()
+
+
+def _telemetry_worker_loop() -> None:
+    """Deliver queued telemetry events one at a time"""
+    while True:
+        event = _telemetry_queue.get()
+        try:
+            _deliver_telemetry_request(*event)
+        finally:
+            _telemetry_queue.task_done()
+
+
+def _ensure_telemetry_worker() -> None:
+    """Start the background telemetry worker if it is not running"""
+    global _telemetry_worker
+    if _telemetry_worker is not None and _telemetry_worker.is_alive():
+        return
+    with _telemetry_worker_lock:
+        if _telemetry_worker is None or not _telemetry_worker.is_alive():
+            _telemetry_worker = threading.Thread(
+                target=_telemetry_worker_loop,
+                name="hyperpod-telemetry",
+                daemon=True,
+            )
+            _telemetry_worker.start()
+
+
+def _flush_telemetry(timeout: float = TELEMETRY_FLUSH_TIMEOUT_SECONDS) -> bool:
+    """
+    Wait until queued telemetry events are delivered or the timeout expires.
+
+    Returns: True if all events were delivered, False otherwise
+    """
+    deadline = monotonic() + timeout
+    with _telemetry_queue.all_tasks_done:
+        while _telemetry_queue.unfinished_tasks:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                logger.debug("Telemetry flush timed out, dropping undelivered events")
+                return False
+            _telemetry_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+atexit.register(_flush_telemetry)
+
+
+def _send_telemetry_request(
+    status: int,
+    feature_list: List[int],
+    session,
+    failure_reason: str = None,
+    failure_type: str = None,
+    extra_info: str = None,
+) -> None:
+    """Queue a telemetry event for delivery on the background worker"""
+    try:
+        _ensure_telemetry_worker()
+        _telemetry_queue.put_nowait(
+            (status, feature_list, session, failure_reason, failure_type, extra_info)
+        )
+    except queue.Full:
+        logger.debug("Telemetry queue is full, dropping event")
+    except Exception:  # pylint: disable=W0703
+        logger.warning("SageMaker Python SDK telemetry not emitted!")
+
+
 def _hyperpod_telemetry_emitter(feature: str, func_name: str):
     def decorator(func):
+        sig = inspect.signature(func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import inspect
-            sig = inspect.signature(func)
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()
             
@@ -0,0 +1,134 @@
+"""Shared Jinja environment for rendering HyperPod templates.
+
+``hyp create`` renders the ``k8s.jinja`` or ``cfn_params.jinja`` written by
+``hyp init`` from the versioned template registries, and recipe jobs render
+their own ``k8s.jinja``. Compiling a template parses it and generates Python
+code, which costs far more than rendering it. Templates are therefore
+compiled once per process and looked up by their source. The compiled code is
+also kept in a ``FileSystemBytecodeCache`` under ``~/.cache/hyperpod/jinja``,
+keyed by a hash of the template source, so the next ``hyp`` process that
+renders the same registry template loads it without compiling.
+
+Rendering is the same as ``jinja2.Template(source).render(...)``. Pass
+``strict=True`` to fail on variables missing from the parameters instead of
+rendering them as empty strings. Any bytecode cache failure falls back to
+compiling the template.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+from typing import Any, Iterable, Iterator, Mapping
+
+from jinja2 import Environment, FileSystemBytecodeCache, StrictUndefined, Template, Undefined
+from jinja2.bccache import Bucket
+
+from sagemaker.hyperpod.common.metadata_cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_BYTECODE_CACHE_DIR_NAME = "jinja"
+# Distinct template sources kept compiled in memory
+TEMPLATE_CACHE_SIZE = 64
+
+
+class _TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache in the HyperPod cache directory that never fails a render."""
+
+    def __init__(self):
+        self.pattern = "%s.jinja-bytecode"
+
+    @property
+    def directory(self) -> str:
+        # Resolved per call so HYPERPOD_CACHE_DIR changes are honored
+        return os.path.join(get_cache_dir(), TEMPLATE_BYTECODE_CACHE_DIR_NAME)
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Template bytecode cache unavailable: {e}")
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            logger.debug(f"Template bytecode cache unavailable: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_environment(strict: bool = False) -> Environment:
+    """Get the shared Jinja environment.
+
+    Args:
+        strict (bool): Raise jinja2.UndefinedError for variables missing from
+            the render parameters instead of rendering them empty.
+
+    Returns:
+        Environment: Environment with the same settings as jinja2.Template
+    """
+    return Environment(
+        undefined=StrictUndefined if strict else Undefined,
+        bytecode_cache=_TemplateBytecodeCache(),
+    )
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: str, strict: bool = False) -> Template:
+    """Compile template source, reusing the compiled template for the same source.
+
+    Args:
+        source (str): Jinja template source
+        strict (bool): Raise on variables missing from the render parameters
+
+    Returns:
+        Template: The compiled template
+
+    Raises:
+        jinja2.TemplateSyntaxError: If the source is not a valid template
+    """
+    environment = get_template_environment(strict)
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    bytecode_cache = environment.bytecode_cache
+    bucket = bytecode_cache.get_bucket(environment, key, None, source)
+    code = bucket.code
+    if code is None:
+        code = environment.compile(source)
+        bucket.code = code
+        bytecode_cache.set_bucket(bucket)
+    return environment.template_class.from_code(environment, code, environment.make_globals(None))
+
+
+def render_template(source: str, parameters: Mapping[str, Any], strict: bool = False) -> str:
+    """Render template source with one set of parameters.
+
+    Args:
+        source (str): Jinja template source
+        parameters (Mapping[str, Any]): Template variables
+        strict (bool): Raise on variables missing from parameters
+
+    Returns:
+        str: The rendered template
+    """
+    return compile_template(source, strict).render(parameters)
+
+
+def render_templates(
+    source: str, parameter_sets: Iterable[Mapping[str, Any]], strict: bool = False
+) -> Iterator[str]:
+    """Render one template with many parameter sets, compiling it once.
+
+    Args:
+        source (str): Jinja template source
+        parameter_sets (Iterable[Mapping[str, Any]]): Template variables of
+            each render, for example one set per job of a parameter sweep
+        strict (bool): Raise on variables missing from a parameter set
+
+    Yields:
+        str: The rendered template for each parameter set, in order
+    """
+    template = compile_template(source, strict)
+    for parameters in parameter_sets:
+        yield template.render(parameters)
@@ -4,13 +4,18 @@ from kubernetes.client.exceptions import ApiException
 from kubernetes import config
 import re
 import boto3
-import json
-from typing import List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
+import copy
 import logging
 import os
+import socket
 import subprocess
+import threading
 import yaml
 import click
+from urllib3.connection import HTTPConnection
+from sagemaker.hyperpod.common.metadata_cache import cached_api_call, is_metadata_cache_enabled
+from sagemaker.hyperpod.common.hub_cache import PUBLIC_HUB_NAME, get_hub_content_document
 from kubernetes.config import (
     KUBE_CONFIG_DEFAULT_LOCATION,
 )
@@ -21,6 +26,28 @@ CLIENT_VERSION_PATTERN = r'^\d+\.\d+\.\d+$'
 
 KUBE_CONFIG_PATH = os.path.expanduser(KUBE_CONFIG_DEFAULT_LOCATION)
 
+# Process-wide boto3 client pool and the private sessions it builds clients
+# from, keyed by profile, see create_boto3_client
+_BOTO3_CLIENTS: Dict[Tuple[str, Optional[str], Optional[str], str], Any] = {}
+_BOTO3_SESSIONS: Dict[Optional[str], boto3.session.Session] = {}
+_BOTO3_CLIENT_LOCK = threading.Lock()
+
+# Connections the shared Kubernetes ApiClient keeps open to the API server,
+# enough for the SDK's concurrent log, exec and LIST workers to reuse them
+KUBERNETES_CONNECTION_POOL_MAXSIZE = 32
+# Idle seconds before TCP keep-alive probes start on a pooled connection,
+# shorter than the idle timeouts of load balancers in front of API servers
+KUBERNETES_TCP_KEEPALIVE_IDLE_SECONDS = 60
+KUBERNETES_TCP_KEEPALIVE_INTERVAL_SECONDS = 15
+KUBERNETES_TCP_KEEPALIVE_PROBES = 4
+
+# Process-wide Kubernetes ApiClient, see get_shared_api_client
+_shared_api_client: Optional[client.ApiClient] = None
+# Default Configuration the shared ApiClient was built from
+_shared_api_client_configuration: Optional[client.Configuration] = None
+_shared_api_client_injected = False
+_SHARED_API_CLIENT_LOCK = threading.Lock()
+
 
 def get_default_namespace():
     _, active_context = config.list_kube_config_contexts()
@@ -132,11 +159,7 @@ def get_region_from_eks_arn(arn: str) -> str:
 def get_jumpstart_model_instance_types(model_id, region) -> List[str]:
     client = create_boto3_client("sagemaker", region_name=region)
 
-    response = client.describe_hub_content(
-        HubName="SageMakerPublicHub", HubContentType="Model", HubContentName=model_id
-    )
-
-    content = json.loads(response["HubContentDocument"])
+    content = get_hub_content_document(client, PUBLIC_HUB_NAME, "Model", model_id)
     instance_types = content["SupportedInferenceInstanceTypes"]
 
     return instance_types
@@ -146,7 +169,7 @@ def get_cluster_instance_types(cluster, region) -> set:
     instance_types = set({})
 
     sagemaker_client = create_boto3_client("sagemaker", region_name=region)
-    response = sagemaker_client.describe_cluster(ClusterName=cluster)
+    response = cached_api_call(sagemaker_client, "describe_cluster", ClusterName=cluster)
 
     for instance_group in response["InstanceGroups"]:
         instance_types.add(instance_group["InstanceType"])
@@ -188,7 +211,7 @@ def setup_logging(logger, debug=False):
 
 
 def is_eks_orchestrator(sagemaker_client, cluster_name: str):
-    response = sagemaker_client.describe_cluster(ClusterName=cluster_name)
+    response = cached_api_call(sagemaker_client, "describe_cluster", ClusterName=cluster_name)
     return response.get("Orchestrator", {}).get("Eks") is not None
 
 
@@ -283,7 +306,7 @@ def set_cluster_context(
     if not is_eks_orchestrator(client, cluster_name):
         raise ValueError(f"Cluster '{cluster_name}' is not EKS-orchestrated. HyperPod CLI only supports EKS-orchestrated clusters.")
     
-    response = client.describe_cluster(ClusterName=cluster_name)
+    response = cached_api_call(client, "describe_cluster", ClusterName=cluster_name)
     eks_cluster_arn = response["Orchestrator"]["Eks"]["ClusterArn"]
     eks_name = get_eks_name_from_arn(eks_cluster_arn)
 
@@ -308,9 +331,10 @@ def get_cluster_context():
 
 def list_clusters(
     region: Optional[str] = None,
+    refresh: bool = False,
 ):
     client = create_boto3_client("sagemaker", region_name=region)
-    clusters = client.list_clusters()
+    clusters = cached_api_call(client, "list_clusters", refresh=refresh)
 
     eks_clusters = []
     slurm_clusters = []
@@ -329,15 +353,19 @@ def get_current_cluster():
     current_context = get_cluster_context()
     region = get_region_from_eks_arn(current_context)
 
-    hyperpod_clusters = list_clusters(region)["Eks"]
     client = create_boto3_client("sagemaker", region_name=region)
 
-    for cluster_name in hyperpod_clusters:
-        if not is_eks_orchestrator(client, cluster_name):
-            continue
-        response = client.describe_cluster(ClusterName=cluster_name)
-        if response["Orchestrator"]["Eks"]["ClusterArn"] == current_context:
-            return cluster_name
+    # A cached cluster list can predate the cluster, so look again uncached before failing
+    for refresh in (False, True):
+        hyperpod_clusters = list_clusters(region, refresh=refresh)["Eks"]
+        for cluster_name in hyperpod_clusters:
+            if not is_eks_orchestrator(client, cluster_name):
+                continue
+            response = cached_api_call(client, "describe_cluster", ClusterName=cluster_name)
+            if response["Orchestrator"]["Eks"]["ClusterArn"] == current_context:
+                return cluster_name
+        if not is_metadata_cache_enabled():
+            break
 
     raise Exception(
         f"Failed to get current Hyperpod cluster name. Check your config file at {KUBE_CONFIG_DEFAULT_LOCATION}"
@@ -379,9 +407,28 @@ def _resolve_region(region_name: Optional[str] = None) -> Optional[str]:
     except Exception:
         return None
 
+def _client_config_fingerprint(kwargs: Dict[str, Any]) -> str:
+    """Build a stable cache key component from boto3 client keyword arguments."""
+    parts = []
+    for key in sorted(kwargs):
+        value = kwargs[key]
+        # botocore.config.Config has no value equality, key it by the options it was built with
+        if hasattr(value, "_user_provided_options"):
+            value = sorted(value._user_provided_options.items())
+        parts.append(f"{key}={value!r}")
+    return ",".join(parts)
+
+
 def create_boto3_client(service_name: str, region_name: Optional[str] = None, **kwargs):
     """Create a boto3 client with smart region handling.
 
+    Clients are cached process-wide by (service, region, profile, client
+    arguments) and built from a private boto3 session per profile, so repeated
+    calls within a command reuse the same service model and HTTP connection
+    pool without touching boto3's default session. boto3 clients are
+    thread-safe and may be shared across threads. Call
+    clear_boto3_client_cache() after changing credentials.
+
     Args:
         service_name (str): AWS service name (e.g., 'sagemaker', 'eks')
         region_name (Optional[str]): AWS region. If None, resolved via
@@ -391,7 +438,115 @@ def create_boto3_client(service_name: str, region_name: Optional[str] = None, **
     Returns:
         boto3 client instance
     """
-    return boto3.client(service_name, region_name=_resolve_region(region_name), **kwargs)
+    region = _resolve_region(region_name)
+    profile = os.environ.get("AWS_PROFILE")
+    key = (service_name, region, profile, _client_config_fingerprint(kwargs))
+    with _BOTO3_CLIENT_LOCK:
+        client = _BOTO3_CLIENTS.get(key)
+        if client is None:
+            session = _BOTO3_SESSIONS.get(profile)
+            if session is None:
+                session = boto3.session.Session(profile_name=profile)
+                _BOTO3_SESSIONS[profile] = session
+            # Session client creation is not thread-safe, so it stays under the lock
+            client = session.client(service_name, region_name=region, **kwargs)
+            _BOTO3_CLIENTS[key] = client
+        return client
+
+
+def clear_boto3_client_cache() -> None:
+    """Drop all cached boto3 clients and the sessions they were built from.
+
+    Use after refreshing or switching AWS credentials so that subsequent
+    create_boto3_client calls pick up the new credential chain.
+    """
+    with _BOTO3_CLIENT_LOCK:
+        _BOTO3_CLIENTS.clear()
+        _BOTO3_SESSIONS.clear()
+
+
+def _tcp_keepalive_socket_options() -> List[tuple]:
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Not every platform lets the keep-alive timers be set per socket
+    for name, value in (
+        ("TCP_KEEPIDLE", KUBERNETES_TCP_KEEPALIVE_IDLE_SECONDS),
+        ("TCP_KEEPINTVL", KUBERNETES_TCP_KEEPALIVE_INTERVAL_SECONDS),
+        ("TCP_KEEPCNT", KUBERNETES_TCP_KEEPALIVE_PROBES),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+def create_api_client(
+    configuration: Optional[client.Configuration] = None,
+    pool_maxsize: int = KUBERNETES_CONNECTION_POOL_MAXSIZE,
+    keep_alive: bool = True,
+) -> client.ApiClient:
+    """Create a Kubernetes ApiClient with a connection pool sized for concurrent SDK calls.
+
+    Args:
+        configuration (Optional[client.Configuration]): Configuration to copy.
+            Defaults to the one loaded by config.load_kube_config.
+        pool_maxsize (int): Connections kept open to the API server
+        keep_alive (bool): Enable TCP keep-alive on pooled connections so
+            idle ones are not silently dropped by the network
+
+    Returns:
+        client.ApiClient: A new ApiClient. It is thread-safe and may be shared across threads.
+    """
+    if configuration is None:
+        configuration = client.Configuration.get_default_copy()
+    else:
+        configuration = copy.deepcopy(configuration)
+    configuration.connection_pool_maxsize = pool_maxsize
+    if keep_alive:
+        configuration.socket_options = _tcp_keepalive_socket_options()
+    return client.ApiClient(configuration)
+
+
+def get_shared_api_client() -> client.ApiClient:
+    """Get the ApiClient shared by all Kubernetes calls in the SDK.
+
+    Constructing the typed API classes without an ApiClient gives each call
+    its own connection pool, so every call repeats the TLS handshake. The
+    shared client keeps connections to the API server alive across calls and
+    threads. It is rebuilt when config.load_kube_config loads another kube
+    context, unless one was injected with set_shared_api_client.
+
+    Returns:
+        client.ApiClient: The shared ApiClient
+    """
+    global _shared_api_client, _shared_api_client_configuration
+    # load_kube_config installs a new default Configuration, so its identity
+    # tells whether the kube context changed since the client was built
+    default_configuration = client.Configuration._default
+    with _SHARED_API_CLIENT_LOCK:
+        if _shared_api_client is None or (
+            not _shared_api_client_injected
+            and _shared_api_client_configuration is not default_configuration
+        ):
+            _shared_api_client = create_api_client()
+            _shared_api_client_configuration = default_configuration
+        return _shared_api_client
+
+
+def set_shared_api_client(api_client: Optional[client.ApiClient]) -> None:
+    """Use the given ApiClient for all Kubernetes calls in the SDK.
+
+    Args:
+        api_client (Optional[client.ApiClient]): ApiClient to use, for example
+            one from create_api_client with a larger pool or a client for
+            another cluster. None goes back to a client built from the loaded
+            kube config.
+    """
+    global _shared_api_client, _shared_api_client_configuration, _shared_api_client_injected
+    with _SHARED_API_CLIENT_LOCK:
+        _shared_api_client = api_client
+        _shared_api_client_configuration = None
+        _shared_api_client_injected = api_client is not None
+
 
 def region_to_az_ids(region_code: str):
     """
@@ -400,7 +555,9 @@ def region_to_az_ids(region_code: str):
     """
     ec2_client = create_boto3_client('ec2', region_name=region_code)
     try:
-        response = ec2_client.describe_availability_zones(
+        response = cached_api_call(
+            ec2_client,
+            "describe_availability_zones",
             Filters=[
                 {'Name': 'region-name', 'Values': [region_code]},
                 {'Name': 'zone-type', 'Values': ['availability-zone']}
@@ -514,6 +671,21 @@ def is_kubernetes_version_compatible(client_version: Tuple[int, int], server_ver
     return True
 
 
+def _echo_log_line(line: str) -> None:
+    """Echo a single log line, color coded by its log level keywords."""
+    line_upper = line.upper()
+    if any(keyword in line_upper for keyword in ["ERROR", "FATAL", "EXCEPTION"]):
+        click.secho(line, fg="red")
+    elif any(keyword in line_upper for keyword in ["WARNING", "WARN"]):
+        click.secho(line, fg="yellow")
+    elif any(keyword in line_upper for keyword in ["INFO", "SUCCESS"]):
+        click.secho(line, fg="green")
+    elif any(keyword in line_upper for keyword in ["DEBUG", "TRACE"]):
+        click.secho(line, fg="blue")
+    else:
+        click.echo(line)
+
+
 def display_formatted_logs(logs: str, title: str = "Logs") -> None:
     """
     Display logs with consistent formatting and color coding across all job types.
@@ -526,25 +698,32 @@ def display_formatted_logs(logs: str, title: str = "Logs") -> None:
         click.echo("No logs available.")
         return
 
-    click.echo(f"\n{title}:")
-    click.echo("=" * 80)
+    display_formatted_log_stream(logs.split("\n"), title=title)
+
 
-    # Split logs into lines and display them with color coding
-    log_lines = logs.split("\n")
-    for line in log_lines:
+def display_formatted_log_stream(lines: Iterable[str], title: str = "Logs") -> None:
+    """
+    Display log lines as they arrive, with the same formatting as display_formatted_logs.
+
+    Each line is color coded and echoed as soon as it is produced, so memory use does
+    not grow with the size of the log and followed logs are printed live.
+
+    Args:
+        lines: Iterable of log lines, e.g. from stream_pod_logs
+        title: Title to display before logs (default: "Logs")
+    """
+    header_printed = False
+    for line in lines:
+        if not header_printed:
+            click.echo(f"\n{title}:")
+            click.echo("=" * 80)
+            header_printed = True
         if line.strip():  # Skip empty lines
-            # Color coding based on log level keywords
-            line_upper = line.upper()
-            if any(keyword in line_upper for keyword in ["ERROR", "FATAL", "EXCEPTION"]):
-                click.secho(line, fg="red")
-            elif any(keyword in line_upper for keyword in ["WARNING", "WARN"]):
-                click.secho(line, fg="yellow")
-            elif any(keyword in line_upper for keyword in ["INFO", "SUCCESS"]):
-                click.secho(line, fg="green")
-            elif any(keyword in line_upper for keyword in ["DEBUG", "TRACE"]):
-                click.secho(line, fg="blue")
-            else:
-                click.echo(line)
+            _echo_log_line(line)
+
+    if not header_printed:
+        click.echo("No logs available.")
+        return
 
     click.echo("\nEnd of logs")
     click.echo("=" * 80)
@@ -569,7 +748,7 @@ def verify_kubernetes_version_compatibility(logger) -> bool:
     """
 
     try:
-        version_api = client.VersionApi()
+        version_api = client.VersionApi(get_shared_api_client())
         server_version_info = version_api.get_code()
 
         server_version_str = f"{server_version_info.major}.{server_version_info.minor}"
@@ -11,6 +11,15 @@ INFERENCE_ENDPOINT_CONFIG_KIND = "InferenceEndpointConfig"
 INFERENCE_ENDPOINT_CONFIG_PLURAL = "inferenceendpointconfigs"
 DEFAULT_MOUNT_PATH = "/opt/ml/model"
 OPERATOR_NAMESPACE = "hyperpod-inference-system"
+POD_LIST_PAGE_SIZE = 500
+# Times a paged endpoint LIST starts over after its continue token expires
+LIST_EXPIRED_RESTARTS = 2
+# Keeps pod list request URLs well under common API server and proxy limits
+MAX_LABEL_SELECTOR_LENGTH = 2000
+# Asks the API server for pod metadata only instead of full pod objects
+PARTIAL_OBJECT_METADATA_LIST_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+)
 
 KIND_PLURAL_MAP = {
     JUMPSTART_MODEL_KIND: JUMPSTART_MODEL_PLURAL,
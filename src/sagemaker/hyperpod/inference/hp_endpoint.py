@@ -16,10 +16,9 @@ from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
 )
 from sagemaker.hyperpod.common.telemetry.constants import Feature
 from sagemaker.hyperpod.inference.hp_endpoint_base import HPEndpointBase
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from sagemaker_core.main.resources import Endpoint
 from pydantic import Field, ValidationError
-from kubernetes import client
 
 
 class HPEndpoint(_HPEndpoint, HPEndpointBase):
@@ -106,11 +105,43 @@ class HPEndpoint(_HPEndpoint, HPEndpointBase):
 
         return self
 
+    def wait_until(
+        self,
+        condition: Callable[["HPEndpoint"], bool],
+        timeout: Optional[float] = None,
+    ) -> "HPEndpoint":
+        """Watch the endpoint until condition(self) is True, refreshing status on every change.
+
+        Raises TimeoutError if the condition does not hold within timeout seconds.
+        """
+        if not self.metadata:
+            raise Exception(
+                "Metadata not found! Please provide object name and namespace in metadata field."
+            )
+
+        def check(response):
+            self.status = (
+                InferenceEndpointConfigStatus.model_validate(response["status"], by_name=True)
+                if response.get("status") else None
+            )
+            return condition(self)
+
+        self.call_wait_api(
+            name=self.metadata.name,
+            kind=INFERENCE_ENDPOINT_CONFIG_KIND,
+            namespace=self.metadata.namespace,
+            condition=check,
+            timeout=timeout,
+        )
+        return self
+
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_endpoints")
     def list(
         cls,
         namespace: str = None,
+        page_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> List[Endpoint]:
         if not namespace:
             namespace = get_default_namespace()
@@ -118,16 +149,14 @@ class HPEndpoint(_HPEndpoint, HPEndpointBase):
         response = cls.call_list_api(
             kind=INFERENCE_ENDPOINT_CONFIG_KIND,
             namespace=namespace,
+            page_size=page_size,
         )
 
-        endpoints = []
-
-        if response and response["items"]:
-            for item in response["items"]:
-                name = item["metadata"]["name"]
-                endpoints.append(cls.get(name, namespace=namespace))
+        if not response or not response["items"]:
+            return []
 
-        return endpoints
+        # LIST items carry the same spec, status and metadata as GET responses
+        return cls._from_list_items(response["items"], max_workers=max_workers)
 
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "get_endpoint")
@@ -141,6 +170,10 @@ class HPEndpoint(_HPEndpoint, HPEndpointBase):
             namespace=namespace,
         )
 
+        return cls._from_response(response)
+
+    @classmethod
+    def _from_response(cls, response: dict) -> "HPEndpoint":
         endpoint = HPEndpoint.model_validate(response["spec"], by_name=True)
         status = response.get("status")
         if status is not None:
@@ -200,32 +233,8 @@ class HPEndpoint(_HPEndpoint, HPEndpointBase):
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_pods_endpoint")
     def list_pods(cls, namespace=None, endpoint_name=None):
-        cls.verify_kube_config()
-
-        if not namespace:
-            namespace = get_default_namespace()
-
-        v1 = client.CoreV1Api()
-        list_pods_response = v1.list_namespaced_pod(namespace=namespace)
-
-        endpoints = set()
-        if endpoint_name:
-            endpoints.add(endpoint_name)
-        else:
-            list_response = cls.call_list_api(
-                kind=INFERENCE_ENDPOINT_CONFIG_KIND,
-                namespace=namespace,
-            )
-            if list_response and list_response["items"]:
-                for item in list_response["items"]:
-                    endpoints.add(item["metadata"]["name"])
-
-        pods = []
-        for item in list_pods_response.items:
-            app_name = item.metadata.labels.get("app", None)
-            if app_name in endpoints:
-                # list_namespaced_pod will return all pods in the namespace, so we need to filter
-                # out the pods that are created by custom endpoint
-                pods.append(item.metadata.name)
-
-        return pods
+        return cls._list_endpoint_pods(
+            kind=INFERENCE_ENDPOINT_CONFIG_KIND,
+            namespace=namespace,
+            endpoint_name=endpoint_name,
+        )
@@ -1,8 +1,11 @@
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+import json
+from typing import Callable, Iterator, List, Optional, Union
 import logging
 import yaml
 from types import SimpleNamespace
 from kubernetes import client, config
+from kubernetes.client.exceptions import ApiException
 from sagemaker.hyperpod.inference.config.constants import *
 from sagemaker.hyperpod.inference.config.hp_jumpstart_endpoint_config import (
     _HPJumpStartEndpoint,
@@ -15,8 +18,16 @@ from sagemaker.hyperpod.common.utils import (
     handle_exception,
     setup_logging,
     get_default_namespace,
+    get_shared_api_client,
     verify_kubernetes_version_compatibility,
 )
+from sagemaker.hyperpod.common.pod_logs import stream_pod_logs
+from sagemaker.hyperpod.common.k8s_bulk import wait_for_custom_object
+from sagemaker.hyperpod.common.informer import (
+    get_cached_object,
+    list_cached_objects,
+    list_cached_pod_names,
+)
 from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
     _hyperpod_telemetry_emitter,
 )
@@ -106,7 +117,7 @@ class HPEndpointBase:
         logger = cls.get_logger()
         logger = setup_logging(logger, debug)
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         body = {
             "apiVersion": INFERENCE_FULL_API_VERSION,
@@ -134,9 +145,14 @@ class HPEndpointBase:
         cls,
         kind: str,
         namespace: str,
+        page_size: Optional[int] = None,
     ):
         """List inference endpoints using Kubernetes API.
 
+        Follows ``continue`` tokens so the returned ``items`` always hold every
+        endpoint in the namespace. If a token expires before the last page is
+        read, the LIST starts over.
+
         **Parameters:**
 
         .. list-table::
@@ -152,6 +168,9 @@ class HPEndpointBase:
            * - namespace
              - str
              - Kubernetes namespace to list endpoints from
+           * - page_size
+             - Optional[int]
+             - Maximum number of endpoints fetched per request. Fetches all endpoints in a single request if not provided
 
         **Returns:**
 
@@ -171,18 +190,65 @@ class HPEndpointBase:
         """
         cls.verify_kube_config()
 
-        custom_api = client.CustomObjectsApi()
+        cached = list_cached_objects(
+            INFERENCE_GROUP, INFERENCE_API_VERSION, KIND_PLURAL_MAP[kind], namespace
+        )
+        if cached is not None:
+            return {"items": cached}
 
-        try:
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
+
+        kwargs = {}
+        if page_size:
+            kwargs["limit"] = page_size
+
+        def _list_page(**page_kwargs):
             return custom_api.list_namespaced_custom_object(
                 group=INFERENCE_GROUP,
                 version=INFERENCE_API_VERSION,
                 namespace=namespace,
                 plural=KIND_PLURAL_MAP[kind],
+                **kwargs,
+                **page_kwargs,
             )
+
+        try:
+            restarts = 0
+            while True:
+                response = _list_page()
+                _continue = (response.get("metadata") or {}).get("continue")
+                try:
+                    while _continue:
+                        page = _list_page(_continue=_continue)
+                        response["items"].extend(page.get("items") or [])
+                        _continue = (page.get("metadata") or {}).get("continue")
+                except ApiException as e:
+                    # A continue token expires with the resourceVersion it was
+                    # issued for (410 Gone), so the LIST starts over
+                    if e.status != 410 or restarts >= LIST_EXPIRED_RESTARTS:
+                        raise
+                    restarts += 1
+                    cls.get_logger().debug(f"Continue token for {kind} in {namespace} expired, listing again")
+                    continue
+                break
+            if response.get("metadata"):
+                response["metadata"].pop("continue", None)
+            return response
         except Exception as e:
             handle_exception(e, "", namespace)
 
+    @classmethod
+    def _from_list_items(
+        cls,
+        items: List[dict],
+        max_workers: Optional[int] = None,
+    ) -> list:
+        """Build endpoint objects from LIST items with the subclass's _from_response, optionally in parallel."""
+        if max_workers and max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(cls._from_response, items))
+        return [cls._from_response(item) for item in items]
+
     @classmethod
     def call_get_api(
         cls,
@@ -229,7 +295,13 @@ class HPEndpointBase:
         """
         cls.verify_kube_config()
 
-        custom_api = client.CustomObjectsApi()
+        cached = get_cached_object(
+            INFERENCE_GROUP, INFERENCE_API_VERSION, KIND_PLURAL_MAP[kind], namespace, name
+        )
+        if cached is not None:
+            return cached
+
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             return custom_api.get_namespaced_custom_object(
@@ -245,6 +317,82 @@ class HPEndpointBase:
             handle_exception(e, name, namespace,
                             operation_type='get', resource_type=resource_type)
 
+    @classmethod
+    def call_wait_api(
+        cls,
+        name: str,
+        kind: str,
+        namespace: str,
+        condition: Callable[[dict], bool],
+        timeout: Optional[float] = None,
+    ):
+        """Wait for an inference endpoint to satisfy a condition using the Kubernetes watch API.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - name
+             - str
+             - Name of the endpoint to wait for
+           * - kind
+             - str
+             - Kubernetes resource kind
+           * - namespace
+             - str
+             - Kubernetes namespace containing the endpoint
+           * - condition
+             - Callable[[dict], bool]
+             - Called with each observed version of the endpoint resource. Waiting stops when it returns True.
+           * - timeout
+             - float, optional
+             - Seconds to wait before raising TimeoutError. If None, waits indefinitely.
+
+        **Returns:**
+
+        dict: The endpoint resource that satisfied the condition
+
+        **Raises:**
+
+        TimeoutError: If the condition is not met within the timeout
+
+        RuntimeError: If the endpoint is deleted while waiting
+
+        Exception: If the Kubernetes API call fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> endpoint = HPEndpointBase.call_wait_api(
+              ...     "my-endpoint", "JumpStartModel", "default",
+              ...     lambda r: r.get("status", {}).get("state") == "DeploymentComplete",
+              ... )
+        """
+        cls.verify_kube_config()
+
+        try:
+            return wait_for_custom_object(
+                client.CustomObjectsApi(get_shared_api_client()),
+                group=INFERENCE_GROUP,
+                version=INFERENCE_API_VERSION,
+                plural=KIND_PLURAL_MAP[kind],
+                name=name,
+                namespace=namespace,
+                condition=condition,
+                timeout=timeout,
+            )
+        except Exception as e:
+            resource_type = 'hyp_jumpstart_endpoint' if kind == 'JumpStartModel' else 'hyp_custom_endpoint'
+            handle_exception(e, name, namespace,
+                            operation_type='get', resource_type=resource_type)
+
     def call_delete_api(
         self,
         name: str,
@@ -286,7 +434,7 @@ class HPEndpointBase:
         """
         self.verify_kube_config()
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             custom_api.delete_namespaced_custom_object(
@@ -344,7 +492,7 @@ class HPEndpointBase:
         """
         cls.verify_kube_config()
 
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(get_shared_api_client())
 
         pods = v1.list_namespaced_pod(namespace=OPERATOR_NAMESPACE)
 
@@ -424,7 +572,7 @@ class HPEndpointBase:
         """
         cls.verify_kube_config()
 
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(get_shared_api_client())
 
         if not namespace:
             namespace = get_default_namespace()
@@ -450,6 +598,98 @@ class HPEndpointBase:
 
         return logs
 
+    @classmethod
+    @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "stream_logs_endpoint")
+    def stream_logs(
+        cls,
+        pod: str,
+        container: str = None,
+        namespace=None,
+        follow: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream logs from a specific pod.
+
+        Like :meth:`get_logs`, but yields log lines as they are read from the API
+        server instead of returning the whole log as one string. With ``follow``
+        the iterator keeps yielding new lines while the container is running.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - pod
+             - str
+             - Name of the pod to get logs from
+           * - container
+             - str, optional
+             - Container name. If not specified, uses the first container in the pod
+           * - namespace
+             - str, optional
+             - Kubernetes namespace. If not specified, uses the default namespace
+           * - follow
+             - bool, optional
+             - Keep streaming new log lines until the container exits. Defaults to False
+           * - since_seconds
+             - int, optional
+             - Only return logs newer than this many seconds
+           * - tail_lines
+             - int, optional
+             - Only return this many lines from the end of the log
+           * - limit_bytes
+             - int, optional
+             - Stop after this many bytes of log output
+
+        **Returns:**
+
+        Iterator[str]: Pod log lines with timestamps
+
+        **Raises:**
+
+        Exception: If log retrieval fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> for line in HPEndpointBase.stream_logs("my-pod", follow=True):
+              ...     print(line)
+        """
+        cls.verify_kube_config()
+
+        v1 = client.CoreV1Api(get_shared_api_client())
+
+        if not namespace:
+            namespace = get_default_namespace()
+
+        try:
+            # if pod has multiple containers, get logs in the first container
+            if not container:
+                pod_details = v1.read_namespaced_pod(name=pod, namespace=namespace)
+                container = pod_details.spec.containers[0].name
+
+            return stream_pod_logs(
+                v1,
+                name=pod,
+                namespace=namespace,
+                container=container,
+                timestamps=True,
+                follow=follow,
+                since_seconds=since_seconds,
+                tail_lines=tail_lines,
+                limit_bytes=limit_bytes,
+            )
+        except Exception as e:
+            handle_exception(e, pod, namespace)
+
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_pods_endpoint")
     def list_pods(cls, namespace=None):
@@ -488,12 +728,91 @@ class HPEndpointBase:
         if not namespace:
             namespace = get_default_namespace()
 
-        v1 = client.CoreV1Api()
-        response = v1.list_namespaced_pod(namespace=namespace)
+        cached = list_cached_pod_names(namespace)
+        if cached is not None:
+            return cached
+
+        return cls._list_pod_names(namespace)
+
+    @classmethod
+    def _list_endpoint_pods(
+        cls,
+        kind: str,
+        namespace: Optional[str] = None,
+        endpoint_name: Optional[str] = None,
+    ) -> List[str]:
+        """List names of the pods serving one or all endpoints of a kind in a namespace."""
+        cls.verify_kube_config()
+
+        if not namespace:
+            namespace = get_default_namespace()
+
+        if endpoint_name:
+            endpoints = [endpoint_name]
+        else:
+            list_response = cls.call_list_api(kind=kind, namespace=namespace)
+            endpoints = []
+            if list_response and list_response["items"]:
+                endpoints = [item["metadata"]["name"] for item in list_response["items"]]
 
+        cached = [list_cached_pod_names(namespace, {"app": name}) for name in sorted(set(endpoints))]
+        if cached and all(names is not None for names in cached):
+            return [pod for names in cached for pod in names]
+
+        # Endpoint pods carry the endpoint name in their app label, so let the
+        # API server select them instead of downloading every pod in the namespace
         pods = []
-        for item in response.items:
-            pods.append(item.metadata.name)
+        for label_selector in cls._app_label_selectors(endpoints):
+            pods.extend(cls._list_pod_names(namespace, label_selector))
+        return pods
+
+    @staticmethod
+    def _app_label_selectors(app_names: List[str]) -> List[str]:
+        """Split app names into ``app in (...)`` selectors no longer than MAX_LABEL_SELECTOR_LENGTH."""
+        selectors = []
+        chunk: List[str] = []
+        length = 0
+        for name in sorted(set(app_names)):
+            if chunk and length + len(name) + 1 > MAX_LABEL_SELECTOR_LENGTH - len("app in ()"):
+                selectors.append(f"app in ({','.join(chunk)})")
+                chunk, length = [], 0
+            chunk.append(name)
+            length += len(name) + 1
+        if chunk:
+            selectors.append(f"app in ({','.join(chunk)})")
+        return selectors
+
+    @classmethod
+    def _list_pod_names(
+        cls,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        page_size: int = POD_LIST_PAGE_SIZE,
+    ) -> List[str]:
+        """List pod names page by page, fetching only pod metadata from the API server."""
+        v1 = client.CoreV1Api(get_shared_api_client())
+
+        pods = []
+        _continue = None
+        while True:
+            # The typed V1PodList model cannot hold a PartialObjectMetadataList,
+            # so the response is read as JSON
+            response = v1.list_namespaced_pod(
+                namespace,
+                label_selector=label_selector,
+                limit=page_size,
+                _continue=_continue,
+                _preload_content=False,
+                _headers={"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT},
+            )
+            page = json.loads(response.data)
+
+            for item in page.get("items") or []:
+                pods.append(item["metadata"]["name"])
+
+            _continue = (page.get("metadata") or {}).get("continue")
+            if not _continue:
+                break
 
         return pods
 
@@ -516,7 +835,7 @@ class HPEndpointBase:
         """
         cls.verify_kube_config()
 
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(get_shared_api_client())
         response = v1.list_namespace()
 
         namespaces = []
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from pydantic import Field, ValidationError
 from sagemaker.hyperpod.inference.config.constants import *
 from sagemaker.hyperpod.inference.constant import INSTANCE_MIG_PROFILES
@@ -21,7 +21,6 @@ from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
     _hyperpod_telemetry_emitter,
 )
 from sagemaker.hyperpod.common.telemetry.constants import Feature
-from kubernetes import client
 
 
 class HPJumpStartEndpoint(_HPJumpStartEndpoint, HPEndpointBase):
@@ -156,11 +155,43 @@ class HPJumpStartEndpoint(_HPJumpStartEndpoint, HPEndpointBase):
 
         return self
 
+    def wait_until(
+        self,
+        condition: Callable[["HPJumpStartEndpoint"], bool],
+        timeout: Optional[float] = None,
+    ) -> "HPJumpStartEndpoint":
+        """Watch the endpoint until condition(self) is True, refreshing status on every change.
+
+        Raises TimeoutError if the condition does not hold within timeout seconds.
+        """
+        if not self.metadata:
+            raise Exception(
+                "Metadata is empty. Please provide name and namespace in metadata field."
+            )
+
+        def check(response):
+            self.status = (
+                JumpStartModelStatus.model_validate(response["status"], by_name=True)
+                if response.get("status") else None
+            )
+            return condition(self)
+
+        self.call_wait_api(
+            name=self.metadata.name,
+            kind=JUMPSTART_MODEL_KIND,
+            namespace=self.metadata.namespace,
+            condition=check,
+            timeout=timeout,
+        )
+        return self
+
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_js_endpoints")
     def list(
         cls,
         namespace: str = None,
+        page_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> List[Endpoint]:
         if not namespace:
             namespace = get_default_namespace()
@@ -168,16 +199,14 @@ class HPJumpStartEndpoint(_HPJumpStartEndpoint, HPEndpointBase):
         response = cls.call_list_api(
             kind=JUMPSTART_MODEL_KIND,
             namespace=namespace,
+            page_size=page_size,
         )
 
-        endpoints = []
+        if not response or not response["items"]:
+            return []
 
-        if response and response["items"]:
-            for item in response["items"]:
-                name = item["metadata"]["name"]
-                endpoints.append(cls.get(name, namespace=namespace))
-
-        return endpoints
+        # LIST items carry the same spec, status and metadata as GET responses
+        return cls._from_list_items(response["items"], max_workers=max_workers)
 
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "get_js_endpoint")
@@ -191,6 +220,10 @@ class HPJumpStartEndpoint(_HPJumpStartEndpoint, HPEndpointBase):
             namespace=namespace,
         )
 
+        return cls._from_response(response)
+
+    @classmethod
+    def _from_response(cls, response: dict) -> "HPJumpStartEndpoint":
         if not isinstance(response, dict):
             raise Exception(f"Expected dictionary response, got {type(response)}")
 
@@ -307,32 +340,8 @@ class HPJumpStartEndpoint(_HPJumpStartEndpoint, HPEndpointBase):
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_pods_endpoint")
     def list_pods(cls, namespace=None, endpoint_name=None):
-        cls.verify_kube_config()
-
-        if not namespace:
-            namespace = get_default_namespace()
-
-        v1 = client.CoreV1Api()
-        list_pods_response = v1.list_namespaced_pod(namespace=namespace)
-
-        endpoints = set()
-        if endpoint_name:
-            endpoints.add(endpoint_name)
-        else:
-            list_response = cls.call_list_api(
-                kind=JUMPSTART_MODEL_KIND,
-                namespace=namespace,
-            )
-            if list_response and list_response["items"]:
-                for item in list_response["items"]:
-                    endpoints.add(item["metadata"]["name"])
-
-        pods = []
-        for item in list_pods_response.items:
-            app_name = item.metadata.labels.get("app", None)
-            if app_name in endpoints:
-                # list_namespaced_pod will return all pods in the namespace, so we need to filter
-                # out the pods that are created by jumpstart endpoint
-                pods.append(item.metadata.name)
-
-        return pods
\ No newline at end of file
+        return cls._list_endpoint_pods(
+            kind=JUMPSTART_MODEL_KIND,
+            namespace=namespace,
+            endpoint_name=endpoint_name,
+        )
\ No newline at end of file
@@ -0,0 +1,361 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Local searchable index of the JumpStart models in a SageMaker Hub.
+
+Browsing the hub used to page through ``list_hub_contents`` and describe every
+listed model to find its supported instance types, for every search. The
+catalog keeps the model summaries and their inference instance types in a
+SQLite database under ``~/.cache/hyperpod``, with a full-text index over the
+model ID, display name, description and search keywords, so searches are
+answered locally in milliseconds.
+
+A sync lists the hub, following ``NextToken``, and only fetches the hub
+content document of models whose ``HubContentVersion`` changed since the
+previous sync, through a bounded pool of ``MODEL_CATALOG_PREFETCH_WORKERS``
+threads and the hub content cache. Models no longer listed are removed.
+ensure_model_catalog syncs once the catalog is older than
+``MODEL_CATALOG_SYNC_TTL_SECONDS`` and keeps using the existing catalog when
+the hub cannot be reached.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from sagemaker.hyperpod.common.hub_cache import PUBLIC_HUB_NAME, get_hub_content_document
+from sagemaker.hyperpod.common.metadata_cache import get_cache_dir, is_metadata_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+MODEL_CATALOG_FILE_NAME = "jumpstart-models.sqlite3"
+# Seconds a synced catalog is used before ensure_model_catalog syncs it again
+MODEL_CATALOG_SYNC_TTL_SECONDS = 24 * 60 * 60
+# Hub content documents fetched at the same time during a sync
+MODEL_CATALOG_PREFETCH_WORKERS = 8
+MODEL_CATALOG_PAGE_SIZE = 100
+# How long a process waits for another process holding the database lock
+MODEL_CATALOG_LOCK_TIMEOUT_SECONDS = 30
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS syncs "
+    "(region TEXT NOT NULL, hub_name TEXT NOT NULL, synced_at REAL NOT NULL, "
+    "PRIMARY KEY (region, hub_name))",
+    "CREATE TABLE IF NOT EXISTS models "
+    "(region TEXT NOT NULL, hub_name TEXT NOT NULL, model_id TEXT NOT NULL, version TEXT, "
+    "display_name TEXT, description TEXT, keywords TEXT NOT NULL, model_type TEXT, "
+    "default_instance_type TEXT, instance_types TEXT NOT NULL, details_version TEXT, "
+    "UNIQUE (region, hub_name, model_id))",
+    "CREATE TABLE IF NOT EXISTS model_instance_types "
+    "(model_rowid INTEGER NOT NULL, region TEXT NOT NULL, hub_name TEXT NOT NULL, "
+    "instance_type TEXT NOT NULL, PRIMARY KEY (region, hub_name, instance_type, model_rowid))",
+    "CREATE INDEX IF NOT EXISTS model_instance_types_by_model ON model_instance_types (model_rowid)",
+)
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS models_fts "
+    "USING fts5(model_id, display_name, description, keywords)"
+)
+_MODEL_COLUMNS = (
+    "model_id, version, display_name, description, keywords, model_type, "
+    "default_instance_type, instance_types"
+)
+
+
+def get_model_catalog_path() -> str:
+    """Location of the model catalog database."""
+    return os.path.join(get_cache_dir(), MODEL_CATALOG_FILE_NAME)
+
+
+def get_model_catalog_synced_at(region: str, hub_name: str = PUBLIC_HUB_NAME) -> Optional[float]:
+    """Time of the last completed sync of a hub's catalog, or None if it was never synced."""
+    if not os.path.exists(get_model_catalog_path()):
+        return None
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT synced_at FROM syncs WHERE region = ? AND hub_name = ?", (region, hub_name)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def sync_model_catalog(
+    client, hub_name: str = PUBLIC_HUB_NAME, max_workers: int = MODEL_CATALOG_PREFETCH_WORKERS
+) -> int:
+    """Bring the catalog of a hub up to date with the hub.
+
+    Args:
+        client: SageMaker boto3 client of the hub's region
+        hub_name (str): Hub to index
+        max_workers (int): Hub content documents fetched at the same time
+
+    Returns:
+        int: Number of models in the catalog
+
+    Raises:
+        botocore.exceptions.ClientError: If the hub cannot be listed
+    """
+    region = client.meta.region_name
+    summaries = _list_models(client, hub_name)
+
+    conn = _connect()
+    try:
+        known = dict(conn.execute(
+            "SELECT model_id, details_version FROM models WHERE region = ? AND hub_name = ?",
+            (region, hub_name),
+        ).fetchall())
+    finally:
+        conn.close()
+
+    stale = [
+        summary for summary in summaries
+        if known.get(summary["HubContentName"], "") != summary.get("HubContentVersion")
+    ]
+    logger.debug(f"Fetching details of {len(stale)} of {len(summaries)} models in {hub_name}")
+
+    def _fetch(summary: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        try:
+            document = get_hub_content_document(
+                client, hub_name, "Model", summary["HubContentName"], summary.get("HubContentVersion")
+            )
+        except Exception as e:
+            # Indexed without instance types and fetched again by the next sync
+            logger.debug(f"Could not describe {summary['HubContentName']}: {e}")
+            return summary, None
+        return summary, document
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = list(executor.map(_fetch, stale))
+
+    conn = _connect()
+    try:
+        with conn:
+            for summary, document in fetched:
+                _upsert_model(conn, region, hub_name, summary, document)
+            listed = {summary["HubContentName"] for summary in summaries}
+            for model_id in set(known) - listed:
+                _delete_model(conn, region, hub_name, model_id)
+            conn.execute(
+                "INSERT OR REPLACE INTO syncs (region, hub_name, synced_at) VALUES (?, ?, ?)",
+                (region, hub_name, time.time()),
+            )
+    finally:
+        conn.close()
+    return len(summaries)
+
+
+def ensure_model_catalog(client, hub_name: str = PUBLIC_HUB_NAME, refresh: bool = False) -> None:
+    """Sync the catalog of a hub if it was never synced, is out of date or refresh is set.
+
+    ``hyp --no-cache`` and ``HYPERPOD_NO_CACHE=1`` always sync. When a sync
+    fails, an existing catalog is used as it is.
+
+    Args:
+        client: SageMaker boto3 client of the hub's region
+        hub_name (str): Hub to index
+        refresh (bool): Sync even if the catalog is up to date
+
+    Raises:
+        botocore.exceptions.ClientError: If the hub cannot be listed and was never synced
+    """
+    synced_at = get_model_catalog_synced_at(client.meta.region_name, hub_name)
+    if (
+        synced_at is not None
+        and not refresh
+        and is_metadata_cache_enabled()
+        and time.time() - synced_at < MODEL_CATALOG_SYNC_TTL_SECONDS
+    ):
+        return
+    try:
+        sync_model_catalog(client, hub_name)
+    except Exception as e:
+        if synced_at is None:
+            raise
+        logger.warning(f"Could not sync the {hub_name} model catalog, using the local copy: {e}")
+
+
+def search_model_catalog(
+    region: str,
+    search: Optional[str] = None,
+    instance_type: Optional[str] = None,
+    hub_name: str = PUBLIC_HUB_NAME,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Find models in the local catalog of a hub.
+
+    Args:
+        region (str): Region of the hub
+        search (Optional[str]): Words that must all occur, as word prefixes, in
+            the model ID, display name, description or search keywords
+        instance_type (Optional[str]): Only return models supporting this
+            inference instance type
+        hub_name (str): Hub the catalog was synced from
+        limit (Optional[int]): Maximum number of models to return
+
+    Returns:
+        List[Dict[str, Any]]: Models ordered by relevance when searching and by
+        model ID otherwise, each with model_id, version, display_name,
+        description, keywords, model_type, default_instance_type and
+        instance_types (default instance type first)
+    """
+    if not os.path.exists(get_model_catalog_path()):
+        return []
+    columns = ", ".join(f"m.{column.strip()}" for column in _MODEL_COLUMNS.split(","))
+    query = f"SELECT {columns} FROM models m"
+    conditions = ["m.region = ?", "m.hub_name = ?"]
+    params: List[Any] = [region, hub_name]
+    order = "m.model_id"
+
+    conn = _connect()
+    try:
+        words = re.findall(r"\w+", search or "")
+        if words and _has_fts(conn):
+            query += " JOIN models_fts f ON f.rowid = m.rowid"
+            conditions.append("models_fts MATCH ?")
+            params.append(" ".join(f'"{word}"*' for word in words))
+            order = "f.rank, m.model_id"
+        else:
+            for word in words:
+                conditions.append(
+                    "(m.model_id || ' ' || IFNULL(m.display_name, '') || ' ' "
+                    "|| IFNULL(m.description, '') || ' ' || m.keywords) LIKE ?"
+                )
+                params.append(f"%{word}%")
+        if instance_type:
+            query += " JOIN model_instance_types t ON t.model_rowid = m.rowid"
+            conditions.append("t.region = ? AND t.hub_name = ? AND t.instance_type = ?")
+            params.extend([region, hub_name, instance_type])
+        query += f" WHERE {' AND '.join(conditions)} ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "model_id": model_id,
+            "version": version,
+            "display_name": display_name,
+            "description": description,
+            "keywords": json.loads(keywords),
+            "model_type": model_type,
+            "default_instance_type": default_instance_type,
+            "instance_types": json.loads(instance_types),
+        }
+        for (model_id, version, display_name, description, keywords, model_type,
+             default_instance_type, instance_types) in rows
+    ]
+
+
+def _list_models(client, hub_name: str) -> List[Dict[str, Any]]:
+    summaries = []
+    params = {"HubName": hub_name, "HubContentType": "Model", "MaxResults": MODEL_CATALOG_PAGE_SIZE}
+    while True:
+        response = client.list_hub_contents(**params)
+        summaries.extend(response.get("HubContentSummaries", []))
+        next_token = response.get("NextToken")
+        if not next_token:
+            return summaries
+        params["NextToken"] = next_token
+
+
+def _model_details(keywords: List[str], document: Optional[Dict[str, Any]]):
+    """Model type, default instance type and instance types, default first, of a model."""
+    if document is None:
+        model_type = None
+        default_type = None
+        instance_types = []
+    else:
+        default_type = document.get("DefaultInferenceInstanceType")
+        instance_types = document.get("SupportedInferenceInstanceTypes", [])
+        if default_type and default_type in instance_types:
+            instance_types = [default_type] + [t for t in instance_types if t != default_type]
+        model_type = "Gated" if document.get("GatedBucket") is True else "Open"
+    if "@model-type:proprietary" in keywords:
+        model_type = "Proprietary"
+    elif "@model-type:open_weights" in keywords:
+        model_type = "Open"
+    return model_type, default_type, instance_types
+
+
+def _upsert_model(conn, region, hub_name, summary, document) -> None:
+    model_id = summary["HubContentName"]
+    keywords = summary.get("HubContentSearchKeywords", [])
+    model_type, default_type, instance_types = _model_details(keywords, document)
+    _delete_model(conn, region, hub_name, model_id)
+    version = summary.get("HubContentVersion")
+    cursor = conn.execute(
+        f"INSERT INTO models (region, hub_name, {_MODEL_COLUMNS}, details_version) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            region, hub_name, model_id, version,
+            summary.get("HubContentDisplayName"), summary.get("HubContentDescription"),
+            json.dumps(keywords), model_type, default_type, json.dumps(instance_types),
+            version if document is not None else None,
+        ),
+    )
+    rowid = cursor.lastrowid
+    conn.executemany(
+        "INSERT OR IGNORE INTO model_instance_types (model_rowid, region, hub_name, instance_type) "
+        "VALUES (?, ?, ?, ?)",
+        [(rowid, region, hub_name, instance_type) for instance_type in instance_types],
+    )
+    if _has_fts(conn):
+        conn.execute(
+            "INSERT INTO models_fts (rowid, model_id, display_name, description, keywords) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (rowid, model_id, summary.get("HubContentDisplayName"),
+             summary.get("HubContentDescription"), " ".join(keywords)),
+        )
+
+
+def _delete_model(conn, region, hub_name, model_id) -> None:
+    row = conn.execute(
+        "SELECT rowid FROM models WHERE region = ? AND hub_name = ? AND model_id = ?",
+        (region, hub_name, model_id),
+    ).fetchone()
+    if row is None:
+        return
+    conn.execute("DELETE FROM models WHERE rowid = ?", row)
+    conn.execute("DELETE FROM model_instance_types WHERE model_rowid = ?", row)
+    if _has_fts(conn):
+        conn.execute("DELETE FROM models_fts WHERE rowid = ?", row)
+
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'models_fts'"
+    ).fetchone() is not None
+
+
+def _connect() -> sqlite3.Connection:
+    path = get_model_catalog_path()
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=MODEL_CATALOG_LOCK_TIMEOUT_SECONDS)
+    # WAL lets searches in other processes proceed while a sync writes
+    conn.execute("PRAGMA journal_mode=WAL")
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    try:
+        conn.execute(_FTS_SCHEMA)
+    except sqlite3.OperationalError as e:
+        # SQLite builds without FTS5 fall back to substring matching
+        logger.debug(f"Full-text search unavailable: {e}")
+    return conn
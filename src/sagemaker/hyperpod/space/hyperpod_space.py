@@ -3,13 +3,18 @@ import re
 import yaml
 import boto3
 from sagemaker.hyperpod.common.utils import create_boto3_client
-from typing import List, Optional, ClassVar, Dict, Set, Any, Union
+from typing import Callable, Iterator, List, Optional, ClassVar, Dict, Set, Any, Union
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 from kr8s.objects import Pod
 
 from sagemaker.hyperpod.common.config.metadata import Metadata
+from sagemaker.hyperpod.common.informer import (
+    get_cached_object,
+    list_cached_objects,
+    list_cached_pod_names,
+)
 from hyperpod_space_template.v1_0.model import SpaceConfig as SpaceConfigV1_0
 from hyperpod_space_template.v1_1.model import SpaceConfig as SpaceConfigV1_1, ResourceRequirements
 
@@ -17,9 +22,12 @@ SpaceConfig = Union[SpaceConfigV1_0, SpaceConfigV1_1]
 from sagemaker.hyperpod.common.utils import (
     handle_exception,
     get_default_namespace,
+    get_shared_api_client,
     setup_logging,
     verify_kubernetes_version_compatibility,
 )
+from sagemaker.hyperpod.common.pod_logs import stream_pod_logs
+from sagemaker.hyperpod.common.k8s_bulk import wait_for_custom_object
 from sagemaker.hyperpod.space.utils import (
     map_kubernetes_response_to_model,
     validate_space_mig_resources,
@@ -370,7 +378,7 @@ class HPSpace(BaseModel):
             yaml.dump(config_body),
         )
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             custom_api.create_namespaced_custom_object(
@@ -439,19 +447,23 @@ class HPSpace(BaseModel):
         caller_identity = sts_client.get_caller_identity()
         caller_arn = caller_identity['Arn']
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
         spaces = []
         continue_token = None
+        cached = list_cached_objects(SPACE_GROUP, SPACE_VERSION, SPACE_PLURAL, namespace)
         
         try:
             while True:
-                response = custom_api.list_namespaced_custom_object(
-                    group=SPACE_GROUP,
-                    version=SPACE_VERSION,
-                    namespace=namespace,
-                    plural=SPACE_PLURAL,
-                    _continue=continue_token
-                )
+                if cached is not None:
+                    response = {"items": cached}
+                else:
+                    response = custom_api.list_namespaced_custom_object(
+                        group=SPACE_GROUP,
+                        version=SPACE_VERSION,
+                        namespace=namespace,
+                        plural=SPACE_PLURAL,
+                        _continue=continue_token
+                    )
 
                 for item in response.get("items", []):
                     # Check if space was created by the caller or it's set as 'Public'
@@ -527,16 +539,18 @@ class HPSpace(BaseModel):
         if not namespace:
             namespace = get_default_namespace()
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
         
         try:
-            response = custom_api.get_namespaced_custom_object(
-                group=SPACE_GROUP,
-                version=SPACE_VERSION,
-                namespace=namespace,
-                plural=SPACE_PLURAL,
-                name=name
-            )
+            response = get_cached_object(SPACE_GROUP, SPACE_VERSION, SPACE_PLURAL, namespace, name)
+            if response is None:
+                response = custom_api.get_namespaced_custom_object(
+                    group=SPACE_GROUP,
+                    version=SPACE_VERSION,
+                    namespace=namespace,
+                    plural=SPACE_PLURAL,
+                    name=name
+                )
 
             # Use dynamic mapping based on SpaceConfig model
             config_data = map_kubernetes_response_to_model(response, SpaceConfigV1_1)
@@ -574,7 +588,7 @@ class HPSpace(BaseModel):
         self.verify_kube_config()
         logger = self.get_logger()
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             custom_api.delete_namespaced_custom_object(
@@ -660,7 +674,7 @@ class HPSpace(BaseModel):
                             kwargs["resources"].setdefault("requests", {})[existing_profile] = None
                             kwargs["resources"].setdefault("limits", {})[existing_profile] = None
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         # Update space config with the input config
         current_config = self.config.model_dump(by_alias=True)
@@ -725,6 +739,79 @@ class HPSpace(BaseModel):
         """
         self.update(desired_status="Stopped")
 
+    def wait_until(
+        self,
+        condition: Callable[["HPSpace"], bool],
+        timeout: Optional[float] = None,
+    ) -> "HPSpace":
+        """Block until the space satisfies a condition, updating its resource data as it changes.
+
+        Uses a single Kubernetes watch on the space instead of repeated polling,
+        so the condition is checked as soon as the space's status changes.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - condition
+             - Callable[[HPSpace], bool]
+             - Called with this space after each change. Waiting stops when it returns True.
+           * - timeout
+             - float, optional
+             - Seconds to wait before raising TimeoutError. If None, waits indefinitely.
+
+        **Returns:**
+
+        HPSpace: This space, with the raw resource that satisfied the condition
+
+        **Raises:**
+
+        TimeoutError: If the condition is not met within the timeout
+
+        RuntimeError: If the space is deleted while waiting
+
+        Exception: If the Kubernetes API call fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> # Start a space and wait until it is available
+              >>> space = HPSpace.get("my-space")
+              >>> space.start()
+              >>> space.wait_until(
+              ...     lambda s: any(c["type"] == "Available" and c["status"] == "True"
+              ...                   for c in (s.status or {}).get("conditions", [])),
+              ...     timeout=600,
+              ... )
+        """
+        self.verify_kube_config()
+
+        def check(response):
+            self.raw_resource = response
+            return condition(self)
+
+        try:
+            wait_for_custom_object(
+                client.CustomObjectsApi(get_shared_api_client()),
+                group=SPACE_GROUP,
+                version=SPACE_VERSION,
+                plural=SPACE_PLURAL,
+                name=self.config.name,
+                namespace=self.config.namespace,
+                condition=check,
+                timeout=timeout,
+            )
+        except Exception as e:
+            handle_exception(e, self.config.name, self.config.namespace)
+        return self
+
     def list_pods(self) -> List[str]:
         """List all pods associated with this space.
 
@@ -752,7 +839,13 @@ class HPSpace(BaseModel):
         self.verify_kube_config()
         logger = self.get_logger()
 
-        v1 = client.CoreV1Api()
+        cached = list_cached_pod_names(
+            self.config.namespace, {f"{SPACE_GROUP}/workspace-name": self.config.name}
+        )
+        if cached is not None:
+            return cached
+
+        v1 = client.CoreV1Api(get_shared_api_client())
 
         try:
             pods = v1.list_namespaced_pod(
@@ -820,7 +913,7 @@ class HPSpace(BaseModel):
         if not container:
             container = "workspace"
 
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(get_shared_api_client())
         
         try:
             return v1.read_namespaced_pod_log(
@@ -831,6 +924,92 @@ class HPSpace(BaseModel):
         except Exception as e:
             handle_exception(e, pod_name, self.config.namespace)
 
+    def stream_logs(
+        self,
+        pod_name: Optional[str] = None,
+        container: Optional[str] = None,
+        follow: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream logs from a pod associated with this space.
+
+        Like :meth:`get_logs`, but yields log lines as they are read from the API
+        server instead of returning the whole log as one string. With ``follow``
+        the iterator keeps yielding new lines while the container is running.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - pod_name
+             - str, optional
+             - Name of the pod to get logs from. If None, gets logs from the first available pod
+           * - container
+             - str, optional
+             - Name of the container to get logs from. Defaults to "workspace"
+           * - follow
+             - bool, optional
+             - Keep streaming new log lines until the container exits. Defaults to False
+           * - since_seconds
+             - int, optional
+             - Only return logs newer than this many seconds
+           * - tail_lines
+             - int, optional
+             - Only return this many lines from the end of the log
+           * - limit_bytes
+             - int, optional
+             - Stop after this many bytes of log output
+
+        **Returns:**
+
+        Iterator[str]: The pod log lines
+
+        **Raises:**
+
+        RuntimeError: If no pods are found for the space
+        Exception: If the Kubernetes API call fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> space = HPSpace.get("my-space")
+              >>> for line in space.stream_logs(follow=True):
+              ...     print(line)
+        """
+        self.verify_kube_config()
+
+        if not pod_name:
+            pods = self.list_pods()
+            if not pods:
+                raise RuntimeError(f"No pods found for space '{self.config.name}'")
+            pod_name = pods[0]
+
+        if not container:
+            container = "workspace"
+
+        try:
+            return stream_pod_logs(
+                client.CoreV1Api(get_shared_api_client()),
+                name=pod_name,
+                namespace=self.config.namespace,
+                container=container,
+                follow=follow,
+                since_seconds=since_seconds,
+                tail_lines=tail_lines,
+                limit_bytes=limit_bytes,
+            )
+        except Exception as e:
+            handle_exception(e, pod_name, self.config.namespace)
+
     # Validates the {ide}-remote pattern: alphanumeric segments separated by single hyphens.
     _remote_connection_type_regex = re.compile(r"^[a-zA-Z0-9]+(?:-[a-zA-Z0-9]+)*-remote$")
 
@@ -902,7 +1081,7 @@ class HPSpace(BaseModel):
             }
         }
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             response = custom_api.create_namespaced_custom_object(
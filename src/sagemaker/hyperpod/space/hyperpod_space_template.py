@@ -7,6 +7,7 @@ from kubernetes.client.rest import ApiException
 from sagemaker.hyperpod.common.utils import (
     handle_exception,
     get_default_namespace,
+    get_shared_api_client,
     verify_kubernetes_version_compatibility
 )
 from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
@@ -196,7 +197,7 @@ class HPSpaceTemplate:
         self.verify_kube_config()
         
         try:
-            api_instance = client.CustomObjectsApi()
+            api_instance = client.CustomObjectsApi(get_shared_api_client())
             response = api_instance.create_namespaced_custom_object(
                 group=SPACE_TEMPLATE_GROUP,
                 version=SPACE_TEMPLATE_VERSION,
@@ -265,7 +266,7 @@ class HPSpaceTemplate:
             namespace = get_default_namespace()
         
         try:
-            api_instance = client.CustomObjectsApi()
+            api_instance = client.CustomObjectsApi(get_shared_api_client())
             response = api_instance.list_namespaced_custom_object(
                 group=SPACE_TEMPLATE_GROUP,
                 version=SPACE_TEMPLATE_VERSION,
@@ -337,7 +338,7 @@ class HPSpaceTemplate:
             namespace = get_default_namespace()
         
         try:
-            api_instance = client.CustomObjectsApi()
+            api_instance = client.CustomObjectsApi(get_shared_api_client())
             response = api_instance.get_namespaced_custom_object(
                 group=SPACE_TEMPLATE_GROUP,
                 version=SPACE_TEMPLATE_VERSION,
@@ -383,7 +384,7 @@ class HPSpaceTemplate:
         self.verify_kube_config()
         
         try:
-            api_instance = client.CustomObjectsApi()
+            api_instance = client.CustomObjectsApi(get_shared_api_client())
             api_instance.delete_namespaced_custom_object(
                 group=SPACE_TEMPLATE_GROUP,
                 version=SPACE_TEMPLATE_VERSION,
@@ -458,7 +459,7 @@ class HPSpaceTemplate:
                 for field in ['resourceVersion', 'uid', 'creationTimestamp', 'managedFields']:
                     config_data['metadata'].pop(field, None)
             
-            api_instance = client.CustomObjectsApi()
+            api_instance = client.CustomObjectsApi(get_shared_api_client())
             response = api_instance.patch_namespaced_custom_object(
                 group=SPACE_TEMPLATE_GROUP,
                 version=SPACE_TEMPLATE_VERSION,
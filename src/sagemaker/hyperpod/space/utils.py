@@ -11,7 +11,8 @@ from pydantic import BaseModel
 from kubernetes import client
 from sagemaker.hyperpod.training.constants import VALIDATE_PROFILE_IN_CLUSTER
 from sagemaker.hyperpod.cli.utils import get_eks_cluster_name, get_hyperpod_cluster_region
-from sagemaker.hyperpod.common.utils import create_boto3_client
+from sagemaker.hyperpod.common.metadata_cache import cached_api_call
+from sagemaker.hyperpod.common.utils import create_boto3_client, get_shared_api_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +31,11 @@ def get_spaces_addon_version(eks_cluster_name: str) -> Optional[str]:
     """
     try:
         region = get_hyperpod_cluster_region()
-        response = create_boto3_client("eks", region_name=region).describe_addon(
-            clusterName=eks_cluster_name, addonName=SPACES_ADDON_NAME,
+        response = cached_api_call(
+            create_boto3_client("eks", region_name=region),
+            "describe_addon",
+            clusterName=eks_cluster_name,
+            addonName=SPACES_ADDON_NAME,
         )
         raw_version = response["addon"]["addonVersion"]
         match = re.match(r"v?(\d+\.\d+\.\d+)", raw_version)
@@ -129,7 +133,7 @@ def get_pod_instance_type(pod_name: str, namespace: str = "default") -> str:
     Raises:
         RuntimeError: If pod is not found or not scheduled on a node
     """
-    v1 = client.CoreV1Api()
+    v1 = client.CoreV1Api(get_shared_api_client())
     
     pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
     
@@ -191,7 +195,7 @@ def validate_mig_profile_in_cluster(mig_profile: str) -> Tuple[bool, str]:
     if os.getenv(VALIDATE_PROFILE_IN_CLUSTER) == "false":
         return True, ""
 
-    v1 = client.CoreV1Api()
+    v1 = client.CoreV1Api(get_shared_api_client())
     for node in v1.list_node().items:
         if node.status and node.status.allocatable:
             allocatable = node.status.allocatable.get(mig_profile)
@@ -11,12 +11,36 @@ from sagemaker.hyperpod.training.config.hyperpod_pytorch_job_unified_config impo
 )
 from sagemaker.hyperpod.common.config.metadata import Metadata
 from kubernetes import client, config, stream
-from typing import List, Optional, ClassVar
+from typing import Callable, Iterator, List, Optional, ClassVar
 from sagemaker.hyperpod.common.utils import (
     handle_exception,
     get_default_namespace,
+    get_shared_api_client,
     setup_logging,
-    verify_kubernetes_version_compatibility
+    verify_kubernetes_version_compatibility,
+)
+from sagemaker.hyperpod.common.pod_logs import (
+    stream_pod_logs,
+    aggregate_pod_logs,
+    LOG_AGGREGATION_MAX_WORKERS,
+)
+from sagemaker.hyperpod.common.pod_exec import (
+    exec_on_pods,
+    ExecResult,
+    EXEC_MAX_WORKERS,
+    EXEC_POD_TIMEOUT_SECONDS,
+)
+from sagemaker.hyperpod.common.k8s_bulk import (
+    CREATE_MANY_MAX_WORKERS,
+    CreateManyResult,
+    create_custom_objects,
+    list_custom_object_pages_all_namespaces,
+    wait_for_custom_object,
+)
+from sagemaker.hyperpod.common.informer import (
+    get_cached_object,
+    list_cached_objects,
+    list_cached_pod_names,
 )
 from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
     _hyperpod_telemetry_emitter,
@@ -269,23 +293,12 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
         logger = self.get_logger()
         logger = setup_logging(logger, debug)
 
-        spec = _HyperPodPytorchJob(**self.model_dump(by_alias=True, exclude_none=True))
-
         if not self.metadata.namespace:
             self.metadata.namespace = get_default_namespace()
 
-        spec = self.allocate_quotas_if_applicable(spec)
-        if spec.replicaSpecs[0].replicas is None or spec.replicaSpecs[0].replicas == 0:
-            spec.replicaSpecs[0].replicas = 1 # default value
-
-        config = {
-            "apiVersion": f"{TRAINING_GROUP}/{API_VERSION}",
-            "kind": KIND,
-            "metadata": self.metadata.model_dump(exclude_none=True),
-            "spec": spec.model_dump(exclude_none=True),
-        }
+        config = self._to_custom_object()
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
         logger.debug(
             "Deploying HyperPodPytorchJob with config:\n%s",
             yaml.dump(config),
@@ -305,12 +318,116 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
             handle_exception(e, self.metadata.name, self.metadata.namespace, debug=debug)
 
 
+    def _to_custom_object(self) -> dict:
+        """Build the HyperPodPyTorchJob object submitted to the cluster, with quotas allocated."""
+        spec = _HyperPodPytorchJob(**self.model_dump(by_alias=True, exclude_none=True))
+
+        spec = self.allocate_quotas_if_applicable(spec)
+        if spec.replicaSpecs[0].replicas is None or spec.replicaSpecs[0].replicas == 0:
+            spec.replicaSpecs[0].replicas = 1 # default value
+
+        return {
+            "apiVersion": f"{TRAINING_GROUP}/{API_VERSION}",
+            "kind": KIND,
+            "metadata": self.metadata.model_dump(exclude_none=True),
+            "spec": spec.model_dump(exclude_none=True),
+        }
+
+    @classmethod
+    @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "create_many_pytorchjobs")
+    def create_many(
+        cls,
+        jobs: List["HyperPodPytorchJob"],
+        max_workers: int = CREATE_MANY_MAX_WORKERS,
+        debug: bool = False,
+    ) -> CreateManyResult:
+        """Create and submit many HyperPod PyTorch jobs, such as the variants of a parameter sweep.
+
+        Every job is validated and built before any is submitted. Jobs are then
+        submitted concurrently within a shared rate limit that backs off when the
+        API server throttles, and throttled or failed requests are retried. A job
+        that cannot be created is recorded in the result and does not stop the others.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - jobs
+             - List[HyperPodPytorchJob]
+             - The jobs to create. Jobs without a namespace use the default namespace from current context.
+           * - max_workers
+             - int, optional
+             - Maximum number of create requests in flight. Defaults to 16.
+           * - debug
+             - bool, optional
+             - Enable debug logging. Defaults to False.
+
+        **Returns:**
+
+        CreateManyResult: Name, namespace and error of every job, in the order given
+
+        **Raises:**
+
+        ValueError: If two jobs have the same name and namespace or a job's resources are invalid
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> jobs = [
+              ...     HyperPodPytorchJob(metadata=Metadata(name=f"sweep-lr-{i}"), ...)
+              ...     for i, lr in enumerate(["1e-4", "3e-4", "1e-3"])
+              ... ]
+              >>> result = HyperPodPytorchJob.create_many(jobs)
+              >>> print([r.name for r in result.failed])
+        """
+        cls.verify_kube_config()
+
+        logger = cls.get_logger()
+        logger = setup_logging(logger, debug)
+
+        default_namespace = None
+        bodies = []
+        seen = set()
+        for job in jobs:
+            if not job.metadata.namespace:
+                if default_namespace is None:
+                    default_namespace = get_default_namespace()
+                job.metadata.namespace = default_namespace
+            key = (job.metadata.namespace, job.metadata.name)
+            if key in seen:
+                raise ValueError(f"Job '{job.metadata.name}' appears more than once in namespace '{job.metadata.namespace}'")
+            seen.add(key)
+            try:
+                bodies.append(job._to_custom_object())
+            except ValueError as e:
+                raise ValueError(f"Job '{job.metadata.name}': {e}") from e
+
+        logger.debug(f"Submitting {len(bodies)} HyperPodPytorchJobs")
+        result = create_custom_objects(
+            client.CustomObjectsApi(get_shared_api_client()),
+            group=TRAINING_GROUP,
+            version=API_VERSION,
+            plural=PLURAL,
+            bodies=bodies,
+            max_workers=max_workers,
+        )
+        logger.info(f"Submitted {len(result.created)} of {len(bodies)} HyperPodPytorchJobs")
+        for failure in result.failed:
+            logger.error(f"Failed to create HyperPodPytorchJob {failure.name}: {failure.error}")
+        return result
 
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_pytorchjobs")
-    def list(cls, namespace=None) -> List["HyperPodPytorchJob"]:
+    def list(cls, namespace=None, all_namespaces: bool = False) -> List["HyperPodPytorchJob"]:
         """
-        List all HyperPod PyTorch jobs in the specified namespace.
+        List all HyperPod PyTorch jobs in the specified namespace, or in every namespace.
 
         **Parameters:**
 
@@ -324,6 +441,10 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
            * - namespace
              - str, optional
              - The Kubernetes namespace to list jobs from. If None, uses the default namespace from current context.
+           * - all_namespaces
+             - bool, optional
+             - List jobs in every namespace the caller can read, ignoring ``namespace``. Uses one paginated
+               cluster-scoped request, or one request per namespace if RBAC forbids it (default: False).
 
         **Returns:**
 
@@ -348,16 +469,39 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
               >>>
               >>> # List jobs in specific namespace
               >>> jobs = HyperPodPytorchJob.list(namespace="my-namespace")
+              >>>
+              >>> # List jobs across all namespaces
+              >>> jobs = HyperPodPytorchJob.list(all_namespaces=True)
         """
         cls.verify_kube_config()
 
-        if namespace is None:
-            namespace = get_default_namespace()
-
         logger = cls.get_logger()
         logger = setup_logging(logger)
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
+
+        if all_namespaces:
+            try:
+                pages = list_custom_object_pages_all_namespaces(
+                    custom_api,
+                    group=TRAINING_GROUP,
+                    version=API_VERSION,
+                    plural=PLURAL,
+                    list_namespaces=lambda: [
+                        ns.metadata.name for ns in client.CoreV1Api(get_shared_api_client()).list_namespace().items
+                    ],
+                )
+                return [job for page in pages for job in _load_hp_job_list({"items": page})]
+            except Exception as e:
+                logger.error("Failed to list HyperpodPytorchJobs!")
+                handle_exception(e, "", None)
+
+        if namespace is None:
+            namespace = get_default_namespace()
+
+        cached = list_cached_objects(TRAINING_GROUP, API_VERSION, PLURAL, namespace)
+        if cached is not None:
+            return _load_hp_job_list({"items": cached})
 
         try:
             hp_job_list = custom_api.list_namespaced_custom_object(
@@ -392,7 +536,7 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
         logger = self.get_logger()
         logger = setup_logging(logger)
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             custom_api.delete_namespaced_custom_object(
@@ -411,7 +555,7 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
         # Clean up associated ConfigMap created during job submission
         configmap_name = f"training-config-{self.metadata.name}"
         try:
-            client.CoreV1Api().delete_namespaced_config_map(
+            client.CoreV1Api(get_shared_api_client()).delete_namespaced_config_map(
                 name=configmap_name,
                 namespace=self.metadata.namespace,
             )
@@ -443,10 +587,26 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
 
         try:
             if all_pods:
+                outputs = {pod_name: [] for pod_name in pods}
+                result = exec_on_pods(
+                    client.CoreV1Api(get_shared_api_client()),
+                    pods=pods,
+                    namespace=namespace,
+                    command=command,
+                    container=container,
+                    on_output=lambda pod_name, line: outputs[pod_name].append(line),
+                    timeout_seconds=None,
+                )
+                for pod_result in result.failed:
+                    if pod_result.error:
+                        raise RuntimeError(
+                            f"Failed to execute command on pod '{pod_result.pod}': {pod_result.error}"
+                        )
+
                 output = ""
                 for pod_name in pods:
                     output += f"=== Pod: {pod_name} ===\n"
-                    output += self._exec_command_on_pod(pod_name, command, container)
+                    output += "\n".join(outputs[pod_name])
                     output += "\n"
                 logger.info(f"Successfully executed command on all pods for job {job_name}")
                 return output
@@ -463,11 +623,93 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
             logger.error(f"Failed to execute command on job {job_name}")
             handle_exception(e, job_name, namespace)
 
+    @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "exec_pytorchjob_all_pods")
+    def exec_command_all_pods(
+        self,
+        command: List[str],
+        container: Optional[str] = None,
+        on_output: Optional[Callable[[str, str], None]] = None,
+        max_workers: int = EXEC_MAX_WORKERS,
+        timeout_seconds: Optional[float] = EXEC_POD_TIMEOUT_SECONDS,
+    ) -> ExecResult:
+        """Execute a command concurrently in every pod associated with this job.
+
+        Output is streamed line by line to ``on_output`` as it arrives instead of
+        being collected, and a pod that fails or times out does not stop the others.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - command
+             - List[str]
+             - The command and its arguments to execute
+           * - container
+             - str, optional
+             - The container name within the pods. If None, uses the first container.
+           * - on_output
+             - Callable[[str, str], None], optional
+             - Called with the pod name and each line of output
+           * - max_workers
+             - int, optional
+             - Maximum number of pods running the command at the same time. Defaults to 32.
+           * - timeout_seconds
+             - float, optional
+             - Per-pod time limit in seconds, or None for no limit. Defaults to 300.
+
+        **Returns:**
+
+        ExecResult: Exit code, duration and error of the command in every pod
+
+        **Raises:**
+
+        RuntimeError: If the job has no pods
+        Exception: If listing the job's pods fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> job = HyperPodPytorchJob.get("my-job")
+              >>> result = job.exec_command_all_pods(
+              ...     ["nvidia-smi"], on_output=lambda pod, line: print(f"[{pod}] {line}")
+              ... )
+              >>> print([r.pod for r in result.failed])
+        """
+        self.verify_kube_config()
+
+        namespace = self.metadata.namespace
+        job_name = self.metadata.name
+
+        pods = self.list_pods()
+        if not pods:
+            raise RuntimeError(f"No pods found for training job {job_name} in namespace {namespace}")
+
+        if container is None:
+            container = self.replicaSpecs[0].template.spec.containers[0].name
+
+        return exec_on_pods(
+            client.CoreV1Api(get_shared_api_client()),
+            pods=pods,
+            namespace=namespace,
+            command=command,
+            container=container,
+            on_output=on_output,
+            max_workers=max_workers,
+            timeout_seconds=timeout_seconds,
+        )
+
     def _exec_command_on_pod(self, pod: str, command: List[str], container: Optional[str] = None):
         from kubernetes.client.exceptions import ApiException
         try:
             return stream.stream(
-                client.CoreV1Api().connect_get_namespaced_pod_exec,
+                client.CoreV1Api(get_shared_api_client()).connect_get_namespaced_pod_exec,
                 stderr=True,
                 stdout=True,
                 name=pod,
@@ -529,10 +771,14 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
         if namespace is None:
             namespace = get_default_namespace()
 
+        cached = get_cached_object(TRAINING_GROUP, API_VERSION, PLURAL, namespace, name)
+        if cached is not None:
+            return _load_hp_job(cached)
+
         logger = cls.get_logger()
         logger = setup_logging(logger)
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             response = custom_api.get_namespaced_custom_object(
@@ -580,7 +826,7 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
         logger = self.get_logger()
         logger = setup_logging(logger)
 
-        custom_api = client.CustomObjectsApi()
+        custom_api = client.CustomObjectsApi(get_shared_api_client())
 
         try:
             response = custom_api.get_namespaced_custom_object(
@@ -597,6 +843,79 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
             logger.error(f"Failed to refresh HyperPodPytorchJob {self.metadata.name}!")
             handle_exception(e, self.metadata.name, self.metadata.namespace)
 
+    def wait_until(
+        self,
+        condition: Callable[["HyperPodPytorchJob"], bool],
+        timeout: Optional[float] = None,
+    ) -> "HyperPodPytorchJob":
+        """Block until the job satisfies a condition, updating its status as it changes.
+
+        Uses a single Kubernetes watch on the job instead of repeated polling, so
+        the condition is checked as soon as the job's status changes.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - condition
+             - Callable[[HyperPodPytorchJob], bool]
+             - Called with this job after each status change. Waiting stops when it returns True.
+           * - timeout
+             - float, optional
+             - Seconds to wait before raising TimeoutError. If None, waits indefinitely.
+
+        **Returns:**
+
+        HyperPodPytorchJob: This job, with the status that satisfied the condition
+
+        **Raises:**
+
+        TimeoutError: If the condition is not met within the timeout
+
+        RuntimeError: If the job is deleted while waiting
+
+        Exception: If the Kubernetes API call fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> job = HyperPodPytorchJob.get("my-job")
+              >>> def running(j):
+              ...     conditions = (j.status.conditions or []) if j.status else []
+              ...     return any(c.type == "Running" and c.status == "True" for c in conditions)
+              >>> job.wait_until(running, timeout=600)
+        """
+        self.verify_kube_config()
+
+        def check(response):
+            self.status = (
+                HyperPodPytorchJobStatus.model_validate(response["status"], by_name=True)
+                if response.get("status") else None
+            )
+            return condition(self)
+
+        try:
+            wait_for_custom_object(
+                client.CustomObjectsApi(get_shared_api_client()),
+                group=TRAINING_GROUP,
+                version=API_VERSION,
+                plural=PLURAL,
+                name=self.metadata.name,
+                namespace=self.metadata.namespace,
+                condition=check,
+                timeout=timeout,
+            )
+        except Exception as e:
+            handle_exception(e, self.metadata.name, self.metadata.namespace)
+        return self
+
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "list_pods_pytorchjob")
     def list_pods(self) -> List[str]:
         """List all pods associated with this HyperPod PyTorch job.
@@ -620,12 +939,15 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
         """
         self.verify_kube_config()
 
+        cached = list_cached_pod_names(self.metadata.namespace, {"HPJob": self.metadata.name})
+        if cached is not None:
+            return cached
+
         logger = self.get_logger()
         logger = setup_logging(logger)
 
         try:
-            config.load_kube_config()
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(get_shared_api_client())
 
             response = v1.list_namespaced_pod(
                 self.metadata.namespace,
@@ -688,8 +1010,7 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
             container = self.replicaSpecs[0].template.spec.containers[0].name
 
         try:
-            config.load_kube_config()
-            v1 = client.CoreV1Api()
+            v1 = client.CoreV1Api(get_shared_api_client())
 
             response = v1.read_namespaced_pod_log(
                 name=pod_name,
@@ -704,12 +1025,179 @@ class HyperPodPytorchJob(_HyperPodPytorchJob):
             logger.error(f"Failed to get logs from pod {pod_name}!")
             handle_exception(e, self.metadata.name, self.metadata.namespace)
 
+    @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "stream_pytorchjob_logs_from_pod")
+    def stream_logs_from_pod(
+        self,
+        pod_name: str,
+        container: Optional[str] = None,
+        follow: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream logs from a specific pod associated with this HyperPod PyTorch job.
+
+        Unlike :meth:`get_logs_from_pod`, the log is never held in memory as a whole.
+        Lines are yielded as they are read from the API server, and with ``follow``
+        the iterator keeps yielding new lines while the container is running.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - pod_name
+             - str
+             - The name of the pod to get logs from
+           * - container
+             - str, optional
+             - The container name within the pod. If None, uses the first container.
+           * - follow
+             - bool, optional
+             - Keep streaming new log lines until the container exits. Defaults to False.
+           * - since_seconds
+             - int, optional
+             - Only return logs newer than this many seconds
+           * - tail_lines
+             - int, optional
+             - Only return this many lines from the end of the log
+           * - limit_bytes
+             - int, optional
+             - Stop after this many bytes of log output
+
+        **Returns:**
+
+        Iterator[str]: Log lines with timestamps, without trailing newlines
+
+        **Raises:**
+
+        Exception: If getting logs fails or Kubernetes API call fails
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> job = HyperPodPytorchJob.get("my-job")
+              >>> pods = job.list_pods()
+              >>> for line in job.stream_logs_from_pod(pods[0], follow=True):
+              ...     print(line)
+        """
+        self.verify_kube_config()
+
+        logger = self.get_logger()
+        logger = setup_logging(logger)
+
+        if container is None:
+            # If container name is not set, get logs from the first container in the pod
+            container = self.replicaSpecs[0].template.spec.containers[0].name
+
+        try:
+            return stream_pod_logs(
+                client.CoreV1Api(get_shared_api_client()),
+                name=pod_name,
+                namespace=self.metadata.namespace,
+                container=container,
+                timestamps=True,
+                follow=follow,
+                since_seconds=since_seconds,
+                tail_lines=tail_lines,
+                limit_bytes=limit_bytes,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get logs from pod {pod_name}!")
+            handle_exception(e, self.metadata.name, self.metadata.namespace)
+
+    @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "get_pytorchjob_logs_all_pods")
+    def get_logs_all_pods(
+        self,
+        container: Optional[str] = None,
+        follow: bool = False,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes_per_pod: Optional[int] = None,
+        max_workers: int = LOG_AGGREGATION_MAX_WORKERS,
+    ) -> Iterator[str]:
+        """Get logs from every pod of this HyperPod PyTorch job as one merged stream.
+
+        Pod logs are read concurrently and each line is prefixed with its pod name.
+        Without ``follow`` the pods' logs are merged in timestamp order; with
+        ``follow`` lines are yielded as they arrive from any pod.
+
+        **Parameters:**
+
+        .. list-table::
+           :header-rows: 1
+           :widths: 20 20 60
+
+           * - Parameter
+             - Type
+             - Description
+           * - container
+             - str, optional
+             - The container name within the pods. If None, uses the first container.
+           * - follow
+             - bool, optional
+             - Keep streaming new log lines until every container exits. Defaults to False.
+           * - since_seconds
+             - int, optional
+             - Only return logs newer than this many seconds
+           * - tail_lines
+             - int, optional
+             - Only return this many lines from the end of each pod's log
+           * - limit_bytes_per_pod
+             - int, optional
+             - Stop reading a pod after this many bytes. Defaults to 1 MiB per pod when not following.
+           * - max_workers
+             - int, optional
+             - Maximum number of pod logs read at the same time. With ``follow`` every pod's log stays open, so at most this many pods can be followed. Defaults to 32.
+
+        **Returns:**
+
+        Iterator[str]: Log lines prefixed with ``[<pod name>]``
+
+        **Raises:**
+
+        Exception: If listing the job's pods fails
+        ValueError: If ``follow`` is set and the job has more pods than ``max_workers``
+
+        .. dropdown:: Usage Examples
+           :open:
+
+           .. code-block:: python
+
+              >>> job = HyperPodPytorchJob.get("my-job")
+              >>> for line in job.get_logs_all_pods(tail_lines=100):
+              ...     print(line)
+        """
+        pods = self.list_pods()
+
+        if container is None:
+            # If container name is not set, get logs from the first container in the pod
+            container = self.replicaSpecs[0].template.spec.containers[0].name
+
+        return aggregate_pod_logs(
+            client.CoreV1Api(get_shared_api_client()),
+            pods=pods,
+            namespace=self.metadata.namespace,
+            container=container,
+            follow=follow,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            limit_bytes_per_pod=limit_bytes_per_pod,
+            max_workers=max_workers,
+        )
+
     @classmethod
     @_hyperpod_telemetry_emitter(Feature.HYPERPOD, "get_operator_logs_pytorchjob")
     def get_operator_logs(cls, since_hours: float):
         cls.verify_kube_config()
 
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(get_shared_api_client())
 
         # Get pods with the training operator label directly
         pods = v1.list_namespaced_pod(
@@ -753,7 +1241,7 @@ def list_accelerator_partition_types(instance_type: str) -> List[str]:
         possible_partition_types = set(INSTANCE_TYPE_MIG_PROFILES[instance_type])
         available_partition_types = set()
         
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(get_shared_api_client())
         label_selector = f"node.kubernetes.io/instance-type={instance_type}"
         nodes = v1.list_node(label_selector=label_selector).items
         
@@ -777,29 +1265,25 @@ def list_accelerator_partition_types(instance_type: str) -> List[str]:
 
 
 def _load_hp_job(response: dict) -> HyperPodPytorchJob:
-
-    spec = _HyperPodPytorchJob.model_validate(response["spec"], by_name=True)
-    metadata = Metadata(**response["metadata"])
-
-    if "status" in response:
-        status = HyperPodPytorchJobStatus.model_validate(
-            response["status"], by_name=True
-        )
-
-    else:
-        status = None
-
-    job = HyperPodPytorchJob(
-        metadata=metadata,
-        status=status,
-        **spec.model_dump(by_alias=True, exclude_none=True),
+    """Build a job from a HyperPodPyTorchJob custom object, validating the spec once."""
+    # The spec model ignores unknown keys but the job model forbids them
+    spec = {k: v for k, v in response["spec"].items() if k in _SPEC_KEYS}
+
+    return HyperPodPytorchJob.model_validate(
+        {
+            **spec,
+            "metadata": response["metadata"],
+            "status": response.get("status"),
+        },
+        by_name=True,
     )
-    return job
 
 
 def _load_hp_job_list(response: dict) -> List[HyperPodPytorchJob]:
-    job_list = []
-    for hp_job in response["items"]:
-        job = _load_hp_job(hp_job)
-        job_list.append(job)
-    return job_list
+    return [_load_hp_job(hp_job) for hp_job in response["items"]]
+
+
+_SPEC_FIELDS = frozenset(_HyperPodPytorchJob.model_fields)
+_SPEC_KEYS = _SPEC_FIELDS | frozenset(
+    field.alias for field in _HyperPodPytorchJob.model_fields.values() if field.alias
+)
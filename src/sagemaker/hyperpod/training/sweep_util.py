@@ -0,0 +1,103 @@
+"""Expansion of parameter sweeps into one job configuration per variant.
+
+A sweep is a job configuration whose strings may be Jinja templates, and a
+matrix of parameter values. Every combination of matrix values is one variant,
+and the configuration is rendered once per variant with the combination and
+its zero-based ``index`` as template variables. A string that is exactly one
+``{{ variable }}`` expression takes the variable's value with its type, so
+numbers and lists stay numbers and lists. Each distinct template string is
+compiled once for the whole sweep.
+
+A sweep file is YAML with the configuration under ``job`` and the matrix
+under ``matrix``::
+
+    job:
+      job_name: "llama-lr{{ index }}"
+      image: 123456789012.dkr.ecr.us-west-2.amazonaws.com/train:latest
+      args: ["--learning-rate={{ learning_rate }}", "--batch-size={{ batch_size }}"]
+      node_count: "{{ nodes }}"
+    matrix:
+      learning_rate: [0.0001, 0.0003]
+      batch_size: [32, 64]
+      nodes: [2]
+"""
+
+import itertools
+import re
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import yaml
+
+from sagemaker.hyperpod.common.templating import compile_template
+
+_SINGLE_EXPRESSION = re.compile(r"^\{\{\s*(\w+)\s*\}\}$")
+
+
+def expand_sweep(template: Mapping[str, Any], matrix: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Render a job configuration for every combination of matrix values.
+
+    Args:
+        template (Mapping[str, Any]): Job configuration whose strings may be
+            Jinja templates over the matrix parameters and ``index``
+        matrix (Mapping[str, Sequence[Any]]): Values of each parameter
+
+    Returns:
+        List[Dict[str, Any]]: One configuration per combination, in the order
+        of itertools.product over the matrix
+
+    Raises:
+        ValueError: If a parameter has no values or is named ``index``
+        jinja2.UndefinedError: If a template uses a variable that is not a parameter
+    """
+    for name, values in matrix.items():
+        if name == "index":
+            raise ValueError("'index' is set for every variant and cannot be a sweep parameter")
+        if isinstance(values, (str, bytes)) or not isinstance(values, Sequence) or not values:
+            raise ValueError(f"Sweep parameter '{name}' must be a non-empty list of values")
+
+    names = list(matrix)
+    return [
+        _render(template, dict(zip(names, combination), index=index))
+        for index, combination in enumerate(itertools.product(*(matrix[name] for name in names)))
+    ]
+
+
+def load_sweep_file(path: str) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+    """Read the job configuration and matrix of a sweep file.
+
+    Args:
+        path (str): Path of the YAML sweep file
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, List[Any]]]: The ``job`` configuration and the ``matrix``
+
+    Raises:
+        ValueError: If the file is not a mapping with ``job`` and ``matrix`` mappings
+    """
+    with open(path) as f:
+        sweep = yaml.safe_load(f)
+    if not isinstance(sweep, dict):
+        raise ValueError(f"Sweep file {path} must be a mapping with 'job' and 'matrix' keys")
+    unknown = set(sweep) - {"job", "matrix"}
+    if unknown:
+        raise ValueError(f"Unknown keys in sweep file {path}: {sorted(unknown)}")
+    job = sweep.get("job") or {}
+    matrix = sweep.get("matrix") or {}
+    if not isinstance(job, dict) or not isinstance(matrix, dict):
+        raise ValueError(f"'job' and 'matrix' in sweep file {path} must be mappings")
+    return job, matrix
+
+
+def _render(value: Any, variables: Dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        match = _SINGLE_EXPRESSION.match(value)
+        if match and match.group(1) in variables:
+            return variables[match.group(1)]
+        if "{{" in value or "{%" in value:
+            return compile_template(value, strict=True).render(variables)
+        return value
+    if isinstance(value, Mapping):
+        return {key: _render(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_render(item, variables) for item in value]
+    return value
@@ -0,0 +1,117 @@
+"""
+Benchmark for listing training jobs across all namespaces against a stubbed Kubernetes API.
+
+Listing all namespaces used to LIST the namespaces and then LIST the jobs of
+each namespace one after another. It now issues a single paginated
+cluster-scoped LIST, and only when RBAC forbids that does it fall back to
+per-namespace LISTs on a bounded thread pool. The stub answers every request
+after a fixed delay standing in for the API server round trip, and counts
+requests so both the request count and the wall time are reported.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import threading
+import time
+
+from kubernetes.client.rest import ApiException
+
+from sagemaker.hyperpod.common.k8s_bulk import list_custom_object_pages_all_namespaces
+
+NAMESPACES = 200
+JOBS_PER_NAMESPACE = 5
+PAGE_SIZE = 500
+# Simulated API server round trip
+ROUND_TRIP_SECONDS = 0.002
+
+
+class StubCustomObjectsApi:
+    """Serves jobs spread over many namespaces like the API server, counting requests."""
+
+    def __init__(self, namespaces, jobs_per_namespace, cluster_scope_allowed=True):
+        self.namespaces = namespaces
+        self.jobs = [
+            {"metadata": {"name": f"job-{i}", "namespace": namespace}}
+            for namespace in namespaces
+            for i in range(jobs_per_namespace)
+        ]
+        self.cluster_scope_allowed = cluster_scope_allowed
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def _request(self):
+        with self._lock:
+            self.requests += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+
+    def list_namespace_names(self):
+        self._request()
+        return list(self.namespaces)
+
+    def list_cluster_custom_object(self, group, version, plural, limit=None, _continue=None, **kwargs):
+        self._request()
+        if not self.cluster_scope_allowed:
+            raise ApiException(status=403, reason="Forbidden")
+        return self._page(self.jobs, limit, _continue)
+
+    def list_namespaced_custom_object(self, group, version, namespace, plural, limit=None, _continue=None, **kwargs):
+        self._request()
+        jobs = [job for job in self.jobs if job["metadata"]["namespace"] == namespace]
+        return self._page(jobs, limit, _continue)
+
+    @staticmethod
+    def _page(items, limit, _continue):
+        start = int(_continue) if _continue else 0
+        end = start + limit if limit else len(items)
+        metadata = {"continue": str(end)} if end < len(items) else {}
+        return {"items": items[start:end], "metadata": metadata}
+
+
+def _list_each_namespace_sequentially(stub):
+    """The previous implementation: LIST namespaces, then LIST jobs in each one in turn."""
+    jobs = []
+    for namespace in stub.list_namespace_names():
+        response = stub.list_namespaced_custom_object("g", "v1", namespace, "jobs")
+        jobs.extend(response["items"])
+    return jobs
+
+
+def _list_all_namespaces(stub):
+    pages = list_custom_object_pages_all_namespaces(
+        stub, "g", "v1", "jobs", stub.list_namespace_names, page_size=PAGE_SIZE
+    )
+    return [job for page in pages for job in page]
+
+
+def _run(stub, list_fn):
+    stub.requests = 0
+    start = time.perf_counter()
+    jobs = list_fn(stub)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return jobs, stub.requests, elapsed_ms
+
+
+def test_list_all_namespaces_cluster_scoped_vs_per_namespace():
+    namespaces = [f"team-{i}" for i in range(NAMESPACES)]
+    stub = StubCustomObjectsApi(namespaces, JOBS_PER_NAMESPACE)
+    forbidden_stub = StubCustomObjectsApi(namespaces, JOBS_PER_NAMESPACE, cluster_scope_allowed=False)
+
+    old, old_requests, old_ms = _run(stub, _list_each_namespace_sequentially)
+    new, new_requests, new_ms = _run(stub, _list_all_namespaces)
+    fallback, fallback_requests, fallback_ms = _run(forbidden_stub, _list_all_namespaces)
+
+    print(
+        f"\n{NAMESPACES} namespaces x {JOBS_PER_NAMESPACE} jobs, "
+        f"{ROUND_TRIP_SECONDS * 1000:.0f} ms round trip:"
+        f"\n  sequential LIST per namespace: {old_requests} requests, {old_ms:.0f} ms"
+        f"\n  cluster-scoped LIST (page size {PAGE_SIZE}): {new_requests} requests, {new_ms:.0f} ms"
+        f"\n  forbidden, parallel LIST per namespace: {fallback_requests} requests, {fallback_ms:.0f} ms"
+    )
+
+    total_jobs = NAMESPACES * JOBS_PER_NAMESPACE
+    assert len(old) == len(new) == len(fallback) == total_jobs
+    assert fallback == old
+    assert old_requests == NAMESPACES + 1
+    assert new_requests == -(-total_jobs // PAGE_SIZE)
+    assert fallback_requests == NAMESPACES + 2
+    assert new_ms < old_ms
+    assert fallback_ms < old_ms
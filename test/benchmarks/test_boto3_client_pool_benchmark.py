@@ -0,0 +1,45 @@
+"""
+Microbenchmark for the boto3 client pool in create_boto3_client.
+
+A single CLI command typically asks for the same few clients several times
+(describe_cluster lookups, addon checks, STS identity, log link generation).
+This compares building those clients with plain boto3.client against the
+pooled create_boto3_client. Client construction is local, so no AWS
+credentials or network access are needed.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import time
+
+import boto3
+
+from sagemaker.hyperpod.common.utils import clear_boto3_client_cache, create_boto3_client
+
+REGION = "us-west-2"
+# Client requests made by a typical `hyp` command that inspects a cluster
+COMMAND_CLIENTS = ["sagemaker", "sagemaker", "eks", "eks", "sagemaker", "sts", "eks"]
+COMMANDS = 5
+
+
+def _run(create) -> float:
+    start = time.perf_counter()
+    for _ in range(COMMANDS):
+        for service in COMMAND_CLIENTS:
+            create(service, region_name=REGION)
+    return (time.perf_counter() - start) * 1000 / COMMANDS
+
+
+def test_client_pool_per_command_savings():
+    clear_boto3_client_cache()
+    # Warm boto3's loader caches so both runs start from the same state
+    boto3.client("sts", region_name=REGION)
+
+    unpooled_ms = _run(boto3.client)
+    pooled_ms = _run(create_boto3_client)
+    clear_boto3_client_cache()
+
+    print(
+        f"\n{len(COMMAND_CLIENTS)} client requests per command: "
+        f"boto3.client {unpooled_ms:.1f} ms, create_boto3_client {pooled_ms:.1f} ms"
+    )
+    assert pooled_ms < unpooled_ms
@@ -0,0 +1,51 @@
+"""
+Startup benchmark for the ``hyp`` entry point.
+
+Measures cold ``hyp --help`` wall time in fresh interpreters. Subcommand
+modules are imported lazily (see sagemaker.hyperpod.cli.command_manifest), so
+help rendering must not pay for kubernetes, boto3 or the template registries.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 5
+# Generous budget so the check stays stable on slow CI hosts; an eager import
+# of every command module takes several seconds.
+HELP_BUDGET_SECONDS = float(os.environ.get("HYP_HELP_BUDGET_SECONDS", "1.5"))
+
+HELP_SCRIPT = "from sagemaker.hyperpod.cli.hyp_cli import cli; cli(['--help'])"
+FULL_IMPORT_SCRIPT = "; ".join(
+    f"import sagemaker.hyperpod.cli.commands.{module}"
+    for module in ("cluster", "cluster_stack", "training", "inference", "space", "space_template", "init")
+)
+
+
+def _time_cold_run(script: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def test_cold_help_startup_time():
+    help_times = [_time_cold_run(HELP_SCRIPT) for _ in range(RUNS)]
+    full_time = _time_cold_run(FULL_IMPORT_SCRIPT)
+
+    help_median = statistics.median(help_times)
+    print(
+        f"\nhyp --help cold start: median {help_median * 1000:.0f} ms "
+        f"(min {min(help_times) * 1000:.0f} ms, max {max(help_times) * 1000:.0f} ms) "
+        f"over {RUNS} runs; eager import of all command modules: {full_time * 1000:.0f} ms"
+    )
+
+    assert help_median < HELP_BUDGET_SECONDS
+    assert help_median < full_time
@@ -0,0 +1,74 @@
+"""
+Benchmark for building click commands from template schemas.
+
+training_utils, inference_utils and space_utils generate their click options
+from the template package's schema.json whenever a command module is
+imported. This measures that cost against the raw json.loads and pickle.loads
+of the same schema so a regression (or the case for caching it) is visible.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import json
+import pickle
+import pkgutil
+import time
+
+from hyperpod_custom_inference_template.registry import SCHEMA_REGISTRY as CUSTOM_REGISTRY
+from hyperpod_pytorch_job_template.registry import SCHEMA_REGISTRY as PYTORCH_REGISTRY
+from hyperpod_space_template.registry import SCHEMA_REGISTRY as SPACE_REGISTRY
+
+from sagemaker.hyperpod.cli import inference_utils, space_utils, training_utils
+from sagemaker.hyperpod.cli.common_utils import get_latest_version
+
+ITERATIONS = 200
+# Per-command budget for schema load + option generation.
+GENERATION_BUDGET_MS = 10.0
+
+GENERATORS = {
+    "hyp-pytorch-job": (
+        training_utils.generate_click_command,
+        "hyperpod_pytorch_job_template",
+        PYTORCH_REGISTRY,
+    ),
+    "hyp-custom-endpoint": (
+        inference_utils.generate_click_command,
+        "hyperpod_custom_inference_template",
+        CUSTOM_REGISTRY,
+    ),
+    "hyp-space": (
+        space_utils.generate_click_command,
+        "hyperpod_space_template",
+        SPACE_REGISTRY,
+    ),
+}
+
+
+def _per_call_ms(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) * 1000 / ITERATIONS
+
+
+def _handler(*args):
+    return None
+
+
+def test_click_generation_cost():
+    print()
+    for command, (generator, schema_pkg, registry) in GENERATORS.items():
+        version = get_latest_version(registry)
+        raw = pkgutil.get_data(f"{schema_pkg}.v{version.replace('.', '_')}", "schema.json")
+        pickled = pickle.dumps(json.loads(raw))
+
+        json_ms = _per_call_ms(lambda: json.loads(raw))
+        pickle_ms = _per_call_ms(lambda: pickle.loads(pickled))
+        generate_ms = _per_call_ms(
+            lambda: generator(schema_pkg=schema_pkg, registry=registry)(_handler)
+        )
+
+        print(
+            f"{command:<22} schema {len(raw) / 1024:5.1f} KiB | json.loads {json_ms:.3f} ms | "
+            f"pickle.loads {pickle_ms:.3f} ms | schema + click options {generate_ms:.3f} ms"
+        )
+        assert generate_ms < GENERATION_BUDGET_MS
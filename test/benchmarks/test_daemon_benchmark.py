@@ -0,0 +1,68 @@
+"""
+Benchmark for repeated ``hyp`` invocations with and without ``hyp daemon``.
+
+Without the daemon every invocation starts an interpreter, imports the command
+module with kubernetes, boto3 and the template packages, and builds its clients
+again. With a daemon running, the entry point forwards the command over a Unix
+domain socket to a process that already did all of that. Help output of a
+command module stands in for a command, so no cluster is needed.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from sagemaker.hyperpod.cli.daemon import _wait_for
+from sagemaker.hyperpod.cli.daemon_client import request_daemon
+
+CALLS = 5
+ARGV = ["describe", "hyp-pytorch-job", "--help"]
+HYP_SCRIPT = "from sagemaker.hyperpod.cli.daemon_client import main; main()"
+
+
+def _run_hyp(env, argv):
+    return subprocess.run(
+        [sys.executable, "-c", HYP_SCRIPT] + argv,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _time_calls(env):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        output = _run_hyp(env, ARGV).stdout
+    return output, (time.perf_counter() - start) * 1000 / CALLS
+
+
+def test_repeated_invocations_with_and_without_daemon():
+    directory = tempfile.mkdtemp()
+    os.chmod(directory, 0o700)
+    socket_path = os.path.join(directory, "daemon.sock")
+    env = dict(os.environ, HYPERPOD_DAEMON_SOCKET=socket_path)
+
+    in_process_output, in_process_ms = _time_calls(dict(env, HYPERPOD_NO_DAEMON="1"))
+
+    _run_hyp(env, ["daemon", "start", "--idle-timeout", "60"])
+    try:
+        daemon_output, daemon_ms = _time_calls(env)
+        served = request_daemon("status", socket_path=socket_path)["status"]["requests"]
+    finally:
+        _run_hyp(env, ["daemon", "stop"])
+    stopped = _wait_for(lambda: not os.path.exists(socket_path), 10)
+
+    print(
+        f"\n{CALLS} x hyp {' '.join(ARGV)}:"
+        f"\n  in-process: {in_process_ms:.0f} ms per call"
+        f"\n  forwarded to hyp daemon: {daemon_ms:.0f} ms per call"
+    )
+
+    assert daemon_output == in_process_output
+    assert served == CALLS
+    assert stopped
+    assert daemon_ms < in_process_ms
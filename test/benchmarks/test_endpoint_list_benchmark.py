@@ -0,0 +1,107 @@
+"""
+Benchmark for HPJumpStartEndpoint.list against a stubbed Kubernetes API.
+
+Listing used to issue one LIST and then one GET per endpoint. It now builds
+the endpoints straight from the LIST items, following continue tokens. The
+stub answers every request after a fixed delay standing in for the API
+server round trip. It counts requests so both the request count and the wall
+time of the two approaches are reported.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import copy
+import time
+from unittest.mock import patch
+
+from sagemaker.hyperpod.inference.config.constants import JUMPSTART_MODEL_KIND
+from sagemaker.hyperpod.inference.hp_jumpstart_endpoint import HPJumpStartEndpoint
+
+ENDPOINTS = 300
+PAGE_SIZE = 100
+# Simulated API server round trip
+ROUND_TRIP_SECONDS = 0.002
+
+
+def _endpoint_object(i: int) -> dict:
+    return {
+        "apiVersion": "inference.sagemaker.aws.amazon.com/v1",
+        "kind": JUMPSTART_MODEL_KIND,
+        "metadata": {"name": f"endpoint-{i}", "namespace": "default"},
+        "spec": {
+            "model": {"modelId": "huggingface-eqa-bert-base-cased"},
+            "server": {"instanceType": "ml.g5.8xlarge"},
+            "sageMakerEndpoint": {"name": f"endpoint-{i}"},
+        },
+        "status": {"state": "DeploymentComplete"},
+    }
+
+
+class StubCustomObjectsApi:
+    """Serves a fixed set of endpoints like the API server, counting requests."""
+
+    def __init__(self, objects):
+        self.objects = {obj["metadata"]["name"]: obj for obj in objects}
+        self.requests = 0
+
+    def list_namespaced_custom_object(self, group, version, namespace, plural, limit=None, _continue=None):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+        names = sorted(self.objects)
+        start = int(_continue) if _continue else 0
+        end = start + limit if limit else len(names)
+        metadata = {"continue": str(end)} if end < len(names) else {}
+        return {
+            "items": [copy.deepcopy(self.objects[name]) for name in names[start:end]],
+            "metadata": metadata,
+        }
+
+    def get_namespaced_custom_object(self, group, version, namespace, plural, name):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+        return copy.deepcopy(self.objects[name])
+
+
+def _list_with_get_per_item(namespace: str):
+    """The previous list implementation: LIST for names, then GET each endpoint."""
+    response = HPJumpStartEndpoint.call_list_api(kind=JUMPSTART_MODEL_KIND, namespace=namespace)
+    return [
+        HPJumpStartEndpoint.get(item["metadata"]["name"], namespace=namespace)
+        for item in response["items"]
+    ]
+
+
+def _run(stub, list_fn):
+    with patch("kubernetes.client.CustomObjectsApi", return_value=stub), patch.object(
+        HPJumpStartEndpoint, "verify_kube_config"
+    ):
+        stub.requests = 0
+        start = time.perf_counter()
+        endpoints = list_fn()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    return endpoints, stub.requests, elapsed_ms
+
+
+def test_list_endpoints_single_list_vs_get_per_item():
+    stub = StubCustomObjectsApi([_endpoint_object(i) for i in range(ENDPOINTS)])
+
+    old, old_requests, old_ms = _run(stub, lambda: _list_with_get_per_item("default"))
+    new, new_requests, new_ms = _run(
+        stub, lambda: HPJumpStartEndpoint.list(namespace="default", page_size=PAGE_SIZE)
+    )
+    parallel, _, parallel_ms = _run(
+        stub,
+        lambda: HPJumpStartEndpoint.list(namespace="default", page_size=PAGE_SIZE, max_workers=4),
+    )
+
+    print(
+        f"\n{ENDPOINTS} endpoints, {ROUND_TRIP_SECONDS * 1000:.0f} ms round trip:"
+        f"\n  LIST + GET per endpoint: {old_requests} requests, {old_ms:.0f} ms"
+        f"\n  paginated LIST (page size {PAGE_SIZE}): {new_requests} requests, {new_ms:.0f} ms"
+        f"\n  paginated LIST, 4 validation workers: {parallel_ms:.0f} ms"
+    )
+
+    assert [e.metadata.name for e in new] == [e.metadata.name for e in old]
+    assert [e.metadata.name for e in parallel] == [e.metadata.name for e in old]
+    assert old_requests == ENDPOINTS + 1
+    assert new_requests == ENDPOINTS // PAGE_SIZE
+    assert new_ms < old_ms
@@ -0,0 +1,77 @@
+"""
+Benchmark for repeated hub content document lookups in one session.
+
+``hyp init``, ``configure`` and ``create`` of a recipe job each called
+describe_hub_content and parsed the JSON document again, so every lookup paid a
+round trip and a json.loads. With the hub cache the first lookup describes and
+stores the parsed document, and later lookups only load it from disk once the
+latest version is known. The service is simulated with a fixed latency.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import json
+import time
+from unittest.mock import MagicMock
+
+from sagemaker.hyperpod.common.hub_cache import clear_hub_cache, get_hub_content_document
+
+LOOKUPS = 20
+# Simulated describe_hub_content round trip
+DESCRIBE_LATENCY_SECONDS = 0.05
+
+
+def _document():
+    recipes = []
+    for i in range(400):
+        recipes.append({
+            "Name": f"recipe-{i}",
+            "CustomizationTechnique": ["SFT", "DPO", "RLVR", "CPT"][i % 4],
+            "SupportedInstanceTypes": ["ml.p4d.24xlarge", "ml.p5.48xlarge", "ml.g5.48xlarge"],
+            "HpEksPayloadTemplateS3Uri": f"s3://jumpstart-cache/recipes/{i}/k8s.jinja",
+            "HpEksOverrideParamsS3Uri": f"s3://jumpstart-cache/recipes/{i}/override_spec.json",
+            "Hyperparameters": {f"param_{j}": {"type": "float", "default": j / 10} for j in range(40)},
+        })
+    return {"RecipeCollection": recipes, "SupportedInferenceInstanceTypes": ["ml.g5.2xlarge"]}
+
+
+def _client(body):
+    def describe_hub_content(**kwargs):
+        time.sleep(DESCRIBE_LATENCY_SECONDS)
+        return {"HubContentVersion": "1.0.0", "HubContentDocument": body}
+
+    client = MagicMock()
+    client.meta.region_name = "us-west-2"
+    client.describe_hub_content.side_effect = describe_hub_content
+    client.list_hub_content_versions.return_value = {
+        "HubContentSummaries": [{"HubContentVersion": "1.0.0"}]
+    }
+    return client
+
+
+def test_repeated_hub_document_lookups(tmp_path, monkeypatch):
+    monkeypatch.setenv("HYPERPOD_CACHE_DIR", str(tmp_path))
+    body = json.dumps(_document())
+    client = _client(body)
+    clear_hub_cache()
+
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        uncached = json.loads(client.describe_hub_content(
+            HubName="SageMakerPublicHub", HubContentType="Model", HubContentName="llama"
+        )["HubContentDocument"])
+    uncached_ms = (time.perf_counter() - start) * 1000 / LOOKUPS
+
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        cached = get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+    cached_ms = (time.perf_counter() - start) * 1000 / LOOKUPS
+
+    print(
+        f"\n{LOOKUPS} lookups of a {len(body) // 1024} KiB hub content document:"
+        f"\n  describe + json.loads: {uncached_ms:.2f} ms per lookup"
+        f"\n  hub cache: {cached_ms:.2f} ms per lookup"
+    )
+
+    assert cached == uncached
+    assert client.describe_hub_content.call_count == LOOKUPS + 1
+    assert cached_ms < uncached_ms
@@ -0,0 +1,105 @@
+"""
+Benchmark for repeated HyperPodPytorchJob.get calls with and without HyperPodCache.
+
+Without the cache every get is a GET round trip to the API server. With a
+running HyperPodCache the jobs are LISTed once and later gets are answered
+from memory. The stub answers every request after a fixed delay standing in
+for the API server round trip, and counts requests so both the request count
+and the wall time are reported.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sagemaker.hyperpod.common.informer import HyperPodCache
+from sagemaker.hyperpod.training.hyperpod_pytorch_job import HyperPodPytorchJob
+
+JOBS = 50
+GETS = 1000
+# Simulated API server round trip
+ROUND_TRIP_SECONDS = 0.002
+
+
+def _job(i):
+    return {
+        "apiVersion": "sagemaker.amazonaws.com/v1",
+        "kind": "HyperPodPyTorchJob",
+        "metadata": {"name": f"job-{i}", "namespace": "team-a", "resourceVersion": str(i + 1)},
+        "spec": {"nprocPerNode": "8", "replicaSpecs": [{"name": "pod", "replicas": 4}]},
+        "status": {"conditions": [{"type": "Running", "status": "True"}]},
+    }
+
+
+class StubCustomObjectsApi:
+    """Serves jobs like the API server, counting requests."""
+
+    def __init__(self, jobs):
+        self.jobs = {job["metadata"]["name"]: job for job in jobs}
+        self.requests = 0
+
+    def get_namespaced_custom_object(self, group, version, namespace, plural, name, **kwargs):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+        return self.jobs[name]
+
+    def list_namespaced_custom_object(self, _preload_content=True, **kwargs):
+        self.requests += 1
+        time.sleep(ROUND_TRIP_SECONDS)
+        body = {"items": list(self.jobs.values()), "metadata": {"resourceVersion": str(len(self.jobs))}}
+        return SimpleNamespace(data=json.dumps(body).encode())
+
+
+class IdleWatch:
+    """A watch on which nothing changes until it is stopped."""
+
+    def __init__(self):
+        self._stopped = threading.Event()
+
+    def stream(self, func, **kwargs):
+        self._stopped.wait(5)
+        return iter(())
+
+    def stop(self):
+        self._stopped.set()
+
+
+def _get_all():
+    for i in range(GETS):
+        job = HyperPodPytorchJob.get(f"job-{i % JOBS}", namespace="team-a")
+    return job
+
+
+def test_repeated_get_with_and_without_cache():
+    stub = StubCustomObjectsApi([_job(i) for i in range(JOBS)])
+
+    with patch.object(HyperPodPytorchJob, "verify_kube_config"), \
+            patch("kubernetes.client.CustomObjectsApi", return_value=stub), \
+            patch("sagemaker.hyperpod.common.informer.config.load_kube_config"), \
+            patch("sagemaker.hyperpod.common.informer.watch.Watch", IdleWatch):
+        start = time.perf_counter()
+        uncached_job = _get_all()
+        uncached_ms = (time.perf_counter() - start) * 1000
+        uncached_requests, stub.requests = stub.requests, 0
+
+        start = time.perf_counter()
+        with HyperPodCache(namespaces=["team-a"], resources=["hyp-pytorch-job"]) as cache:
+            cached_job = _get_all()
+            metrics = cache.metrics()["hyp-pytorch-job/team-a"]
+        cached_ms = (time.perf_counter() - start) * 1000
+        cached_requests = stub.requests
+
+    print(
+        f"\n{GETS} gets of {JOBS} jobs, {ROUND_TRIP_SECONDS * 1000:.0f} ms round trip:"
+        f"\n  GET per call: {uncached_requests} requests, {uncached_ms:.0f} ms"
+        f"\n  HyperPodCache: {cached_requests} requests, {cached_ms:.0f} ms"
+    )
+
+    assert cached_job == uncached_job
+    assert uncached_requests == GETS
+    assert cached_requests == 1
+    assert metrics["hits"] == GETS
+    assert cached_ms < uncached_ms
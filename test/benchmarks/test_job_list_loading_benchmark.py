@@ -0,0 +1,119 @@
+"""
+Benchmark for turning a large HyperPodPyTorchJob LIST response into job objects.
+
+Each job used to be validated twice: once into the spec model, then again
+when the dumped spec was passed to the HyperPodPytorchJob constructor. Jobs
+are now validated in a single pass. The benchmark loads 5k jobs with
+realistic specs both ways and reads the fields the ``hyp list hyp-pytorch-job``
+table uses.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import time
+
+from sagemaker.hyperpod.common.config.metadata import Metadata
+from sagemaker.hyperpod.training.config.hyperpod_pytorch_job_unified_config import (
+    _HyperPodPytorchJob,
+    HyperPodPytorchJobStatus,
+)
+from sagemaker.hyperpod.training.hyperpod_pytorch_job import (
+    HyperPodPytorchJob,
+    _load_hp_job_list,
+)
+
+JOBS = 5000
+
+
+def _job(i):
+    container = {
+        "name": "pytorch",
+        "image": "123456789012.dkr.ecr.us-west-2.amazonaws.com/train:latest",
+        "imagePullPolicy": "Always",
+        "command": ["torchrun"],
+        "args": ["--nnodes", "4", "train.py", "--epochs", "10"],
+        "env": [{"name": f"VAR_{n}", "value": str(n)} for n in range(8)],
+        "resources": {
+            "requests": {"nvidia.com/gpu": "8", "vpc.amazonaws.com/efa": "32"},
+            "limits": {"nvidia.com/gpu": "8", "vpc.amazonaws.com/efa": "32"},
+        },
+        "volumeMounts": [{"name": "data", "mountPath": "/data"}],
+    }
+    return {
+        "apiVersion": "sagemaker.amazonaws.com/v1",
+        "kind": "HyperPodPyTorchJob",
+        "metadata": {
+            "name": f"job-{i}",
+            "namespace": "team-a",
+            "uid": f"uid-{i}",
+            "labels": {"kueue.x-k8s.io/queue-name": "team-a-localqueue"},
+        },
+        "spec": {
+            "nprocPerNode": "8",
+            "runPolicy": {"cleanPodPolicy": "None", "jobMaxRetryCount": 3},
+            "replicaSpecs": [
+                {
+                    "name": "pod",
+                    "replicas": 4,
+                    "template": {
+                        "metadata": {"labels": {"app": f"job-{i}"}},
+                        "spec": {
+                            "containers": [container],
+                            "nodeSelector": {"node.kubernetes.io/instance-type": "ml.p5.48xlarge"},
+                            "tolerations": [{"key": "gpu", "operator": "Exists", "effect": "NoSchedule"}],
+                            "volumes": [{"name": "data", "persistentVolumeClaim": {"claimName": "fsx"}}],
+                        },
+                    },
+                }
+            ],
+        },
+        "status": {
+            "conditions": [
+                {"type": "Created", "status": "True", "lastTransitionTime": "2025-01-01T00:00:00Z"},
+                {"type": "Running", "status": "True", "lastTransitionTime": "2025-01-01T00:01:00Z"},
+            ],
+        },
+    }
+
+
+def _load_validating_twice(response):
+    """The previous loader: validate the spec, dump it, then validate it again."""
+    jobs = []
+    for item in response["items"]:
+        spec = _HyperPodPytorchJob.model_validate(item["spec"], by_name=True)
+        status = HyperPodPytorchJobStatus.model_validate(item["status"], by_name=True)
+        jobs.append(HyperPodPytorchJob(
+            metadata=Metadata(**item["metadata"]),
+            status=status,
+            **spec.model_dump(by_alias=True, exclude_none=True),
+        ))
+    return jobs
+
+
+def _list_view(jobs):
+    """Read what the list table shows: name, namespace and conditions."""
+    return [(job.metadata.name, job.metadata.namespace, job.status.conditions[-1].type) for job in jobs]
+
+
+def _run(load):
+    response = {"items": [_job(i) for i in range(JOBS)]}
+    start = time.perf_counter()
+    rows = _list_view(load(response))
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def test_load_job_list_single_pass():
+    old_rows, old_ms = _run(_load_validating_twice)
+    rows, ms = _run(_load_hp_job_list)
+
+    print(
+        f"\nLoading {JOBS} jobs for the list view:"
+        f"\n  validating twice: {old_ms:.0f} ms"
+        f"\n  validating once: {ms:.0f} ms"
+    )
+
+    assert old_rows == rows
+    assert len(rows) == JOBS
+    assert ms < old_ms
+
+    response = {"items": [_job(0)]}
+    assert _load_hp_job_list(response) == _load_validating_twice(response)
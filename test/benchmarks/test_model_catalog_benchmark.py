@@ -0,0 +1,111 @@
+"""
+Benchmark for searching the JumpStart model catalog.
+
+Finding models that run on an instance type used to page through
+list_hub_contents and describe every model, one after another. The model
+catalog syncs once, describing models through a bounded thread pool, and then
+answers searches from a local SQLite full-text index. The service is simulated
+with fixed latencies.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import json
+import re
+import time
+from unittest.mock import MagicMock
+
+from sagemaker.hyperpod.common.hub_cache import clear_hub_cache
+from sagemaker.hyperpod.inference.jumpstart_model_catalog import search_model_catalog, sync_model_catalog
+
+MODELS = 600
+PAGE_SIZE = 100
+LIST_LATENCY_SECONDS = 0.05
+DESCRIBE_LATENCY_SECONDS = 0.01
+INSTANCE_TYPES = ["ml.g5.xlarge", "ml.g5.2xlarge", "ml.g5.12xlarge", "ml.p4d.24xlarge", "ml.p5.48xlarge"]
+
+
+def _summary(i):
+    return {
+        "HubContentName": f"family-{i % 20}-textgeneration-model-{i}",
+        "HubContentVersion": "1.0.0",
+        "HubContentDisplayName": f"Family {i % 20} Model {i}",
+        "HubContentDescription": f"Text generation model {i} of family {i % 20}",
+        "HubContentSearchKeywords": ["@task:text-generation", f"@family:{i % 20}"],
+    }
+
+
+def _client():
+    summaries = [_summary(i) for i in range(MODELS)]
+
+    def list_hub_contents(NextToken=None, **kwargs):
+        time.sleep(LIST_LATENCY_SECONDS)
+        start = int(NextToken or 0)
+        response = {"HubContentSummaries": summaries[start:start + PAGE_SIZE]}
+        if start + PAGE_SIZE < MODELS:
+            response["NextToken"] = str(start + PAGE_SIZE)
+        return response
+
+    def describe_hub_content(HubContentName, **kwargs):
+        time.sleep(DESCRIBE_LATENCY_SECONDS)
+        i = int(HubContentName.rsplit("-", 1)[1])
+        document = {"SupportedInferenceInstanceTypes": INSTANCE_TYPES[i % 5:] or INSTANCE_TYPES}
+        return {"HubContentVersion": "1.0.0", "HubContentDocument": json.dumps(document)}
+
+    client = MagicMock()
+    client.meta.region_name = "us-west-2"
+    client.list_hub_contents.side_effect = list_hub_contents
+    client.describe_hub_content.side_effect = describe_hub_content
+    return client
+
+
+def _live_search(client, search, instance_type):
+    matches = []
+    params = {"HubName": "SageMakerPublicHub", "HubContentType": "Model", "MaxResults": PAGE_SIZE}
+    while True:
+        response = client.list_hub_contents(**params)
+        for summary in response["HubContentSummaries"]:
+            document = json.loads(client.describe_hub_content(
+                HubName="SageMakerPublicHub", HubContentType="Model", HubContentName=summary["HubContentName"]
+            )["HubContentDocument"])
+            text = " ".join([
+                summary["HubContentName"],
+                summary["HubContentDisplayName"],
+                summary["HubContentDescription"],
+                *summary["HubContentSearchKeywords"],
+            ])
+            tokens = re.findall(r"\w+", text.lower())
+            found = all(any(token.startswith(word) for token in tokens) for word in search.lower().split())
+            if found and instance_type in document["SupportedInferenceInstanceTypes"]:
+                matches.append(summary["HubContentName"])
+        if "NextToken" not in response:
+            return matches
+        params["NextToken"] = response["NextToken"]
+
+
+def test_search_model_catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("HYPERPOD_CACHE_DIR", str(tmp_path))
+    clear_hub_cache()
+    client = _client()
+
+    start = time.perf_counter()
+    live = _live_search(client, "family 7", "ml.g5.xlarge")
+    live_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    sync_model_catalog(client)
+    sync_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    models = search_model_catalog("us-west-2", search="family 7", instance_type="ml.g5.xlarge")
+    search_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\nSearching {MODELS} hub models by words and instance type:"
+        f"\n  Live paging and describing: {live_ms:.0f} ms"
+        f"\n  Catalog sync (once): {sync_ms:.0f} ms"
+        f"\n  Catalog search: {search_ms:.2f} ms"
+    )
+
+    assert sorted(m["model_id"] for m in models) == sorted(live)
+    assert sync_ms < live_ms
+    assert search_ms < 100
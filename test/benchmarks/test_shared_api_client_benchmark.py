@@ -0,0 +1,97 @@
+"""
+Benchmark for Kubernetes calls made through a fresh ApiClient versus the SDK's shared one.
+
+SDK methods used to construct ``client.CustomObjectsApi()`` or
+``client.CoreV1Api()`` without an ApiClient, so every call built a new
+ApiClient with its own connection pool and opened a new connection to the API
+server. They now pass ``get_shared_api_client()``, which keeps connections
+alive across calls. A local HTTP/1.1 server stands in for the API server and
+counts the connections it accepts; against a real cluster each new connection
+also costs a TLS handshake.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from kubernetes import client
+
+from sagemaker.hyperpod.common.utils import create_api_client, get_shared_api_client, set_shared_api_client
+
+CALLS = 300
+
+
+class VersionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Like the API server, reply without waiting on Nagle's algorithm
+    disable_nagle_algorithm = True
+    body = json.dumps({
+        "major": "1",
+        "minor": "31",
+        "gitVersion": "v1.31.0",
+        "gitCommit": "0" * 40,
+        "gitTreeState": "clean",
+        "buildDate": "2024-08-13T07:28:49Z",
+        "goVersion": "go1.22.5",
+        "compiler": "gc",
+        "platform": "linux/amd64",
+    }).encode()
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _run(server, make_api):
+    server.connections = 0
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        version = make_api().get_code()
+    per_call_ms = (time.perf_counter() - start) * 1000 / CALLS
+    return version, server.connections, per_call_ms
+
+
+def test_shared_api_client_reuses_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), VersionHandler)
+    server.lock = threading.Lock()
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    configuration = client.Configuration(host=f"http://127.0.0.1:{server.server_address[1]}")
+    try:
+        old_version, old_connections, old_ms = _run(
+            server, lambda: client.VersionApi(client.ApiClient(configuration))
+        )
+        set_shared_api_client(create_api_client(configuration))
+        new_version, new_connections, new_ms = _run(
+            server, lambda: client.VersionApi(get_shared_api_client())
+        )
+    finally:
+        set_shared_api_client(None)
+        server.shutdown()
+        server.server_close()
+
+    print(
+        f"\n{CALLS} GET /version calls against a local server:"
+        f"\n  new ApiClient per call: {old_connections} connections, {old_ms:.2f} ms per call"
+        f"\n  shared ApiClient: {new_connections} connections, {new_ms:.2f} ms per call"
+    )
+
+    assert old_version.git_version == new_version.git_version == "v1.31.0"
+    assert old_connections == CALLS
+    assert new_connections == 1
+    assert new_ms < old_ms
@@ -0,0 +1,97 @@
+"""
+Benchmark for creating the jobs of a 1,000-variant parameter sweep.
+
+Creating the jobs of a sweep with ``hyp create hyp-pytorch-job`` one at a time
+paid a full API server round trip per job. HyperPodPytorchJob.create_many
+expands and validates every variant first and then submits them through a
+bounded thread pool within an adaptive rate limit, retrying throttled requests.
+The API server is simulated with a fixed latency and, like its priority and
+fairness limits, throttles requests beyond a fixed number in flight.
+
+Run with ``pytest test/benchmarks -s`` to see the timings.
+"""
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.telemetry.telemetry_logging import _flush_telemetry
+from sagemaker.hyperpod.training import HyperPodPytorchJob
+from sagemaker.hyperpod.training.sweep_util import expand_sweep
+from hyperpod_pytorch_job_template.v1_1.model import PyTorchJobConfig
+
+JOBS = 1000
+SERIAL_SAMPLE = 50
+# Simulated create_namespaced_custom_object round trip
+CREATE_LATENCY_SECONDS = 0.02
+# Create requests the simulated API server handles at once before answering 429
+MAX_IN_FLIGHT = 4
+
+
+def _custom_api():
+    in_flight = [0]
+    lock = threading.Lock()
+
+    def create_namespaced_custom_object(**kwargs):
+        with lock:
+            if in_flight[0] >= MAX_IN_FLIGHT:
+                raise ApiException(status=429, reason="Too Many Requests")
+            in_flight[0] += 1
+        time.sleep(CREATE_LATENCY_SECONDS)
+        with lock:
+            in_flight[0] -= 1
+
+    custom_api = MagicMock()
+    custom_api.create_namespaced_custom_object.side_effect = create_namespaced_custom_object
+    return custom_api
+
+
+def _jobs():
+    template = {
+        "job_name": "sweep-{{ index }}",
+        "namespace": "default",
+        "image": "123456789012.dkr.ecr.us-west-2.amazonaws.com/train:latest",
+        "args": ["--learning-rate={{ lr }}", "--batch-size={{ batch_size }}", "--seed={{ seed }}"],
+    }
+    matrix = {"lr": [1e-5, 3e-5, 1e-4, 3e-4, 1e-3], "batch_size": [16, 32, 64, 128], "seed": list(range(50))}
+    return [PyTorchJobConfig(**variant).to_domain() for variant in expand_sweep(template, matrix)]
+
+
+def test_create_sweep_jobs():
+    start = time.perf_counter()
+    jobs = _jobs()
+    render_ms = (time.perf_counter() - start) * 1000
+
+    custom_api = _custom_api()
+    with patch.object(HyperPodPytorchJob, "verify_kube_config"), \
+            patch("sagemaker.hyperpod.common.telemetry.telemetry_logging._deliver_telemetry_request"), \
+            patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CustomObjectsApi",
+                  return_value=custom_api):
+        start = time.perf_counter()
+        for job in jobs[:SERIAL_SAMPLE]:
+            try:
+                job.create()
+            except Exception:
+                pass
+        serial_s = (time.perf_counter() - start) * JOBS / SERIAL_SAMPLE
+
+        custom_api.reset_mock()
+        start = time.perf_counter()
+        result = HyperPodPytorchJob.create_many(jobs)
+        create_many_s = time.perf_counter() - start
+        _flush_telemetry()
+    retries = sum(r.attempts - 1 for r in result.objects)
+
+    print(
+        f"\nCreating {JOBS} sweep jobs:"
+        f"\n  Expand and validate: {render_ms:.0f} ms"
+        f"\n  One at a time (estimated from {SERIAL_SAMPLE}): {serial_s:.1f} s"
+        f"\n  create_many: {create_many_s:.1f} s ({retries} throttled requests retried)"
+    )
+
+    assert len(jobs) == JOBS
+    assert result.succeeded
+    assert len({r.name for r in result.created}) == JOBS
+    assert create_many_s < serial_s
+    assert create_many_s < 15
@@ -1,8 +1,11 @@
+import subprocess
+import sys
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import click
 from click.testing import CliRunner
 from sagemaker.hyperpod.cli.hyp_cli import cli, create, list, describe
+from sagemaker.hyperpod.cli.command_manifest import COMMAND_MANIFEST
 from sagemaker.hyperpod.cli.commands.training import (
     pytorch_create,
     list_jobs,
@@ -29,15 +32,13 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(result.exit_code, 0)
         self.assertIn("hyp-pytorch-job", result.output)
 
-    @patch("sagemaker.hyperpod.cli.commands.training.list_jobs")
-    def test_cli_list_jobs_help(self, mock_list_jobs):
+    def test_cli_list_jobs_help(self):
         """Test that the list jobs help command works"""
         result = self.runner.invoke(cli, ["list", "hyp-pytorch-job", "--help"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("List all HyperPod PyTorch jobs", result.output)
 
-    @patch("sagemaker.hyperpod.cli.commands.training.pytorch_describe")
-    def test_cli_describe_job_help(self, mock_pytorch_describe):
+    def test_cli_describe_job_help(self):
         """Test that the describe job help command works"""
         result = self.runner.invoke(cli, ["describe", "hyp-pytorch-job", "--help"])
         self.assertEqual(result.exit_code, 0)
@@ -56,9 +57,9 @@ class TestCLI(unittest.TestCase):
     def test_subcommands_registered(self):
         """Test that all subcommands are registered with their parent commands"""
         # Check that the expected subcommands are registered
-        create_commands = create.commands
-        list_commands = list.commands
-        describe_commands = describe.commands
+        create_commands = create.list_commands(None)
+        list_commands = list.list_commands(None)
+        describe_commands = describe.list_commands(None)
 
         self.assertIn("hyp-pytorch-job", create_commands)
         self.assertIn("hyp-pytorch-job", list_commands)
@@ -80,3 +81,45 @@ class TestCLI(unittest.TestCase):
         result = self.runner.invoke(describe, ["--help"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("Usage: describe [OPTIONS] COMMAND [ARGS]", result.output)
+
+    def test_command_manifest_matches_commands(self):
+        """Test that the lazy command manifest matches the real click commands"""
+        for group_name, entries in COMMAND_MANIFEST.items():
+            group = cli if group_name == "hyp" else cli.commands[group_name]
+            self.assertEqual(set(entries), set(group.lazy_commands))
+            for name, spec in entries.items():
+                cmd = group.get_command(None, name)
+                self.assertIsInstance(cmd, click.Command, f"{group_name} {name}")
+                self.assertEqual(
+                    spec.short_help, cmd.get_short_help_str(limit=1000), f"{group_name} {name}"
+                )
+                self.assertEqual(spec.hidden, cmd.hidden, f"{group_name} {name}")
+
+    def test_cli_help_does_not_import_command_modules(self):
+        """Test that top-level and group help are rendered without importing command modules"""
+        script = (
+            "import sys\n"
+            "from sagemaker.hyperpod.cli.hyp_cli import cli\n"
+            "for args in (['--help'], ['create', '--help'], ['get-logs', '--help']):\n"
+            "    try:\n"
+            "        cli(args)\n"
+            "    except SystemExit:\n"
+            "        pass\n"
+            "heavy = ('kubernetes', 'boto3', 'sagemaker_core', 'jinja2', 'hyperpod_pytorch_job_template',\n"
+            "         'sagemaker.hyperpod.cli.commands.training')\n"
+            "print('LOADED=' + ','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("hyp-pytorch-job", result.stdout)
+        self.assertIn("LOADED=\n", result.stdout)
+
+    def test_lazy_command_resolved_on_demand(self):
+        """Test that resolving a lazy command registers it and applies alias help text"""
+        recipe_cmd = list.get_command(None, "hyp-recipe-job")
+        self.assertEqual(recipe_cmd.help, "List all HyperPod recipe jobs")
+        self.assertIs(list.commands["hyp-recipe-job"], recipe_cmd)
+        self.assertIsNot(recipe_cmd, list.get_command(None, "hyp-pytorch-job"))
+        self.assertIsNone(list.get_command(None, "does-not-exist"))
@@ -54,7 +54,7 @@ class TestStackDeletionWorkflow:
             }
         ]
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_with_confirmation_success(self, mock_boto3_client):
         """Test successful stack deletion with confirmation."""
         mock_cf_client = Mock()
@@ -86,7 +86,7 @@ class TestStackDeletionWorkflow:
         assert confirm_callback.called
         assert success_callback.called
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_with_confirmation_cancelled(self, mock_boto3_client):
         """Test stack deletion cancelled by user."""
         mock_cf_client = Mock()
@@ -116,7 +116,7 @@ class TestStackDeletionWorkflow:
         message_callback.assert_any_call("Operation cancelled.")
         assert not success_callback.called
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_with_confirmation_stack_not_found(self, mock_boto3_client):
         """Test handling when stack doesn't exist."""
         mock_cf_client = Mock()
@@ -141,7 +141,7 @@ class TestStackDeletionWorkflow:
                 success_callback=success_callback
             )
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_with_retain_resources(self, mock_boto3_client):
         """Test stack deletion with resource retention."""
         mock_cf_client = Mock()
@@ -169,7 +169,7 @@ class TestStackDeletionWorkflow:
             RetainResources=['S3Bucket1', 'VPCStack']
         )
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_with_invalid_retain_resources(self, mock_boto3_client):
         """Test handling of invalid retain resources."""
         mock_cf_client = Mock()
@@ -202,7 +202,7 @@ class TestStackDeletionWorkflow:
             RetainResources=['S3Bucket1']
         )
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_termination_protection_error(self, mock_boto3_client):
         """Test handling of termination protection error."""
         mock_cf_client = Mock()
@@ -234,7 +234,7 @@ class TestStackDeletionWorkflow:
                            if 'Termination Protection is enabled' in str(call)]
         assert len(protection_calls) > 0
 
-    @patch('boto3.client')
+    @patch('boto3.session.Session.client')
     def test_delete_stack_retention_limitation_error(self, mock_boto3_client):
         """Test handling of CloudFormation retention limitation error."""
         mock_cf_client = Mock()
@@ -268,7 +268,7 @@ class TestStackDeletionWorkflow:
         message_callback = Mock()
         confirm_callback = Mock(return_value=False)  # Cancel to avoid actual deletion
         
-        with patch('boto3.client') as mock_boto3_client:
+        with patch('boto3.session.Session.client') as mock_boto3_client:
             mock_cf_client = Mock()
             mock_boto3_client.return_value = mock_cf_client
             mock_cf_client.list_stack_resources.return_value = {
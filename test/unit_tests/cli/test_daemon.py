@@ -0,0 +1,191 @@
+import io
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import click
+from click.testing import CliRunner
+
+from sagemaker.hyperpod.cli import daemon as daemon_module
+from sagemaker.hyperpod.cli.daemon import HypDaemon, daemon_status
+from sagemaker.hyperpod.cli.daemon_client import forward_command, request_daemon
+from sagemaker.hyperpod.common import metadata_cache
+
+
+@click.group()
+def fake_cli():
+    pass
+
+
+@fake_cli.command("list")
+@click.option("--fail", is_flag=True)
+def fake_list(fail):
+    tty = click.get_text_stream("stdout").isatty()
+    click.echo(f"team={os.environ.get('TEAM')} cwd={os.path.basename(os.getcwd())} tty={tty}")
+    click.echo("warning", err=True)
+    logging.getLogger("fake.command").addHandler(logging.StreamHandler())
+    metadata_cache.set_metadata_cache_enabled(False)
+    if fail:
+        raise click.ClickException("failed")
+
+
+@fake_cli.command("describe")
+def fake_describe():
+    raise RuntimeError("boom")
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.chmod(self.directory, 0o700)
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.socket_path = os.path.join(self.directory, "daemon.sock")
+        self.workdir = os.path.join(self.directory, "workdir")
+        os.mkdir(self.workdir)
+
+    def _start(self, **kwargs):
+        daemon = HypDaemon(self.socket_path, idle_timeout=0, command=fake_cli, **kwargs)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        self.assertTrue(daemon.wait_until_ready(5))
+
+        def stop():
+            daemon.shutdown()
+            thread.join(5)
+
+        self.addCleanup(stop)
+        return daemon
+
+    def _forward(self, argv, env=None):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        cwd = os.getcwd()
+        os.chdir(self.workdir)
+        try:
+            with patch.dict(os.environ, env or {}):
+                exit_code = forward_command(argv, socket_path=self.socket_path, stdout=stdout, stderr=stderr)
+        finally:
+            os.chdir(cwd)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_runs_command_with_caller_env_and_cwd(self):
+        self._start()
+
+        exit_code, stdout, stderr = self._forward(["list"], env={"TEAM": "a"})
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stdout, "team=a cwd=workdir tty=False\n")
+        self.assertEqual(stderr, "warning\n")
+        self.assertNotIn("TEAM", os.environ)
+
+    def test_returns_exit_code_and_errors(self):
+        self._start()
+
+        exit_code, _, stderr = self._forward(["list", "--fail"])
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Error: failed", stderr)
+
+        exit_code, _, stderr = self._forward(["describe"])
+        self.assertEqual(exit_code, 1)
+        self.assertIn("RuntimeError: boom", stderr)
+
+    def test_restores_process_state_between_commands(self):
+        daemon = self._start()
+
+        self._forward(["list"])
+        self._forward(["list"])
+
+        self.assertEqual(logging.getLogger("fake.command").handlers, [])
+        self.assertTrue(metadata_cache.is_metadata_cache_enabled())
+        self.assertEqual(daemon.requests, 2)
+
+    def test_other_installation_falls_back(self):
+        self._start()
+
+        with patch.object(daemon_module, "get_build_id", return_value="other"):
+            exit_code, stdout, _ = self._forward(["list"])
+
+        self.assertIsNone(exit_code)
+        self.assertEqual(stdout, "")
+
+    def test_kubeconfig_change_reloads_sdk_config(self):
+        from sagemaker.hyperpod.cli.clients.kubernetes_client import KubernetesClient
+        from sagemaker.hyperpod.common.telemetry import telemetry_logging
+        from sagemaker.hyperpod.training.hyperpod_pytorch_job import HyperPodPytorchJob
+
+        kubeconfig = os.path.join(self.directory, "kubeconfig")
+        with open(kubeconfig, "w") as f:
+            f.write("{}")
+        with patch.dict(os.environ, {"KUBECONFIG": kubeconfig}):
+            self._start()
+        self.addCleanup(setattr, HyperPodPytorchJob, "is_kubeconfig_loaded", False)
+        HyperPodPytorchJob.is_kubeconfig_loaded = True
+
+        self._forward(["list"], env={"KUBECONFIG": kubeconfig})
+        self.assertTrue(HyperPodPytorchJob.is_kubeconfig_loaded)
+
+        self.addCleanup(setattr, KubernetesClient, "_instance", KubernetesClient._instance)
+        KubernetesClient._instance = object.__new__(KubernetesClient)
+        with patch.object(
+            telemetry_logging, "get_region_and_account_from_current_context", return_value=("us-west-2", "1")
+        ):
+            telemetry_logging._get_cached_region_and_account()
+        self.addCleanup(telemetry_logging._get_cached_region_and_account.cache_clear)
+
+        os.utime(kubeconfig, ns=(0, 0))
+        self._forward(["list"], env={"KUBECONFIG": kubeconfig})
+        self.assertFalse(HyperPodPytorchJob.is_kubeconfig_loaded)
+        self.assertIsNone(KubernetesClient._instance)
+        self.assertEqual(telemetry_logging._get_cached_region_and_account.cache_info().currsize, 0)
+
+    def test_status_and_stop(self):
+        self._start()
+
+        status = request_daemon("status", socket_path=self.socket_path)["status"]
+        self.assertEqual(status["pid"], os.getpid())
+        self.assertEqual(status["requests"], 0)
+
+        self.assertEqual(request_daemon("stop", socket_path=self.socket_path), {"stopped": True})
+        self.assertTrue(daemon_module._wait_for(lambda: not os.path.exists(self.socket_path), 5))
+        self.assertIsNone(request_daemon("status", socket_path=self.socket_path))
+
+    def test_refuses_shared_socket_directory(self):
+        os.chmod(self.directory, 0o777)
+        daemon = HypDaemon(self.socket_path, idle_timeout=0, command=fake_cli)
+
+        with self.assertRaises(click.ClickException):
+            daemon.serve_forever()
+
+
+class TestForwardCommand(unittest.TestCase):
+    def setUp(self):
+        self.socket_path = os.path.join(tempfile.mkdtemp(), "daemon.sock")
+
+    @patch("sagemaker.hyperpod.cli.daemon_client.connect_to_daemon")
+    def test_only_read_only_commands_are_forwarded(self, mock_connect):
+        mock_connect.side_effect = FileNotFoundError()
+
+        for argv in (["create", "hyp-pytorch-job"], ["get-logs", "hyp-space", "-f"], ["--version"], []):
+            self.assertIsNone(forward_command(argv, socket_path=self.socket_path))
+        mock_connect.assert_not_called()
+
+        self.assertIsNone(forward_command(["--no-cache", "list", "hyp-space"], socket_path=self.socket_path))
+        mock_connect.assert_called_once()
+
+    @patch.dict(os.environ, {"HYPERPOD_NO_DAEMON": "1"})
+    @patch("sagemaker.hyperpod.cli.daemon_client.connect_to_daemon")
+    def test_disabled_by_environment(self, mock_connect):
+        self.assertIsNone(forward_command(["list", "hyp-space"], socket_path=self.socket_path))
+        mock_connect.assert_not_called()
+
+    def test_no_daemon_runs_in_process(self):
+        self.assertIsNone(forward_command(["list", "hyp-space"], socket_path=self.socket_path))
+
+    def test_status_when_not_running(self):
+        with patch.dict(os.environ, {"HYPERPOD_DAEMON_SOCKET": self.socket_path}):
+            result = CliRunner().invoke(daemon_status)
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output, "hyp daemon is not running.\n")
@@ -13,6 +13,7 @@ from sagemaker.hyperpod.cli.commands.inference import (
     custom_create,
     custom_invoke,
     js_list,
+    js_model_list,
     custom_list,
     js_describe,
     custom_describe,
@@ -490,6 +491,35 @@ def test_js_list_default_namespace(mock_hp):
     inst.list.assert_called_once_with("default")
 
 
+@patch("sagemaker.hyperpod.cli.commands.inference.search_model_catalog")
+@patch("sagemaker.hyperpod.cli.commands.inference.ensure_model_catalog")
+@patch("sagemaker.hyperpod.cli.commands.inference.create_boto3_client")
+def test_js_model_list(mock_client, mock_ensure, mock_search):
+    mock_client.return_value.meta.region_name = "us-west-2"
+    mock_search.return_value = [{
+        "model_id": "meta-textgeneration-llama-3-2-1b",
+        "display_name": "Llama 3.2 1B",
+        "model_type": "Gated",
+        "default_instance_type": "ml.g5.2xlarge",
+    }]
+    runner = CliRunner()
+    result = runner.invoke(
+        js_model_list, ["--search", "llama", "--instance-type", "ml.g5.2xlarge", "--refresh"]
+    )
+    assert result.exit_code == 0
+    mock_ensure.assert_called_once_with(mock_client.return_value, refresh=True)
+    mock_search.assert_called_once_with(
+        "us-west-2", search="llama", instance_type="ml.g5.2xlarge", limit=None
+    )
+    assert "meta-textgeneration-llama-3-2-1b" in result.output
+    assert "ml.g5.2xlarge" in result.output
+
+    mock_search.return_value = []
+    result = runner.invoke(js_model_list, ["--output", "json"])
+    assert result.exit_code == 0
+    assert result.output == "[]\n"
+
+
 @patch("sagemaker.hyperpod.cli.commands.inference.HPEndpoint")
 def test_custom_list_default_namespace(mock_hp):
     inst = Mock(list=Mock(return_value=[]))
@@ -532,24 +562,45 @@ def test_custom_list_pods(mock_hp, mock_namespace_exists):
 @patch("sagemaker.hyperpod.cli.commands.inference.HPJumpStartEndpoint")
 def test_js_get_logs(mock_hp, mock_namespace_exists):
     mock_namespace_exists.return_value = True
-    inst = Mock(get_logs=Mock(return_value="logs"))
+    inst = Mock(stream_logs=Mock(return_value=iter(["logs"])))
     mock_hp.model_construct.return_value = inst
     runner = CliRunner()
     result = runner.invoke(js_get_logs, ["--pod-name", "p", "--namespace", "ns"])
     assert result.exit_code == 0
     assert "logs" in result.output
+    inst.stream_logs.assert_called_once_with(
+        pod="p",
+        container=None,
+        namespace="ns",
+        follow=False,
+        since_seconds=None,
+        tail_lines=None,
+        limit_bytes=None,
+    )
 
 
 @patch("sagemaker.hyperpod.common.cli_decorators._namespace_exists")
 @patch("sagemaker.hyperpod.cli.commands.inference.HPEndpoint")
 def test_custom_get_logs(mock_hp, mock_namespace_exists):
     mock_namespace_exists.return_value = True
-    inst = Mock(get_logs=Mock(return_value="l"))
+    inst = Mock(stream_logs=Mock(return_value=iter(["l"])))
     mock_hp.model_construct.return_value = inst
     runner = CliRunner()
-    result = runner.invoke(custom_get_logs, ["--pod-name", "p", "--namespace", "ns"])
+    result = runner.invoke(
+        custom_get_logs,
+        ["--pod-name", "p", "--namespace", "ns", "-f", "--since", "5m", "--tail", "20"],
+    )
     assert result.exit_code == 0
     assert "l" in result.output
+    inst.stream_logs.assert_called_once_with(
+        pod="p",
+        container=None,
+        namespace="ns",
+        follow=True,
+        since_seconds=300,
+        tail_lines=20,
+        limit_bytes=None,
+    )
 
 
 @patch("sys.argv", ["pytest", "--version", "1.1"])
@@ -294,6 +294,41 @@ class TestSpaceCommands:
         mock_hp_space_class.get.assert_called_once_with(name='test-space', namespace='test-ns')
         mock_hp_space_instance.start.assert_called_once()
 
+    @patch('sagemaker.hyperpod.cli.commands.space.HPSpace')
+    def test_space_start_wait(self, mock_hp_space_class, mock_namespace_exists):
+        """Test space start with --wait watches the space until it is available"""
+        mock_hp_space_instance = Mock()
+        mock_hp_space_instance.config.name = 'test-space'
+        mock_hp_space_instance.status = {'conditions': [{'type': 'Available', 'status': 'True'}]}
+        mock_hp_space_class.get.return_value = mock_hp_space_instance
+
+        result = self.runner.invoke(space_start, [
+            '--name', 'test-space',
+            '--namespace', 'test-ns',
+            '--wait',
+            '--wait-timeout', '10m',
+        ])
+
+        assert result.exit_code == 0
+        assert "Space 'test-space' is available" in result.output
+        condition = mock_hp_space_instance.wait_until.call_args[0][0]
+        assert condition(mock_hp_space_instance)
+        assert mock_hp_space_instance.wait_until.call_args[1] == {'timeout': 600}
+
+    @patch('sagemaker.hyperpod.cli.commands.space.HPSpace')
+    def test_space_start_wait_degraded(self, mock_hp_space_class, mock_namespace_exists):
+        """Test space start with --wait fails when the space becomes degraded"""
+        mock_hp_space_instance = Mock()
+        mock_hp_space_instance.config.name = 'test-space'
+        mock_hp_space_instance.status = {'conditions': [{'type': 'Degraded', 'status': 'True'}]}
+        mock_hp_space_class.get.return_value = mock_hp_space_instance
+
+        result = self.runner.invoke(space_start, ['--name', 'test-space', '--wait'])
+
+        assert result.exit_code == 1
+        assert "Space 'test-space' is degraded." in result.output
+        assert mock_hp_space_instance.wait_until.call_args[1] == {'timeout': 3600}
+
     @patch('sagemaker.hyperpod.cli.commands.space.HPSpace')
     def test_space_stop_success(self, mock_hp_space_class, mock_namespace_exists):
         """Test successful space stop"""
@@ -314,7 +349,7 @@ class TestSpaceCommands:
     def test_space_get_logs_success(self, mock_hp_space_class, mock_namespace_exists):
         """Test successful space get logs"""
         mock_hp_space_instance = Mock()
-        mock_hp_space_instance.get_logs.return_value = "test logs"
+        mock_hp_space_instance.stream_logs.return_value = iter(["test logs"])
         mock_hp_space_class.get.return_value = mock_hp_space_instance
 
         result = self.runner.invoke(space_get_logs, [
@@ -325,13 +360,58 @@ class TestSpaceCommands:
         assert result.exit_code == 0
         assert "test logs" in result.output
         mock_hp_space_class.get.assert_called_once_with(name='test-space', namespace='test-ns')
-        mock_hp_space_instance.get_logs.assert_called_once_with(pod_name=None, container=None)
+        mock_hp_space_instance.stream_logs.assert_called_once_with(
+            pod_name=None,
+            container=None,
+            follow=False,
+            since_seconds=None,
+            tail_lines=None,
+            limit_bytes=None,
+        )
+
+    @patch('sagemaker.hyperpod.cli.commands.space.HPSpace')
+    def test_space_get_logs_follow_options(self, mock_hp_space_class, mock_namespace_exists):
+        """Test space get logs passes streaming options through"""
+        mock_hp_space_instance = Mock()
+        mock_hp_space_instance.stream_logs.return_value = iter(["line 1", "line 2"])
+        mock_hp_space_class.get.return_value = mock_hp_space_instance
+
+        result = self.runner.invoke(space_get_logs, [
+            '--name', 'test-space',
+            '--follow',
+            '--since', '1h30m',
+            '--tail', '10',
+            '--limit-bytes', '1024'
+        ])
+
+        assert result.exit_code == 0
+        assert "line 1\nline 2" in result.output
+        mock_hp_space_instance.stream_logs.assert_called_once_with(
+            pod_name=None,
+            container=None,
+            follow=True,
+            since_seconds=5400,
+            tail_lines=10,
+            limit_bytes=1024,
+        )
+
+    @patch('sagemaker.hyperpod.cli.commands.space.HPSpace')
+    def test_space_get_logs_invalid_since(self, mock_hp_space_class, mock_namespace_exists):
+        """Test space get logs rejects a malformed --since duration"""
+        result = self.runner.invoke(space_get_logs, [
+            '--name', 'test-space',
+            '--since', 'yesterday'
+        ])
+
+        assert result.exit_code == 2
+        assert "Invalid duration 'yesterday'" in result.output
+        mock_hp_space_class.get.assert_not_called()
 
     @patch('sagemaker.hyperpod.cli.commands.space.HPSpace')
     def test_space_get_logs_no_pods(self, mock_hp_space_class, mock_namespace_exists):
         """Test space get logs with no pods"""
         mock_hp_space_instance = Mock()
-        mock_hp_space_instance.get_logs.return_value = ""
+        mock_hp_space_instance.stream_logs.return_value = iter([])
         mock_hp_space_class.get.return_value = mock_hp_space_instance
 
         result = self.runner.invoke(space_get_logs, [
@@ -340,7 +420,7 @@ class TestSpaceCommands:
         ])
 
         assert result.exit_code == 0
-        # HPSpace.get_logs() handles the "no pods" case internally
+        # HPSpace.stream_logs() handles the "no pods" case internally
 
     def test_missing_required_arguments(self, mock_namespace_exists):
         """Test commands with missing required arguments"""
@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import patch, MagicMock, Mock
 import click
@@ -6,6 +7,7 @@ from sagemaker.hyperpod.cli.commands.training import (
     pytorch_create,
     list_jobs,
     pytorch_describe,
+    pytorch_get_logs,
     pytorch_get_operator_logs,
     pytorch_exec,
     list_accelerator_partition_type,
@@ -303,6 +305,21 @@ class TestTrainingCommands(unittest.TestCase):
         self.assertIn("job1", result.output)
         self.assertIn("job2", result.output)
 
+    @patch("sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob")
+    def test_list_jobs_all_namespaces(self, mock_hyperpod_pytorch_job):
+        """Test the list_jobs function across all namespaces"""
+        mock_job = Mock()
+        mock_job.metadata.name = "job1"
+        mock_job.metadata.namespace = "team-a"
+        mock_job.status.conditions = [Mock(status="True", type="Running")]
+        mock_hyperpod_pytorch_job.list.return_value = [mock_job]
+
+        result = self.runner.invoke(list_jobs, ["--all-namespaces"])
+
+        self.assertEqual(result.exit_code, 0)
+        mock_hyperpod_pytorch_job.list.assert_called_once_with(all_namespaces=True)
+        self.assertIn("team-a", result.output)
+
     @patch("sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob")
     def test_list_jobs_empty(self, mock_hyperpod_pytorch_job):
         """Test the list_jobs function with no jobs"""
@@ -464,6 +481,62 @@ class TestTrainingCommands(unittest.TestCase):
         self.assertIn("command output", result.output)
         mock_job.exec_command.assert_called_once_with(['ls', '-la'], 'test-pod', False, None)
 
+    @patch('sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob.get')
+    def test_pytorch_exec_all_pods_streams_and_summarizes(self, mock_get):
+        """Test pytorch_exec --all-pods streams prefixed output and reports per-pod results"""
+        from sagemaker.hyperpod.common.pod_exec import ExecResult, PodExecResult
+
+        def exec_all_pods(command, container, on_output, max_workers, timeout_seconds):
+            on_output("test-pod-0", "GPU 0: H100")
+            on_output("test-pod-1", "GPU 0: H100")
+            return ExecResult(pods=[
+                PodExecResult("test-pod-0", 0, 1.2),
+                PodExecResult("test-pod-1", 0, 1.5),
+            ])
+
+        mock_job = Mock()
+        mock_job.exec_command_all_pods.side_effect = exec_all_pods
+        mock_get.return_value = mock_job
+
+        result = self.runner.invoke(pytorch_exec, [
+            '--job-name', 'test-job',
+            '--all-pods',
+            '--max-workers', '8',
+            '--timeout', '30',
+            '--', 'nvidia-smi', '-L'
+        ])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("[test-pod-0] GPU 0: H100", result.output)
+        self.assertIn("[test-pod-1] GPU 0: H100", result.output)
+        self.assertIn("1.5s", result.output)
+        _, kwargs = mock_job.exec_command_all_pods.call_args
+        self.assertEqual(kwargs["max_workers"], 8)
+        self.assertEqual(kwargs["timeout_seconds"], 30)
+        mock_job.exec_command.assert_not_called()
+
+    @patch('sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob.get')
+    def test_pytorch_exec_all_pods_reports_failures(self, mock_get):
+        """Test pytorch_exec --all-pods exits non-zero when a pod fails"""
+        from sagemaker.hyperpod.common.pod_exec import ExecResult, PodExecResult
+
+        mock_job = Mock()
+        mock_job.exec_command_all_pods.return_value = ExecResult(pods=[
+            PodExecResult("test-pod-0", 0, 1.0),
+            PodExecResult("test-pod-1", None, 300.0, "Timed out after 300s"),
+        ])
+        mock_get.return_value = mock_job
+
+        result = self.runner.invoke(pytorch_exec, [
+            '--job-name', 'test-job',
+            '--all-pods',
+            '--', 'ls'
+        ])
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Timed out after 300s", result.output)
+        self.assertIn("Command failed on 1 of 2 pods", result.output)
+
     @patch('sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob.get')
     def test_pytorch_exec_error_handling(self, mock_get):
         """Test pytorch_exec error handling"""
@@ -481,6 +554,142 @@ class TestTrainingCommands(unittest.TestCase):
         self.assertIn("Pod not found", result.output)
 
 
+    def test_pytorch_get_logs_requires_pod_name_or_all_pods(self):
+        """Test that pytorch_get_logs requires exactly one of --pod-name or --all-pods"""
+        result = self.runner.invoke(pytorch_get_logs, ['--job-name', 'test-job'])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Must specify exactly one", result.output)
+
+        result = self.runner.invoke(pytorch_get_logs, [
+            '--job-name', 'test-job', '--pod-name', 'test-pod', '--all-pods'
+        ])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Must specify exactly one", result.output)
+
+    @patch('sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob.get')
+    def test_pytorch_get_logs_single_pod(self, mock_get):
+        """Test pytorch_get_logs streams logs from a single pod"""
+        mock_job = Mock()
+        mock_job.stream_logs_from_pod.return_value = iter(["INFO step 1"])
+        mock_get.return_value = mock_job
+
+        result = self.runner.invoke(pytorch_get_logs, [
+            '--job-name', 'test-job',
+            '--pod-name', 'test-pod',
+            '--tail', '50'
+        ])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("INFO step 1", result.output)
+        mock_job.stream_logs_from_pod.assert_called_once_with(
+            pod_name='test-pod',
+            follow=False,
+            since_seconds=None,
+            tail_lines=50,
+            limit_bytes=None,
+        )
+
+    @patch('sagemaker.hyperpod.cli.commands.training.HyperPodPytorchJob.get')
+    def test_pytorch_get_logs_all_pods(self, mock_get):
+        """Test pytorch_get_logs aggregates logs from all pods"""
+        mock_job = Mock()
+        mock_job.get_logs_all_pods.return_value = iter([
+            "[test-job-pod-0] 2024-01-01T00:00:00Z rank 0",
+            "[test-job-pod-1] 2024-01-01T00:00:01Z rank 1",
+        ])
+        mock_get.return_value = mock_job
+
+        result = self.runner.invoke(pytorch_get_logs, [
+            '--job-name', 'test-job',
+            '--all-pods',
+            '--limit-bytes', '4096',
+            '--max-workers', '8'
+        ])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("[test-job-pod-0] 2024-01-01T00:00:00Z rank 0", result.output)
+        self.assertIn("[test-job-pod-1] 2024-01-01T00:00:01Z rank 1", result.output)
+        mock_job.get_logs_all_pods.assert_called_once_with(
+            follow=False,
+            since_seconds=None,
+            tail_lines=None,
+            limit_bytes_per_pod=4096,
+            max_workers=8,
+        )
+        mock_job.stream_logs_from_pod.assert_not_called()
+
+    @patch('sys.argv', ['pytest', '--version', '1.1'])
+    def test_pytorch_create_sweep(self):
+        """Test that --sweep creates one job per variant and writes the manifest"""
+        if 'sagemaker.hyperpod.cli.commands.training' in sys.modules:
+            importlib.reload(sys.modules['sagemaker.hyperpod.cli.commands.training'])
+
+        from sagemaker.hyperpod.cli.commands.training import pytorch_create, HyperPodPytorchJob
+        from sagemaker.hyperpod.common.k8s_bulk import CreateManyResult, ObjectCreateResult
+
+        sweep = (
+            "job:\n"
+            "  job_name: 'lr-sweep-{{ index }}'\n"
+            "  image: test-image\n"
+            "  args: ['--lr={{ lr }}', '--batch-size={{ batch_size }}']\n"
+            "matrix:\n"
+            "  lr: [0.1, 0.01]\n"
+            "  batch_size: [32, 64]\n"
+        )
+        with self.runner.isolated_filesystem(), \
+                patch.object(HyperPodPytorchJob, 'create_many') as mock_create_many:
+            with open('sweep.yaml', 'w') as f:
+                f.write(sweep)
+            mock_create_many.side_effect = lambda jobs, debug: CreateManyResult([
+                ObjectCreateResult(job.metadata.name, "default", 1) for job in jobs
+            ])
+
+            result = self.runner.invoke(
+                pytorch_create,
+                ["--version", "1.1", "--sweep", "sweep.yaml", "--namespace", "default"],
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            jobs = mock_create_many.call_args[0][0]
+            self.assertEqual([job.metadata.name for job in jobs], [f"lr-sweep-{i}" for i in range(4)])
+            self.assertEqual(
+                jobs[3].replicaSpecs[0].template.spec.containers[0].args,
+                ["--lr=0.01", "--batch-size=64"],
+            )
+            self.assertTrue(all(job.metadata.namespace == "default" for job in jobs))
+            self.assertIn("Created 4 of 4 jobs. Manifest written to sweep.manifest.json", result.output)
+            with open('sweep.manifest.json') as f:
+                manifest = json.load(f)
+            self.assertEqual(len(manifest["created"]), 4)
+            self.assertEqual(manifest["failed"], [])
+
+    @patch('sys.argv', ['pytest', '--version', '1.1'])
+    def test_pytorch_create_sweep_validates_every_variant(self):
+        """Test that no job is created when a sweep variant is invalid"""
+        if 'sagemaker.hyperpod.cli.commands.training' in sys.modules:
+            importlib.reload(sys.modules['sagemaker.hyperpod.cli.commands.training'])
+
+        from sagemaker.hyperpod.cli.commands.training import pytorch_create, HyperPodPytorchJob
+
+        sweep = (
+            "job:\n"
+            "  job_name: '{{ name }}'\n"
+            "  image: test-image\n"
+            "matrix:\n"
+            "  name: [valid-name, Invalid_Name]\n"
+        )
+        with self.runner.isolated_filesystem(), \
+                patch.object(HyperPodPytorchJob, 'create_many') as mock_create_many:
+            with open('sweep.yaml', 'w') as f:
+                f.write(sweep)
+
+            result = self.runner.invoke(pytorch_create, ["--version", "1.1", "--sweep", "sweep.yaml"])
+
+            self.assertNotEqual(result.exit_code, 0)
+            self.assertIn("[Invalid_Name] job_name: String should match pattern", result.output)
+            mock_create_many.assert_not_called()
+
+
 @unittest.skipUnless(PYDANTIC_AVAILABLE, "Pydantic model not available")
 class TestValidationPatterns(unittest.TestCase):
     """Test cases for validation patterns added to PyTorchJobConfig"""
@@ -10,8 +10,10 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import base64
 import os
 import unittest
+from urllib.parse import parse_qs, urlparse
 from unittest.mock import (
     MagicMock,
     Mock,
@@ -38,6 +40,10 @@ from kubernetes.config import (
 
 from sagemaker.hyperpod.cli.clients.kubernetes_client import (
     KubernetesClient,
+    clear_api_client_pool,
+    get_api_client,
+    get_eks_api_client,
+    get_eks_token,
 )
 
 KUBECONFIG_DATA = {
@@ -418,6 +424,25 @@ class TestKubernetesClient(unittest.TestCase):
         auth_v1_api = test_client.get_auth_v1_api()
         self.assertIsInstance(auth_v1_api, client.AuthorizationV1Api)
 
+    @patch("sagemaker.hyperpod.cli.clients.kubernetes_client.get_shared_api_client")
+    @patch("kubernetes.config.load_kube_config")
+    def test_get_apis_follow_shared_api_client(
+        self,
+        mock_kube_config: Mock,
+        mock_get_shared_api_client: Mock,
+    ):
+        cluster_a, cluster_b = MagicMock(), MagicMock()
+        mock_get_shared_api_client.return_value = cluster_a
+        test_client = KubernetesClient()
+        self.assertIs(test_client.get_core_v1_api().api_client, cluster_a)
+
+        # A reloaded kubeconfig replaces the shared ApiClient
+        mock_get_shared_api_client.return_value = cluster_b
+        self.assertIs(test_client.get_core_v1_api().api_client, cluster_b)
+        self.assertIs(test_client.get_apps_v1_api().api_client, cluster_b)
+        self.assertIs(test_client.get_auth_v1_api().api_client, cluster_b)
+
+    @patch("kubernetes.config.new_client_from_config")
     @patch("kubernetes.config.load_kube_config")
     @patch(
         "kubernetes.client.CoreV1Api.list_node",
@@ -427,11 +452,23 @@ class TestKubernetesClient(unittest.TestCase):
         self,
         mock_core_client: Mock,
         mock_kube_config: Mock,
+        mock_new_client_from_config: Mock,
     ):
         mock_kube_config.return_value = None
         test_client = KubernetesClient()
+        mock_kube_config.reset_mock()
+        clear_api_client_pool()
         test_client.list_node_with_temp_config("temp-file", "temp-label")
+        # The temp kubeconfig must not replace the process-wide default config
+        mock_kube_config.assert_not_called()
+        mock_new_client_from_config.assert_called_once_with(
+            config_file=os.path.abspath("temp-file"),
+            context=None,
+            persist_config=False,
+        )
+        clear_api_client_pool()
 
+    @patch("kubernetes.config.new_client_from_config")
     @patch("kubernetes.config.load_kube_config")
     @patch(
         "kubernetes.client.CoreV1Api.list_node",
@@ -444,6 +481,7 @@ class TestKubernetesClient(unittest.TestCase):
         self,
         mock_core_client: Mock,
         mock_kube_config: Mock,
+        mock_new_client_from_config: Mock,
     ):
         mock_kube_config.return_value = None
         test_client = KubernetesClient()
@@ -542,6 +580,23 @@ class TestKubernetesClient(unittest.TestCase):
         result = test_client.list_training_jobs("kubeflow", "test:test")
         self.assertEqual(2, len(result.get("items")))
 
+    @patch("kubernetes.client.CustomObjectsApi")
+    def test_has_custom_objects(self, mock_custom_api: Mock):
+        mock_custom_api.return_value.list_namespaced_custom_object.return_value = {
+            "items": [{"metadata": {"name": "job-1"}}]
+        }
+        mock_custom_api.return_value.list_cluster_custom_object.return_value = {"items": []}
+        test_client = KubernetesClient()
+
+        self.assertTrue(test_client.has_custom_objects("g", "v1", "jobs", namespace="kubeflow"))
+        self.assertFalse(test_client.has_custom_objects("g", "v1", "templates"))
+        mock_custom_api.return_value.list_namespaced_custom_object.assert_called_once_with(
+            group="g", version="v1", namespace="kubeflow", plural="jobs", limit=1, _request_timeout=None
+        )
+        mock_custom_api.return_value.list_cluster_custom_object.assert_called_once_with(
+            group="g", version="v1", plural="templates", limit=1, _request_timeout=None
+        )
+
     @patch(
         "kubernetes.client.CoreV1Api",
         return_value=Mock(
@@ -1014,3 +1069,153 @@ class TestKubernetesClient(unittest.TestCase):
             body=patch_body
         )
         self.assertEqual(result, patch_body)
+
+
+class TestApiClientPool(unittest.TestCase):
+    def setUp(self):
+        clear_api_client_pool()
+
+    def tearDown(self):
+        clear_api_client_pool()
+
+    @patch("kubernetes.config.new_client_from_config")
+    def test_get_api_client_reuses_client_per_config_and_context(
+        self, mock_new_client_from_config: Mock
+    ):
+        mock_new_client_from_config.side_effect = lambda **kwargs: MagicMock()
+
+        client1 = get_api_client("config-a")
+        client2 = get_api_client("config-a")
+        client3 = get_api_client("config-b")
+        client4 = get_api_client("config-a", context="other")
+
+        self.assertIs(client1, client2)
+        self.assertIsNot(client1, client3)
+        self.assertIsNot(client1, client4)
+        self.assertEqual(mock_new_client_from_config.call_count, 3)
+
+    @patch("sagemaker.hyperpod.cli.clients.kubernetes_client._kubeconfig_mtime")
+    @patch("kubernetes.config.new_client_from_config")
+    def test_get_api_client_rebuilds_client_when_kubeconfig_changes(
+        self, mock_new_client_from_config: Mock, mock_mtime: Mock
+    ):
+        mock_new_client_from_config.side_effect = lambda **kwargs: MagicMock()
+        mock_mtime.side_effect = [1.0, 2.0]
+
+        client1 = get_api_client("config-a")
+        client2 = get_api_client("config-a")
+
+        self.assertIsNot(client1, client2)
+        client1.close.assert_called_once()
+
+    @patch("kubernetes.config.load_kube_config")
+    @patch("kubernetes.config.new_client_from_config")
+    def test_explicit_config_file_returns_isolated_client(
+        self, mock_new_client_from_config: Mock, mock_load_kube_config: Mock
+    ):
+        api_client_a = MagicMock()
+        api_client_b = MagicMock()
+        mock_new_client_from_config.side_effect = [api_client_a, api_client_b]
+
+        client_a = KubernetesClient(config_file="config-a")
+        client_b = KubernetesClient(config_file="config-b")
+
+        self.assertIsNot(client_a, client_b)
+        self.assertIsNot(client_a, KubernetesClient())
+        self.assertIs(client_a._api_client, api_client_a)
+        self.assertIs(client_b._api_client, api_client_b)
+        mock_load_kube_config.assert_not_called()
+
+    @patch("kubernetes.client.CoreV1Api")
+    @patch("kubernetes.config.new_client_from_config")
+    def test_isolated_client_calls_use_own_api_client(
+        self, mock_new_client_from_config: Mock, mock_core_client: Mock
+    ):
+        api_client = MagicMock()
+        mock_new_client_from_config.return_value = api_client
+        mock_core_client.return_value = Mock(list_namespace=Mock(return_value=namespaces))
+
+        KubernetesClient(config_file="config-a").list_namespaces()
+
+        mock_core_client.assert_called_once_with(api_client)
+
+
+FAKE_AWS_ENV = {
+    "AWS_ACCESS_KEY_ID": "AKIAEXAMPLE",
+    "AWS_SECRET_ACCESS_KEY": "secret",
+    "AWS_DEFAULT_REGION": "us-west-2",
+}
+
+
+class TestEksAuth(unittest.TestCase):
+    def setUp(self):
+        clear_api_client_pool()
+
+    def tearDown(self):
+        clear_api_client_pool()
+
+    @patch.dict(os.environ, FAKE_AWS_ENV)
+    def test_get_eks_token_presigns_caller_identity_for_cluster(self):
+        token = get_eks_token("my-eks", "us-west-2")
+
+        self.assertTrue(token.startswith("k8s-aws-v1."))
+        encoded = token[len("k8s-aws-v1."):]
+        url = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+        query = parse_qs(urlparse(url).query)
+        self.assertEqual(query["Action"], ["GetCallerIdentity"])
+        self.assertIn("x-k8s-aws-id", query["X-Amz-SignedHeaders"][0])
+        self.assertNotIn("x-k8s-aws-id", query)
+
+    @patch.dict(os.environ, FAKE_AWS_ENV)
+    @patch("sagemaker.hyperpod.cli.clients.kubernetes_client.time.monotonic")
+    def test_get_eks_token_cached_until_expiry(self, mock_monotonic):
+        mock_monotonic.return_value = 1000.0
+        token1 = get_eks_token("my-eks", "us-west-2")
+        mock_monotonic.return_value = 1001.0
+        token2 = get_eks_token("my-eks", "us-west-2")
+        self.assertIs(token1, token2)
+
+        mock_monotonic.return_value = 1000.0 + 15 * 60
+        token3 = get_eks_token("my-eks", "us-west-2")
+        self.assertIsNot(token1, token3)
+
+    @patch("sagemaker.hyperpod.cli.clients.kubernetes_client.get_eks_token")
+    @patch("sagemaker.hyperpod.cli.clients.kubernetes_client.create_boto3_client")
+    def test_get_eks_api_client_builds_configuration_in_memory(
+        self, mock_create_boto3_client: Mock, mock_get_eks_token: Mock
+    ):
+        mock_create_boto3_client.return_value.describe_cluster.return_value = {
+            "cluster": {
+                "endpoint": "https://ABC.gr7.us-west-2.eks.amazonaws.com",
+                "certificateAuthority": {
+                    "data": base64.b64encode(b"test-ca").decode()
+                },
+            }
+        }
+        mock_get_eks_token.side_effect = ["token-1", "token-2"]
+
+        api_client = get_eks_api_client("my-eks", "us-west-2")
+
+        self.assertIs(api_client, get_eks_api_client("my-eks", "us-west-2"))
+        mock_create_boto3_client.return_value.describe_cluster.assert_called_once_with(
+            name="my-eks"
+        )
+        configuration = api_client.configuration
+        self.assertEqual(configuration.host, "https://ABC.gr7.us-west-2.eks.amazonaws.com")
+        with open(configuration.ssl_ca_cert, "rb") as ca_file:
+            self.assertEqual(ca_file.read(), b"test-ca")
+        # Each request asks for the current token, which refreshes after expiry
+        self.assertEqual(
+            configuration.get_api_key_with_prefix("authorization"), "Bearer token-2"
+        )
+
+    @patch("sagemaker.hyperpod.cli.clients.kubernetes_client.get_eks_api_client")
+    def test_eks_name_returns_isolated_client(self, mock_get_eks_api_client: Mock):
+        api_client = MagicMock()
+        mock_get_eks_api_client.return_value = api_client
+
+        eks_client = KubernetesClient(eks_name="my-eks", region="us-west-2")
+
+        self.assertIsNot(eks_client, KubernetesClient())
+        self.assertIs(eks_client._api_client, api_client)
+        mock_get_eks_api_client.assert_called_once_with("my-eks", "us-west-2")
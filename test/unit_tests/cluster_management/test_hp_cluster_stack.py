@@ -9,8 +9,8 @@ from sagemaker.hyperpod.cluster_management.hp_cluster_stack import HpClusterStac
 class TestHpClusterStack(unittest.TestCase):
     @patch('uuid.uuid4')
     @patch('boto3.session.Session')
-    @patch('boto3.client')
-    def test_create(self, mock_boto3_client, mock_boto3_session, mock_uuid):
+    def test_create(self, mock_boto3_session, mock_uuid):
+        mock_boto3_client = mock_boto3_session.return_value.client
         # Setup mocks
         mock_uuid.return_value = MagicMock()
         mock_uuid.return_value.__str__ = MagicMock(return_value="12345-67890-abcde")
@@ -75,8 +75,8 @@ class TestHpClusterStack(unittest.TestCase):
         self.assertEqual(result, mock_response)
 
     @patch('boto3.session.Session')
-    @patch('boto3.client')
-    def test_describe_access_denied(self, mock_boto3_client, mock_boto3_session):
+    def test_describe_access_denied(self, mock_boto3_session):
+        mock_boto3_client = mock_boto3_session.return_value.client
         mock_region = "us-west-2"
         mock_boto3_session.return_value.region_name = mock_region
         
@@ -120,8 +120,8 @@ class TestHpClusterStack(unittest.TestCase):
         self.assertEqual(call_kwargs['StackStatusFilter'], ['CREATE_COMPLETE'])
 
     @patch('boto3.session.Session')
-    @patch('boto3.client')
-    def test_list_access_denied(self, mock_boto3_client, mock_boto3_session):
+    def test_list_access_denied(self, mock_boto3_session):
+        mock_boto3_client = mock_boto3_session.return_value.client
         from botocore.exceptions import ClientError
         
         mock_region = "us-west-2"
@@ -1,5 +1,8 @@
 import pytest
-from unittest.mock import patch, MagicMock, Mock
+import statistics
+import threading
+import time
+from unittest.mock import patch, Mock
 import subprocess
 from typing import Tuple
 
@@ -7,6 +10,9 @@ from typing import Tuple
 from sagemaker.hyperpod.common.telemetry.telemetry_logging import (
     get_region_and_account_from_current_context,
     _send_telemetry_request,
+    _deliver_telemetry_request,
+    _flush_telemetry,
+    _get_cached_region_and_account,
     _hyperpod_telemetry_emitter,
     _requests_helper,
     _construct_url,
@@ -29,9 +35,9 @@ MOCK_CONTEXTS = {
 
 
 @pytest.fixture
-def mock_subprocess():
-    with patch("subprocess.run") as mock_run:
-        yield mock_run
+def mock_kube_contexts():
+    with patch("kubernetes.config.list_kube_config_contexts") as mock_contexts:
+        yield mock_contexts
 
 
 @pytest.fixture
@@ -50,60 +56,130 @@ def mock_requests():
     ],
 )
 def test_get_region_and_account_from_current_context(
-    mock_subprocess, context, expected
+    mock_kube_contexts, context, expected
 ):
     # Setup mock
-    mock_subprocess.return_value = MagicMock(returncode=0, stdout=context)
+    mock_kube_contexts.return_value = ([], {"name": context, "context": {}})
 
     # Test
     result = get_region_and_account_from_current_context()
     assert result == expected
 
 
-def test_get_region_and_account_subprocess_failure(mock_subprocess):
-    # Setup mock to simulate failure
-    mock_subprocess.return_value = MagicMock(returncode=1)
+def test_get_region_and_account_does_not_spawn_kubectl(mock_kube_contexts):
+    mock_kube_contexts.return_value = ([], {"name": MOCK_CONTEXTS["eks_arn"], "context": {}})
 
-    # Test
-    result = get_region_and_account_from_current_context()
-    assert result == (DEFAULT_AWS_REGION, "unknown")
+    with patch("subprocess.run") as mock_run:
+        get_region_and_account_from_current_context()
 
+    mock_run.assert_not_called()
 
-def test_get_region_and_account_exception(mock_subprocess):
-    # Setup mock to raise exception
-    mock_subprocess.side_effect = Exception("Command failed")
+
+def test_get_region_and_account_exception(mock_kube_contexts):
+    # Setup mock to raise exception, e.g. no kubeconfig
+    mock_kube_contexts.side_effect = Exception("Invalid kube-config file")
 
     # Test
     result = get_region_and_account_from_current_context()
     assert result == (DEFAULT_AWS_REGION, "unknown")
 
 
+def test_get_cached_region_and_account_resolves_once():
+    _get_cached_region_and_account.cache_clear()
+    with patch(
+        "sagemaker.hyperpod.common.telemetry.telemetry_logging.get_region_and_account_from_current_context",
+        return_value=("us-west-2", "123456789012"),
+    ) as mock_resolve:
+        assert _get_cached_region_and_account() == ("us-west-2", "123456789012")
+        assert _get_cached_region_and_account() == ("us-west-2", "123456789012")
+    assert mock_resolve.call_count == 1
+    _get_cached_region_and_account.cache_clear()
+
+
 @pytest.fixture
 def mock_get_region_account():
     with patch(
-        "sagemaker.hyperpod.common.telemetry.telemetry_logging.get_region_and_account_from_current_context"
+        "sagemaker.hyperpod.common.telemetry.telemetry_logging._get_cached_region_and_account"
     ) as mock:
         mock.return_value = ("us-west-2", "123456789012")
         yield mock
 
 
-def test_send_telemetry_request(mock_get_region_account, mock_requests):
+def test_deliver_telemetry_request(mock_get_region_account, mock_requests):
     # Test successful telemetry request
-    _send_telemetry_request(status=1, feature_list=[1], session=None, extra_info="test")
+    _deliver_telemetry_request(status=1, feature_list=[1], session=None, extra_info="test")
 
     # Verify request was made
     assert mock_requests.called
 
 
-def test_send_telemetry_request_failure(mock_get_region_account, mock_requests):
+def test_deliver_telemetry_request_failure(mock_get_region_account, mock_requests):
     # Setup mock to simulate failure
     mock_requests.side_effect = Exception("Request failed")
 
     # Test
-    _send_telemetry_request(status=1, feature_list=[1], session=None, extra_info="test")
+    _deliver_telemetry_request(status=1, feature_list=[1], session=None, extra_info="test")
     # Should not raise exception
 
 
+def test_send_telemetry_request_delivers_in_background():
+    caller = threading.current_thread()
+    delivered_on = []
+
+    def record_delivery(*args):
+        # Events queued by earlier tests may still be draining
+        if args[5] == "test_background_delivery":
+            delivered_on.append(threading.current_thread())
+
+    with patch(
+        "sagemaker.hyperpod.common.telemetry.telemetry_logging._deliver_telemetry_request",
+        side_effect=record_delivery,
+    ):
+        _send_telemetry_request(1, [6], None, None, None, "test_background_delivery")
+        assert _flush_telemetry(timeout=5)
+
+    assert len(delivered_on) == 1
+    assert delivered_on[0] is not caller
+
+
+def test_flush_telemetry_gives_up_after_timeout():
+    release = threading.Event()
+
+    with patch(
+        "sagemaker.hyperpod.common.telemetry.telemetry_logging._deliver_telemetry_request",
+        side_effect=lambda *args: release.wait(5),
+    ):
+        _send_telemetry_request(1, [6], None, None, None, "test")
+        start = time.perf_counter()
+        assert not _flush_telemetry(timeout=0.1)
+        assert time.perf_counter() - start < 1
+        release.set()
+        assert _flush_telemetry(timeout=5)
+
+
+def test_telemetry_decorator_overhead_is_negligible():
+    """Slow telemetry delivery must not add latency to the decorated call"""
+
+    @_hyperpod_telemetry_emitter(Feature.HYPERPOD_CLI, "test_func")
+    def sample_function(template: str = None):
+        return "success"
+
+    release = threading.Event()
+    with patch(
+        "sagemaker.hyperpod.common.telemetry.telemetry_logging._deliver_telemetry_request",
+        side_effect=lambda *args: release.wait(5),
+    ):
+        durations = []
+        for _ in range(200):
+            start = time.perf_counter()
+            sample_function(template="hyp-pytorch-job")
+            durations.append(time.perf_counter() - start)
+        release.set()
+        assert _flush_telemetry(timeout=5)
+
+    assert statistics.median(durations) < 0.001
+
+
 # Test the decorator
 def test_hyperpod_telemetry_emitter():
     # Create a mock function
@@ -138,12 +214,12 @@ def test_hyperpod_telemetry_emitter_failure():
 
 
 # Test invalid region handling
-def test_send_telemetry_request_invalid_region(mock_get_region_account, mock_requests):
+def test_deliver_telemetry_request_invalid_region(mock_get_region_account, mock_requests):
     # Setup mock to return invalid region
     mock_get_region_account.return_value = ("invalid-region", "123456789012")
 
     # Test
-    _send_telemetry_request(status=1, feature_list=[1], session=None, extra_info="test")
+    _deliver_telemetry_request(status=1, feature_list=[1], session=None, extra_info="test")
 
     # Verify no request was made due to invalid region
     assert not mock_requests.called
@@ -221,7 +297,7 @@ def test_requests_helper_success():
 
         # Verify
         assert response == mock_response
-        mock_get.assert_called_once_with("https://test.com", 2)
+        mock_get.assert_called_once_with("https://test.com", timeout=2)
 
 
 def test_requests_helper_with_invalid_url(caplog):
@@ -0,0 +1,151 @@
+import json
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sagemaker.hyperpod.common.hub_cache import (
+    RecipeIndex,
+    clear_hub_cache,
+    get_hub_cache_dir,
+    get_hub_content_document,
+    get_recipe_index,
+)
+from sagemaker.hyperpod.common.metadata_cache import set_metadata_cache_enabled
+
+RECIPES = [
+    {"Name": "sft-small", "CustomizationTechnique": "SFT", "SupportedInstanceTypes": ["ml.g5.12xlarge"]},
+    {"Name": "dpo", "CustomizationTechnique": "DPO", "SupportedInstanceTypes": ["ml.p4d.24xlarge"]},
+    {"Name": "sft-large", "CustomizationTechnique": "sft", "SupportedInstanceTypes": ["ml.p4d.24xlarge", "ml.g5.12xlarge"]},
+    {"Name": "eval", "EvaluationType": "DeterministicEvaluation", "SupportedInstanceTypes": ["ml.g5.2xlarge"]},
+    {"Name": "other"},
+]
+
+
+def _hub_client(region="us-west-2", access_key="AKIAEXAMPLE", version="1.0.0", document=None):
+    client = MagicMock()
+    client.meta.region_name = region
+    client._get_credentials.return_value.access_key = access_key
+    client.list_hub_content_versions.return_value = {
+        "HubContentSummaries": [{"HubContentVersion": version}]
+    }
+    client.describe_hub_content.return_value = {
+        "HubContentVersion": version,
+        "HubContentDocument": json.dumps(document or {"RecipeCollection": RECIPES}),
+    }
+    return client
+
+
+class TestGetHubContentDocument(unittest.TestCase):
+    def setUp(self):
+        clear_hub_cache()
+        self.addCleanup(clear_hub_cache)
+
+    def test_document_is_read_from_disk_after_first_describe(self):
+        client = _hub_client()
+
+        first = get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+        second = get_hub_content_document(_hub_client(), "SageMakerPublicHub", "Model", "llama")
+
+        self.assertEqual(first, {"RecipeCollection": RECIPES})
+        self.assertEqual(second, first)
+        client.describe_hub_content.assert_called_once_with(
+            HubName="SageMakerPublicHub", HubContentType="Model", HubContentName="llama", HubContentVersion="1.0.0"
+        )
+        client.list_hub_content_versions.assert_called_once()
+        self.assertEqual(len(os.listdir(get_hub_cache_dir())), 1)
+
+    def test_latest_version_is_revalidated_after_ttl(self):
+        client = _hub_client()
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+        self.assertEqual(client.list_hub_content_versions.call_count, 1)
+
+        newer = _hub_client(version="2.0.0", document={"SupportedInferenceInstanceTypes": ["ml.g5.xlarge"]})
+        with patch("sagemaker.hyperpod.common.metadata_cache.time.time", return_value=10 ** 10):
+            document = get_hub_content_document(newer, "SageMakerPublicHub", "Model", "llama")
+
+        self.assertEqual(document, {"SupportedInferenceInstanceTypes": ["ml.g5.xlarge"]})
+        newer.list_hub_content_versions.assert_called_once()
+        newer.describe_hub_content.assert_called_once()
+
+    def test_explicit_version_skips_version_lookup(self):
+        client = _hub_client()
+
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama", "1.0.0")
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama", "1.0.0")
+
+        client.list_hub_content_versions.assert_not_called()
+        client.describe_hub_content.assert_called_once()
+
+    def test_described_version_is_used_when_versions_cannot_be_listed(self):
+        client = _hub_client()
+        client.list_hub_content_versions.side_effect = Exception("AccessDenied")
+
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+
+        client.list_hub_content_versions.assert_called_once()
+        client.describe_hub_content.assert_called_once_with(
+            HubName="SageMakerPublicHub", HubContentType="Model", HubContentName="llama"
+        )
+
+    def test_private_hub_documents_are_keyed_by_access_key(self):
+        get_hub_content_document(_hub_client(), "my-hub", "Model", "llama")
+        other = _hub_client(access_key="AKIAOTHER")
+
+        get_hub_content_document(other, "my-hub", "Model", "llama")
+
+        other.describe_hub_content.assert_called_once()
+
+    def test_disabled_cache_always_describes(self):
+        set_metadata_cache_enabled(False)
+        client = _hub_client()
+
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+        get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+
+        self.assertEqual(client.describe_hub_content.call_count, 2)
+        client.list_hub_content_versions.assert_not_called()
+        self.assertFalse(os.path.exists(get_hub_cache_dir()))
+
+    def test_unreadable_entry_is_fetched_again(self):
+        get_hub_content_document(_hub_client(), "SageMakerPublicHub", "Model", "llama")
+        for name in os.listdir(get_hub_cache_dir()):
+            with open(os.path.join(get_hub_cache_dir(), name), "wb") as f:
+                f.write(b"\x00")
+        client = _hub_client()
+
+        document = get_hub_content_document(client, "SageMakerPublicHub", "Model", "llama")
+
+        self.assertEqual(document, {"RecipeCollection": RECIPES})
+        client.describe_hub_content.assert_called_once()
+
+    def test_recipe_index_is_built_once_per_document(self):
+        first = get_recipe_index(_hub_client(), "SageMakerPublicHub", "Model", "llama")
+        client = _hub_client()
+
+        second = get_recipe_index(client, "SageMakerPublicHub", "Model", "llama")
+
+        self.assertIs(second, first)
+        client.describe_hub_content.assert_not_called()
+
+
+class TestRecipeIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = RecipeIndex(RECIPES)
+
+    def test_recipes_match_technique_in_document_order(self):
+        self.assertEqual([r["Name"] for r in self.index.recipes("SFT")], ["sft-small", "sft-large"])
+        self.assertEqual([r["Name"] for r in self.index.recipes("DeterministicEvaluation")], ["eval"])
+        self.assertEqual(self.index.recipes("PPO"), [])
+
+    def test_recipe_for_instance_type(self):
+        self.assertEqual(self.index.recipe("SFT", "ml.g5.12xlarge")["Name"], "sft-small")
+        self.assertEqual(self.index.recipe("SFT", "ml.p4d.24xlarge")["Name"], "sft-large")
+        self.assertIsNone(self.index.recipe("SFT", "ml.g5.2xlarge"))
+        self.assertEqual(self.index.instance_types("SFT"), {"ml.g5.12xlarge", "ml.p4d.24xlarge"})
+
+    def test_techniques(self):
+        self.assertEqual(
+            self.index.techniques(), {"SFT", "sft", "DPO", "DeterministicEvaluation", "(none)"}
+        )
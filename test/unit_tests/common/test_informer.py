@@ -0,0 +1,265 @@
+import json
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.rest import ApiException
+
+from sagemaker.hyperpod.common import informer as informer_module
+from sagemaker.hyperpod.common.informer import (
+    HyperPodCache,
+    Informer,
+    get_cached_object,
+    list_cached_objects,
+    list_cached_pod_names,
+)
+
+
+def _obj(name, resource_version="1", labels=None, owner_uid=None):
+    metadata = {"name": name, "namespace": "team-a", "resourceVersion": resource_version}
+    if labels:
+        metadata["labels"] = labels
+    if owner_uid:
+        metadata["ownerReferences"] = [{"uid": owner_uid}]
+    return {"metadata": metadata, "spec": {}}
+
+
+def _event(event_type, obj):
+    return {"type": event_type, "raw_object": obj, "object": obj}
+
+
+class FakeList:
+    """Serves LIST pages like the API server with _preload_content=False, recording each request."""
+
+    def __init__(self, *lists):
+        self.lists = list(lists)
+        self.calls = []
+
+    def __call__(self, _preload_content=True, **kwargs):
+        self.calls.append(kwargs)
+        items, resource_version = self.lists[0] if len(self.lists) == 1 else self.lists.pop(0)
+        start = int(kwargs.get("_continue") or 0)
+        end = start + kwargs["limit"]
+        metadata = {"resourceVersion": resource_version}
+        if end < len(items):
+            metadata["continue"] = str(end)
+        return SimpleNamespace(data=json.dumps({"items": items[start:end], "metadata": metadata}).encode())
+
+
+class FakeWatch:
+    """Replays one scripted connection per stream call, then blocks until stopped."""
+
+    def __init__(self, connections):
+        self.connections = list(connections)
+        self.stream_kwargs = []
+        self.stopped = threading.Event()
+
+    def __call__(self):
+        return self
+
+    def stream(self, func, **kwargs):
+        self.stream_kwargs.append(kwargs)
+        if not self.connections:
+            self.stopped.wait(5)
+            return
+        connection = self.connections.pop(0)
+        if isinstance(connection, Exception):
+            raise connection
+        yield from connection
+
+    def stop(self):
+        self.stopped.set()
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+class TestInformer(unittest.TestCase):
+    def _start(self, fake_list, fake_watch, **kwargs):
+        informer = Informer(fake_list, "test/team-a", page_size=2, namespace="team-a", **kwargs)
+        with patch("sagemaker.hyperpod.common.informer.watch.Watch", fake_watch):
+            informer.start()
+            self.addCleanup(informer.stop)
+            _wait_for(lambda: fake_watch.stream_kwargs)
+        return informer
+
+    def test_lists_all_pages_and_indexes_objects(self):
+        fake_list = FakeList(([
+            _obj("a", labels={"app": "x"}),
+            _obj("b", labels={"app": "y", "tier": "web"}, owner_uid="uid-1"),
+            _obj("c", labels={"app": "y"}, owner_uid="uid-1"),
+        ], "10"))
+        fake_watch = FakeWatch([])
+
+        informer = self._start(fake_list, fake_watch)
+
+        self.assertEqual([call.get("_continue") for call in fake_list.calls], [None, "2"])
+        self.assertEqual(informer.get("b")["metadata"]["name"], "b")
+        self.assertIsNone(informer.get("missing"))
+        self.assertEqual([o["metadata"]["name"] for o in informer.list()], ["a", "b", "c"])
+        self.assertEqual([o["metadata"]["name"] for o in informer.list({"app": "y"})], ["b", "c"])
+        self.assertEqual([o["metadata"]["name"] for o in informer.list({"app": "y", "tier": "web"})], ["b"])
+        self.assertEqual([o["metadata"]["name"] for o in informer.list_owned_by("uid-1")], ["b", "c"])
+        self.assertEqual(fake_watch.stream_kwargs[0]["resource_version"], "10")
+        self.assertTrue(fake_watch.stream_kwargs[0]["allow_watch_bookmarks"])
+        self.assertEqual(fake_watch.stream_kwargs[0]["namespace"], "team-a")
+
+    def test_applies_watch_events_to_store_and_indexes(self):
+        fake_list = FakeList(([_obj("a", labels={"app": "x"}), _obj("b", labels={"app": "x"})], "10"))
+        fake_watch = FakeWatch([[
+            _event("ADDED", _obj("c", "11", labels={"app": "x"})),
+            _event("MODIFIED", _obj("a", "12", labels={"app": "z"})),
+            _event("DELETED", _obj("b", "13", labels={"app": "x"})),
+            _event("BOOKMARK", {"metadata": {"resourceVersion": "20"}}),
+        ]])
+
+        informer = self._start(fake_list, fake_watch)
+        _wait_for(lambda: len(fake_watch.stream_kwargs) == 2)
+
+        self.assertEqual(informer.resource_version, "20")
+        self.assertEqual([o["metadata"]["name"] for o in informer.list()], ["a", "c"])
+        self.assertEqual([o["metadata"]["name"] for o in informer.list({"app": "x"})], ["c"])
+        self.assertEqual(informer.get("a")["metadata"]["resourceVersion"], "12")
+        # The closed connection resumes from the bookmark without listing again
+        self.assertEqual(fake_watch.stream_kwargs[1]["resource_version"], "20")
+        self.assertEqual(informer.metrics()["relists"], 1)
+        self.assertEqual(informer.metrics()["reconnects"], 1)
+
+    def test_lists_again_when_resource_version_expires(self):
+        fake_list = FakeList(([_obj("a")], "10"), ([_obj("b")], "50"))
+        fake_watch = FakeWatch([ApiException(status=410, reason="Gone")])
+
+        informer = self._start(fake_list, fake_watch)
+        _wait_for(lambda: len(fake_watch.stream_kwargs) == 2)
+
+        self.assertEqual([o["metadata"]["name"] for o in informer.list()], ["b"])
+        self.assertEqual(fake_watch.stream_kwargs[1]["resource_version"], "50")
+        self.assertEqual(informer.metrics()["relists"], 2)
+
+    def test_transform_is_applied_to_listed_and_watched_objects(self):
+        fake_list = FakeList(([_obj("a")], "10"))
+        fake_watch = FakeWatch([[_event("ADDED", _obj("b", "11"))]])
+
+        informer = self._start(fake_list, fake_watch, transform=lambda obj: {"metadata": obj["metadata"]})
+        _wait_for(lambda: len(fake_watch.stream_kwargs) == 2)
+
+        self.assertEqual(informer.get("a"), {"metadata": _obj("a")["metadata"]})
+        self.assertNotIn("spec", informer.get("b"))
+
+    def test_list_errors_are_raised_from_start(self):
+        fake_list = MagicMock(side_effect=ApiException(status=403, reason="Forbidden"))
+
+        with self.assertRaises(ApiException):
+            Informer(fake_list, "test/team-a", namespace="team-a").start()
+
+
+class TestHyperPodCache(unittest.TestCase):
+    def setUp(self):
+        self.fake_watch = FakeWatch([])
+        self.jobs = FakeList(([
+            _obj("job-1", labels={"team": "a"}),
+            _obj("job-2"),
+        ], "10"))
+        self.custom_api = MagicMock(list_namespaced_custom_object=self.jobs)
+        self.pods = FakeList(([
+            _obj("job-1-pod-0", labels={"HPJob": "job-1"}),
+            _obj("job-2-pod-0", labels={"HPJob": "job-2"}),
+        ], "10"))
+        patches = [
+            patch("sagemaker.hyperpod.common.informer.config.load_kube_config"),
+            patch("sagemaker.hyperpod.common.informer.watch.Watch", self.fake_watch),
+            patch("sagemaker.hyperpod.common.informer.client.CustomObjectsApi", return_value=self.custom_api),
+            patch("sagemaker.hyperpod.common.informer.client.CoreV1Api",
+                  return_value=MagicMock(list_namespaced_pod=self.pods)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _cache(self, **kwargs):
+        cache = HyperPodCache(namespaces=["team-a"], resources=["hyp-pytorch-job", "pods"], **kwargs)
+        self.addCleanup(cache.stop)
+        return cache
+
+    def test_serves_reads_while_running(self):
+        self.assertIsNone(get_cached_object("sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs", "team-a", "job-1"))
+
+        with self._cache() as cache:
+            job = get_cached_object("sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs", "team-a", "job-1")
+            self.assertEqual(job["metadata"]["name"], "job-1")
+            jobs = list_cached_objects("sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs", "team-a")
+            self.assertEqual([j["metadata"]["name"] for j in jobs], ["job-1", "job-2"])
+            self.assertEqual(list_cached_pod_names("team-a", {"HPJob": "job-2"}), ["job-2-pod-0"])
+            # Objects not in the cache, other namespaces and uncached resources go to the API server
+            self.assertIsNone(get_cached_object("sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs", "team-a", "new"))
+            self.assertIsNone(list_cached_objects("sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs", "team-b"))
+            self.assertIsNone(list_cached_objects("workspace.jupyter.org", "v1alpha1", "workspaces", "team-a"))
+
+            metrics = cache.metrics()
+            self.assertEqual(set(metrics), {"hyp-pytorch-job/team-a", "pods/team-a"})
+            self.assertEqual(metrics["hyp-pytorch-job/team-a"]["hits"], 2)
+            self.assertEqual(metrics["hyp-pytorch-job/team-a"]["misses"], 1)
+            self.assertEqual(metrics["pods/team-a"]["objects"], 2)
+            self.assertTrue(metrics["pods/team-a"]["running"])
+            self.assertLess(cache.staleness_seconds, 5)
+
+        self.assertIsNone(list_cached_pod_names("team-a"))
+
+    def test_pods_are_stored_without_spec(self):
+        with self._cache() as cache:
+            pod = cache._informers[("pods", "team-a")].get("job-1-pod-0")
+        self.assertEqual(set(pod), {"metadata"})
+
+    def test_stale_cache_falls_back_to_api_server(self):
+        with self._cache(max_staleness=60):
+            with patch("sagemaker.hyperpod.common.informer.time.monotonic", return_value=time.monotonic() + 120):
+                self.assertIsNone(list_cached_pod_names("team-a"))
+            self.assertEqual(list_cached_pod_names("team-a"), ["job-1-pod-0", "job-2-pod-0"])
+
+    def test_only_one_cache_runs_at_a_time(self):
+        with self._cache():
+            with self.assertRaises(RuntimeError):
+                self._cache().start()
+
+    def test_unknown_resources_are_rejected(self):
+        with self.assertRaises(ValueError):
+            HyperPodCache(resources=["hyp-pytorch-job", "nodes"])
+
+    def test_failed_start_does_not_activate_cache(self):
+        failing = HyperPodCache(namespaces=["team-a"], resources=["hyp-pytorch-job"])
+        with patch.object(informer_module, "Informer") as mock_informer:
+            mock_informer.return_value.start.side_effect = ApiException(status=403, reason="Forbidden")
+            with self.assertRaises(ApiException):
+                failing.start()
+        self.assertIsNone(informer_module._active_cache)
+
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.HyperPodPytorchJob.verify_kube_config")
+    def test_job_reads_use_the_cache(self, mock_verify):
+        from sagemaker.hyperpod.training.hyperpod_pytorch_job import HyperPodPytorchJob
+
+        self.jobs.lists = [([
+            {
+                "metadata": {"name": "job-1", "namespace": "team-a", "resourceVersion": "1"},
+                "spec": {"replicaSpecs": [{"name": "pod"}]},
+                "status": {"conditions": [{"type": "Running", "status": "True"}]},
+            }
+        ], "10")]
+
+        with self._cache():
+            job = HyperPodPytorchJob.get("job-1", namespace="team-a")
+            jobs = HyperPodPytorchJob.list(namespace="team-a")
+            pods = job.list_pods()
+
+        self.assertEqual(job.metadata.name, "job-1")
+        self.assertEqual(job.status.conditions[0].type, "Running")
+        self.assertEqual([j.metadata.name for j in jobs], ["job-1"])
+        self.assertEqual(pods, ["job-1-pod-0"])
+        self.custom_api.get_namespaced_custom_object.assert_not_called()
+        self.assertEqual(len(self.jobs.calls), 1)
@@ -0,0 +1,309 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.k8s_bulk import (
+    CREATE_REQUEST_ANNOTATION,
+    create_custom_objects,
+    list_custom_object_pages,
+    list_custom_object_pages_all_namespaces,
+    wait_for_custom_object,
+)
+from sagemaker.hyperpod.common.rate_limit import AdaptiveRateLimiter
+
+
+class TestCreateCustomObjects(unittest.TestCase):
+    def _body(self, name):
+        return {"metadata": {"name": name, "namespace": "default"}}
+
+    def _create(self, custom_api, names, **kwargs):
+        limiter = MagicMock(wraps=AdaptiveRateLimiter(rate=1000, max_rate=1000))
+        result = create_custom_objects(
+            custom_api, "sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs",
+            [self._body(name) for name in names], limiter=limiter, **kwargs
+        )
+        return result, limiter
+
+    def test_creates_every_object_within_rate_limit(self):
+        custom_api = MagicMock()
+
+        result, limiter = self._create(custom_api, [f"job-{i}" for i in range(10)], max_workers=4)
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual([r.name for r in result.created], [f"job-{i}" for i in range(10)])
+        self.assertEqual(custom_api.create_namespaced_custom_object.call_count, 10)
+        self.assertEqual(limiter.acquire.call_count, 10)
+        body = next(
+            c.kwargs["body"] for c in custom_api.create_namespaced_custom_object.call_args_list
+            if c.kwargs["body"]["metadata"]["name"] == "job-3"
+        )
+        self.assertEqual(body["metadata"]["namespace"], "default")
+        self.assertIn(CREATE_REQUEST_ANNOTATION, body["metadata"]["annotations"])
+
+    def test_retries_throttled_and_server_errors(self):
+        custom_api = MagicMock()
+        custom_api.create_namespaced_custom_object.side_effect = [
+            ApiException(status=429), ApiException(status=503), None,
+        ]
+
+        result, limiter = self._create(custom_api, ["job-0"])
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.objects[0].attempts, 3)
+        self.assertEqual(limiter.on_throttle.call_count, 2)
+        limiter.on_success.assert_called_once()
+
+    def test_conflict_on_retry_counts_as_created(self):
+        custom_api = MagicMock()
+        custom_api.create_namespaced_custom_object.side_effect = [
+            ApiException(status=500), ApiException(status=409),
+        ]
+        # The first attempt created the object before its response was lost
+        custom_api.get_namespaced_custom_object.side_effect = lambda **kwargs: (
+            custom_api.create_namespaced_custom_object.call_args_list[0].kwargs["body"]
+        )
+
+        result, _ = self._create(custom_api, ["job-0"])
+
+        self.assertTrue(result.succeeded)
+        custom_api.get_namespaced_custom_object.assert_called_once_with(
+            group="sagemaker.amazonaws.com", version="v1", namespace="default",
+            plural="hyperpodpytorchjobs", name="job-0",
+        )
+
+    def test_conflict_on_retry_with_existing_object_fails(self):
+        custom_api = MagicMock()
+        custom_api.create_namespaced_custom_object.side_effect = [
+            ApiException(status=500), ApiException(status=409, reason="Conflict"),
+        ]
+        # An object of the same name left over from an earlier run
+        custom_api.get_namespaced_custom_object.return_value = {
+            "metadata": {"name": "job-0", "annotations": {CREATE_REQUEST_ANNOTATION: "earlier-run"}},
+        }
+
+        result, _ = self._create(custom_api, ["job-0"])
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(result.objects[0].error, "409 Conflict")
+
+    def test_does_not_modify_given_bodies(self):
+        custom_api = MagicMock()
+        body = {"metadata": {"name": "job-0", "namespace": "default", "annotations": {"team": "a"}}}
+
+        create_custom_objects(custom_api, "sagemaker.amazonaws.com", "v1", "hyperpodpytorchjobs", [body])
+
+        self.assertEqual(body["metadata"]["annotations"], {"team": "a"})
+        sent = custom_api.create_namespaced_custom_object.call_args.kwargs["body"]
+        self.assertEqual(sent["metadata"]["annotations"]["team"], "a")
+
+    def test_records_failures_without_stopping_others(self):
+        def create(namespace, body, **kwargs):
+            if body["metadata"]["name"] == "job-1":
+                raise ApiException(status=409, reason="Conflict")
+            if body["metadata"]["name"] == "job-2":
+                raise ApiException(status=429, reason="Too Many Requests")
+
+        custom_api = MagicMock()
+        custom_api.create_namespaced_custom_object.side_effect = create
+
+        result, _ = self._create(custom_api, ["job-0", "job-1", "job-2"], retry_attempts=2)
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(result.to_manifest(), {
+            "created": [{"name": "job-0", "namespace": "default"}],
+            "failed": [
+                {"name": "job-1", "namespace": "default", "error": "409 Conflict"},
+                {"name": "job-2", "namespace": "default", "error": "429 Too Many Requests"},
+            ],
+        })
+        self.assertEqual(result.failed[1].attempts, 2)
+
+
+class TestListCustomObjectPages(unittest.TestCase):
+    def _custom_api(self, cluster_pages=None, cluster_error=None, namespace_items=None):
+        custom_api = MagicMock()
+        if cluster_error is not None:
+            custom_api.list_cluster_custom_object.side_effect = cluster_error
+        else:
+            custom_api.list_cluster_custom_object.side_effect = cluster_pages
+
+        def list_namespaced(group, version, namespace, plural, **kwargs):
+            items = namespace_items[namespace]
+            if isinstance(items, Exception):
+                raise items
+            return {"items": items, "metadata": {}}
+
+        custom_api.list_namespaced_custom_object.side_effect = list_namespaced
+        return custom_api
+
+    def test_follows_continue_tokens(self):
+        custom_api = self._custom_api(cluster_pages=[
+            {"items": [{"id": 1}, {"id": 2}], "metadata": {"continue": "token-1"}},
+            {"items": [{"id": 3}], "metadata": {}},
+        ])
+
+        pages = list(list_custom_object_pages(
+            custom_api, "g", "v1", "jobs", label_selector="team=a", page_size=2
+        ))
+
+        self.assertEqual(pages, [[{"id": 1}, {"id": 2}], [{"id": 3}]])
+        calls = custom_api.list_cluster_custom_object.call_args_list
+        self.assertEqual(calls[0], call(group="g", version="v1", plural="jobs", limit=2, label_selector="team=a"))
+        self.assertEqual(calls[1].kwargs["_continue"], "token-1")
+
+    def test_all_namespaces_uses_single_cluster_scoped_list(self):
+        custom_api = self._custom_api(cluster_pages=[{"items": [{"id": 1}], "metadata": {}}])
+        list_namespaces = MagicMock()
+
+        pages = list(list_custom_object_pages_all_namespaces(
+            custom_api, "g", "v1", "jobs", list_namespaces
+        ))
+
+        self.assertEqual(pages, [[{"id": 1}]])
+        list_namespaces.assert_not_called()
+        custom_api.list_namespaced_custom_object.assert_not_called()
+
+    def test_all_namespaces_falls_back_per_namespace_when_forbidden(self):
+        custom_api = self._custom_api(
+            cluster_error=ApiException(status=403, reason="Forbidden"),
+            namespace_items={
+                "team-a": [{"id": "a"}],
+                "team-b": ApiException(status=403, reason="Forbidden"),
+                "team-c": [{"id": "c1"}, {"id": "c2"}],
+            },
+        )
+
+        pages = list(list_custom_object_pages_all_namespaces(
+            custom_api, "g", "v1", "jobs", lambda: ["team-a", "team-b", "team-c"], max_workers=2
+        ))
+
+        self.assertEqual(pages, [[{"id": "a"}], [{"id": "c1"}, {"id": "c2"}]])
+        self.assertEqual(custom_api.list_namespaced_custom_object.call_count, 3)
+
+    def test_all_namespaces_raises_other_errors(self):
+        custom_api = self._custom_api(cluster_error=ApiException(status=500, reason="Internal"))
+
+        with self.assertRaises(ApiException):
+            list(list_custom_object_pages_all_namespaces(custom_api, "g", "v1", "jobs", list))
+
+
+def _job(resource_version, state=None):
+    return {"metadata": {"name": "job", "resourceVersion": resource_version}, "status": {"state": state}}
+
+
+def _event(event_type, obj):
+    return {"type": event_type, "raw_object": obj, "object": obj}
+
+
+class FakeWatch:
+    """Replays one scripted list of events, or an exception, per watch connection."""
+
+    def __init__(self, connections):
+        self.connections = list(connections)
+        self.stream_kwargs = []
+
+    def __call__(self):
+        return self
+
+    def stream(self, func, **kwargs):
+        self.stream_kwargs.append(kwargs)
+        connection = self.connections.pop(0)
+        if isinstance(connection, Exception):
+            raise connection
+        yield from connection
+
+    def stop(self):
+        pass
+
+
+class TestWaitForCustomObject(unittest.TestCase):
+    def _wait(self, custom_api, fake_watch, timeout=None):
+        with patch("sagemaker.hyperpod.common.k8s_bulk.watch.Watch", fake_watch):
+            return wait_for_custom_object(
+                custom_api, "g", "v1", "jobs", "job", "team-a",
+                lambda obj: obj["status"]["state"] == "Ready", timeout=timeout,
+            )
+
+    def test_returns_without_watching_when_already_satisfied(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.return_value = _job("5", "Ready")
+        fake_watch = FakeWatch([])
+
+        result = self._wait(custom_api, fake_watch)
+
+        self.assertEqual(result["metadata"]["resourceVersion"], "5")
+        self.assertEqual(fake_watch.stream_kwargs, [])
+
+    def test_watches_from_read_resource_version_until_condition_holds(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.return_value = _job("5", "Pending")
+        fake_watch = FakeWatch([[
+            _event("MODIFIED", _job("6", "Pending")),
+            _event("BOOKMARK", {"metadata": {"resourceVersion": "7"}}),
+            _event("MODIFIED", _job("8", "Ready")),
+            _event("MODIFIED", _job("9", "Ready")),
+        ]])
+
+        result = self._wait(custom_api, fake_watch)
+
+        self.assertEqual(result["metadata"]["resourceVersion"], "8")
+        custom_api.get_namespaced_custom_object.assert_called_once()
+        kwargs = fake_watch.stream_kwargs[0]
+        self.assertEqual(kwargs["resource_version"], "5")
+        self.assertEqual(kwargs["field_selector"], "metadata.name=job")
+        self.assertTrue(kwargs["allow_watch_bookmarks"])
+
+    def test_resumes_from_last_bookmark_when_connection_closes(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.return_value = _job("5", "Pending")
+        fake_watch = FakeWatch([
+            [_event("BOOKMARK", {"metadata": {"resourceVersion": "12"}})],
+            [_event("MODIFIED", _job("13", "Ready"))],
+        ])
+
+        result = self._wait(custom_api, fake_watch)
+
+        self.assertEqual(result["metadata"]["resourceVersion"], "13")
+        self.assertEqual([k["resource_version"] for k in fake_watch.stream_kwargs], ["5", "12"])
+        custom_api.get_namespaced_custom_object.assert_called_once()
+
+    def test_rereads_object_when_resource_version_expired(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.side_effect = [_job("5", "Pending"), _job("40", "Pending")]
+        fake_watch = FakeWatch([
+            ApiException(status=410, reason="Gone"),
+            [_event("MODIFIED", _job("41", "Ready"))],
+        ])
+
+        result = self._wait(custom_api, fake_watch)
+
+        self.assertEqual(result["metadata"]["resourceVersion"], "41")
+        self.assertEqual([k["resource_version"] for k in fake_watch.stream_kwargs], ["5", "40"])
+
+    def test_raises_when_object_deleted(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.return_value = _job("5", "Pending")
+        fake_watch = FakeWatch([[_event("DELETED", _job("6", "Pending"))]])
+
+        with self.assertRaises(RuntimeError):
+            self._wait(custom_api, fake_watch)
+
+    def test_raises_timeout_and_bounds_each_connection(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.return_value = _job("5", "Pending")
+        fake_watch = FakeWatch([[]])
+
+        with patch("sagemaker.hyperpod.common.k8s_bulk.time.monotonic", side_effect=[0, 0, 31]):
+            with self.assertRaises(TimeoutError):
+                self._wait(custom_api, fake_watch, timeout=30)
+
+        self.assertEqual(fake_watch.stream_kwargs[0]["timeout_seconds"], 30)
+
+    def test_raises_other_api_errors(self):
+        custom_api = MagicMock()
+        custom_api.get_namespaced_custom_object.return_value = _job("5", "Pending")
+        fake_watch = FakeWatch([ApiException(status=403, reason="Forbidden")])
+
+        with self.assertRaises(ApiException):
+            self._wait(custom_api, fake_watch)
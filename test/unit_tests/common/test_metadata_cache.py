@@ -0,0 +1,150 @@
+import datetime
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from sagemaker.hyperpod.common.metadata_cache import (
+    cached_api_call,
+    clear_metadata_cache,
+    get_metadata_cache_path,
+    set_metadata_cache_enabled,
+)
+
+
+def _mock_client(service="sagemaker", region="us-west-2", access_key="AKIAEXAMPLE"):
+    client = MagicMock()
+    client.meta.service_model.service_name = service
+    client.meta.region_name = region
+    client._get_credentials.return_value.access_key = access_key
+    return client
+
+
+class TestCachedApiCall(unittest.TestCase):
+    def test_reuses_response_until_expired(self):
+        client = _mock_client()
+        created = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        client.describe_cluster.return_value = {
+            "ClusterName": "c1",
+            "CreationTime": created,
+            "ResponseMetadata": {"RequestId": "r1"},
+        }
+
+        first = cached_api_call(client, "describe_cluster", ClusterName="c1")
+        second = cached_api_call(client, "describe_cluster", ClusterName="c1")
+
+        client.describe_cluster.assert_called_once_with(ClusterName="c1")
+        self.assertEqual(first, {"ClusterName": "c1", "CreationTime": created})
+        self.assertEqual(second, first)
+        self.assertTrue(os.path.exists(get_metadata_cache_path()))
+
+        with patch("sagemaker.hyperpod.common.metadata_cache.time.time",
+                   return_value=datetime.datetime.now().timestamp() + 301):
+            cached_api_call(client, "describe_cluster", ClusterName="c1")
+        self.assertEqual(client.describe_cluster.call_count, 2)
+
+    def test_entries_are_keyed_by_identity_region_and_params(self):
+        client = _mock_client()
+        client.describe_cluster.return_value = {"ClusterName": "c1"}
+
+        cached_api_call(client, "describe_cluster", ClusterName="c1")
+        cached_api_call(client, "describe_cluster", ClusterName="c2")
+        other_account = _mock_client(access_key="AKIAOTHER")
+        other_account.describe_cluster.return_value = {"ClusterName": "c1"}
+        cached_api_call(other_account, "describe_cluster", ClusterName="c1")
+        other_region = _mock_client(region="us-east-1")
+        other_region.describe_cluster.return_value = {"ClusterName": "c1"}
+        cached_api_call(other_region, "describe_cluster", ClusterName="c1")
+
+        self.assertEqual(client.describe_cluster.call_count, 2)
+        other_account.describe_cluster.assert_called_once()
+        other_region.describe_cluster.assert_called_once()
+
+    def test_bypassed_when_disabled(self):
+        client = _mock_client()
+        client.list_clusters.return_value = {"ClusterSummaries": []}
+
+        set_metadata_cache_enabled(False)
+        cached_api_call(client, "list_clusters")
+        cached_api_call(client, "list_clusters")
+        set_metadata_cache_enabled(True)
+        with patch.dict(os.environ, {"HYPERPOD_NO_CACHE": "1"}):
+            cached_api_call(client, "list_clusters")
+
+        self.assertEqual(client.list_clusters.call_count, 3)
+        self.assertFalse(os.path.exists(get_metadata_cache_path()))
+
+    def test_refresh_replaces_cached_response(self):
+        client = _mock_client()
+        client.list_clusters.side_effect = [
+            {"ClusterSummaries": []},
+            {"ClusterSummaries": [{"ClusterName": "c1"}]},
+        ]
+
+        cached_api_call(client, "list_clusters")
+        refreshed = cached_api_call(client, "list_clusters", refresh=True)
+
+        self.assertEqual(refreshed, {"ClusterSummaries": [{"ClusterName": "c1"}]})
+        self.assertEqual(cached_api_call(client, "list_clusters"), refreshed)
+        self.assertEqual(client.list_clusters.call_count, 2)
+
+    def test_uncached_operations_and_unknown_clients_call_through(self):
+        client = _mock_client()
+        cached_api_call(client, "create_cluster", ClusterName="c1")
+        cached_api_call(client, "create_cluster", ClusterName="c1")
+        self.assertEqual(client.create_cluster.call_count, 2)
+
+        unknown = MagicMock()
+        cached_api_call(unknown, "describe_cluster", ClusterName="c1")
+        cached_api_call(unknown, "describe_cluster", ClusterName="c1")
+        self.assertEqual(unknown.describe_cluster.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        client = _mock_client(service="eks")
+        client.list_addons.side_effect = [
+            ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "ListAddons"),
+            {"addons": ["amazon-sagemaker-hyperpod-observability"]},
+        ]
+
+        with self.assertRaises(ClientError):
+            cached_api_call(client, "list_addons", clusterName="eks")
+        result = cached_api_call(client, "list_addons", clusterName="eks")
+
+        self.assertEqual(result, {"addons": ["amazon-sagemaker-hyperpod-observability"]})
+
+    def test_unusable_cache_directory_falls_back_to_service(self):
+        blocker = os.path.dirname(get_metadata_cache_path())
+        with open(blocker, "w") as f:
+            f.write("not a directory")
+        client = _mock_client()
+        client.describe_cluster.return_value = {"ClusterName": "c1"}
+
+        cached_api_call(client, "describe_cluster", ClusterName="c1")
+        result = cached_api_call(client, "describe_cluster", ClusterName="c1")
+
+        self.assertEqual(result, {"ClusterName": "c1"})
+        self.assertEqual(client.describe_cluster.call_count, 2)
+
+    def test_concurrent_writers_share_the_cache(self):
+        client = _mock_client()
+        client.describe_cluster.side_effect = lambda ClusterName: {"ClusterName": ClusterName}
+        names = [f"cluster-{i}" for i in range(16)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda n: cached_api_call(client, "describe_cluster", ClusterName=n), names))
+        results = [cached_api_call(client, "describe_cluster", ClusterName=n) for n in names]
+
+        self.assertEqual([r["ClusterName"] for r in results], names)
+        self.assertEqual(client.describe_cluster.call_count, len(names))
+
+    def test_clear_metadata_cache(self):
+        client = _mock_client()
+        client.describe_cluster.return_value = {"ClusterName": "c1"}
+
+        cached_api_call(client, "describe_cluster", ClusterName="c1")
+        clear_metadata_cache()
+        cached_api_call(client, "describe_cluster", ClusterName="c1")
+
+        self.assertEqual(client.describe_cluster.call_count, 2)
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.pod_exec import exec_on_pods
+
+
+class TestExecOnPods(unittest.TestCase):
+    """Test exec_on_pods"""
+
+    def _mock_ws(self, frames, returncode=0, open_checks=None):
+        ws = MagicMock()
+        remaining = list(frames)
+        ws.is_open.side_effect = lambda: bool(remaining) if open_checks is None else next(open_checks)
+
+        def peek_channel(channel):
+            return bool(remaining) and remaining[0][0] == channel
+
+        def read_channel(channel):
+            return remaining.pop(0)[1]
+
+        ws.peek_channel.side_effect = peek_channel
+        ws.read_channel.side_effect = read_channel
+        ws.returncode = returncode
+        return ws
+
+    @patch('sagemaker.hyperpod.common.pod_exec.stream.stream')
+    def test_streams_lines_and_reports_exit_codes(self, mock_stream):
+        sessions = {
+            "pod-0": self._mock_ws([(1, "GPU 0\nGP"), (1, "U 1\n")]),
+            "pod-1": self._mock_ws([(2, "disk full")], returncode=1),
+        }
+        mock_stream.side_effect = lambda *args, **kwargs: sessions[kwargs["name"]]
+        output = []
+
+        result = exec_on_pods(
+            MagicMock(), ["pod-0", "pod-1"], "ns", ["nvidia-smi"],
+            container="main", on_output=lambda pod, line: output.append((pod, line)),
+        )
+
+        self.assertCountEqual(output, [
+            ("pod-0", "GPU 0"), ("pod-0", "GPU 1"), ("pod-1", "disk full"),
+        ])
+        self.assertEqual([r.pod for r in result.pods], ["pod-0", "pod-1"])
+        self.assertEqual([r.exit_code for r in result.pods], [0, 1])
+        self.assertFalse(result.succeeded)
+        self.assertEqual([r.pod for r in result.failed], ["pod-1"])
+        self.assertEqual(mock_stream.call_args.kwargs["_preload_content"], False)
+        self.assertEqual(mock_stream.call_args.kwargs["container"], "main")
+        for ws in sessions.values():
+            ws.close.assert_called_once()
+
+    @patch('sagemaker.hyperpod.common.pod_exec.stream.stream')
+    def test_records_api_errors_per_pod(self, mock_stream):
+        def open_session(*args, **kwargs):
+            if kwargs["name"] == "pod-0":
+                raise ApiException(status=400, reason="Bad Request")
+            return self._mock_ws([(1, "ok\n")])
+
+        mock_stream.side_effect = open_session
+
+        result = exec_on_pods(MagicMock(), ["pod-0", "pod-1"], "ns", ["ls"])
+
+        self.assertIsNone(result.pods[0].exit_code)
+        self.assertIsNotNone(result.pods[0].error)
+        self.assertTrue(result.pods[1].succeeded)
+
+    @patch('sagemaker.hyperpod.common.pod_exec.time.monotonic')
+    @patch('sagemaker.hyperpod.common.pod_exec.stream.stream')
+    def test_times_out_slow_pods(self, mock_stream, mock_monotonic):
+        mock_stream.return_value = self._mock_ws([], open_checks=iter([True] * 10))
+        clock = iter([0, 0])
+        mock_monotonic.side_effect = lambda: next(clock, 5)
+
+        result = exec_on_pods(MagicMock(), ["pod-0"], "ns", ["sleep", "60"], timeout_seconds=2)
+
+        self.assertIsNone(result.pods[0].exit_code)
+        self.assertIn("Timed out", result.pods[0].error)
+        mock_stream.return_value.close.assert_called_once()
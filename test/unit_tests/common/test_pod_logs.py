@@ -0,0 +1,158 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.pod_logs import aggregate_pod_logs, stream_pod_logs
+
+
+class TestStreamPodLogs(unittest.TestCase):
+    """Test stream_pod_logs"""
+
+    def _mock_v1(self, chunks):
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.return_value.stream.return_value = iter(chunks)
+        return v1
+
+    def test_yields_lines_across_chunk_boundaries(self):
+        v1 = self._mock_v1([b"first li", b"ne\nsecond\nthi", b"rd"])
+
+        lines = list(stream_pod_logs(v1, "pod", "ns"))
+
+        self.assertEqual(lines, ["first line", "second", "third"])
+        v1.read_namespaced_pod_log.return_value.release_conn.assert_called_once()
+
+    def test_decodes_multibyte_characters_split_across_chunks(self):
+        encoded = "caf\u00e9\n".encode("utf-8")
+        v1 = self._mock_v1([encoded[:4], encoded[4:]])
+
+        self.assertEqual(list(stream_pod_logs(v1, "pod", "ns")), ["caf\u00e9"])
+
+    def test_passes_streaming_options(self):
+        v1 = self._mock_v1([])
+
+        stream_pod_logs(
+            v1, "pod", "ns", container="c", timestamps=True, follow=True,
+            since_seconds=60, tail_lines=10, limit_bytes=1024,
+        )
+
+        v1.read_namespaced_pod_log.assert_called_once_with(
+            name="pod",
+            namespace="ns",
+            timestamps=True,
+            follow=True,
+            _preload_content=False,
+            container="c",
+            since_seconds=60,
+            tail_lines=10,
+            limit_bytes=1024,
+        )
+
+    def test_api_errors_raised_before_iteration(self):
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.side_effect = ApiException(status=404)
+
+        with self.assertRaises(ApiException):
+            stream_pod_logs(v1, "pod", "ns")
+
+
+class TestAggregatePodLogs(unittest.TestCase):
+    """Test aggregate_pod_logs"""
+
+    def _mock_v1(self, logs_by_pod):
+        v1 = MagicMock()
+
+        def read_log(name, **kwargs):
+            response = MagicMock()
+            if isinstance(logs_by_pod[name], Exception):
+                raise logs_by_pod[name]
+            response.stream.return_value = iter([logs_by_pod[name].encode("utf-8")])
+            return response
+
+        v1.read_namespaced_pod_log.side_effect = read_log
+        return v1
+
+    def test_merges_pods_in_timestamp_order(self):
+        v1 = self._mock_v1({
+            "pod-0": "2024-01-01T00:00:00.5Z a\n2024-01-01T00:00:02Z c\n",
+            "pod-1": "2024-01-01T00:00:00.25Z first\n2024-01-01T00:00:01.123Z b\n",
+        })
+
+        lines = list(aggregate_pod_logs(v1, ["pod-0", "pod-1"], "ns"))
+
+        self.assertEqual(lines, [
+            "[pod-1] 2024-01-01T00:00:00.25Z first",
+            "[pod-0] 2024-01-01T00:00:00.5Z a",
+            "[pod-1] 2024-01-01T00:00:01.123Z b",
+            "[pod-0] 2024-01-01T00:00:02Z c",
+        ])
+
+    def test_applies_default_per_pod_byte_cap(self):
+        v1 = self._mock_v1({"pod-0": ""})
+
+        list(aggregate_pod_logs(v1, ["pod-0"], "ns"))
+
+        self.assertEqual(
+            v1.read_namespaced_pod_log.call_args.kwargs["limit_bytes"], 1024 * 1024
+        )
+
+    def test_skips_pods_that_fail(self):
+        v1 = self._mock_v1({
+            "pod-0": ApiException(status=404),
+            "pod-1": "2024-01-01T00:00:00Z ok\n",
+        })
+
+        lines = list(aggregate_pod_logs(v1, ["pod-0", "pod-1"], "ns"))
+
+        self.assertEqual(lines, ["[pod-1] 2024-01-01T00:00:00Z ok"])
+
+    def test_follow_yields_lines_from_every_pod(self):
+        v1 = self._mock_v1({
+            "pod-0": "2024-01-01T00:00:00Z a\n",
+            "pod-1": "2024-01-01T00:00:00Z b\n",
+        })
+
+        lines = list(aggregate_pod_logs(v1, ["pod-0", "pod-1"], "ns", follow=True, queue_size=1))
+
+        self.assertCountEqual(lines, [
+            "[pod-0] 2024-01-01T00:00:00Z a",
+            "[pod-1] 2024-01-01T00:00:00Z b",
+        ])
+        self.assertIsNone(v1.read_namespaced_pod_log.call_args.kwargs.get("limit_bytes"))
+
+    def test_follow_rejects_more_pods_than_workers(self):
+        pods = [f"pod-{i}" for i in range(5)]
+        v1 = self._mock_v1({pod: f"2024-01-01T00:00:00Z {pod}\n" for pod in pods})
+
+        with self.assertRaises(ValueError):
+            aggregate_pod_logs(v1, pods, "ns", follow=True, max_workers=2)
+        v1.read_namespaced_pod_log.assert_not_called()
+
+    def test_merge_reads_at_most_max_workers_pods_at_once(self):
+        pods = [f"pod-{i}" for i in range(6)]
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def stream(pod):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.01)
+            yield f"2024-01-01T00:00:0{pod[-1]}Z {pod}\n".encode("utf-8")
+            with lock:
+                in_flight[0] -= 1
+
+        def read_log(name, **kwargs):
+            response = MagicMock()
+            response.stream.return_value = stream(name)
+            return response
+
+        v1 = MagicMock()
+        v1.read_namespaced_pod_log.side_effect = read_log
+
+        lines = list(aggregate_pod_logs(v1, list(reversed(pods)), "ns", max_workers=2))
+
+        self.assertEqual(lines, [f"[{pod}] 2024-01-01T00:00:0{pod[-1]}Z {pod}" for pod in pods])
+        self.assertEqual(in_flight[1], 2)
@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.rate_limit import AdaptiveRateLimiter, is_throttling_error
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    def test_is_throttling_error(self):
+        throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "DescribeCluster")
+        denied = ClientError({"Error": {"Code": "AccessDeniedException"}}, "DescribeCluster")
+
+        self.assertTrue(is_throttling_error(throttled))
+        self.assertTrue(is_throttling_error(ApiException(status=429)))
+        self.assertFalse(is_throttling_error(denied))
+        self.assertFalse(is_throttling_error(ApiException(status=500)))
+        self.assertFalse(is_throttling_error(RuntimeError("boom")))
+
+    def test_throttle_halves_rate_and_success_recovers(self):
+        limiter = AdaptiveRateLimiter(rate=8, max_rate=10, min_rate=1, increase=1)
+
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 4)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 1)
+
+        for _ in range(20):
+            limiter.on_success()
+        self.assertEqual(limiter.rate, 10)
+
+    @patch('sagemaker.hyperpod.common.rate_limit.time.sleep')
+    @patch('sagemaker.hyperpod.common.rate_limit.time.monotonic')
+    def test_acquire_waits_when_bucket_is_empty(self, mock_monotonic, mock_sleep):
+        clock = [0.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        limiter = AdaptiveRateLimiter(rate=2, burst=1)
+
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(0.5)
@@ -0,0 +1,66 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from jinja2 import Environment, Template, TemplateSyntaxError, UndefinedError
+
+from sagemaker.hyperpod.common import templating
+from sagemaker.hyperpod.common.templating import (
+    compile_template,
+    get_template_environment,
+    render_template,
+    render_templates,
+)
+
+SOURCE = "name: {{ job_name }}\nreplicas: {{ node_count | default(1) }}\n{% if image %}image: {{ image }}{% endif %}"
+
+
+class TestTemplating(unittest.TestCase):
+    def setUp(self):
+        compile_template.cache_clear()
+        self.addCleanup(compile_template.cache_clear)
+
+    def _bytecode_files(self):
+        directory = templating._TemplateBytecodeCache().directory
+        return os.listdir(directory) if os.path.isdir(directory) else []
+
+    def test_renders_like_jinja_template(self):
+        for parameters in ({"job_name": "a", "image": "img"}, {"job_name": "b", "node_count": 4}, {}):
+            self.assertEqual(render_template(SOURCE, parameters), Template(SOURCE).render(**parameters))
+
+    def test_strict_rejects_missing_variables(self):
+        self.assertEqual(render_template("{{ missing }}", {}), "")
+        with self.assertRaises(UndefinedError):
+            render_template("{{ missing }}", {}, strict=True)
+
+    def test_compiles_each_source_once(self):
+        with patch.object(Environment, "compile", autospec=True, side_effect=Environment.compile) as mock_compile:
+            rendered = list(render_templates(SOURCE, ({"job_name": f"job-{i}"} for i in range(3))))
+            render_template(SOURCE, {"job_name": "job-3"})
+
+        self.assertEqual([line.splitlines()[0] for line in rendered], ["name: job-0", "name: job-1", "name: job-2"])
+        self.assertEqual(mock_compile.call_count, 1)
+
+    def test_bytecode_is_reused_by_a_new_process(self):
+        render_template(SOURCE, {"job_name": "a"})
+        self.assertEqual(len(self._bytecode_files()), 1)
+
+        # A new process starts with empty in-memory caches
+        compile_template.cache_clear()
+        with patch.object(Environment, "compile") as mock_compile:
+            self.assertEqual(render_template(SOURCE, {"job_name": "b"}).splitlines()[0], "name: b")
+        mock_compile.assert_not_called()
+
+    def test_bytecode_cache_failures_fall_back_to_compiling(self):
+        with patch("sagemaker.hyperpod.common.templating.os.makedirs", side_effect=PermissionError()):
+            self.assertEqual(render_template(SOURCE, {"job_name": "a"}).splitlines()[0], "name: a")
+        self.assertEqual(self._bytecode_files(), [])
+
+    def test_syntax_errors_are_raised(self):
+        with self.assertRaises(TemplateSyntaxError) as context:
+            render_template("{% if %}", {})
+        self.assertIsNone(context.exception.name)
+
+    def test_environment_is_shared(self):
+        self.assertIs(get_template_environment(), get_template_environment())
+        self.assertIsNot(get_template_environment(), get_template_environment(strict=True))
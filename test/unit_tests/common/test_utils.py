@@ -1,6 +1,7 @@
 import unittest
 import subprocess
 import logging
+import socket
 from unittest.mock import patch, MagicMock, mock_open, call
 from sagemaker.hyperpod.common.utils import (
     handle_exception,
@@ -15,7 +16,17 @@ from sagemaker.hyperpod.common.utils import (
     parse_client_kubernetes_version,
     is_kubernetes_version_compatible,
     _resolve_region,
+    create_boto3_client,
+    clear_boto3_client_cache,
+    display_formatted_log_stream,
+    create_api_client,
+    get_shared_api_client,
+    set_shared_api_client,
 )
+import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from kubernetes import client
 from kubernetes.client.exceptions import ApiException
 from pydantic import ValidationError
 
@@ -390,7 +401,7 @@ class TestUtilityFunctions(unittest.TestCase):
         mock_safe_dump.assert_called_once()
         mock_load_config.assert_called_once()
 
-    @patch("boto3.client")
+    @patch("boto3.session.Session.client")
     @patch("sagemaker.hyperpod.common.utils.is_eks_orchestrator")
     def test_list_clusters(self, mock_is_eks, mock_boto3_client):
         mock_client = MagicMock()
@@ -406,7 +417,7 @@ class TestUtilityFunctions(unittest.TestCase):
 
         self.assertEqual(result["Eks"], ["eks-cluster"])
 
-    @patch("boto3.client")
+    @patch("boto3.session.Session.client")
     @patch("sagemaker.hyperpod.common.utils.get_eks_name_from_arn")
     @patch("sagemaker.hyperpod.common.utils.update_kube_config")
     @patch("sagemaker.hyperpod.common.utils.set_eks_context")
@@ -480,3 +491,144 @@ class TestResolveRegion(unittest.TestCase):
         mock_session.return_value.region_name = None
         mock_context.side_effect = Exception("no context")
         assert _resolve_region() is None
+
+
+class TestCreateBoto3Client(unittest.TestCase):
+    """Test the process-wide boto3 client pool in create_boto3_client"""
+
+    def setUp(self):
+        clear_boto3_client_cache()
+        self.addCleanup(clear_boto3_client_cache)
+        session_patcher = patch('sagemaker.hyperpod.common.utils.boto3.session.Session')
+        self.mock_session = session_patcher.start()
+        self.addCleanup(session_patcher.stop)
+        self.mock_session.side_effect = lambda **kwargs: MagicMock(
+            client=MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+        )
+
+    def test_reuses_client_for_same_service_and_region(self):
+        first = create_boto3_client('sagemaker', region_name='us-west-2')
+        second = create_boto3_client('sagemaker', region_name='us-west-2')
+
+        self.assertIs(first, second)
+        self.mock_session.assert_called_once_with(profile_name=None)
+
+    def test_separate_clients_per_service_region_and_config(self):
+        clients = [
+            create_boto3_client('sagemaker', region_name='us-west-2'),
+            create_boto3_client('sagemaker', region_name='us-east-1'),
+            create_boto3_client('eks', region_name='us-west-2'),
+            create_boto3_client('sagemaker', region_name='us-west-2', config=Config(read_timeout=10)),
+        ]
+
+        self.assertEqual(len({id(c) for c in clients}), 4)
+        # Equivalent configs share a client even though Config objects are distinct
+        self.assertIs(
+            clients[3],
+            create_boto3_client('sagemaker', region_name='us-west-2', config=Config(read_timeout=10)),
+        )
+        # Every client comes from the same session
+        self.mock_session.assert_called_once()
+
+    def test_clear_cache_rebuilds_clients(self):
+        first = create_boto3_client('sts', region_name='us-west-2')
+        clear_boto3_client_cache()
+        second = create_boto3_client('sts', region_name='us-west-2')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.mock_session.call_count, 2)
+
+    def test_separate_sessions_per_profile(self):
+        with patch.dict('os.environ', {'AWS_PROFILE': 'team-a'}):
+            first = create_boto3_client('sagemaker', region_name='us-west-2')
+        with patch.dict('os.environ', {'AWS_PROFILE': 'team-b'}):
+            second = create_boto3_client('sagemaker', region_name='us-west-2')
+        with patch.dict('os.environ', {'AWS_PROFILE': 'team-a'}):
+            third = create_boto3_client('sagemaker', region_name='us-west-2')
+
+        self.assertIsNot(first, second)
+        self.assertIs(first, third)
+        self.mock_session.assert_has_calls([call(profile_name='team-a'), call(profile_name='team-b')])
+
+    def test_leaves_default_session_untouched(self):
+        default_session = boto3.DEFAULT_SESSION
+
+        with patch.dict('os.environ', {'AWS_PROFILE': 'team-a'}):
+            create_boto3_client('sagemaker', region_name='us-west-2')
+        clear_boto3_client_cache()
+
+        self.assertIs(boto3.DEFAULT_SESSION, default_session)
+
+    def test_concurrent_calls_create_single_client(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(
+                lambda _: create_boto3_client('eks', region_name='us-west-2'), range(32)
+            ))
+
+        self.assertEqual(len({id(c) for c in clients}), 1)
+        self.mock_session.assert_called_once()
+
+
+class TestDisplayFormattedLogStream(unittest.TestCase):
+    """Test display_formatted_log_stream"""
+
+    @patch('sagemaker.hyperpod.common.utils.click')
+    def test_display_formatted_log_stream(self, mock_click):
+        display_formatted_log_stream(iter(["INFO ready", "", "ERROR boom"]), title="Pod Logs")
+
+        mock_click.secho.assert_has_calls([
+            call("INFO ready", fg="green"),
+            call("ERROR boom", fg="red"),
+        ])
+        mock_click.echo.assert_any_call("\nPod Logs:")
+        mock_click.echo.assert_any_call("\nEnd of logs")
+
+    @patch('sagemaker.hyperpod.common.utils.click')
+    def test_display_formatted_log_stream_empty(self, mock_click):
+        display_formatted_log_stream(iter([]))
+
+        mock_click.echo.assert_called_once_with("No logs available.")
+
+
+class TestSharedApiClient(unittest.TestCase):
+    def setUp(self):
+        default_configuration = client.Configuration._default
+        self.addCleanup(setattr, client.Configuration, "_default", default_configuration)
+        client.Configuration.set_default(client.Configuration(host="https://cluster-a"))
+
+    def test_reused_across_calls_with_pool_and_keep_alive(self):
+        api_client = get_shared_api_client()
+
+        self.assertIs(get_shared_api_client(), api_client)
+        self.assertEqual(api_client.configuration.host, "https://cluster-a")
+        self.assertEqual(api_client.configuration.connection_pool_maxsize, 32)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), api_client.configuration.socket_options)
+
+    def test_rebuilt_when_another_kube_config_is_loaded(self):
+        api_client = get_shared_api_client()
+
+        client.Configuration.set_default(client.Configuration(host="https://cluster-b"))
+
+        rebuilt = get_shared_api_client()
+        self.assertIsNot(rebuilt, api_client)
+        self.assertEqual(rebuilt.configuration.host, "https://cluster-b")
+
+    def test_injected_client_is_used_until_reset(self):
+        injected = create_api_client(client.Configuration(host="https://cluster-c"), pool_maxsize=64)
+        set_shared_api_client(injected)
+        client.Configuration.set_default(client.Configuration(host="https://cluster-b"))
+
+        self.assertIs(get_shared_api_client(), injected)
+        self.assertEqual(injected.configuration.connection_pool_maxsize, 64)
+
+        set_shared_api_client(None)
+        self.assertEqual(get_shared_api_client().configuration.host, "https://cluster-b")
+
+    def test_create_api_client_copies_configuration(self):
+        configuration = client.Configuration(host="https://cluster-a")
+
+        api_client = create_api_client(configuration, keep_alive=False)
+
+        self.assertIsNot(api_client.configuration, configuration)
+        self.assertIsNone(configuration.socket_options)
+        self.assertIsNone(api_client.configuration.socket_options)
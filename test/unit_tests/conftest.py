@@ -0,0 +1,39 @@
+import pytest
+from unittest.mock import patch
+
+from sagemaker.hyperpod.common.metadata_cache import set_metadata_cache_enabled
+from sagemaker.hyperpod.common.utils import clear_boto3_client_cache, set_shared_api_client
+
+
+@pytest.fixture(autouse=True)
+def reset_boto3_client_cache():
+    """Keep boto3 clients (often mocks) from leaking between tests through the client pool."""
+    clear_boto3_client_cache()
+    yield
+    clear_boto3_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_api_client():
+    """Keep an ApiClient injected by one test from serving Kubernetes calls in another."""
+    yield
+    set_shared_api_client(None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_metadata_cache(tmp_path, monkeypatch):
+    """Keep cached AWS responses out of the user's cache directory and away from other tests."""
+    monkeypatch.setenv("HYPERPOD_CACHE_DIR", str(tmp_path / "hyperpod-cache"))
+    monkeypatch.delenv("HYPERPOD_NO_CACHE", raising=False)
+    set_metadata_cache_enabled(True)
+    yield
+    set_metadata_cache_enabled(True)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def offline_telemetry():
+    """Keep the background telemetry worker from sending events queued by decorated calls under test."""
+    with patch(
+        "sagemaker.hyperpod.common.telemetry.telemetry_logging._deliver_telemetry_request"
+    ):
+        yield
@@ -9,6 +9,7 @@ import click
 from unittest.mock import Mock, patch, MagicMock, PropertyMock
 from kubernetes.client.exceptions import ApiException
 
+from sagemaker.hyperpod.common import cli_decorators
 from sagemaker.hyperpod.common.cli_decorators import (
     handle_cli_exceptions,
     _extract_resource_from_command,
@@ -275,6 +276,104 @@ class TestTemplateAgnostic404Handling:
         mock_sys.exit.assert_called_with(1)
 
 
+class TestResourceExistenceProbe:
+    """Test the in-process check for other resources after a 404."""
+
+    @pytest.fixture(autouse=True)
+    def forget_existing_namespaces(self):
+        cli_decorators._existing_namespaces.clear()
+        yield
+        cli_decorators._existing_namespaces.clear()
+
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_check_resources_exist_lists_one_item(self, mock_k8s_client_class):
+        """Test resources are probed with a single limited LIST of the command's custom resource."""
+        mock_k8s_client = mock_k8s_client_class.return_value
+        mock_k8s_client.has_custom_objects.return_value = True
+
+        assert _check_resources_exist("pytorch-job", "default") is True
+
+        mock_k8s_client.has_custom_objects.assert_called_once_with(
+            group="sagemaker.amazonaws.com",
+            version="v1",
+            plural="hyperpodpytorchjobs",
+            namespace="default",
+            request_timeout=cli_decorators.RESOURCE_EXISTENCE_PROBE_TIMEOUT_SECONDS,
+        )
+        mock_k8s_client.check_if_namespace_exists.assert_not_called()
+
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_check_resources_exist_cluster_scoped_resource(self, mock_k8s_client_class):
+        """Test cluster-scoped resources are probed without a namespace."""
+        mock_k8s_client = mock_k8s_client_class.return_value
+        mock_k8s_client.has_custom_objects.return_value = False
+
+        assert _check_resources_exist("space-template", "team-a") is False
+
+        assert mock_k8s_client.has_custom_objects.call_args.kwargs["namespace"] is None
+        mock_k8s_client.check_if_namespace_exists.assert_not_called()
+
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_check_resources_exist_reuses_namespace_check(self, mock_k8s_client_class):
+        """Test a namespace confirmed by the proactive check is not read again."""
+        mock_k8s_client = mock_k8s_client_class.return_value
+        mock_k8s_client.check_if_namespace_exists.return_value = True
+        mock_k8s_client.has_custom_objects.return_value = False
+
+        assert _namespace_exists("team-a") is True
+        assert _check_resources_exist("jumpstart-endpoint", "team-a") is False
+
+        mock_k8s_client.check_if_namespace_exists.assert_called_once_with("team-a")
+        assert mock_k8s_client.has_custom_objects.call_args.kwargs["plural"] == "jumpstartmodels"
+
+    @patch('sagemaker.hyperpod.common.utils.get_shared_api_client')
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_namespace_check_is_remembered_per_cluster(self, mock_k8s_client_class, mock_get_api_client):
+        """Test a namespace seen on one cluster is checked again after switching cluster context."""
+        mock_k8s_client = mock_k8s_client_class.return_value
+        mock_k8s_client.check_if_namespace_exists.return_value = True
+        mock_get_api_client.return_value.configuration.host = "https://cluster-a"
+
+        assert _namespace_exists("team-a") is True
+        assert _namespace_exists("team-a") is True
+        mock_k8s_client.check_if_namespace_exists.assert_called_once_with("team-a")
+
+        mock_get_api_client.return_value.configuration.host = "https://cluster-b"
+        mock_k8s_client.check_if_namespace_exists.return_value = False
+
+        assert _namespace_exists("team-a") is False
+        assert mock_k8s_client.check_if_namespace_exists.call_count == 2
+
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_check_resources_exist_missing_namespace(self, mock_k8s_client_class):
+        """Test a missing namespace reports no resources without listing them."""
+        mock_k8s_client = mock_k8s_client_class.return_value
+        mock_k8s_client.check_if_namespace_exists.return_value = False
+
+        assert _check_resources_exist("custom-endpoint", "missing") is False
+
+        mock_k8s_client.has_custom_objects.assert_not_called()
+
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_check_resources_exist_unknown(self, mock_k8s_client_class):
+        """Test unknown resource types and API failures are reported as undetermined."""
+        mock_k8s_client = mock_k8s_client_class.return_value
+        mock_k8s_client.has_custom_objects.side_effect = ApiException(status=403, reason="Forbidden")
+
+        assert _check_resources_exist("resource-endpoint", "default") is None
+        assert _check_resources_exist("space", "default") is None
+
+    @patch('subprocess.run')
+    @patch('sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient')
+    def test_check_resources_exist_does_not_spawn_cli(self, mock_k8s_client_class, mock_subprocess):
+        """Test the probe never shells out to another hyp process."""
+        mock_k8s_client_class.return_value.has_custom_objects.return_value = True
+
+        _check_resources_exist("pytorch-job", "default")
+
+        mock_subprocess.assert_not_called()
+
+
 class TestGetLogsOperationDetection:
     """Test get-logs operation detection functionality."""
     
@@ -1,6 +1,11 @@
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 from sagemaker.hyperpod.inference.hp_endpoint import HPEndpoint
+from sagemaker.hyperpod.inference.config.constants import (
+    POD_LIST_PAGE_SIZE,
+    PARTIAL_OBJECT_METADATA_LIST_ACCEPT,
+)
 from sagemaker.hyperpod.inference.config.hp_endpoint_config import (
     CloudWatchTrigger,
     CloudWatchTriggerList,
@@ -52,6 +57,13 @@ from sagemaker.hyperpod.inference.config.constants import *
 from sagemaker.hyperpod.common.config import Metadata
 
 
+def _pod_page(names, continue_token=None):
+    """Raw PartialObjectMetadataList response as returned with _preload_content=False."""
+    metadata = {"continue": continue_token} if continue_token else {}
+    items = [{"metadata": {"name": name}} for name in names]
+    return MagicMock(data=json.dumps({"metadata": metadata, "items": items}).encode())
+
+
 class TestHPEndpoint(unittest.TestCase):
     def setUp(self):
         tls_config = TlsConfig(
@@ -234,21 +246,65 @@ class TestHPEndpoint(unittest.TestCase):
         )
         self.assertEqual(result, self.endpoint)
 
-    @patch.object(HPEndpoint, "get")
+    @patch.object(HPEndpoint, "call_get_api")
     @patch.object(HPEndpoint, "call_list_api")
-    def test_list(self, mock_list_api, mock_get):
+    def test_list(self, mock_list_api, mock_get_api):
         mock_list_api.return_value = {
-            "items": [{"metadata": {"name": "test-endpoint"}}]
+            "items": [
+                {
+                    "spec": self.endpoint.model_dump(exclude_none=True),
+                    "status": {"state": "DeploymentComplete"},
+                    "metadata": {"name": "test-endpoint", "namespace": "default"},
+                },
+                {
+                    "spec": self.endpoint.model_dump(exclude_none=True),
+                    "status": {"state": 1},
+                    "metadata": {"name": "invalid-status", "namespace": "default"},
+                },
+            ]
         }
-        mock_get.return_value = MagicMock()
 
         result = HPEndpoint.list(namespace="default")
 
         mock_list_api.assert_called_once_with(
-            kind=INFERENCE_ENDPOINT_CONFIG_KIND, namespace="default"
+            kind=INFERENCE_ENDPOINT_CONFIG_KIND, namespace="default", page_size=None
+        )
+        # Endpoints are built from the LIST items without a GET per endpoint
+        mock_get_api.assert_not_called()
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], HPEndpoint)
+        self.assertEqual(result[0].metadata.name, "test-endpoint")
+        self.assertEqual(result[0].status.state, "DeploymentComplete")
+        # Same fallback as get when the status does not validate
+        self.assertIsNone(result[1].status)
+
+    @patch.object(HPEndpoint, "call_list_api")
+    def test_list_parallel_validation_preserves_order(self, mock_list_api):
+        mock_list_api.return_value = {
+            "items": [
+                {
+                    "spec": self.endpoint.model_dump(exclude_none=True),
+                    "metadata": {"name": f"endpoint-{i}", "namespace": "default"},
+                }
+                for i in range(20)
+            ]
+        }
+
+        result = HPEndpoint.list(namespace="default", page_size=5, max_workers=4)
+
+        mock_list_api.assert_called_once_with(
+            kind=INFERENCE_ENDPOINT_CONFIG_KIND, namespace="default", page_size=5
         )
-        mock_get.assert_called_once_with("test-endpoint", namespace="default")
-        self.assertIsInstance(result, list)
+        self.assertEqual(
+            [endpoint.metadata.name for endpoint in result],
+            [f"endpoint-{i}" for i in range(20)],
+        )
+
+    @patch.object(HPEndpoint, "call_list_api")
+    def test_list_empty(self, mock_list_api):
+        mock_list_api.return_value = {"items": []}
+
+        self.assertEqual(HPEndpoint.list(namespace="default"), [])
 
     @patch.object(HPEndpoint, "call_get_api")
     def test_get(self, mock_get_api):
@@ -302,60 +358,54 @@ class TestHPEndpoint(unittest.TestCase):
     @patch("kubernetes.client.CoreV1Api")
     @patch.object(HPEndpoint, "verify_kube_config")
     def test_list_pods(self, mock_verify_config, mock_core_api, mock_list_api):
-        mock_pod1 = MagicMock()
-        mock_pod1.metadata.name = "custom-endpoint-pod1"
-        mock_pod1.metadata.labels = {"app": "custom-endpoint"}
-        mock_pod2 = MagicMock()
-        mock_pod2.metadata.name = "custom-endpoint-pod2"
-        mock_pod2.metadata.labels = {"app": "custom-endpoint"}
-        mock_pod3 = MagicMock()
-        mock_pod3.metadata.name = "not-custom-endpoint-pod"
-        mock_pod3.metadata.labels = {"app": "not-custom-endpoint"}
-        mock_core_api.return_value.list_namespaced_pod.return_value.items = [
-            mock_pod1,
-            mock_pod2,
-            mock_pod3,
-        ]
+        mock_list_pods = mock_core_api.return_value.list_namespaced_pod
+        mock_list_pods.return_value = _pod_page(["custom-endpoint-pod1", "custom-endpoint-pod2"])
 
-        mock_list_api.return_value = {
-            "items": [
-                {
-                    "metadata": {"name": "custom-endpoint"}
-                }
-            ]
-        }
+        mock_list_api.return_value = {"items": [{"metadata": {"name": "custom-endpoint"}}]}
 
         result = self.endpoint.list_pods(namespace="default")
 
         self.assertEqual(result, ["custom-endpoint-pod1", "custom-endpoint-pod2"])
-        mock_core_api.return_value.list_namespaced_pod.assert_called_once_with(
-            namespace="default"
+        mock_list_pods.assert_called_once_with(
+            "default",
+            label_selector="app in (custom-endpoint)",
+            limit=POD_LIST_PAGE_SIZE,
+            _continue=None,
+            _preload_content=False,
+            _headers={"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT},
         )
 
     @patch("kubernetes.client.CoreV1Api")
     @patch.object(HPEndpoint, "verify_kube_config")
     def test_list_pods_with_endpoint_name(self, mock_verify_config, mock_core_api):
-        mock_pod1 = MagicMock()
-        mock_pod1.metadata.name = "custom-endpoint1-pod1"
-        mock_pod1.metadata.labels = {"app": "custom-endpoint1"}
-        mock_pod2 = MagicMock()
-        mock_pod2.metadata.name = "custom-endpoint1-pod2"
-        mock_pod2.metadata.labels = {"app": "custom-endpoint1"}
-        mock_pod3 = MagicMock()
-        mock_pod3.metadata.name = "custom-endpoint2-pod2"
-        mock_pod3.metadata.labels = {"app": "custom-endpoint2"}
-        mock_core_api.return_value.list_namespaced_pod.return_value.items = [
-            mock_pod1,
-            mock_pod2,
-            mock_pod3,
+        mock_list_pods = mock_core_api.return_value.list_namespaced_pod
+        mock_list_pods.side_effect = [
+            _pod_page(["custom-endpoint1-pod1"], continue_token="token"),
+            _pod_page(["custom-endpoint1-pod2"]),
         ]
 
-        result = self.endpoint.list_pods(namespace="default", endpoint_name="custom-endpoint1")
+        result = self.endpoint.list_pods(
+            namespace="default", endpoint_name="custom-endpoint1"
+        )
 
         self.assertEqual(result, ["custom-endpoint1-pod1", "custom-endpoint1-pod2"])
-        mock_core_api.return_value.list_namespaced_pod.assert_called_once_with(
-            namespace="default"
-        )
+        self.assertEqual(mock_list_pods.call_count, 2)
+        first_call = mock_list_pods.call_args_list[0].kwargs
+        second_call = mock_list_pods.call_args_list[1].kwargs
+        self.assertEqual(first_call["label_selector"], "app in (custom-endpoint1)")
+        self.assertIsNone(first_call["_continue"])
+        self.assertEqual(second_call["_continue"], "token")
+
+    @patch.object(HPEndpoint, "call_list_api")
+    @patch("kubernetes.client.CoreV1Api")
+    @patch.object(HPEndpoint, "verify_kube_config")
+    def test_list_pods_no_endpoints(self, mock_verify_config, mock_core_api, mock_list_api):
+        mock_list_api.return_value = {"items": []}
+
+        result = self.endpoint.list_pods(namespace="default")
+
+        self.assertEqual(result, [])
+        mock_core_api.return_value.list_namespaced_pod.assert_not_called()
 
 
 class TestServiceAccountName(unittest.TestCase):
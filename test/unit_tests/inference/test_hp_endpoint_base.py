@@ -1,5 +1,13 @@
+import io
+import json
 import unittest
 from unittest.mock import MagicMock, patch
+
+import urllib3
+from kubernetes import client
+from kubernetes.client.exceptions import ApiException
+
+from sagemaker.hyperpod.common.utils import create_api_client
 from sagemaker.hyperpod.inference.hp_endpoint_base import HPEndpointBase
 from sagemaker.hyperpod.inference.config.constants import *
 
@@ -56,6 +64,56 @@ class TestHPEndpointBase(unittest.TestCase):
         mock_custom_api.return_value.list_namespaced_custom_object.assert_called_once()
         self.assertEqual(result, {"items": []})
 
+    @patch("kubernetes.client.CustomObjectsApi")
+    @patch.object(HPEndpointBase, "verify_kube_config")
+    def test_call_list_api_follows_continue_tokens(self, mock_verify_config, mock_custom_api):
+        mock_custom_api.return_value.list_namespaced_custom_object.side_effect = [
+            {"items": [{"id": 1}, {"id": 2}], "metadata": {"continue": "token-1"}},
+            {"items": [{"id": 3}], "metadata": {"continue": "token-2"}},
+            {"items": [{"id": 4}], "metadata": {}},
+        ]
+
+        result = self.base.call_list_api("JumpStartModel", "test-ns", page_size=2)
+
+        self.assertEqual(result["items"], [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
+        self.assertNotIn("continue", result["metadata"])
+        calls = mock_custom_api.return_value.list_namespaced_custom_object.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(calls[0].kwargs["limit"], 2)
+        self.assertNotIn("_continue", calls[0].kwargs)
+        self.assertEqual(calls[1].kwargs["_continue"], "token-1")
+        self.assertEqual(calls[2].kwargs["_continue"], "token-2")
+
+    @patch("kubernetes.client.CustomObjectsApi")
+    @patch.object(HPEndpointBase, "verify_kube_config")
+    def test_call_list_api_restarts_after_expired_continue_token(self, mock_verify_config, mock_custom_api):
+        mock_custom_api.return_value.list_namespaced_custom_object.side_effect = [
+            {"items": [{"id": 1}], "metadata": {"continue": "token-1"}},
+            ApiException(status=410, reason="Gone"),
+            {"items": [{"id": 1}], "metadata": {"continue": "token-2"}},
+            {"items": [{"id": 2}], "metadata": {}},
+        ]
+
+        result = self.base.call_list_api("JumpStartModel", "test-ns", page_size=1)
+
+        self.assertEqual(result["items"], [{"id": 1}, {"id": 2}])
+        calls = mock_custom_api.return_value.list_namespaced_custom_object.call_args_list
+        self.assertNotIn("_continue", calls[2].kwargs)
+        self.assertEqual(calls[3].kwargs["_continue"], "token-2")
+
+    @patch("kubernetes.client.CustomObjectsApi")
+    @patch.object(HPEndpointBase, "verify_kube_config")
+    def test_call_list_api_gives_up_on_repeatedly_expired_continue_token(self, mock_verify_config, mock_custom_api):
+        first_page = {"items": [{"id": 1}], "metadata": {"continue": "token"}}
+        mock_custom_api.return_value.list_namespaced_custom_object.side_effect = (
+            [first_page, ApiException(status=410, reason="Gone")] * (LIST_EXPIRED_RESTARTS + 1)
+        )
+
+        with self.assertRaises(Exception) as context:
+            self.base.call_list_api("JumpStartModel", "test-ns", page_size=1)
+
+        self.assertIn("410", str(context.exception))
+
     @patch("kubernetes.client.CustomObjectsApi")
     @patch.object(HPEndpointBase, "verify_kube_config")
     def test_call_get_api(self, mock_verify_config, mock_custom_api):
@@ -68,6 +126,27 @@ class TestHPEndpointBase(unittest.TestCase):
         mock_custom_api.return_value.get_namespaced_custom_object.assert_called_once()
         self.assertEqual(result, {"name": "test"})
 
+    @patch("sagemaker.hyperpod.inference.hp_endpoint_base.wait_for_custom_object")
+    @patch("kubernetes.client.CustomObjectsApi")
+    @patch.object(HPEndpointBase, "verify_kube_config")
+    def test_call_wait_api(self, mock_verify_config, mock_custom_api, mock_wait):
+        mock_wait.return_value = {"status": {"state": "DeploymentComplete"}}
+        condition = MagicMock()
+
+        result = self.base.call_wait_api("test-name", "JumpStartModel", "test-ns", condition, timeout=30)
+
+        mock_wait.assert_called_once_with(
+            mock_custom_api.return_value,
+            group=INFERENCE_GROUP,
+            version=INFERENCE_API_VERSION,
+            plural=KIND_PLURAL_MAP["JumpStartModel"],
+            name="test-name",
+            namespace="test-ns",
+            condition=condition,
+            timeout=30,
+        )
+        self.assertEqual(result, {"status": {"state": "DeploymentComplete"}})
+
     @patch("kubernetes.client.CustomObjectsApi")
     @patch.object(HPEndpointBase, "verify_kube_config")
     def test_call_delete_api(self, mock_verify_config, mock_custom_api):
@@ -75,6 +154,26 @@ class TestHPEndpointBase(unittest.TestCase):
 
         mock_custom_api.return_value.delete_namespaced_custom_object.assert_called_once()
 
+    @patch("kubernetes.client.CoreV1Api")
+    @patch.object(HPEndpointBase, "verify_kube_config")
+    def test_stream_logs(self, mock_verify_config, mock_core_api):
+        mock_core_api.return_value.read_namespaced_pod.return_value.spec.containers[0].name = "main"
+        mock_response = mock_core_api.return_value.read_namespaced_pod_log.return_value
+        mock_response.stream.return_value = iter([b"line 1\nline 2\n"])
+
+        result = self.base.stream_logs("test-pod", namespace="test-ns", since_seconds=300)
+
+        self.assertEqual(list(result), ["line 1", "line 2"])
+        mock_core_api.return_value.read_namespaced_pod_log.assert_called_once_with(
+            name="test-pod",
+            namespace="test-ns",
+            timestamps=True,
+            follow=False,
+            _preload_content=False,
+            container="main",
+            since_seconds=300,
+        )
+
     @patch("kubernetes.client.CoreV1Api")
     @patch.object(HPEndpointBase, "verify_kube_config")
     def test_get_operator_logs(self, mock_verify_config, mock_core_api):
@@ -129,3 +228,29 @@ class TestHPEndpointBase(unittest.TestCase):
 
         self.assertEqual(result, ["namespace1", "namespace2"])
         mock_core_api.return_value.list_namespace.assert_called_once()
+
+    def test_list_pod_names_through_api_client(self):
+        api_client = create_api_client(client.Configuration(host="https://cluster-a"))
+        body = {
+            "kind": "PartialObjectMetadataList",
+            "metadata": {},
+            "items": [{"metadata": {"name": "pod-1"}}, {"metadata": {"name": "pod-2"}}],
+        }
+        response = urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(body).encode()),
+            status=200,
+            headers={"Content-Type": "application/json"},
+            preload_content=False,
+        )
+
+        with patch.object(api_client.rest_client.pool_manager, "request", return_value=response) as mock_request, \
+                patch("sagemaker.hyperpod.inference.hp_endpoint_base.get_shared_api_client", return_value=api_client):
+            result = HPEndpointBase._list_pod_names("team-a", "app in (ep)")
+
+        self.assertEqual(result, ["pod-1", "pod-2"])
+        method, url = mock_request.call_args.args[:2]
+        self.assertEqual(method, "GET")
+        self.assertTrue(url.startswith("https://cluster-a/api/v1/namespaces/team-a/pods?"))
+        self.assertIn("labelSelector=app%20in%20%28ep%29", url)
+        self.assertIn("limit=", url)
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["Accept"], PARTIAL_OBJECT_METADATA_LIST_ACCEPT)
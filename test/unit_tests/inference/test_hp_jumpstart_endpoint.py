@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 from sagemaker.hyperpod.inference.hp_jumpstart_endpoint import HPJumpStartEndpoint
@@ -20,6 +21,13 @@ from sagemaker.hyperpod.inference.config.hp_jumpstart_endpoint_config import (
 from sagemaker.hyperpod.common.config import Metadata
 
 
+def _pod_page(names, continue_token=None):
+    """Raw PartialObjectMetadataList response as returned with _preload_content=False."""
+    metadata = {"continue": continue_token} if continue_token else {}
+    items = [{"metadata": {"name": name}} for name in names]
+    return MagicMock(data=json.dumps({"metadata": metadata, "items": items}).encode())
+
+
 class TestHPJumpStartEndpoint(unittest.TestCase):
     def setUp(self):
 
@@ -113,21 +121,32 @@ class TestHPJumpStartEndpoint(unittest.TestCase):
         )
         self.assertEqual(result, self.endpoint)
 
-    @patch.object(HPJumpStartEndpoint, "get")
+    @patch.object(HPJumpStartEndpoint, "call_get_api")
     @patch.object(HPJumpStartEndpoint, "call_list_api")
-    def test_list(self, mock_list_api, mock_get):
+    def test_list(self, mock_list_api, mock_get_api):
         mock_list_api.return_value = {
-            "items": [{"metadata": {"name": "test-endpoint"}}]
+            "items": [
+                {
+                    "spec": {
+                        "model": {"modelId": "test-model"},
+                        "server": {"instance_type": "ml.c5.2xlarge"},
+                    },
+                    "status": {"state": "Ready"},
+                    "metadata": {"name": "test-endpoint", "namespace": "test-ns"},
+                }
+            ]
         }
-        mock_get.return_value = MagicMock()
 
         result = HPJumpStartEndpoint.list(namespace="test-ns")
 
         mock_list_api.assert_called_once_with(
-            kind=JUMPSTART_MODEL_KIND, namespace="test-ns"
+            kind=JUMPSTART_MODEL_KIND, namespace="test-ns", page_size=None
         )
-        mock_get.assert_called_once_with("test-endpoint", namespace="test-ns")
-        self.assertIsInstance(result, list)
+        # Endpoints are built from the LIST items without a GET per endpoint
+        mock_get_api.assert_not_called()
+        self.assertEqual(len(result), 1)
+        self.assertIsInstance(result[0], HPJumpStartEndpoint)
+        self.assertEqual(result[0].metadata.name, "test-endpoint")
 
     @patch.object(HPJumpStartEndpoint, "call_get_api")
     def test_get(self, mock_get_api):
@@ -182,46 +201,30 @@ class TestHPJumpStartEndpoint(unittest.TestCase):
     @patch("kubernetes.client.CoreV1Api")
     @patch.object(HPJumpStartEndpoint, "verify_kube_config")
     def test_list_pods(self, mock_verify_config, mock_core_api, mock_list_api):
-        mock_pod1 = MagicMock()
-        mock_pod1.metadata.name = "js-endpoint-pod1"
-        mock_pod1.metadata.labels = {"app": "js-endpoint"}
-        mock_pod2 = MagicMock()
-        mock_pod2.metadata.name = "js-endpoint-pod2"
-        mock_pod2.metadata.labels = {"app": "js-endpoint"}
-        mock_pod3 = MagicMock()
-        mock_pod3.metadata.name = "not-js-endpoint-pod"
-        mock_pod3.metadata.labels = {"app": "not-js-endpoint"}
-        mock_core_api.return_value.list_namespaced_pod.return_value.items = [
-            mock_pod1,
-            mock_pod2,
-            mock_pod3,
-        ]
+        mock_list_pods = mock_core_api.return_value.list_namespaced_pod
+        mock_list_pods.return_value = _pod_page(["js-endpoint-pod1", "js-endpoint-pod2"])
 
         mock_list_api.return_value = {"items": [{"metadata": {"name": "js-endpoint"}}]}
 
         result = self.endpoint.list_pods(namespace="test-ns")
 
         self.assertEqual(result, ["js-endpoint-pod1", "js-endpoint-pod2"])
-        mock_core_api.return_value.list_namespaced_pod.assert_called_once_with(
-            namespace="test-ns"
+        mock_list_pods.assert_called_once_with(
+            "test-ns",
+            label_selector="app in (js-endpoint)",
+            limit=POD_LIST_PAGE_SIZE,
+            _continue=None,
+            _preload_content=False,
+            _headers={"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT},
         )
 
     @patch("kubernetes.client.CoreV1Api")
     @patch.object(HPJumpStartEndpoint, "verify_kube_config")
     def test_list_pods_with_endpoint_name(self, mock_verify_config, mock_core_api):
-        mock_pod1 = MagicMock()
-        mock_pod1.metadata.name = "js-endpoint1-pod1"
-        mock_pod1.metadata.labels = {"app": "js-endpoint1"}
-        mock_pod2 = MagicMock()
-        mock_pod2.metadata.name = "js-endpoint1-pod2"
-        mock_pod2.metadata.labels = {"app": "js-endpoint1"}
-        mock_pod3 = MagicMock()
-        mock_pod3.metadata.name = "js-endpoint2-pod"
-        mock_pod3.metadata.labels = {"app": "js-endpoint2"}
-        mock_core_api.return_value.list_namespaced_pod.return_value.items = [
-            mock_pod1,
-            mock_pod2,
-            mock_pod3,
+        mock_list_pods = mock_core_api.return_value.list_namespaced_pod
+        mock_list_pods.side_effect = [
+            _pod_page(["js-endpoint1-pod1"], continue_token="token"),
+            _pod_page(["js-endpoint1-pod2"]),
         ]
 
         result = self.endpoint.list_pods(
@@ -229,9 +232,23 @@ class TestHPJumpStartEndpoint(unittest.TestCase):
         )
 
         self.assertEqual(result, ["js-endpoint1-pod1", "js-endpoint1-pod2"])
-        mock_core_api.return_value.list_namespaced_pod.assert_called_once_with(
-            namespace="test-ns"
-        )
+        self.assertEqual(mock_list_pods.call_count, 2)
+        first_call = mock_list_pods.call_args_list[0].kwargs
+        second_call = mock_list_pods.call_args_list[1].kwargs
+        self.assertEqual(first_call["label_selector"], "app in (js-endpoint1)")
+        self.assertIsNone(first_call["_continue"])
+        self.assertEqual(second_call["_continue"], "token")
+
+    @patch.object(HPJumpStartEndpoint, "call_list_api")
+    @patch("kubernetes.client.CoreV1Api")
+    @patch.object(HPJumpStartEndpoint, "verify_kube_config")
+    def test_list_pods_no_endpoints(self, mock_verify_config, mock_core_api, mock_list_api):
+        mock_list_api.return_value = {"items": []}
+
+        result = self.endpoint.list_pods(namespace="test-ns")
+
+        self.assertEqual(result, [])
+        mock_core_api.return_value.list_namespaced_pod.assert_not_called()
 
     def test_validate_mig_profile_valid(self):
         """Test validate_mig_profile with valid instance type and MIG profile"""
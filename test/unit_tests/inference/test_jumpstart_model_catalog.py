@@ -0,0 +1,161 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sagemaker.hyperpod.common.hub_cache import clear_hub_cache
+from sagemaker.hyperpod.common.metadata_cache import set_metadata_cache_enabled
+from sagemaker.hyperpod.inference.jumpstart_model_catalog import (
+    ensure_model_catalog,
+    get_model_catalog_synced_at,
+    search_model_catalog,
+    sync_model_catalog,
+)
+
+DOCUMENTS = {
+    "meta-textgeneration-llama-3-2-1b": {
+        "SupportedInferenceInstanceTypes": ["ml.g5.xlarge", "ml.g5.2xlarge"],
+        "DefaultInferenceInstanceType": "ml.g5.2xlarge",
+        "GatedBucket": True,
+    },
+    "huggingface-llm-mistral-7b": {
+        "SupportedInferenceInstanceTypes": ["ml.g5.12xlarge"],
+        "DefaultInferenceInstanceType": "ml.g5.12xlarge",
+    },
+    "cohere-command-r": {"SupportedInferenceInstanceTypes": ["ml.p4d.24xlarge"]},
+}
+
+
+def _summary(model_id, version="1.0.0", description="A text generation model"):
+    keywords = ["@task:text-generation"]
+    if model_id.startswith("cohere"):
+        keywords.append("@model-type:proprietary")
+    return {
+        "HubContentName": model_id,
+        "HubContentVersion": version,
+        "HubContentDisplayName": model_id.replace("-", " ").title(),
+        "HubContentDescription": description,
+        "HubContentSearchKeywords": keywords,
+    }
+
+
+def _hub_client(summaries, documents=DOCUMENTS):
+    client = MagicMock()
+    client.meta.region_name = "us-west-2"
+    pages = [summaries[:2], summaries[2:]]
+    client.list_hub_contents.side_effect = lambda **kwargs: (
+        {"HubContentSummaries": pages[0], "NextToken": "page-2"}
+        if "NextToken" not in kwargs
+        else {"HubContentSummaries": pages[1]}
+    )
+
+    def describe_hub_content(HubContentName, HubContentVersion, **kwargs):
+        return {
+            "HubContentVersion": HubContentVersion,
+            "HubContentDocument": json.dumps(documents[HubContentName]),
+        }
+
+    client.describe_hub_content.side_effect = describe_hub_content
+    return client
+
+
+class TestModelCatalog(unittest.TestCase):
+    def setUp(self):
+        clear_hub_cache()
+        self.addCleanup(clear_hub_cache)
+        self.summaries = [_summary(model_id) for model_id in DOCUMENTS]
+        self.client = _hub_client(self.summaries)
+        sync_model_catalog(self.client)
+
+    def test_sync_indexes_every_page(self):
+        models = search_model_catalog("us-west-2")
+
+        self.assertEqual(
+            [m["model_id"] for m in models],
+            ["cohere-command-r", "huggingface-llm-mistral-7b", "meta-textgeneration-llama-3-2-1b"],
+        )
+        llama = models[2]
+        self.assertEqual(llama["instance_types"], ["ml.g5.2xlarge", "ml.g5.xlarge"])
+        self.assertEqual(llama["default_instance_type"], "ml.g5.2xlarge")
+        self.assertEqual(llama["model_type"], "Gated")
+        self.assertEqual(models[0]["model_type"], "Proprietary")
+        self.assertEqual(models[1]["model_type"], "Open")
+        self.assertEqual(self.client.list_hub_contents.call_count, 2)
+        self.assertEqual(self.client.describe_hub_content.call_count, 3)
+
+    def test_search_by_words_and_instance_type(self):
+        self.assertEqual(
+            [m["model_id"] for m in search_model_catalog("us-west-2", search="llama 3")],
+            ["meta-textgeneration-llama-3-2-1b"],
+        )
+        self.assertEqual(
+            [m["model_id"] for m in search_model_catalog("us-west-2", search="Mistral")],
+            ["huggingface-llm-mistral-7b"],
+        )
+        self.assertEqual(
+            [m["model_id"] for m in search_model_catalog("us-west-2", instance_type="ml.g5.xlarge")],
+            ["meta-textgeneration-llama-3-2-1b"],
+        )
+        self.assertEqual(search_model_catalog("us-west-2", search="mistral", instance_type="ml.g5.xlarge"), [])
+        self.assertEqual(search_model_catalog("us-east-1"), [])
+        self.assertEqual(len(search_model_catalog("us-west-2", search="text generation", limit=2)), 2)
+
+    def test_resync_only_describes_changed_models(self):
+        summaries = [
+            _summary("meta-textgeneration-llama-3-2-1b", version="2.0.0"),
+            _summary("huggingface-llm-mistral-7b", description="Instruction tuned"),
+        ]
+        documents = dict(DOCUMENTS)
+        documents["meta-textgeneration-llama-3-2-1b"] = {"SupportedInferenceInstanceTypes": ["ml.p5.48xlarge"]}
+        client = _hub_client(summaries, documents)
+
+        self.assertEqual(sync_model_catalog(client), 2)
+
+        client.describe_hub_content.assert_called_once()
+        self.assertEqual(
+            [m["model_id"] for m in search_model_catalog("us-west-2", instance_type="ml.p5.48xlarge")],
+            ["meta-textgeneration-llama-3-2-1b"],
+        )
+        self.assertEqual(search_model_catalog("us-west-2", instance_type="ml.g5.xlarge"), [])
+        self.assertEqual(search_model_catalog("us-west-2", search="cohere"), [])
+
+    def test_failed_details_are_fetched_by_next_sync(self):
+        summaries = [_summary("huggingface-llm-mistral-7b", version="2.0.0")]
+        client = _hub_client(summaries)
+        client.describe_hub_content.side_effect = Exception("ThrottlingException")
+        sync_model_catalog(client)
+
+        model = search_model_catalog("us-west-2", search="mistral")[0]
+        self.assertEqual(model["instance_types"], [])
+        self.assertIsNone(model["model_type"])
+
+        sync_model_catalog(_hub_client(summaries))
+        model = search_model_catalog("us-west-2", search="mistral")[0]
+        self.assertEqual(model["instance_types"], ["ml.g5.12xlarge"])
+
+    def test_ensure_syncs_only_when_out_of_date(self):
+        client = _hub_client(self.summaries)
+        ensure_model_catalog(client)
+        client.list_hub_contents.assert_not_called()
+
+        synced_at = get_model_catalog_synced_at("us-west-2")
+        with patch("sagemaker.hyperpod.inference.jumpstart_model_catalog.time.time",
+                   return_value=synced_at + 25 * 60 * 60):
+            ensure_model_catalog(client)
+        self.assertEqual(client.list_hub_contents.call_count, 2)
+        client.describe_hub_content.assert_not_called()
+
+        set_metadata_cache_enabled(False)
+        ensure_model_catalog(client)
+        self.assertEqual(client.list_hub_contents.call_count, 4)
+
+    def test_ensure_uses_local_catalog_when_hub_unreachable(self):
+        client = MagicMock()
+        client.meta.region_name = "us-west-2"
+        client.list_hub_contents.side_effect = Exception("EndpointConnectionError")
+
+        ensure_model_catalog(client, refresh=True)
+
+        self.assertEqual(len(search_model_catalog("us-west-2")), 3)
+        client.meta.region_name = "us-east-1"
+        with self.assertRaises(Exception):
+            ensure_model_catalog(client)
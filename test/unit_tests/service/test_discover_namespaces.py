@@ -14,12 +14,33 @@ import unittest
 from unittest import mock
 from unittest.mock import MagicMock
 from kubernetes.client.rest import ApiException
-from sagemaker.hyperpod.cli.service.discover_namespaces import DiscoverNamespaces
+from kubernetes.client import V1ResourceAttributes
+from sagemaker.hyperpod.cli.service.discover_namespaces import DiscoverNamespaces, _rules_allow
 from concurrent.futures import Future
 from sagemaker.hyperpod.cli.clients.kubernetes_client import (
     KubernetesClient,
 )
 
+LIST_PODS = V1ResourceAttributes(verb="list", group="", resource="pods")
+GET_POD_LOGS = V1ResourceAttributes(verb="get", group="", resource="pods", subresource="log")
+LIST_JOBS = V1ResourceAttributes(
+    verb="list", group="sagemaker.amazonaws.com", resource="hyperpodpytorchjobs"
+)
+
+
+def _rule(verbs, api_groups, resources, resource_names=None):
+    return MagicMock(
+        verbs=verbs, api_groups=api_groups, resources=resources, resource_names=resource_names
+    )
+
+
+def _rules_review_response(rules, incomplete=False):
+    response = MagicMock()
+    response.status.incomplete = incomplete
+    response.status.resource_rules = rules
+    return response
+
+
 class TestDiscoverNamespaces(unittest.TestCase):
 
     def setUp(self):
@@ -158,11 +179,16 @@ class TestDiscoverNamespaces(unittest.TestCase):
         # Assert sys.exit is called with status code 1
         mock_exit.assert_called_once_with(1)
 
+    @mock.patch("sagemaker.hyperpod.cli.service.self_subject_rules_review.SelfSubjectRulesReview.self_subject_rules_review")
     @mock.patch("sagemaker.hyperpod.cli.service.self_subject_access_review.SelfSubjectAccessReview.self_subject_access_review")
     def test_get_namespaces_by_checking_access_permission(
         self, 
         mock_self_subject_access_review,
+        mock_self_subject_rules_review,
     ):
+        # Rules that cannot be evaluated completely fall back to an access review
+        mock_self_subject_rules_review.return_value = _rules_review_response([], incomplete=True)
+
         # Mock the SelfSubjectAccessReview response
         mock_future = Future()
         mock_response = MagicMock()
@@ -190,5 +216,102 @@ class TestDiscoverNamespaces(unittest.TestCase):
         self.assertEqual(namespaces, ["namespace1"])
 
 
+    @mock.patch("sagemaker.hyperpod.cli.service.discover_namespaces._kube_identity")
+    @mock.patch("sagemaker.hyperpod.cli.service.self_subject_rules_review.SelfSubjectRulesReview.self_subject_rules_review")
+    @mock.patch("sagemaker.hyperpod.cli.service.self_subject_access_review.SelfSubjectAccessReview.self_subject_access_review")
+    def test_rules_review_answers_every_resource_from_one_pass(
+        self,
+        mock_self_subject_access_review,
+        mock_self_subject_rules_review,
+        mock_kube_identity,
+    ):
+        mock_kube_identity.return_value = ["context", "cluster", "user", None]
+        team_rules = [
+            _rule(["get", "list", "watch"], [""], ["pods", "pods/log"]),
+            _rule(["*"], ["sagemaker.amazonaws.com"], ["hyperpodpytorchjobs"]),
+        ]
+        mock_self_subject_rules_review.side_effect = lambda namespace: _rules_review_response(
+            team_rules if namespace == "team-a" else [_rule(["list"], [""], ["pods"])]
+        )
+        discover_ns = DiscoverNamespaces()
+
+        list_pods = discover_ns.get_namespaces_by_checking_access_permission(["team-a", "team-b"], LIST_PODS)
+        get_logs = discover_ns.get_namespaces_by_checking_access_permission(["team-a", "team-b"], GET_POD_LOGS)
+        list_jobs = discover_ns.get_namespaces_by_checking_access_permission(["team-a", "team-b"], LIST_JOBS)
+
+        self.assertEqual(list_pods, ["team-a", "team-b"])
+        self.assertEqual(get_logs, ["team-a"])
+        self.assertEqual(list_jobs, ["team-a"])
+        # One rules review per namespace, reused from the cache for the later checks
+        self.assertEqual(mock_self_subject_rules_review.call_count, 2)
+        mock_self_subject_access_review.assert_not_called()
+
+    @mock.patch("sagemaker.hyperpod.cli.service.self_subject_rules_review.SelfSubjectRulesReview.self_subject_rules_review")
+    @mock.patch("sagemaker.hyperpod.cli.service.self_subject_access_review.SelfSubjectAccessReview.self_subject_access_review")
+    def test_failed_rules_review_falls_back_to_access_review(
+        self,
+        mock_self_subject_access_review,
+        mock_self_subject_rules_review,
+    ):
+        mock_self_subject_rules_review.side_effect = ApiException(status=500)
+        mock_response = MagicMock()
+        mock_response.status.allowed = True
+        mock_response.spec.resource_attributes.namespace = "team-a"
+        mock_self_subject_access_review.return_value = mock_response
+
+        namespaces = DiscoverNamespaces().get_namespaces_by_checking_access_permission(
+            ["team-a"], LIST_PODS, max_workers=1
+        )
+
+        self.assertEqual(namespaces, ["team-a"])
+        mock_self_subject_access_review.assert_called_once()
+
+    @mock.patch("sagemaker.hyperpod.cli.service.discover_namespaces._kube_identity")
+    @mock.patch("sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient.__new__")
+    @mock.patch("sagemaker.hyperpod.cli.service.get_namespaces.GetNamespaces.get_sagemaker_managed_namespaces")
+    @mock.patch("sagemaker.hyperpod.cli.service.discover_namespaces.DiscoverNamespaces.get_namespaces_by_checking_access_permission")
+    def test_discover_accessible_namespace_is_cached_per_identity(
+        self,
+        mock_get_namespaces_by_checking_access_permission,
+        mock_get_sagemaker_managed_namespaces,
+        mock_kubernetes_client,
+        mock_kube_identity,
+    ):
+        mock_kubernetes_client.return_value = self.mock_k8s_client
+        self.mock_k8s_client.get_current_context_namespace.return_value = None
+        mock_kube_identity.return_value = ["context", "cluster", "user", None]
+        mock_get_sagemaker_managed_namespaces.return_value = ["namespace1", "namespace2"]
+        mock_get_namespaces_by_checking_access_permission.return_value = ["namespace1"]
+        discover_ns = DiscoverNamespaces()
+
+        self.assertEqual(discover_ns.discover_accessible_namespace(LIST_PODS), "namespace1")
+        self.assertEqual(discover_ns.discover_accessible_namespace(LIST_PODS), "namespace1")
+        mock_get_namespaces_by_checking_access_permission.assert_called_once()
+
+        discover_ns.discover_accessible_namespace(GET_POD_LOGS)
+        mock_kube_identity.return_value = ["other-context", "other-cluster", "user", None]
+        discover_ns.discover_accessible_namespace(LIST_PODS)
+        self.assertEqual(mock_get_namespaces_by_checking_access_permission.call_count, 3)
+
+    def test_rules_allow_matches_like_rbac(self):
+        def allows(rule, attributes):
+            return _rules_allow({"incomplete": False, "resource_rules": [rule]}, attributes)
+
+        def rule(verbs, api_groups, resources, resource_names=None):
+            return {
+                "verbs": verbs,
+                "api_groups": api_groups,
+                "resources": resources,
+                "resource_names": resource_names or [],
+            }
+
+        self.assertTrue(allows(rule(["*"], ["*"], ["*"]), GET_POD_LOGS))
+        self.assertTrue(allows(rule(["get"], [""], ["*/log"]), GET_POD_LOGS))
+        self.assertFalse(allows(rule(["get"], [""], ["pods"]), GET_POD_LOGS))
+        self.assertFalse(allows(rule(["list"], ["apps"], ["pods"]), LIST_PODS))
+        self.assertFalse(allows(rule(["get"], [""], ["pods"]), LIST_PODS))
+        self.assertFalse(allows(rule(["list"], [""], ["pods"], ["pod-1"]), LIST_PODS))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -220,11 +220,17 @@ class ListTrainingJobsTest(unittest.TestCase):
         mock_kubernetes_client: mock.Mock,
     ):
         mock_kubernetes_client.return_value = self.mock_k8s_client
-        self.mock_k8s_client.list_namespaces.return_value = ["namespace"]
-        self.mock_k8s_client.list_training_jobs.return_value = SAMPLE_OUTPUT
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.return_value = iter(
+            [SAMPLE_OUTPUT["items"]]
+        )
         result = self.mock_list_training_jobs.list_training_jobs(None, True, None, None)
         self.assertIn("test-name", result)
         self.assertIn("test-name1", result)
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.assert_called_once_with(
+            label_selector=None,
+        )
+        self.mock_k8s_client.list_namespaces.assert_not_called()
+        self.mock_k8s_client.list_training_jobs.assert_not_called()
 
     @mock.patch("sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient.__new__")
     def test_list_training_jobs_all_namespace_api_exception(
@@ -232,21 +238,33 @@ class ListTrainingJobsTest(unittest.TestCase):
         mock_kubernetes_client: mock.Mock,
     ):
         mock_kubernetes_client.return_value = self.mock_k8s_client
-        self.mock_k8s_client.list_namespaces.return_value = ["namespace"]
-        self.mock_k8s_client.list_training_jobs.side_effect = ApiException(
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.side_effect = ApiException(
             status="Failed", reason="unexpected"
         )
         with self.assertRaises(RuntimeError):
             self.mock_list_training_jobs.list_training_jobs(None, True, None, None)
 
+    @mock.patch("sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient.__new__")
+    def test_list_training_jobs_all_namespace_api_exception_on_later_page(
+        self,
+        mock_kubernetes_client: mock.Mock,
+    ):
+        def pages():
+            yield SAMPLE_OUTPUT["items"]
+            raise ApiException(status=500, reason="unexpected")
+
+        mock_kubernetes_client.return_value = self.mock_k8s_client
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.return_value = pages()
+        with self.assertRaises(RuntimeError):
+            self.mock_list_training_jobs.list_training_jobs(None, True, None, None)
+
     @mock.patch("sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient.__new__")
     def test_list_training_jobs_all_namespace_no_jobs(
         self,
         mock_kubernetes_client: mock.Mock,
     ):
         mock_kubernetes_client.return_value = self.mock_k8s_client
-        self.mock_k8s_client.list_namespaces.return_value = ["namespace"]
-        self.mock_k8s_client.list_training_jobs.return_value = {"items": []}
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.return_value = iter([[]])
         result = self.mock_list_training_jobs.list_training_jobs(None, True, None, None)
         self.assertNotIn("test-name", result)
         self.assertNotIn("test-name1", result)
@@ -257,8 +275,9 @@ class ListTrainingJobsTest(unittest.TestCase):
         mock_kubernetes_client: mock.Mock,
     ):
         mock_kubernetes_client.return_value = self.mock_k8s_client
-        self.mock_k8s_client.list_namespaces.return_value = ["namespace"]
-        self.mock_k8s_client.list_training_jobs.return_value = INVALID_OUTPUT
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.return_value = iter(
+            [INVALID_OUTPUT["items"]]
+        )
         result = self.mock_list_training_jobs.list_training_jobs(None, True, None, None)
         self.assertNotIn("name", result)
 
@@ -268,8 +287,9 @@ class ListTrainingJobsTest(unittest.TestCase):
         mock_kubernetes_client: mock.Mock,
     ):
         mock_kubernetes_client.return_value = self.mock_k8s_client
-        self.mock_k8s_client.list_namespaces.return_value = ["namespace"]
-        self.mock_k8s_client.list_training_jobs.return_value = OUTPUT_WITHOUT_STATUS
+        self.mock_k8s_client.list_training_job_pages_for_all_namespaces.return_value = iter(
+            [OUTPUT_WITHOUT_STATUS["items"]]
+        )
         result = self.mock_list_training_jobs.list_training_jobs(None, True, None, None)
         self.assertNotIn("State: null", result)
 
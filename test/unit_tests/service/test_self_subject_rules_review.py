@@ -0,0 +1,40 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+from kubernetes.client import V1SelfSubjectRulesReview
+from kubernetes.client import AuthorizationV1Api
+from sagemaker.hyperpod.cli.service.self_subject_rules_review import SelfSubjectRulesReview
+
+
+class TestSelfSubjectRulesReview(unittest.TestCase):
+
+    @mock.patch("sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient.__new__")
+    def test_self_subject_rules_review_success(self, mock_kubernetes_client):
+        mock_auth_v1_api = MagicMock(spec=AuthorizationV1Api)
+        mock_kubernetes_client().get_auth_v1_api.return_value = mock_auth_v1_api
+        mock_response = MagicMock()
+        mock_auth_v1_api.create_self_subject_rules_review.return_value = mock_response
+
+        response = SelfSubjectRulesReview().self_subject_rules_review("test-namespace")
+
+        self.assertIs(response, mock_response)
+        mock_auth_v1_api.create_self_subject_rules_review.assert_called_once()
+        args, kwargs = mock_auth_v1_api.create_self_subject_rules_review.call_args
+        self.assertIsInstance(kwargs['body'], V1SelfSubjectRulesReview)
+        self.assertEqual(kwargs['body'].spec.namespace, 'test-namespace')
+
+
+if __name__ == "__main__":
+    unittest.main()
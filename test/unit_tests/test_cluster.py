@@ -11,13 +11,17 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import botocore
+import contextlib
+import io
 import json
 import subprocess
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, mock_open
 
+from botocore.exceptions import ClientError
 from click.testing import CliRunner
+from tabulate import tabulate
 from kubernetes import client
 from kubernetes.client import (
     V1Namespace, 
@@ -32,6 +36,9 @@ from sagemaker.hyperpod.cli.commands.cluster import (
     INSTANCE_TYPE_LABEL,
     set_cluster_context,
     list_cluster,
+    rate_limited_operation,
+    _get_hyperpod_clusters,
+    _ClusterCapacityWriter,
 )
 from sagemaker.hyperpod.cli.validators.validator import Validator
 
@@ -277,7 +284,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -332,7 +339,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -377,7 +384,7 @@ class ClusterTest(unittest.TestCase):
     )
     @mock.patch("sagemaker.hyperpod.cli.clients.kubernetes_client.KubernetesClient.__new__")
     @mock.patch("subprocess.run")
-    def test_get_clusters_maximum_number(
+    def test_get_clusters_scans_every_cluster(
         self,
         mock_subprocess_run: mock.Mock,
         mock_kubernetes_client: mock.Mock,
@@ -386,7 +393,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -424,7 +431,49 @@ class ClusterTest(unittest.TestCase):
         self.assertIn("cluster-2", result.output)
         # Expect JSON output
         output = json.loads(result.output)
-        self.assertEqual(len(output), 50)
+        self.assertEqual(len(output), 100)
+
+    def test_get_hyperpod_clusters_follows_next_token(self):
+        self.mock_sm_client.list_clusters.side_effect = [
+            {
+                "ClusterSummaries": [{"ClusterName": "cluster-1"}],
+                "NextToken": "token-1",
+            },
+            {"ClusterSummaries": [{"ClusterName": "cluster-2"}]},
+        ]
+
+        result = _get_hyperpod_clusters(self.mock_sm_client)
+
+        self.assertEqual(result, ["cluster-1", "cluster-2"])
+        self.assertEqual(
+            self.mock_sm_client.list_clusters.call_args_list,
+            [mock.call(), mock.call(NextToken="token-1")],
+        )
+
+    def test_rate_limited_operation_retries_throttled_cluster(self):
+        throttled = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "DescribeCluster",
+        )
+        self.mock_sm_client.describe_cluster.side_effect = [
+            throttled,
+            {"ClusterStatus": "InService", "InstanceGroups": []},
+        ]
+        limiter = mock.Mock()
+
+        result = rate_limited_operation(
+            cluster_name="cluster-1",
+            validator=mock.Mock(),
+            sm_client=self.mock_sm_client,
+            region=None,
+            namespace=None,
+            limiter=limiter,
+        )
+
+        self.assertEqual(result, [["cluster-1", "N/A", 0, 0, 0, "N/A"]])
+        self.assertEqual(limiter.acquire.call_count, 2)
+        limiter.on_throttle.assert_called_once()
+        limiter.on_success.assert_called_once()
 
     @mock.patch("kubernetes.config.load_kube_config")
     @mock.patch("boto3.Session")
@@ -445,7 +494,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -497,7 +546,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -559,7 +608,7 @@ class ClusterTest(unittest.TestCase):
             "node-name-1": 1,
             "node-name-2": 2,
         }
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_deep_health_check_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -618,7 +667,7 @@ class ClusterTest(unittest.TestCase):
             "node-name-1": 1,
             "node-name-2": 2,
         }
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list_unexpected_label()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -678,7 +727,7 @@ class ClusterTest(unittest.TestCase):
             "node-name-1": 1,
             "node-name-2": 2,
         }
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list_no_status()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -764,7 +813,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -819,7 +868,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -869,7 +918,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.side_effect = Exception(
+        self.mock_k8s_client.list_nodes.side_effect = Exception(
             "Unexpected error"
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -922,7 +971,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -973,7 +1022,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -1054,7 +1103,7 @@ class ClusterTest(unittest.TestCase):
         mock_session: mock.Mock,
         mock_load_kube_config: mock.Mock,
     ):
-        self.mock_k8s_client.list_node_with_temp_config.return_value = (
+        self.mock_k8s_client.list_nodes.return_value = (
             _generate_nodes_list()
         )
         mock_kubernetes_client.return_value = self.mock_k8s_client
@@ -1155,6 +1204,20 @@ class ClusterTest(unittest.TestCase):
         # Should contain TotalNodes with 0 value
         self.assertIn('"TotalNodes": 0', result.output)
 
+    def test_cluster_capacity_writer_table_matches_tabulate(self):
+        headers = ["Cluster", "InstanceType", "TotalNodes"]
+        first = [["cluster-1", "ml.g5.xlarge", 2]]
+        second = [["cluster-2", "ml.p6e-gb200.36xlarge.ultraserver", 18]]
+        writer = _ClusterCapacityWriter("table", headers, None)
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            writer.write(first)
+            writer.write(second)
+            writer.finish()
+
+        self.assertEqual(stdout.getvalue(), tabulate(first + second, headers=headers, tablefmt="presto") + "\n")
+
 
 def _generate_nodes_list():
     return [
@@ -13,6 +13,7 @@
 from click.testing import CliRunner
 
 from sagemaker.hyperpod.cli.hyp_cli import cli
+from sagemaker.hyperpod.common.metadata_cache import is_metadata_cache_enabled
 
 
 def test_hyperpod_cli_importable():
@@ -31,3 +32,11 @@ def test_cli_help():
     result = runner.invoke(cli, ["--help"])
     assert result.exit_code == 0
     assert "Usage:" in result.output
+
+
+def test_cli_no_cache_disables_metadata_cache():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--no-cache", "--help"])
+    assert result.exit_code == 0
+    assert "--no-cache" in result.output
+    assert not is_metadata_cache_enabled()
@@ -97,7 +97,7 @@ class TestHPSpace(unittest.TestCase):
         
         mock_handle_exception.assert_called_once()
 
-    @patch('sagemaker.hyperpod.space.hyperpod_space.boto3.client')
+    @patch('boto3.session.Session.client')
     @patch('sagemaker.hyperpod.space.hyperpod_space.client.CustomObjectsApi')
     @patch.object(HPSpace, 'verify_kube_config')
     @patch('sagemaker.hyperpod.space.hyperpod_space.get_default_namespace')
@@ -145,7 +145,7 @@ class TestHPSpace(unittest.TestCase):
         self.assertEqual(result[1].config.name, "space2")
         mock_custom_api.list_namespaced_custom_object.assert_called_once()
 
-    @patch('sagemaker.hyperpod.space.hyperpod_space.boto3.client')
+    @patch('boto3.session.Session.client')
     @patch('sagemaker.hyperpod.space.hyperpod_space.client.CustomObjectsApi')
     @patch.object(HPSpace, 'verify_kube_config')
     def test_list_with_namespace(self, mock_verify_config, mock_custom_api_class, mock_boto3_client):
@@ -172,7 +172,7 @@ class TestHPSpace(unittest.TestCase):
         )
 
 
-    @patch('sagemaker.hyperpod.space.hyperpod_space.boto3.client')
+    @patch('boto3.session.Session.client')
     @patch('sagemaker.hyperpod.space.hyperpod_space.client.CustomObjectsApi')
     @patch.object(HPSpace, 'verify_kube_config')
     @patch('sagemaker.hyperpod.space.hyperpod_space.get_default_namespace')
@@ -227,7 +227,7 @@ class TestHPSpace(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].config.name, "my-space")
 
-    @patch('sagemaker.hyperpod.space.hyperpod_space.boto3.client')
+    @patch('boto3.session.Session.client')
     @patch('sagemaker.hyperpod.space.hyperpod_space.client.CustomObjectsApi')
     @patch.object(HPSpace, 'verify_kube_config')
     @patch('sagemaker.hyperpod.space.hyperpod_space.get_default_namespace')
@@ -291,7 +291,7 @@ class TestHPSpace(unittest.TestCase):
         self.assertEqual(calls[0][1]['_continue'], None)  # First call
         self.assertEqual(calls[1][1]['_continue'], "page2-token")  # Second call with token
 
-    @patch('sagemaker.hyperpod.space.hyperpod_space.boto3.client')
+    @patch('boto3.session.Session.client')
     @patch('sagemaker.hyperpod.space.hyperpod_space.client.CustomObjectsApi')
     @patch.object(HPSpace, 'verify_kube_config')
     def test_list_no_matching_spaces_across_pages(self, mock_verify_config, mock_custom_api_class, mock_boto3_client):
@@ -347,7 +347,7 @@ class TestHPSpace(unittest.TestCase):
         # Should still paginate through all pages
         self.assertEqual(mock_custom_api.list_namespaced_custom_object.call_count, 2)
 
-    @patch('sagemaker.hyperpod.space.hyperpod_space.boto3.client')
+    @patch('boto3.session.Session.client')
     @patch('sagemaker.hyperpod.space.hyperpod_space.client.CustomObjectsApi')
     @patch.object(HPSpace, 'verify_kube_config')
     @patch('sagemaker.hyperpod.space.hyperpod_space.handle_exception')
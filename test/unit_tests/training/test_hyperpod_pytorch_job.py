@@ -1,7 +1,9 @@
 import unittest
+from sagemaker.hyperpod.common.pod_exec import ExecResult, PodExecResult
 from unittest.mock import patch, MagicMock, Mock
 import pytest
 from kubernetes.client.exceptions import ApiException
+from pydantic import TypeAdapter, ValidationError
 
 from sagemaker.hyperpod.training import (
     HyperPodPytorchJob,
@@ -15,6 +17,7 @@ from sagemaker.hyperpod.training import (
     _load_hp_job,
     _load_hp_job_list,
 )
+from sagemaker.hyperpod.training.config.hyperpod_pytorch_job_unified_config import _HyperPodPytorchJob
 from sagemaker.hyperpod.training.hyperpod_pytorch_job import list_accelerator_partition_types
 from sagemaker.hyperpod.common.config import Metadata
 
@@ -129,6 +132,35 @@ class TestHyperPodPytorchJob(unittest.TestCase):
             result, [HyperPodPytorchJob(metadata=Metadata(name="test-job"))]
         )
 
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.get_default_namespace")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CustomObjectsApi")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job._load_hp_job_list")
+    def test_list_all_namespaces(
+        self, mock_load_list, mock_custom_api, mock_default_namespace, mock_verify_config
+    ):
+        """Test listing jobs across namespaces with one paginated cluster-scoped request"""
+        mock_load_list.side_effect = lambda response: [
+            HyperPodPytorchJob(metadata=Metadata(**item["metadata"])) for item in response["items"]
+        ]
+        mock_api_instance = mock_custom_api.return_value
+        mock_api_instance.list_cluster_custom_object.side_effect = [
+            {"items": [{"metadata": {"name": "job-1", "namespace": "team-a"}}],
+             "metadata": {"continue": "token-1"}},
+            {"items": [{"metadata": {"name": "job-2", "namespace": "team-b"}}],
+             "metadata": {}},
+        ]
+
+        result = HyperPodPytorchJob.list(all_namespaces=True)
+
+        self.assertEqual(
+            [(job.metadata.name, job.metadata.namespace) for job in result],
+            [("job-1", "team-a"), ("job-2", "team-b")],
+        )
+        self.assertEqual(mock_api_instance.list_cluster_custom_object.call_count, 2)
+        mock_api_instance.list_namespaced_custom_object.assert_not_called()
+        mock_default_namespace.assert_not_called()
+
     @patch.object(HyperPodPytorchJob, "verify_kube_config")
     @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CustomObjectsApi")
     def test_delete_success(self, mock_custom_api, mock_verify_config):
@@ -218,6 +250,28 @@ class TestHyperPodPytorchJob(unittest.TestCase):
         )
         self.assertIsInstance(self.job.status, HyperPodPytorchJobStatus)
 
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CustomObjectsApi")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.wait_for_custom_object")
+    def test_wait_until_updates_status(self, mock_wait, mock_custom_api, mock_verify_config):
+        """Test waiting for a job condition updates the job status from each watched change"""
+        def fake_wait(custom_api, group, version, plural, name, namespace, condition, timeout):
+            running = {"status": {"conditions": [{"type": "Running", "status": "True"}]}}
+            self.assertFalse(condition({"status": {"conditions": [{"type": "Created", "status": "True"}]}}))
+            self.assertTrue(condition(running))
+            return running
+        mock_wait.side_effect = fake_wait
+
+        result = self.job.wait_until(lambda job: job.status.conditions[-1].type == "Running", timeout=60)
+
+        self.assertIs(result, self.job)
+        self.assertEqual(self.job.status.conditions[-1].type, "Running")
+        _, kwargs = mock_wait.call_args
+        self.assertEqual(kwargs["plural"], "hyperpodpytorchjobs")
+        self.assertEqual(kwargs["name"], "test-job")
+        self.assertEqual(kwargs["namespace"], "default")
+        self.assertEqual(kwargs["timeout"], 60)
+
     @patch.object(HyperPodPytorchJob, "verify_kube_config")
     @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.config.load_kube_config")
     @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CoreV1Api")
@@ -238,7 +292,8 @@ class TestHyperPodPytorchJob(unittest.TestCase):
 
         result = self.job.list_pods()
 
-        mock_load_config.assert_called_once()
+        # The kube config is loaded once by verify_kube_config, not on every call
+        mock_load_config.assert_not_called()
         mock_api_instance.list_namespaced_pod.assert_called_once_with(
             "default", label_selector="HPJob=test-job"
         )
@@ -292,6 +347,99 @@ class TestHyperPodPytorchJob(unittest.TestCase):
         )
         self.assertEqual(result, "test logs")
 
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CoreV1Api")
+    def test_stream_logs_from_pod(self, mock_core_api, mock_verify_config):
+        """Test streaming log retrieval from pod"""
+        mock_api_instance = MagicMock()
+        mock_core_api.return_value = mock_api_instance
+        mock_response = mock_api_instance.read_namespaced_pod_log.return_value
+        mock_response.stream.return_value = iter([b"line 1\nline", b" 2\n"])
+
+        result = self.job.stream_logs_from_pod("test-pod", follow=True, tail_lines=5)
+
+        mock_api_instance.read_namespaced_pod_log.assert_called_once_with(
+            name="test-pod",
+            namespace="default",
+            timestamps=True,
+            follow=True,
+            _preload_content=False,
+            container="test-container",
+            tail_lines=5,
+        )
+        self.assertEqual(list(result), ["line 1", "line 2"])
+
+    @patch.object(HyperPodPytorchJob, "list_pods")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.aggregate_pod_logs")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CoreV1Api")
+    def test_get_logs_all_pods(self, mock_core_api, mock_aggregate, mock_list_pods):
+        """Test aggregating logs across every pod of the job"""
+        mock_list_pods.return_value = ["test-job-pod-0", "test-job-pod-1"]
+        mock_aggregate.return_value = iter(["[test-job-pod-0] line"])
+
+        result = self.job.get_logs_all_pods(tail_lines=10, max_workers=4)
+
+        self.assertEqual(list(result), ["[test-job-pod-0] line"])
+        mock_aggregate.assert_called_once_with(
+            mock_core_api.return_value,
+            pods=["test-job-pod-0", "test-job-pod-1"],
+            namespace="default",
+            container="test-container",
+            follow=False,
+            since_seconds=None,
+            tail_lines=10,
+            limit_bytes_per_pod=None,
+            max_workers=4,
+        )
+
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch.object(HyperPodPytorchJob, "list_pods")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.exec_on_pods")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CoreV1Api")
+    def test_exec_command_all_pods_concatenates_output(
+        self, mock_core_api, mock_exec_on_pods, mock_list_pods, mock_verify_config
+    ):
+        """Test exec_command with all_pods groups streamed output per pod"""
+        mock_list_pods.return_value = ["test-job-pod-0", "test-job-pod-1"]
+
+        def run(v1, pods, namespace, command, container, on_output, timeout_seconds):
+            on_output("test-job-pod-1", "b")
+            on_output("test-job-pod-0", "a")
+            return ExecResult(pods=[PodExecResult(pod, 0, 0.1) for pod in pods])
+
+        mock_exec_on_pods.side_effect = run
+
+        result = self.job.exec_command(["hostname"], all_pods=True)
+
+        self.assertEqual(
+            result,
+            "=== Pod: test-job-pod-0 ===\na\n=== Pod: test-job-pod-1 ===\nb\n",
+        )
+
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch.object(HyperPodPytorchJob, "list_pods")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.exec_on_pods")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CoreV1Api")
+    def test_exec_command_all_pods(
+        self, mock_core_api, mock_exec_on_pods, mock_list_pods, mock_verify_config
+    ):
+        """Test concurrent exec across every pod of the job"""
+        mock_list_pods.return_value = ["test-job-pod-0"]
+        on_output = MagicMock()
+
+        self.job.exec_command_all_pods(["df", "-h"], on_output=on_output, timeout_seconds=60)
+
+        mock_exec_on_pods.assert_called_once_with(
+            mock_core_api.return_value,
+            pods=["test-job-pod-0"],
+            namespace="default",
+            command=["df", "-h"],
+            container="test-container",
+            on_output=on_output,
+            max_workers=32,
+            timeout_seconds=60,
+        )
+
     @patch("kubernetes.client.CoreV1Api")
     @patch.object(HyperPodPytorchJob, "verify_kube_config")
     def test_get_operator_logs(self, mock_verify_config, mock_core_api):
@@ -317,6 +465,41 @@ class TestHyperPodPytorchJob(unittest.TestCase):
             since_seconds=9000,
         )
 
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.get_default_namespace", return_value="team-a")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CustomObjectsApi")
+    def test_create_many(self, mock_custom_api, mock_namespace, mock_verify_config):
+        """Test creating many jobs reports each job's outcome"""
+        mock_api_instance = MagicMock()
+        mock_custom_api.return_value = mock_api_instance
+        mock_api_instance.create_namespaced_custom_object.side_effect = [None, ApiException(status=403, reason="Forbidden")]
+        jobs = [
+            self.job.model_copy(update={"metadata": Metadata(name=f"sweep-{i}")}, deep=True)
+            for i in range(2)
+        ]
+
+        result = HyperPodPytorchJob.create_many(jobs, max_workers=1)
+
+        mock_verify_config.assert_called_once()
+        mock_namespace.assert_called_once()
+        self.assertEqual(result.to_manifest(), {
+            "created": [{"name": "sweep-0", "namespace": "team-a"}],
+            "failed": [{"name": "sweep-1", "namespace": "team-a", "error": "403 Forbidden"}],
+        })
+        body = mock_api_instance.create_namespaced_custom_object.call_args_list[0][1]["body"]
+        self.assertEqual(body["kind"], "HyperPodPyTorchJob")
+        self.assertEqual(body["metadata"]["name"], "sweep-0")
+        self.assertEqual(body["spec"]["replicaSpecs"][0]["replicas"], 1)
+
+    @patch.object(HyperPodPytorchJob, "verify_kube_config")
+    @patch("sagemaker.hyperpod.training.hyperpod_pytorch_job.client.CustomObjectsApi")
+    def test_create_many_rejects_duplicate_names(self, mock_custom_api, mock_verify_config):
+        """Test that no job is submitted when two jobs share a name"""
+        with self.assertRaises(ValueError):
+            HyperPodPytorchJob.create_many([self.job, self.job.model_copy(deep=True)])
+
+        mock_custom_api.return_value.create_namespaced_custom_object.assert_not_called()
+
 
 class TestLoadHpJob(unittest.TestCase):
     """Test the _load_hp_job function"""
@@ -350,6 +533,51 @@ class TestLoadHpJob(unittest.TestCase):
         self.assertEqual(result.metadata.namespace, "default")
         self.assertIsNone(result.status)
 
+    def test_load_hp_job_ignores_unknown_spec_fields(self):
+        """Test unknown spec fields are dropped rather than rejected"""
+        response = {
+            "metadata": {"name": "test-job", "namespace": "default", "uid": "abc"},
+            "spec": {"nprocPerNode": "2", "addedByNewerOperator": True},
+        }
+
+        result = _load_hp_job(response)
+
+        self.assertEqual(result.nprocPerNode, "2")
+        self.assertEqual(result.model_fields_set, {"metadata", "status", "nprocPerNode"})
+
+    def test_load_hp_job_matches_constructed_job(self):
+        """Test a loaded job dumps and compares like one built through the constructor"""
+        response = {
+            "metadata": {"name": "test-job", "namespace": "default"},
+            "spec": {"nprocPerNode": "2", "replicaSpecs": [{"name": "pod", "replicas": 2}]},
+            "status": {"conditions": [{"type": "Created", "status": "True"}]},
+        }
+
+        result = _load_hp_job(response)
+        spec = _HyperPodPytorchJob.model_validate(response["spec"], by_name=True)
+        expected = HyperPodPytorchJob(
+            metadata=Metadata(**response["metadata"]),
+            status=HyperPodPytorchJobStatus.model_validate(response["status"], by_name=True),
+            **spec.model_dump(by_alias=True, exclude_none=True),
+        )
+
+        self.assertEqual(result, expected)
+        self.assertEqual(result.model_fields_set, expected.model_fields_set)
+        self.assertEqual(
+            TypeAdapter(HyperPodPytorchJob).dump_python(result),
+            TypeAdapter(HyperPodPytorchJob).dump_python(expected),
+        )
+
+    def test_load_hp_job_invalid_spec(self):
+        """Test an invalid spec is rejected when the job is loaded"""
+        response = {
+            "metadata": {"name": "test-job"},
+            "spec": {"replicaSpecs": "not-a-list"},
+        }
+
+        with self.assertRaises(ValidationError):
+            _load_hp_job(response)
+
 
 class TestLoadHpJobList(unittest.TestCase):
     """Test the _load_hp_job_list function"""
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+import jinja2
+
+from sagemaker.hyperpod.training.sweep_util import expand_sweep, load_sweep_file
+
+
+class TestExpandSweep(unittest.TestCase):
+    def test_renders_every_combination(self):
+        template = {
+            "job_name": "lr-{{ index }}",
+            "args": ["--lr={{ lr }}", "--batch-size={{ batch_size }}"],
+            "node_count": "{{ nodes }}",
+            "image": "train:latest",
+        }
+
+        variants = expand_sweep(template, {"lr": [0.1, 0.01], "batch_size": [32, 64], "nodes": [2]})
+
+        self.assertEqual(len(variants), 4)
+        self.assertEqual(variants[3], {
+            "job_name": "lr-3",
+            "args": ["--lr=0.01", "--batch-size=64"],
+            "node_count": 2,
+            "image": "train:latest",
+        })
+        self.assertEqual([v["args"][0] for v in variants], ["--lr=0.1", "--lr=0.1", "--lr=0.01", "--lr=0.01"])
+
+    def test_empty_matrix_is_one_variant(self):
+        self.assertEqual(expand_sweep({"job_name": "job-{{ index }}"}, {}), [{"job_name": "job-0"}])
+
+    def test_invalid_matrix(self):
+        with self.assertRaises(ValueError):
+            expand_sweep({}, {"lr": []})
+        with self.assertRaises(ValueError):
+            expand_sweep({}, {"lr": "0.1"})
+        with self.assertRaises(ValueError):
+            expand_sweep({}, {"index": [1, 2]})
+
+    def test_undefined_variable(self):
+        with self.assertRaises(jinja2.UndefinedError):
+            expand_sweep({"job_name": "job-{{ missing }}"}, {"lr": [0.1]})
+
+
+class TestLoadSweepFile(unittest.TestCase):
+    def _write(self, content):
+        fd, path = tempfile.mkstemp(suffix=".yaml")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_load(self):
+        path = self._write("job:\n  image: train:latest\nmatrix:\n  lr: [0.1]\n")
+
+        self.assertEqual(load_sweep_file(path), ({"image": "train:latest"}, {"lr": [0.1]}))
+
+    def test_invalid_file(self):
+        for content in ["- job\n", "job: {}\nmatrixx: {}\n", "job: [image]\nmatrix: {}\n"]:
+            with self.assertRaises(ValueError):
+                load_sweep_file(self._write(content))